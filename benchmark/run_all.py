@@ -78,11 +78,13 @@ _ALL_PROVIDERS = list(constants.MILPProvider)
 _ALL_PROVIDERS = [
     constants.MILPProvider.GUROBI,
     constants.MILPProvider.PULP,
+    constants.MILPProvider.HIGHS,
     constants.MILPProvider.PULP_HIGHS,
 ]
 PROVIDER_RENAME = {
     constants.MILPProvider.GUROBI: "Gurobi",
     constants.MILPProvider.MIP: "MIP",
+    constants.MILPProvider.HIGHS: "HiGHSpy",
     constants.MILPProvider.PULP: "CBC",
     constants.MILPProvider.PULP_CPLEX: "CPLEX",
     constants.MILPProvider.PULP_GLPK: "GLPK",
@@ -158,6 +160,11 @@ def _provider_available(provider: constants.MILPProvider) -> bool:
             import mip
         except Exception:
             return False
+    if provider == constants.MILPProvider.HIGHS:
+        try:
+            import highspy
+        except Exception:
+            return False
     return True
 
 
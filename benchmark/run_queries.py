@@ -30,6 +30,7 @@ PROVIDER_MAP = {
     "cplex": constants.MILPProvider.PULP_CPLEX,
     "glpk": constants.MILPProvider.PULP_GLPK,
     "highs": constants.MILPProvider.PULP_HIGHS,
+    "highspy": constants.MILPProvider.HIGHS,
 }
 
 
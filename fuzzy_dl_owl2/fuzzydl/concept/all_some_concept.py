@@ -35,11 +35,12 @@ class AllSomeConcept(Concept, HasRoleConceptInterface):
         assert c_type in (ConceptType.ALL, ConceptType.SOME)
         # self._name: str = self.compute_name()  # eager; disabled to defer string building until __str__ is actually called
         self._name: typing.Optional[str] = None
+        self._key = (c_type, role, c.concept_id)
 
     @staticmethod
     def new(c_type: ConceptType, role: str, concept: Concept) -> typing.Self:
         """
-        Acts as a factory method for instantiating `AllSomeConcept` objects based on a specified concept type, role, and nested concept. When optimizations are enabled via the configuration, the method applies logical simplifications: if the type is `SOME` and the nested concept is `BOTTOM`, it returns the global bottom concept; conversely, if the type is `ALL` and the nested concept is `TOP`, it returns the global top concept. If these optimization conditions are not met, the method constructs and returns a new `AllSomeConcept` instance initialized with the provided arguments.
+        Acts as a factory method for instantiating `AllSomeConcept` objects based on a specified concept type, role, and nested concept. When optimizations are enabled via the configuration, the method applies logical simplifications: if the type is `SOME` and the nested concept is `BOTTOM`, it returns the global bottom concept; conversely, if the type is `ALL` and the nested concept is `TOP`, it returns the global top concept. If these optimization conditions are not met, the method returns the interned `AllSomeConcept` instance for the given type, role and nested concept, constructing it only the first time.
 
         :param c_type: Specifies the type of concept to instantiate, determining whether it represents a universal (ALL) or existential (SOME) quantification.
         :type c_type: fuzzy_dl_owl2.fuzzydl.util.constants.ConceptType
@@ -48,7 +49,7 @@ class AllSomeConcept(Concept, HasRoleConceptInterface):
         :param concept: The concept instance to be wrapped or restricted.
         :type concept: Concept
 
-        :return: Returns a new instance representing the specified restriction. If optimizations are enabled and the result is trivial (e.g., `SOME` of `BOTTOM` or `ALL` of `TOP`), returns the corresponding `TruthConcept` singleton.
+        :return: Returns the instance representing the specified restriction. If optimizations are enabled and the result is trivial (e.g., `SOME` of `BOTTOM` or `ALL` of `TOP`), returns the corresponding `TruthConcept` singleton.
 
         :rtype: typing.Self
         """
@@ -59,7 +60,10 @@ class AllSomeConcept(Concept, HasRoleConceptInterface):
         else:
             if ConfigReader.OPTIMIZATIONS != 0 and concept.type == ConceptType.TOP:
                 return TruthConcept.get_top()
-        return AllSomeConcept(role, concept, c_type)
+        return Concept.intern(
+            (c_type, role, concept.concept_id),
+            lambda: AllSomeConcept(role, concept, c_type),
+        )
 
     @staticmethod
     def all(role: str, concept: Concept) -> typing.Self:
@@ -197,7 +201,7 @@ class AllSomeConcept(Concept, HasRoleConceptInterface):
 
     def __hash__(self) -> int:
         """
-        Return a hash value for this object, computed from its string representation. This approach ensures that the hash value reflects the structural identity of the object without relying on cached values or additional methods. The hash is derived from the output of the `__str__` method, which provides a consistent and unique representation of the concept's structure. This implementation does not utilize any internal caching mechanism and directly computes the hash each time it is called.
+        Return a hash value for this object, computed from its string representation, which is consistent with the string-based equality of concepts. The hash is computed once and cached together with the name of the restriction, so hashing a restriction does not traverse the nested concept again.
 
         :return: An integer hash value representing the structural identity of this object.
 
@@ -205,9 +209,9 @@ class AllSomeConcept(Concept, HasRoleConceptInterface):
         """
         # return hash(str(self))
         # return id(self)
-        return hash(
-            (hash(self.role), hash(self.curr_concept), hash(self.type))
-        )
+        if self._hash is None:
+            self._hash = hash(str(self))
+        return self._hash
 
 
 # class AllConcept(AllSomeConcept):
@@ -31,10 +31,10 @@ class AtomicConcept(Concept):
         :rtype: typing.Self
         """
 
-        Concept.num_new_concepts += 1
-        return AtomicConcept(
-            f"NewConcept{Concept.SPECIAL_STRING}{Concept.num_new_concepts}"
-        )
+        with Concept.num_new_concepts_lock:
+            Concept.num_new_concepts += 1
+            name: str = f"NewConcept{Concept.SPECIAL_STRING}{Concept.num_new_concepts}"
+        return AtomicConcept(name)
 
     def is_concrete(self) -> bool:
         """
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import itertools
 import re
+import threading
 import typing
+import weakref
 from abc import abstractmethod
 
+from fuzzy_dl_owl2.fuzzydl.util.config_reader import ConfigReader
 from fuzzy_dl_owl2.fuzzydl.util.constants import ConceptType
 
 
@@ -509,7 +513,7 @@ class Thing:
 
 class Concept(Thing):
     """
-    This entity serves as the foundational building block for fuzzy description logic ontologies, capable of representing either primitive atomic concepts or complex structures formed through logical composition. It enables the construction of intricate logical expressions by overloading standard Python operators, allowing conjunction, disjunction, and implication to be performed directly between instances. When instantiated, the object automatically manages naming conventions, generating unique identifiers if a specific name is not provided, while exposing properties to inspect and modify its type and label. Equality comparisons are based on the string representation of the entity, facilitating structural checks within the logical framework.
+    This entity serves as the foundational building block for fuzzy description logic ontologies, capable of representing either primitive atomic concepts or complex structures formed through logical composition. It enables the construction of intricate logical expressions by overloading standard Python operators, allowing conjunction, disjunction, and implication to be performed directly between instances. When instantiated, the object automatically manages naming conventions, generating unique identifiers if a specific name is not provided, while exposing properties to inspect and modify its type and label. Equality comparisons are based on the string representation of the entity, facilitating structural checks within the logical framework. Every concept also receives a unique integer identifier, which the factory methods of the complex concepts use to hash-cons their results: structurally identical concepts built from the same sub-concepts are looked up in a table of canonical instances by a key made of the identifiers of their sub-concepts, so that they share a single object, with its name and its cached hash value, instead of allocating a new tree every time.
 
     :param SPECIAL_STRING: Special character used as a delimiter in the default naming convention for concepts.
     :type SPECIAL_STRING: typing.Any
@@ -517,6 +521,16 @@ class Concept(Thing):
     :type DEFAULT_NAME: typing.Any
     :param num_new_concepts: Counter used to generate unique default names for concepts.
     :type num_new_concepts: typing.Any
+    :param num_new_concepts_lock: Lock serializing the updates of `num_new_concepts` across threads.
+    :type num_new_concepts_lock: threading.Lock
+    :param INTERNED: Canonical instances of the concepts built by the factory methods, indexed by their structural key. Entries are removed as soon as their concept is no longer referenced.
+    :type INTERNED: weakref.WeakValueDictionary[tuple, Concept]
+    :param concept_id: Unique identifier of the concept, renewed whenever the structure of the concept changes in place.
+    :type concept_id: int
+    :param _key: Structural key under which the concept can be interned, made of its type and of the identifiers of its sub-concepts, or None if the concept is never interned.
+    :type _key: typing.Optional[tuple]
+    :param _hash: Cached hash value of the concept, computed on demand from its name.
+    :type _hash: typing.Optional[int]
     :param _type: Determines the classification of the concept, distinguishing between primitive atomic concepts and complex structures formed by logical operators.
     :type _type: fuzzy_dl_owl2.fuzzydl.util.constants.ConceptType
     :param _name: Internal storage for the concept's identifier, used as its string representation and computed from the structure if not explicitly provided.
@@ -529,6 +543,14 @@ class Concept(Thing):
     DEFAULT_NAME = f"Concept{SPECIAL_STRING}"
     # Number of new concepts
     num_new_concepts = 1
+    # Lock guarding the number of new concepts
+    num_new_concepts_lock: threading.Lock = threading.Lock()
+    # Source of the identifiers of the concepts
+    _ids: typing.Iterator[int] = itertools.count()
+    # Canonical instances of the concepts built by the factory methods
+    INTERNED: weakref.WeakValueDictionary[tuple, Concept] = (
+        weakref.WeakValueDictionary()
+    )
 
     def __init__(
         self, c_type: ConceptType = ConceptType.ATOMIC, name: typing.Optional[str] = ""
@@ -546,6 +568,79 @@ class Concept(Thing):
         self._type: ConceptType = c_type
         # Name of the concept
         self._name: typing.Optional[str] = name
+        # Identifier of the concept
+        self.concept_id: int = next(Concept._ids)
+        # Structural key of the concept, if it can be interned
+        self._key: typing.Optional[tuple] = None
+        # Cached hash value
+        self._hash: typing.Optional[int] = None
+
+    def __setstate__(self, state: dict[str, typing.Any]) -> None:
+        """
+        Restores a concept from its pickled state. The concept receives a fresh identifier and loses its structural key and cached hash value, since identifiers are only unique within the process that created them and string hashes are salted differently in every process. Restored concepts are therefore never returned by the factory methods as canonical instances, but they compare equal to them as usual.
+
+        :param state: The attributes of the pickled concept.
+        :type state: dict[str, typing.Any]
+        """
+
+        self.__dict__.update(state)
+        self.concept_id = next(Concept._ids)
+        self._key = None
+        self._hash = None
+
+    @staticmethod
+    def intern(key: tuple, create: typing.Callable[[], Concept]) -> Concept:
+        """
+        Returns the canonical instance of the concept with the given structural key, creating it with `create` and registering it if there is none yet. The key must identify the structure of the concept, usually through its type and the `concept_id` of its sub-concepts, so that two concepts with the same key are structurally identical. Interning is skipped when optimizations are disabled.
+
+        :param key: The structural key of the concept.
+        :type key: tuple
+        :param create: A function building the concept when it has not been interned yet.
+        :type create: typing.Callable[[], Concept]
+
+        :return: The canonical instance of the concept.
+
+        :rtype: Concept
+        """
+
+        if ConfigReader.OPTIMIZATIONS == 0:
+            return create()
+        concept: typing.Optional[Concept] = Concept.INTERNED.get(key)
+        if concept is None:
+            concept = create()
+            if concept._key == key:
+                Concept.INTERNED[key] = concept
+        return concept
+
+    @staticmethod
+    def canonical(concept: Concept) -> Concept:
+        """
+        Returns the canonical instance of a concept that has already been built, registering the concept itself if no structurally identical concept has been interned yet. Concepts without a structural key are returned unchanged.
+
+        :param concept: The concept to look up.
+        :type concept: Concept
+
+        :return: The canonical instance structurally identical to `concept`, or `concept` itself.
+
+        :rtype: Concept
+        """
+
+        if concept._key is None:
+            return concept
+        return Concept.intern(concept._key, lambda: concept)
+
+    @staticmethod
+    def release(concept: Concept) -> None:
+        """
+        Marks a concept whose structure is about to change in place, for instance during normalization. The concept stops being the canonical instance of its old structural key and receives a fresh identifier, so that the keys of the concepts built on top of it before the change no longer match the keys computed from it afterwards.
+
+        :param concept: The concept whose structure changes.
+        :type concept: Concept
+        """
+
+        if concept._key is not None and Concept.INTERNED.get(concept._key) is concept:
+            del Concept.INTERNED[concept._key]
+        concept.concept_id = next(Concept._ids)
 
     @property
     def type(self) -> ConceptType:
@@ -585,13 +680,14 @@ class Concept(Thing):
     @name.setter
     def name(self, value: typing.Optional[str]) -> None:
         """
-        Sets the name of this concept. The provided value is stored directly in the private ``_name`` attribute, replacing any previously stored name; ``None`` marks the concept as anonymous.
+        Sets the name of this concept. The provided value is stored directly in the private ``_name`` attribute, replacing any previously stored name; ``None`` marks the concept as anonymous. The cached hash value, which depends on the name, is discarded.
 
         :param value: The new name to assign, or ``None`` to mark the concept anonymous.
         :type value: typing.Optional[str]
         """
 
         self._name = value
+        self._hash = None
 
     def is_atomic(self) -> bool:
         """
@@ -706,7 +802,7 @@ class Concept(Thing):
 
     def __eq__(self, value: typing.Self) -> bool:
         """
-        Determines equality between the current instance and another object by comparing their string representations. The method returns True if the string output of the current object exactly matches the string output of the provided value. This behavior implies that two distinct instances are considered equal if they serialize to the same string, regardless of their internal memory addresses or specific attribute implementations, provided those attributes result in identical string representations.
+        Determines equality between the current instance and another object by comparing their string representations. The method returns True if the string output of the current object exactly matches the string output of the provided value. This behavior implies that two distinct instances are considered equal if they serialize to the same string, regardless of their internal memory addresses or specific attribute implementations, provided those attributes result in identical string representations. Identical objects, which is the common case for interned concepts, are recognized without building any string.
 
         :param value: The object to compare against, where equality is determined by comparing string representations.
         :type value: typing.Self
@@ -716,7 +812,7 @@ class Concept(Thing):
         :rtype: bool
         """
 
-        return str(self) == str(value)
+        return self is value or str(self) == str(value)
 
     def __ne__(self, value: typing.Self) -> bool:
         """
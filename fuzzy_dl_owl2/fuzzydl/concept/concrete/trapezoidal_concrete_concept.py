@@ -188,7 +188,7 @@ class TrapezoidalConcreteConcept(FuzzyConcreteConcept):
             return 0.0
         if self.b <= x <= self.c:
             return 1.0
-        if x >= self.a:
+        if x < self.b:
             return (x - self.a) / (self.b - self.a)
         return (self.d - x) / (self.d - self.c)
 
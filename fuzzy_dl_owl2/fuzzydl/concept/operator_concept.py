@@ -13,7 +13,7 @@ from fuzzy_dl_owl2.fuzzydl.util.constants import ConceptType, FuzzyLogic
 
 class OperatorConcept(Concept, HasConceptsInterface):
     """
-    This class serves as a representation of logical operators—specifically conjunctions, disjunctions, and negations—within a fuzzy description logic system. It extends the base `Concept` class to support the construction and manipulation of complex logical expressions using various fuzzy logic semantics, such as classical, Lukasiewicz, and Zadeh (Goedel). Users can create operator concepts through static factory methods like `and_`, `or_`, and `not_`, which dynamically determine the specific operator type based on the global knowledge base semantics or allow for explicit selection of fuzzy variants. Beyond construction, the class offers a suite of methods for logical simplification and normalization, including the application of De Morgan's laws, reduction of double negations, distribution of operators, and conversion to Conjunctive or Disjunctive Normal Forms (CNF/DNF). It also integrates with quantifier logic by merging `AllSomeConcept` instances and supports operator overloading for `&`, `|`, and unary `-` to enable syntactically natural logical operations.
+    This class serves as a representation of logical operators—specifically conjunctions, disjunctions, and negations—within a fuzzy description logic system. It extends the base `Concept` class to support the construction and manipulation of complex logical expressions using various fuzzy logic semantics, such as classical, Lukasiewicz, and Zadeh (Goedel). Users can create operator concepts through static factory methods like `and_`, `or_`, and `not_`, which dynamically determine the specific operator type based on the global knowledge base semantics or allow for explicit selection of fuzzy variants. Beyond construction, the class offers a suite of methods for logical simplification and normalization, including the application of De Morgan's laws, reduction of double negations, distribution of operators, and conversion to Conjunctive or Disjunctive Normal Forms (CNF/DNF). It also integrates with quantifier logic by merging `AllSomeConcept` instances and supports operator overloading for `&`, `|`, and unary `-` to enable syntactically natural logical operations. The factory methods hash-cons their results, so that structurally identical operator concepts built from the same operands share a single interned instance.
 
     :param AND_OPERATORS: Concept types identifying conjunction operators for classical, Lukasiewicz, and Goedel fuzzy logic semantics.
     :type AND_OPERATORS: list[fuzzy_dl_owl2.fuzzydl.util.constants.ConceptType]
@@ -91,6 +91,7 @@ class OperatorConcept(Concept, HasConceptsInterface):
         assert c_type in OperatorConcept.ALL_OPERATORS, f"Type {c_type} is not valid."
 
         self.type: ConceptType = c_type
+        self._key = self.compute_key()
         self.name = self.compute_name()
 
     @property
@@ -108,15 +109,30 @@ class OperatorConcept(Concept, HasConceptsInterface):
     @concepts.setter
     def concepts(self, value: typing.Iterable[Concept]) -> None:
         """
-        Sets the operand concepts of this operator concept. The provided iterable is materialized into a list and stored in the private ``_concepts`` attribute, and the concept's cached ``name`` is recomputed via :meth:`compute_name` to stay consistent with the new operands.
+        Sets the operand concepts of this operator concept. The provided iterable is materialized into a list and stored in the private ``_concepts`` attribute, and the concept's cached ``name`` is recomputed via :meth:`compute_name` to stay consistent with the new operands. If the operands are not the same objects as before, the concept is released from the table of interned concepts and receives a new identifier, since its structure has changed in place.
 
         :param value: The new operand concepts, replacing the current ones.
         :type value: typing.Iterable[Concept]
         """
 
         self._concepts = list(value)
+        key: tuple = self.compute_key()
+        if key != self._key:
+            Concept.release(self)
+            self._key = key
         self.name = self.compute_name()
 
+    def compute_key(self) -> tuple:
+        """
+        Computes the structural key of the operator concept, made of its type and the identifiers of its operands in order, which is used to intern it.
+
+        :return: The structural key of the concept.
+
+        :rtype: tuple
+        """
+
+        return (self.type, tuple(c.concept_id for c in self._concepts))
+
     def clone(self) -> Concept:
         """
         Generates a shallow copy of the current `OperatorConcept` instance, preserving its type and associated concepts. The returned object is a new instance containing a shallow copy of the original's concept list, ensuring that structural modifications to the list do not affect the source object. However, because the copy is shallow, any mutable objects referenced within the concepts list remain shared between the original and the clone.
@@ -180,13 +196,19 @@ class OperatorConcept(Concept, HasConceptsInterface):
         """
 
         if constants.KNOWLEDGE_BASE_SEMANTICS == FuzzyLogic.CLASSICAL:
-            return OperatorConcept.__op(ConceptType.AND, concepts).classic_cnf()
+            return Concept.canonical(
+                OperatorConcept.__op(ConceptType.AND, concepts).classic_cnf()
+            )
         if constants.KNOWLEDGE_BASE_SEMANTICS == FuzzyLogic.LUKASIEWICZ:
-            return OperatorConcept.__op(
-                ConceptType.LUKASIEWICZ_AND, concepts
-            ).lukasiewicz_cnf()
+            return Concept.canonical(
+                OperatorConcept.__op(
+                    ConceptType.LUKASIEWICZ_AND, concepts
+                ).lukasiewicz_cnf()
+            )
         if constants.KNOWLEDGE_BASE_SEMANTICS == FuzzyLogic.ZADEH:
-            return OperatorConcept.__op(ConceptType.GOEDEL_AND, concepts).goedel_cnf()
+            return Concept.canonical(
+                OperatorConcept.__op(ConceptType.GOEDEL_AND, concepts).goedel_cnf()
+            )
 
     @staticmethod
     def goedel_and(*concepts: Concept) -> Concept:
@@ -201,7 +223,9 @@ class OperatorConcept(Concept, HasConceptsInterface):
         :rtype: Concept
         """
 
-        return OperatorConcept.__op(ConceptType.GOEDEL_AND, concepts).goedel_cnf()
+        return Concept.canonical(
+            OperatorConcept.__op(ConceptType.GOEDEL_AND, concepts).goedel_cnf()
+        )
 
     @staticmethod
     def lukasiewicz_and(*concepts: Concept) -> Concept:
@@ -216,9 +240,11 @@ class OperatorConcept(Concept, HasConceptsInterface):
         :rtype: Concept
         """
 
-        return OperatorConcept.__op(
-            ConceptType.LUKASIEWICZ_AND, concepts
-        ).lukasiewicz_cnf()
+        return Concept.canonical(
+            OperatorConcept.__op(
+                ConceptType.LUKASIEWICZ_AND, concepts
+            ).lukasiewicz_cnf()
+        )
 
     @staticmethod
     def or_(*concepts: Concept) -> Concept:
@@ -234,13 +260,19 @@ class OperatorConcept(Concept, HasConceptsInterface):
         """
 
         if constants.KNOWLEDGE_BASE_SEMANTICS == FuzzyLogic.CLASSICAL:
-            return OperatorConcept.__op(ConceptType.OR, concepts).classic_cnf()
+            return Concept.canonical(
+                OperatorConcept.__op(ConceptType.OR, concepts).classic_cnf()
+            )
         if constants.KNOWLEDGE_BASE_SEMANTICS == FuzzyLogic.LUKASIEWICZ:
-            return OperatorConcept.__op(
-                ConceptType.LUKASIEWICZ_OR, concepts
-            ).lukasiewicz_cnf()
+            return Concept.canonical(
+                OperatorConcept.__op(
+                    ConceptType.LUKASIEWICZ_OR, concepts
+                ).lukasiewicz_cnf()
+            )
         if constants.KNOWLEDGE_BASE_SEMANTICS == FuzzyLogic.ZADEH:
-            return OperatorConcept.__op(ConceptType.GOEDEL_OR, concepts).goedel_cnf()
+            return Concept.canonical(
+                OperatorConcept.__op(ConceptType.GOEDEL_OR, concepts).goedel_cnf()
+            )
 
     @staticmethod
     def goedel_or(*concepts: Concept) -> Concept:
@@ -255,7 +287,9 @@ class OperatorConcept(Concept, HasConceptsInterface):
         :rtype: Concept
         """
 
-        return OperatorConcept.__op(ConceptType.GOEDEL_OR, concepts).goedel_cnf()
+        return Concept.canonical(
+            OperatorConcept.__op(ConceptType.GOEDEL_OR, concepts).goedel_cnf()
+        )
 
     @staticmethod
     def lukasiewicz_or(*concepts: Concept) -> Concept:
@@ -270,14 +304,16 @@ class OperatorConcept(Concept, HasConceptsInterface):
         :rtype: Concept
         """
 
-        return OperatorConcept.__op(
-            ConceptType.LUKASIEWICZ_OR, concepts
-        ).lukasiewicz_cnf()
+        return Concept.canonical(
+            OperatorConcept.__op(
+                ConceptType.LUKASIEWICZ_OR, concepts
+            ).lukasiewicz_cnf()
+        )
 
     @staticmethod
     def not_(concept: Concept) -> Concept:
         """
-        Computes the logical complement of the provided concept, performing immediate simplifications where possible. If the input concept represents the universal set (Top), the method returns the empty set (Bottom), and vice versa. In cases of double negation, where the input is already a complement operator, the method unwraps and returns the original inner concept. For all other inputs, it constructs and returns a new complement operator node wrapping the provided concept.
+        Computes the logical complement of the provided concept, performing immediate simplifications where possible. If the input concept represents the universal set (Top), the method returns the empty set (Bottom), and vice versa. In cases of double negation, where the input is already a complement operator, the method unwraps and returns the original inner concept. For all other inputs, it returns the interned complement operator node wrapping the provided concept, constructing it only the first time.
 
         :param concept: The concept to apply logical negation to.
         :type concept: Concept
@@ -292,7 +328,10 @@ class OperatorConcept(Concept, HasConceptsInterface):
         if concept.type == ConceptType.BOTTOM:
             return TruthConcept.get_top()
         if concept.type != ConceptType.COMPLEMENT:
-            return OperatorConcept(ConceptType.COMPLEMENT, [concept])
+            return Concept.intern(
+                (ConceptType.COMPLEMENT, (concept.concept_id,)),
+                lambda: OperatorConcept(ConceptType.COMPLEMENT, [concept]),
+            )
         else:
             return typing.cast(OperatorConcept, concept).concepts[0]
 
@@ -1324,7 +1363,7 @@ class OperatorConcept(Concept, HasConceptsInterface):
 
     def __eq__(self, value: typing.Self) -> bool:
         """
-        Determines equality by verifying that the provided value is an instance of the same class and that its string representation matches that of the current instance. This comparison relies entirely on the output of the string conversion method, meaning two distinct objects are considered equal if they produce identical strings. Comparisons against objects of different types will result in a value of False.
+        Determines equality by verifying that the provided value is an instance of the same class and that its string representation matches that of the current instance. This comparison relies entirely on the output of the string conversion method, meaning two distinct objects are considered equal if they produce identical strings. Comparisons against objects of different types will result in a value of False. Identical objects, which is the common case for interned concepts, are recognized without comparing strings.
 
         :param value: The object to compare against the current instance, where equality is determined by comparing the string representations.
         :type value: typing.Self
@@ -1334,7 +1373,9 @@ class OperatorConcept(Concept, HasConceptsInterface):
         :rtype: bool
         """
 
-        return isinstance(value, OperatorConcept) and str(self) == str(value)
+        return self is value or (
+            isinstance(value, OperatorConcept) and str(self) == str(value)
+        )
 
     def __ne__(self, value: typing.Self) -> bool:
         """
@@ -1352,7 +1393,7 @@ class OperatorConcept(Concept, HasConceptsInterface):
 
     def __hash__(self) -> int:
         """
-        Return a hash value for this object, computed from its string representation. This approach ensures that the hash value reflects the structural identity of the object without relying on cached values or additional methods. The hash is derived from the output of the `__str__` method, which provides a consistent and unique representation of the concept's structure. This implementation does not utilize any internal caching mechanism and directly computes the hash each time it is called.
+        Return a hash value for this object, computed from its string representation, which is consistent with the string-based equality of operator concepts. The hash is computed once and cached until the name of the concept changes, so hashing a concept does not traverse its operands.
 
         :return: An integer hash value representing the structural identity of this object.
 
@@ -1361,7 +1402,9 @@ class OperatorConcept(Concept, HasConceptsInterface):
 
         # return hash(str(self))
         # return id(self)
-        return hash((hash(self.type), tuple(map(hash, self.concepts)), self.name))
+        if self._hash is None:
+            self._hash = hash(str(self))
+        return self._hash
 
 
 # class Not(OperatorConcept):
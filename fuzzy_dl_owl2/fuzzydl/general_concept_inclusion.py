@@ -3,6 +3,7 @@ from __future__ import annotations
 import typing
 
 from fuzzy_dl_owl2.fuzzydl.concept.concept import Concept
+from fuzzy_dl_owl2.fuzzydl.concept.implies_concept import ImpliesConcept
 from fuzzy_dl_owl2.fuzzydl.degree.degree import Degree
 from fuzzy_dl_owl2.fuzzydl.util.constants import LogicOperatorType
 
@@ -51,6 +52,9 @@ class GeneralConceptInclusion:
         self.type: LogicOperatorType = type_
 
         self._name: typing.Optional[str] = None  # Cache for the string representation
+        # Caches for the concepts asserted when the GCI is applied to an individual
+        self._negated_subsumed: typing.Optional[Concept] = None
+        self._implication: typing.Optional[Concept] = None
 
     def clone(self) -> typing.Self:
         """
@@ -87,6 +91,47 @@ class GeneralConceptInclusion:
 
         return self.subsumed
 
+    def get_negated_subsumed(self) -> Concept:
+        """
+        Returns the negation of the subsumed concept, which is asserted for every individual to which the GCI is applied. The negation is built the first time it is requested and cached, so that applying the GCI to many individuals does not rebuild the same concept for each of them.
+
+        :return: The negation of the subsumed concept.
+
+        :rtype: Concept
+        """
+
+        if self._negated_subsumed is None:
+            self._negated_subsumed = -self.subsumed
+        return self._negated_subsumed
+
+    def get_implication(self) -> Concept:
+        """
+        Returns the implication from the subsumed concept to the subsumer concept according to the logic operator type of the GCI, which is asserted for every individual to which the GCI is applied. As for the negation of the subsumed concept, the implication is built once and cached.
+
+        :return: The implication concept between the subsumed and the subsumer concepts.
+
+        :rtype: Concept
+        """
+
+        if self._implication is None:
+            if self.type == LogicOperatorType.GOEDEL:
+                self._implication = ImpliesConcept.goedel_implies(
+                    self.subsumed, self.subsumer
+                )
+            elif self.type == LogicOperatorType.KLEENE_DIENES:
+                self._implication = ImpliesConcept.kleene_dienes_implies(
+                    self.subsumed, self.subsumer
+                )
+            elif self.type == LogicOperatorType.LUKASIEWICZ:
+                self._implication = ImpliesConcept.lukasiewicz_implies(
+                    self.subsumed, self.subsumer
+                )
+            else:
+                self._implication = ImpliesConcept.zadeh_implies(
+                    self.subsumed, self.subsumer
+                )
+        return self._implication
+
     def get_type(self) -> LogicOperatorType:
         """
         Retrieves the specific logic operator type associated with this general concept inclusion instance. This method acts as a getter for the internal `type` attribute, returning the classification of the logical operator without modifying the object's state.
@@ -118,6 +163,7 @@ class GeneralConceptInclusion:
         """
 
         self.degree = deg
+        self._name = None
 
     def set_subsumer(self, new_concept: Concept) -> None:
         """
@@ -128,6 +174,7 @@ class GeneralConceptInclusion:
         """
 
         self.subsumer = new_concept
+        self._name = self._implication = None
 
     def set_subsumed(self, new_concept: Concept) -> None:
         """
@@ -138,6 +185,7 @@ class GeneralConceptInclusion:
         """
 
         self.subsumed = new_concept
+        self._name = self._negated_subsumed = self._implication = None
 
     def __eq__(self, other: typing.Self) -> bool:
         """
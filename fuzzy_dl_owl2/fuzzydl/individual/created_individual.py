@@ -94,6 +94,10 @@ class CreatedIndividual(Individual):
 
         # List of concept labels
         self.concept_list: set[int] = set()
+        # Concept labels as a bitset: bit i is set if concept i is in concept_list
+        self.concept_bits: int = 0
+        # Cached hash of the concept labels, None if it has to be recomputed
+        self.label_hash: typing.Optional[int] = None
 
         # Indicates if the individual is directly blocked or not
         self.directly_blocked: CreatedIndividualBlockingType = (
@@ -181,6 +185,8 @@ class CreatedIndividual(Individual):
         )
         # ind.concept_list = copy.deepcopy(self.concept_list)
         ind.concept_list = set(self.concept_list)
+        ind.concept_bits = self.concept_bits
+        ind.label_hash = self.label_hash
         ind.depth = self.depth
         ind.directly_blocked = self.directly_blocked
         # ind.indirectly_blocked = copy.deepcopy(self.indirectly_blocked)
@@ -190,6 +196,70 @@ class CreatedIndividual(Individual):
             ind.parent = self.parent.clone()
         ind.role_name = self.role_name
 
+    def add_concept_label(self, concept_id: int) -> bool:
+        """
+        Adds a concept to the label of the individual, keeping the set of concept identifiers and its bitset encoding in sync. The bitset is an arbitrary-precision integer in which the bit at the position of each concept identifier is set, so it grows with the number of concepts of the knowledge base, and the cached hash of the label is discarded whenever the label changes.
+
+        :param concept_id: The identifier of the concept, as returned by `KnowledgeBase.get_number_from_concept`.
+        :type concept_id: int
+
+        :return: True if the concept was not already in the label, False otherwise.
+
+        :rtype: bool
+        """
+
+        bit: int = 1 << concept_id
+        if self.concept_bits & bit:
+            return False
+        self.concept_list.add(concept_id)
+        self.concept_bits |= bit
+        self.label_hash = None
+        return True
+
+    def get_label_hash(self) -> int:
+        """
+        Returns the hash of the concept label of the individual, which is computed from its bitset encoding and cached until the label changes. Individuals with the same label have the same hash, so comparing the hashes tells most different labels apart without comparing the whole bitsets.
+
+        :return: The hash of the concept label.
+
+        :rtype: int
+        """
+
+        if self.label_hash is None:
+            self.label_hash = hash(self.concept_bits)
+        return self.label_hash
+
+    def label_is_subset_of(self, other: typing.Self) -> bool:
+        """
+        Checks whether every concept in the label of the individual is also in the label of another individual, by testing that no bit of the bitset of the individual is missing in the bitset of the other one.
+
+        :param other: The individual whose label has to contain the label of this individual.
+        :type other: typing.Self
+
+        :return: True if the label of the individual is a subset of the label of `other`, False otherwise.
+
+        :rtype: bool
+        """
+
+        return self.concept_bits & ~other.concept_bits == 0
+
+    def label_equals(self, other: typing.Self) -> bool:
+        """
+        Checks whether two individuals have the same concept label. The cached hashes are compared first, so that different labels are usually told apart without comparing the whole bitsets.
+
+        :param other: The individual whose label is compared with the label of this individual.
+        :type other: typing.Self
+
+        :return: True if both individuals have the same label, False otherwise.
+
+        :rtype: bool
+        """
+
+        return (
+            self.get_label_hash() == other.get_label_hash()
+            and self.concept_bits == other.concept_bits
+        )
+
     def get_integer_id(self) -> int:
         """
         Extracts the unique numeric identifier from the individual's name by stripping the standard default name prefix and converting the remaining characters into an integer. The method relies on the name being formatted with the default prefix followed by a valid numeric suffix; consequently, it will raise a ValueError if the name is shorter than the prefix or if the trailing characters cannot be parsed as an integer.
@@ -465,7 +535,7 @@ class CreatedIndividual(Individual):
                 self.depth,
                 self.role_name,
                 self.parent.name if self.parent else str(None),
-                tuple(self.concept_list),
+                self.concept_bits,
                 tuple(map(hash, self.representatives)),
                 self.directly_blocked,
                 self.indirectly_blocked,
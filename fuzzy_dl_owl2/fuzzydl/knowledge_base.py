@@ -3,6 +3,7 @@ from __future__ import annotations
 import contextlib
 import pickle
 import sys
+import time
 import typing
 from collections import deque
 
@@ -96,6 +97,7 @@ from fuzzy_dl_owl2.fuzzydl.individual.representative_individual import (
 from fuzzy_dl_owl2.fuzzydl.milp.expression import Expression
 from fuzzy_dl_owl2.fuzzydl.milp.milp_helper import MILPHelper
 from fuzzy_dl_owl2.fuzzydl.milp.solution import Solution
+from fuzzy_dl_owl2.fuzzydl.milp.solver_limits import SolverLimits
 from fuzzy_dl_owl2.fuzzydl.milp.term import Term
 from fuzzy_dl_owl2.fuzzydl.milp.variable import Variable
 from fuzzy_dl_owl2.fuzzydl.modifier.linear_modifier import LinearModifier
@@ -119,10 +121,13 @@ from fuzzy_dl_owl2.fuzzydl.util.constants import (
     InequalityType,
     KnowledgeBaseRules,
     LogicOperatorType,
+    MembershipEncoding,
     RepresentativeIndividualType,
     RestrictionType,
+    SolverCapability,
     VariableType,
 )
+from fuzzy_dl_owl2.fuzzydl.util.reasoner_context import ReasonerContext
 from fuzzy_dl_owl2.fuzzydl.util.util import Util
 from fuzzy_dl_owl2.fuzzydl.util.utils import class_debugging
 
@@ -217,8 +222,16 @@ class KnowledgeBase:
     :type exist_assertions: list[Assertion]
     :param positive_concrete_value_assertions: A list of positive datatype restrictions in the ABox, specifically at-most, at-least, and exact value assertions, stored for processing.
     :type positive_concrete_value_assertions: list[Assertion]
+    :param fixed_concrete_values: The literal values of the concrete features of the named individuals, keyed by the name of the individual and the name of the feature, recorded from the exact value assertions with a positive numeric degree so that the fuzzy concrete concepts of the fillers can be evaluated directly, or None if conflicting values have been asserted.
+    :type fixed_concrete_values: dict[tuple[str, str], typing.Optional[float]]
     :param t_G: A list of General Concept Inclusions (GCIs) from the TBox that could not be absorbed or simplified via lazy unfolding.
     :type t_G: list[GeneralConceptInclusion]
+    :param gci_index: The GCIs of `t_G` that are applied to every individual, without duplicates and without the GCIs involving modified concrete concepts, which are never applied.
+    :type gci_index: list[GeneralConceptInclusion]
+    :param indexed_gcis: The GCIs in `gci_index`, used to discard duplicates.
+    :type indexed_gcis: set[GeneralConceptInclusion]
+    :param num_indexed_gcis: The number of GCIs at the beginning of `t_G` that have already been considered for `gci_index`.
+    :type num_indexed_gcis: int
     :param axioms_C_equiv_D: A list of concept equivalence axioms of the form C = D, used to track equivalent concepts within the TBox.
     :type axioms_C_equiv_D: list[ConceptEquivalence]
     :param temp_string_concept_list: A temporary list of concepts involving string datatypes, used to track and convert string values to integers during the reasoning process.
@@ -229,6 +242,10 @@ class KnowledgeBase:
     :type tmp_features: list[str]
     :param nodes_classification: A list of classification nodes representing the atomic concepts and their hierarchical structure derived during the classification process.
     :type nodes_classification: list[ClassificationNode]
+    :param classification_index: Maps every atomic concept name (including equivalent names) to the classification node that represents it in the computed hierarchy, so that classified subsumption queries are answered by lookups.
+    :type classification_index: dict[str, ClassificationNode]
+    :param classification_descendants: Caches, for the nodes of the computed hierarchy queried so far, the set of nodes strictly below them, so that classified subsumption queries do not traverse the hierarchy again.
+    :type classification_descendants: dict[ClassificationNode, set[ClassificationNode]]
     :param abstract_roles: A set of names for the abstract roles defined in the knowledge base, representing relationships between individuals.
     :type abstract_roles: set[str]
     :param reflexive_roles: A set of names for the reflexive roles defined in the knowledge base, indicating that every individual is related to itself via these roles.
@@ -307,6 +324,12 @@ class KnowledgeBase:
     :type roles_with_trans_children: dict[str, list[str]]
     :param rules_applied: A dictionary mapping each reasoning rule to the number of times it has been applied during the reasoning process.
     :type rules_applied: dict[KnowledgeBaseRules, int]
+    :param rule_handlers: Dispatch table mapping the rule key of the concept of an assertion, as computed by `get_rule_key`, to the bound method applying the corresponding completion rule in `solve_assertions`.
+    :type rule_handlers: dict[tuple[ConceptType, typing.Optional[ConceptType]], typing.Callable[[Assertion], None]]
+    :param rule_handler_calls: A dictionary mapping the name of each completion rule handler to the number of assertions it has processed.
+    :type rule_handler_calls: dict[str, int]
+    :param rule_handler_time: A dictionary mapping the name of each completion rule handler to the total time, in seconds, spent applying it.
+    :type rule_handler_time: dict[str, float]
     :param x_prime_individuals: A dictionary mapping individual names to lists of their corresponding x' individuals, used to track indirect blocking conditions during the reasoning process.
     :type x_prime_individuals: dict[str, list[str]]
     :param y_prime_individuals: A dictionary of the y' individuals for indirect blocking, where the keys are the names of the individuals and the values are lists of the names of the corresponding y' individuals.
@@ -400,8 +423,16 @@ class KnowledgeBase:
         self.exist_assertions: list[Assertion] = []
         # Positive datatype restrictions
         self.positive_concrete_value_assertions: list[Assertion] = []
+        # Literal values of the concrete features of named individuals
+        self.fixed_concrete_values: dict[tuple[str, str], typing.Optional[float]] = (
+            dict()
+        )
         # Part of the TBox to which we cannot apply lazy unfolding
         self.t_G: list[GeneralConceptInclusion] = []
+        # GCIs of tG applied to every individual, built incrementally from tG
+        self.gci_index: list[GeneralConceptInclusion] = []
+        self.indexed_gcis: set[GeneralConceptInclusion] = set()
+        self.num_indexed_gcis: int = 0
         # Equivalent concepts C = D
         self.axioms_C_equiv_D: list[ConceptEquivalence] = []
         # Used by string datatypes
@@ -412,6 +443,12 @@ class KnowledgeBase:
         self.tmp_features: list[str] = []
         # Classified atomic concepts
         self.nodes_classification: list[ClassificationNode] = list()
+        # Classification node of every atomic concept name
+        self.classification_index: dict[str, ClassificationNode] = dict()
+        # Nodes below every classification node queried so far
+        self.classification_descendants: dict[
+            ClassificationNode, set[ClassificationNode]
+        ] = dict()
 
         # Abstract roles
         self.abstract_roles: set[str] = set()
@@ -495,6 +532,15 @@ class KnowledgeBase:
         self.rules_applied: dict[KnowledgeBaseRules, int] = {
             rule: 0 for rule in list(KnowledgeBaseRules)
         }
+        # Number of assertions processed by each completion rule handler
+        self.rule_handler_calls: dict[str, int] = dict()
+        # Time spent in each completion rule handler
+        self.rule_handler_time: dict[str, float] = dict()
+        # Completion rule handlers indexed by rule key
+        self.rule_handlers: dict[
+            tuple[ConceptType, typing.Optional[ConceptType]],
+            typing.Callable[[Assertion], None],
+        ] = self.get_rule_handlers()
 
         # x' individuals for indirect blocking
         self.x_prime_individuals: dict[str, list[str]] = dict()
@@ -525,7 +571,7 @@ class KnowledgeBase:
 
     def clone(self) -> typing.Self:
         """
-        Creates and returns a deep copy of the current `KnowledgeBase` instance, ensuring that the new object is independent of the original. The method initiates the copy by generating a clone of the base structure without the ABox via `clone_without_abox`, then systematically reconstructs the ABox by duplicating all assertions, individuals, and nominal nodes. Additionally, it replicates internal components such as the MILP model, blocking states, parser-specific data, and statistical counters, using deep copies or element-wise cloning where necessary to preserve the integrity of complex nested structures.
+        Creates and returns a deep copy of the current `KnowledgeBase` instance, ensuring that the new object is independent of the original. The method initiates the copy by generating a clone of the base structure without the ABox via `clone_without_abox`, then systematically reconstructs the ABox by duplicating all assertions, individuals, and nominal nodes. Additionally, it replicates internal components such as blocking states, parser-specific data, and statistical counters, and takes a copy-on-write snapshot of the MILP model, which shares the existing constraints and variables with the original knowledge base so that a query only pays for the part of the model it adds or modifies.
 
         :return: A deep copy of the current knowledge base instance, including all assertions, individuals, and internal state.
 
@@ -587,6 +633,8 @@ class KnowledgeBase:
         kb.old_binary_variables = self.old_binary_variables
         # kb.rules_applied = copy.deepcopy(self.rules_applied)
         kb.rules_applied = dict(self.rules_applied)
+        kb.rule_handler_calls = dict(self.rule_handler_calls)
+        kb.rule_handler_time = dict(self.rule_handler_time)
 
         return kb
 
@@ -648,6 +696,10 @@ class KnowledgeBase:
         kb.blocking_dynamic = self.blocking_dynamic
         kb.blocking_type = self.blocking_type
         kb.CLASSIFIED = self.CLASSIFIED
+        # The hierarchy is never modified after classification, so it is shared
+        kb.nodes_classification = self.nodes_classification
+        kb.classification_index = self.classification_index
+        kb.classification_descendants = self.classification_descendants
 
         # Clone data used by DL parser
         # kb.tmp_features = copy.deepcopy(self.tmp_features)
@@ -718,6 +770,7 @@ class KnowledgeBase:
         kb.positive_concrete_value_assertions = list(
             self.positive_concrete_value_assertions
         )
+        kb.fixed_concrete_values = dict(self.fixed_concrete_values)
 
         # kb.processed_assertions = copy.deepcopy(self.processed_assertions)
         kb.processed_assertions = set(self.processed_assertions)
@@ -755,6 +808,9 @@ class KnowledgeBase:
         }
         # kb.t_G = [gci.clone() for gci in self.t_G]
         kb.t_G = list(self.t_G)
+        kb.gci_index = list(self.gci_index)
+        kb.indexed_gcis = set(self.indexed_gcis)
+        kb.num_indexed_gcis = self.num_indexed_gcis
         # kb.t_inclusions = {
         #     k: set([pcd.clone() for pcd in v]) for k, v in self.t_inclusions.items()
         # }
@@ -1082,7 +1138,7 @@ class KnowledgeBase:
             raise pickle.UnpicklingError(
                 f"Expected KnowledgeBase, got {type(kb).__name__}"
             )
-        constants.KNOWLEDGE_BASE_SEMANTICS = kb.get_logic()
+        ReasonerContext.current().semantics = kb.get_logic()
         return kb
 
     def get_individuals(self) -> dict[str, Individual]:
@@ -1381,18 +1437,19 @@ class KnowledgeBase:
         :type new_ass: Assertion
         """
 
+        debug: bool = ConfigReader.DEBUG_PRINT
         deg: Degree = new_ass.get_lower_limit()
         if deg.is_numeric() and deg.is_number_zero():
             return
         if self.is_assertion_processed(new_ass):
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(
                     f"Assertion (without the degree): {new_ass} already processed"
                 )
             # Add xNewAss >= lowerBound
             self.milp.add_new_constraint(new_ass)
         else:
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"Adding assertion: {new_ass}")
             self.num_assertions += 1
             self.assertions.append(new_ass)
@@ -1401,9 +1458,9 @@ class KnowledgeBase:
             if c.type != ConceptType.TOP and ind.is_blockable():
                 aux: int = self.get_number_from_concept(str(c))
                 ind: CreatedIndividual = typing.cast(CreatedIndividual, ind)
-                ind.concept_list.add(aux)
+                ind.add_concept_label(aux)
                 ind.directly_blocked = CreatedIndividualBlockingType.UNCHECKED
-                if ConfigReader.DEBUG_PRINT:
+                if debug:
                     Util.debug(f"Mark node.directly_blocked = {ind.name} as unchecked")
                 self.add_individual_to_concept(aux, ind)
 
@@ -3075,14 +3132,36 @@ class KnowledgeBase:
 
     def __solve_gci_2(self, ind: Individual) -> None:
         """
-        Iterates over the set of General Concept Inclusions (GCIs) stored in `self.t_G` and applies each one to the provided individual. By invoking `solve_gci` for every GCI in the collection, this method ensures that the individual adheres to all defined terminological constraints. This operation modifies the internal state of the knowledge base or the individual directly and produces no return value.
+        Iterates over the index of General Concept Inclusions (GCIs) built from `self.t_G` and applies each one to the provided individual. Since the index contains every distinct GCI that can be applied, this method ensures that the individual adheres to all defined terminological constraints without applying duplicated GCIs or checking the GCIs that are never applied once per individual. This operation modifies the internal state of the knowledge base or the individual directly and produces no return value.
 
         :param ind: The individual to which all General Concept Inclusions are applied.
         :type ind: Individual
         """
 
-        for gci in self.t_G:
-            self.solve_gci(ind, gci)
+        for gci in self.get_gci_index():
+            self.__solve_gci_1(ind, gci)
+
+    def get_gci_index(self) -> list[GeneralConceptInclusion]:
+        """
+        Returns the GCIs of `t_G` that have to be applied to every individual of the knowledge base. Every GCI of `t_G` is instantiated for every individual, since its degree of satisfaction is decided by the MILP problem and not by the label of the individual, so the index does not select GCIs per individual; instead, it keeps the work done for each individual proportional to the number of distinct applicable GCIs. The index is updated incrementally with the GCIs appended to `t_G` since the last call, discarding the GCIs that are equal to an indexed one and the GCIs involving modified concrete concepts, which `solve_gci` never applies.
+
+        :return: The distinct GCIs of `t_G` that are applied to every individual.
+
+        :rtype: list[GeneralConceptInclusion]
+        """
+
+        for gci in self.t_G[self.num_indexed_gcis :]:
+            if gci in self.indexed_gcis or any(
+                c.type == ConceptType.MODIFIED
+                and typing.cast(ModifiedConcept, c).curr_concept.type
+                == ConceptType.CONCRETE
+                for c in (gci.get_subsumed(), gci.get_subsumer())
+            ):
+                continue
+            self.indexed_gcis.add(gci)
+            self.gci_index.append(gci)
+        self.num_indexed_gcis = len(self.t_G)
+        return self.gci_index
 
     def solve_lukasiewicz_gci(
         self, ind: Individual, gci: GeneralConceptInclusion
@@ -3126,7 +3205,7 @@ class KnowledgeBase:
                 new_ass: Assertion = Assertion(ind, d, l)
                 self.add_assertion(new_ass)
         else:
-            not_c: Concept = -c
+            not_c: Concept = gci.get_negated_subsumed()
             if d.type == ConceptType.BOTTOM:
                 # a: \not C >= n
                 new_ass: Assertion = Assertion(ind, not_c, l)
@@ -3203,7 +3282,7 @@ class KnowledgeBase:
                 new_ass: Assertion = Assertion(ind, d, l)
                 self.add_assertion(new_ass)
         else:
-            not_c: Concept = -c
+            not_c: Concept = gci.get_negated_subsumed()
             if d.type == ConceptType.BOTTOM:
                 # a: \not C >= n
                 new_ass: Assertion = Assertion(ind, not_c, l)
@@ -3233,7 +3312,7 @@ class KnowledgeBase:
                         InequalityType.LESS_THAN,
                     )
                 else:
-                    c_impl_d: Concept = ImpliesConcept.goedel_implies(c, d)
+                    c_impl_d: Concept = gci.get_implication()
                     # a : C g-implies D >= L
                     self.add_assertion(Assertion(ind, c_impl_d, l))
         if ConfigReader.DEBUG_PRINT:
@@ -3253,7 +3332,6 @@ class KnowledgeBase:
 
         c: Concept = gci.get_subsumed()
         d: Concept = gci.get_subsumer()
-        c_impl_d: Concept = ImpliesConcept.kleene_dienes_implies(c, d)
         if ConfigReader.DEBUG_PRINT:
             Util.debug(f"{constants.SEPARATOR}Applying GCI{constants.SEPARATOR}")
         if ConfigReader.DEBUG_PRINT:
@@ -3261,7 +3339,7 @@ class KnowledgeBase:
         if c.type == ConceptType.TOP:
             self.add_assertion(Assertion(ind, d, gci.get_degree()))
         else:
-            self.add_assertion(Assertion(ind, c_impl_d, gci.get_degree()))
+            self.add_assertion(Assertion(ind, gci.get_implication(), gci.get_degree()))
         if ConfigReader.DEBUG_PRINT:
             Util.debug(f"{constants.SEPARATOR}GCI completed{constants.SEPARATOR}")
 
@@ -3285,7 +3363,7 @@ class KnowledgeBase:
             self.add_assertion(Assertion(ind, d, DegreeNumeric.get_degree(1.0)))
         else:
             self.old_01_variables += 1
-            not_c: Concept = -c
+            not_c: Concept = gci.get_negated_subsumed()
             x_ind_is_not_c: Variable = self.milp.get_variable(ind, not_c)
             x_ind_is_d: Variable = self.milp.get_variable(ind, d)
             self.add_assertion(ind, not_c, DegreeVariable.get_degree(x_ind_is_not_c))
@@ -5357,16 +5435,17 @@ class KnowledgeBase:
     def solve_one_exist_assertion(self) -> None:
         """Processes a single existential assertion from the queue, applying blocking optimizations and handling resource constraints. The method iterates through pending assertions, skipping any that have already been processed. If the assertion involves a blockable individual that is currently blocked, the assertion is moved to a blocked list and deferred. Otherwise, provided the maximum number of individuals has not been reached, the method applies the existential rule to expand the knowledge base, marks the assertion as processed, and removes it from the queue. If the individual limit is exceeded, an error is logged."""
 
+        debug: bool = ConfigReader.DEBUG_PRINT
         while len(self.exist_assertions) > 0:
             ass: Assertion = self.exist_assertions[0]
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(
                     f"{constants.SEPARATOR}Processing Existential Assertion{constants.SEPARATOR}"
                 )
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"{ass}")
             if self.is_assertion_processed(ass):
-                if ConfigReader.DEBUG_PRINT:
+                if debug:
                     Util.debug(
                         f"Assertion (without the degree): {ass} already processed."
                     )
@@ -5376,7 +5455,7 @@ class KnowledgeBase:
                     subject: CreatedIndividual = typing.cast(
                         CreatedIndividual, ass.get_individual()
                     )
-                    if ConfigReader.DEBUG_PRINT:
+                    if debug:
                         Util.debug(
                             f"Testing if created individual {subject} is blocked."
                         )
@@ -5392,7 +5471,7 @@ class KnowledgeBase:
                         f"Error: Maximal number of individuals created: {self.num_defined_individuals}"
                     )
                 else:
-                    if ConfigReader.DEBUG_PRINT:
+                    if debug:
                         Util.debug("NO blocking")
                     self.rule_some(ass)
                 self.mark_process_assertion(ass)
@@ -5400,7 +5479,10 @@ class KnowledgeBase:
                 return
 
     def solve_kb(self) -> None:
-        """Prepares the fuzzy knowledge base for reasoning by performing a series of necessary preprocessing and compilation steps. If no specific logic semantics have been defined, it defaults to Lukasiewicz fuzzy logic. The method computes the language, converts symbolic strings into integer representations for efficiency, and resolves various role axioms including inverse, inclusion, reflexive, and functional properties. Additionally, it preprocesses the Terminological Box (TBox), prints its current state, and determines the appropriate blocking type for the reasoning algorithm. Upon completion, it sets an internal flag indicating that the knowledge base is fully loaded and ready for queries."""
+        """Prepares the fuzzy knowledge base for reasoning by performing a series of necessary preprocessing and compilation steps. If no specific logic semantics have been defined, it defaults to Lukasiewicz fuzzy logic. The method computes the language, converts symbolic strings into integer representations for efficiency, and resolves various role axioms including inverse, inclusion, reflexive, and functional properties. Additionally, it preprocesses the Terminological Box (TBox), prints its current state, and determines the appropriate blocking type for the reasoning algorithm. Upon completion, it sets an internal flag indicating that the knowledge base is fully loaded and ready for queries; calling the method again on a knowledge base that is already loaded, such as one returned by the parsers with `solve=True` or from the compiled knowledge base cache, has no effect."""
+
+        if self.KB_LOADED:
+            return
 
         if constants.KNOWLEDGE_BASE_SEMANTICS is None:
             self.set_logic(FuzzyLogic.LUKASIEWICZ)
@@ -5507,29 +5589,146 @@ class KnowledgeBase:
             self.solve_assertions()
             self.ABOX_EXPANDED = True
 
+    @staticmethod
+    def get_rule_key(
+        concept: Concept,
+    ) -> tuple[ConceptType, typing.Optional[ConceptType]]:
+        """
+        Computes the key used to select the completion rule applied to an assertion involving the given concept. The key is a pair containing the type of the concept and, for complemented concepts, the type of the negated concept (None otherwise), so that a single dictionary lookup in `rule_handlers` replaces the sequence of type tests performed on the concept. The negation of any atomic concept, including the truth constants, is identified by the pair (COMPLEMENT, ATOMIC).
+
+        :param concept: The concept of the assertion.
+        :type concept: Concept
+
+        :return: The pair of concept types identifying the completion rule to apply.
+
+        :rtype: tuple[ConceptType, typing.Optional[ConceptType]]
+        """
+
+        if concept.type != ConceptType.COMPLEMENT or not isinstance(
+            concept, OperatorConcept
+        ):
+            return concept.type, None
+        atom: Concept = concept.concepts[0]
+        if atom.is_atomic():
+            return ConceptType.COMPLEMENT, ConceptType.ATOMIC
+        return ConceptType.COMPLEMENT, atom.type
+
+    def get_rule_handlers(
+        self,
+    ) -> dict[
+        tuple[ConceptType, typing.Optional[ConceptType]],
+        typing.Callable[[Assertion], None],
+    ]:
+        """
+        Builds the dispatch table used by `solve_assertions`, mapping every rule key produced by `get_rule_key` to the bound method implementing the corresponding completion rule. Each supported concept type is paired with the rule handling the positive concept, keyed as (type, None), and, when it exists, with the rule handling its negation, keyed as (COMPLEMENT, type). Existential restrictions and has-value concepts are not included, since their assertions are postponed rather than expanded immediately.
+
+        :return: A dictionary mapping rule keys to the bound methods applying the completion rules.
+
+        :rtype: dict[tuple[ConceptType, typing.Optional[ConceptType]], typing.Callable[[Assertion], None]]
+        """
+
+        positive: dict[ConceptType, typing.Callable[[Assertion], None]] = {
+            ConceptType.ATOMIC: self.rule_atomic,
+            ConceptType.AND: self.rule_and,
+            ConceptType.OR: self.rule_or,
+            ConceptType.ALL: self.rule_all,
+            ConceptType.CONCRETE: self.rule_concrete,
+            ConceptType.FUZZY_NUMBER: self.rule_fuzzy_number,
+            ConceptType.MODIFIED: self.rule_modified,
+            ConceptType.TOP: self.rule_top,
+            ConceptType.BOTTOM: self.rule_bottom,
+            ConceptType.AT_MOST_VALUE: self.add_positive_datatype_restriction,
+            ConceptType.AT_LEAST_VALUE: self.add_positive_datatype_restriction,
+            ConceptType.EXACT_VALUE: self.add_positive_datatype_restriction,
+            ConceptType.SELF: self.rule_self,
+            ConceptType.UPPER_APPROX: self.rule_upper_approximation,
+            ConceptType.TIGHT_UPPER_APPROX: self.rule_tight_upper_approximation,
+            ConceptType.LOOSE_UPPER_APPROX: self.rule_loose_upper_approximation,
+            ConceptType.LOWER_APPROX: self.rule_lower_approximation,
+            ConceptType.TIGHT_LOWER_APPROX: self.rule_tight_lower_approximation,
+            ConceptType.LOOSE_LOWER_APPROX: self.rule_loose_lower_approximation,
+            ConceptType.GOEDEL_AND: self.rule_goedel_and,
+            ConceptType.LUKASIEWICZ_AND: self.rule_lukasiewicz_and,
+            ConceptType.GOEDEL_OR: self.rule_goedel_or,
+            ConceptType.LUKASIEWICZ_OR: self.rule_lukasiewicz_or,
+            ConceptType.GOEDEL_IMPLIES: self.rule_goedel_implication,
+            ConceptType.ZADEH_IMPLIES: self.rule_zadeh_implication,
+            ConceptType.W_SUM: self.rule_weighted_sum,
+            ConceptType.W_SUM_ZERO: self.rule_weighted_sum_zero,
+            ConceptType.WEIGHTED: self.rule_weighted_concept,
+            ConceptType.POS_THRESHOLD: self.rule_positive_threshold,
+            ConceptType.NEG_THRESHOLD: self.rule_negative_threshold,
+            ConceptType.EXT_POS_THRESHOLD: self.rule_extended_positive_threshold,
+            ConceptType.EXT_NEG_THRESHOLD: self.rule_extended_negative_threshold,
+            ConceptType.OWA: self.rule_owa,
+            ConceptType.QUANTIFIED_OWA: self.rule_quantified_owa,
+            ConceptType.CHOQUET_INTEGRAL: self.rule_choquet,
+            ConceptType.SUGENO_INTEGRAL: self.rule_sugeno,
+            ConceptType.QUASI_SUGENO_INTEGRAL: self.rule_quasi_sugeno,
+            ConceptType.W_MIN: self.rule_weighted_min,
+            ConceptType.W_MAX: self.rule_weighted_max,
+            ConceptType.SIGMA_CONCEPT: self.rule_sigma_concept,
+        }
+        negative: dict[ConceptType, typing.Callable[[Assertion], None]] = {
+            ConceptType.ATOMIC: self.rule_complemented_atomic,
+            ConceptType.HAS_VALUE: self.rule_complemented_has_value,
+            ConceptType.CONCRETE: self.rule_complemented_concrete,
+            ConceptType.FUZZY_NUMBER: self.rule_complemented_fuzzy_number,
+            ConceptType.MODIFIED: self.rule_complemented_modified,
+            ConceptType.AT_MOST_VALUE: self.add_negated_datatype_restriction,
+            ConceptType.AT_LEAST_VALUE: self.add_negated_datatype_restriction,
+            ConceptType.EXACT_VALUE: self.add_negated_datatype_restriction,
+            ConceptType.SELF: self.rule_complemented_self,
+            ConceptType.GOEDEL_IMPLIES: self.rule_complemented_goedel_implication,
+            ConceptType.ZADEH_IMPLIES: self.rule_complemented_zadeh_implication,
+            ConceptType.W_SUM: self.rule_complemented_weighted_sum,
+            ConceptType.W_SUM_ZERO: self.rule_complemented_weighted_sum_zero,
+            ConceptType.WEIGHTED: self.rule_complemented_weighted_concept,
+            ConceptType.POS_THRESHOLD: self.rule_complemented_positive_threshold,
+            ConceptType.NEG_THRESHOLD: self.rule_complemented_negative_threshold,
+            ConceptType.EXT_POS_THRESHOLD: self.rule_complemented_extended_positive_threshold,
+            ConceptType.EXT_NEG_THRESHOLD: self.rule_complemented_extended_negative_threshold,
+            ConceptType.OWA: self.rule_complemented_owa,
+            ConceptType.QUANTIFIED_OWA: self.rule_complemented_quantified_owa,
+            ConceptType.CHOQUET_INTEGRAL: self.rule_complemented_choquet,
+            ConceptType.SUGENO_INTEGRAL: self.rule_complemented_sugeno,
+            ConceptType.QUASI_SUGENO_INTEGRAL: self.rule_complemented_quasi_sugeno,
+            ConceptType.W_MIN: self.rule_complemented_weighted_min,
+            ConceptType.W_MAX: self.rule_complemented_weighted_max,
+            ConceptType.SIGMA_CONCEPT: self.rule_complemented_sigma_concept,
+        }
+        handlers: dict[
+            tuple[ConceptType, typing.Optional[ConceptType]],
+            typing.Callable[[Assertion], None],
+        ] = {(c_type, None): rule for c_type, rule in positive.items()}
+        for c_type, rule in negative.items():
+            handlers[(ConceptType.COMPLEMENT, c_type)] = rule
+        return handlers
+
     def solve_assertions(self) -> None:
         """
-        Iteratively processes the queue of fuzzy assertions to determine satisfiability and membership degrees within the knowledge base. It begins by verifying that the knowledge base is not already marked as unsatisfiable, raising an exception if it is. For each assertion, the method checks for blocking conditions and zero-degree lower bounds to optimize processing, then dispatches to specific reasoning rules based on the concept type—ranging from standard logical constructs to complex fuzzy operators like Gödel or Łukasiewicz implications. This process updates the internal Mixed-Integer Linear Programming (MILP) model with new constraints and clears the assertion queue, repeating the cycle until no further assertions remain in the main or existential queues. Finally, it triggers the resolution of concrete value assertions to complete the reasoning process.
+        Iteratively processes the queue of fuzzy assertions to determine satisfiability and membership degrees within the knowledge base. It begins by verifying that the knowledge base is not already marked as unsatisfiable, raising an exception if it is. For each assertion, the method checks for blocking conditions and zero-degree lower bounds to optimize processing, then dispatches to specific reasoning rules based on the concept type—ranging from standard logical constructs to complex fuzzy operators like Gödel or Łukasiewicz implications. The rule is selected with a single lookup of the key computed by `get_rule_key` in the `rule_handlers` table, and the number of applications and the time spent in each handler are recorded in `rule_handler_calls` and `rule_handler_time`. This process updates the internal Mixed-Integer Linear Programming (MILP) model with new constraints and clears the assertion queue, repeating the cycle until no further assertions remain in the main or existential queues. Finally, it triggers the resolution of concrete value assertions to complete the reasoning process.
 
         :raises InconsistentOntologyException: Raised if the fuzzy knowledge base is unsatisfiable, indicating that no valid model exists for the current assertions.
         """
 
+        debug: bool = ConfigReader.DEBUG_PRINT
         if self.KB_UNSAT:
             raise InconsistentOntologyException("Unsatisfiable fuzzy KB")
 
         # We will exit only after solving all assertions
         while True:
             for ass in self.assertions:
-                if ConfigReader.DEBUG_PRINT:
+                if debug:
                     Util.debug(
                         f"{constants.SEPARATOR}Processing assertion{constants.SEPARATOR}"
                     )
-                if ConfigReader.DEBUG_PRINT:
+                if debug:
                     Util.debug(f"{ass}")
                 deg: Degree = ass.get_lower_limit()
                 if deg.is_numeric() and deg.is_number_zero():
                     self.mark_process_assertion(ass)
-                    if ConfigReader.DEBUG_PRINT:
+                    if debug:
                         Util.debug(
                             f"{constants.SEPARATOR}Assertion completed{constants.SEPARATOR}"
                         )
@@ -5538,11 +5737,11 @@ class KnowledgeBase:
                 # Use right version of the individual (needed when we clone the KB or merge individuals)
                 self.get_correct_version_of_individual(ass)
                 if ass.get_individual().is_blockable():
-                    if ConfigReader.DEBUG_PRINT:
+                    if debug:
                         Util.debug(
                             f"Direct Blocking status {typing.cast(CreatedIndividual, ass.get_individual()).directly_blocked}"
                         )
-                    if ConfigReader.DEBUG_PRINT:
+                    if debug:
                         Util.debug(
                             f"Indirect Blocking status {typing.cast(CreatedIndividual, ass.get_individual()).indirectly_blocked}"
                         )
@@ -5555,7 +5754,7 @@ class KnowledgeBase:
                     )
                 ):
                     name: str = str(ass.get_individual())
-                    if ConfigReader.DEBUG_PRINT:
+                    if debug:
                         Util.debug(
                             "Skipping assertion (it has an indirectly blocked individual)"
                         )
@@ -5567,7 +5766,7 @@ class KnowledgeBase:
                 # Add xAss >= lowerBound
                 self.milp.add_new_constraint(ass)
                 if self.is_assertion_processed(ass):
-                    if ConfigReader.DEBUG_PRINT:
+                    if debug:
                         Util.debug(
                             f"Assertion (without the degree): {ass} already processed."
                         )
@@ -5576,147 +5775,29 @@ class KnowledgeBase:
                 ind: Individual = ass.get_individual()
                 ci: Concept = ass.get_concept()
                 self.add_negated_equations(ind, ci)
-                c_type: ConceptType = ass.get_type()
+                c_type: ConceptType = ci.type
 
                 # Apply reasoning rule according to the type of the assertion
-                if c_type == ConceptType.ATOMIC:
-                    self.rule_atomic(ass)
-                elif ci.is_complemented_atomic():
-                    # Atomic but complemented
-                    self.rule_complemented_atomic(ass)
-                elif c_type == ConceptType.AND:
-                    self.rule_and(ass)
-                elif c_type == ConceptType.OR:
-                    self.rule_or(ass)
-                elif c_type in (ConceptType.SOME, ConceptType.HAS_VALUE):
+                if c_type in (ConceptType.SOME, ConceptType.HAS_VALUE):
                     self.exist_assertions.append(ass)
                     continue
-                elif c_type == ConceptType.ALL:
-                    self.rule_all(ass)
-                elif OperatorConcept.is_not_has_value(ci):
-                    self.rule_complemented_has_value(ass)
-                elif c_type == ConceptType.CONCRETE:
-                    self.rule_concrete(ass)
-                elif OperatorConcept.is_not_concrete(ci):
-                    self.rule_complemented_concrete(ass)
-                elif c_type == ConceptType.FUZZY_NUMBER:
-                    self.rule_fuzzy_number(ass)
-                elif OperatorConcept.is_not_fuzzy_number(ci):
-                    self.rule_complemented_fuzzy_number(ass)
-                elif c_type == ConceptType.MODIFIED:
-                    self.rule_modified(ass)
-                elif OperatorConcept.is_not_modified(ci):
-                    self.rule_complemented_modified(ass)
-                elif c_type == ConceptType.TOP:
-                    self.rule_top(ass)
-                elif c_type == ConceptType.BOTTOM:
-                    self.rule_bottom(ass)
-                elif c_type in (
-                    ConceptType.AT_MOST_VALUE,
-                    ConceptType.AT_LEAST_VALUE,
-                    ConceptType.EXACT_VALUE,
-                ):
-                    self.positive_concrete_value_assertions.append(ass)
-                elif (
-                    OperatorConcept.is_not_at_least_value(ci)
-                    or OperatorConcept.is_not_at_most_value(ci)
-                    or OperatorConcept.is_not_exact_value(ci)
-                ):
-                    self.add_negated_datatype_restriction(ass)
-                elif c_type == ConceptType.SELF:
-                    self.rule_self(ass)
-                elif OperatorConcept.is_not_self(ci):
-                    self.rule_complemented_self(ass)
-                elif c_type == ConceptType.UPPER_APPROX:
-                    self.rule_upper_approximation(ass)
-                elif c_type == ConceptType.TIGHT_UPPER_APPROX:
-                    self.rule_tight_upper_approximation(ass)
-                elif c_type == ConceptType.LOOSE_UPPER_APPROX:
-                    self.rule_loose_upper_approximation(ass)
-                elif c_type == ConceptType.LOWER_APPROX:
-                    self.rule_lower_approximation(ass)
-                elif c_type == ConceptType.TIGHT_LOWER_APPROX:
-                    self.rule_tight_lower_approximation(ass)
-                elif c_type == ConceptType.LOOSE_LOWER_APPROX:
-                    self.rule_loose_lower_approximation(ass)
-                elif c_type == ConceptType.GOEDEL_AND:
-                    self.rule_goedel_and(ass)
-                elif c_type == ConceptType.LUKASIEWICZ_AND:
-                    self.rule_lukasiewicz_and(ass)
-                elif c_type == ConceptType.GOEDEL_OR:
-                    self.rule_goedel_or(ass)
-                elif c_type == ConceptType.LUKASIEWICZ_OR:
-                    self.rule_lukasiewicz_or(ass)
-                elif c_type == ConceptType.GOEDEL_IMPLIES:
-                    self.rule_goedel_implication(ass)
-                elif OperatorConcept.is_not_goedel_implies(ci):
-                    self.rule_complemented_goedel_implication(ass)
-                elif c_type == ConceptType.ZADEH_IMPLIES:
-                    self.rule_zadeh_implication(ass)
-                elif OperatorConcept.is_not_zadeh_implies(ci):
-                    self.rule_complemented_zadeh_implication(ass)
-                elif c_type == ConceptType.W_SUM:
-                    self.rule_weighted_sum(ass)
-                elif OperatorConcept.is_not_weighted_sum(ci):
-                    self.rule_complemented_weighted_sum(ass)
-                elif c_type == ConceptType.W_SUM_ZERO:
-                    self.rule_weighted_sum_zero(ass)
-                elif OperatorConcept.is_not_weighted_sum_zero(ci):
-                    self.rule_complemented_weighted_sum_zero(ass)
-                elif c_type == ConceptType.WEIGHTED:
-                    self.rule_weighted_concept(ass)
-                elif OperatorConcept.is_not_weighted(ci):
-                    self.rule_complemented_weighted_concept(ass)
-                elif c_type == ConceptType.POS_THRESHOLD:
-                    self.rule_positive_threshold(ass)
-                elif OperatorConcept.is_not_pos_threshold(ci):
-                    self.rule_complemented_positive_threshold(ass)
-                elif c_type == ConceptType.NEG_THRESHOLD:
-                    self.rule_negative_threshold(ass)
-                elif OperatorConcept.is_not_neg_threshold(ci):
-                    self.rule_complemented_negative_threshold(ass)
-                elif c_type == ConceptType.EXT_POS_THRESHOLD:
-                    self.rule_extended_positive_threshold(ass)
-                elif OperatorConcept.is_not_ext_pos_threshold(ci):
-                    self.rule_complemented_extended_positive_threshold(ass)
-                elif c_type == ConceptType.EXT_NEG_THRESHOLD:
-                    self.rule_extended_negative_threshold(ass)
-                elif OperatorConcept.is_not_ext_neg_threshold(ci):
-                    self.rule_complemented_extended_negative_threshold(ass)
-                elif c_type == ConceptType.OWA:
-                    self.rule_owa(ass)
-                elif OperatorConcept.is_not_owa(ci):
-                    self.rule_complemented_owa(ass)
-                elif c_type == ConceptType.QUANTIFIED_OWA:
-                    self.rule_quantified_owa(ass)
-                elif OperatorConcept.is_not_qowa(ci):
-                    self.rule_complemented_quantified_owa(ass)
-                elif c_type == ConceptType.CHOQUET_INTEGRAL:
-                    self.rule_choquet(ass)
-                elif OperatorConcept.is_not_choquet(ci):
-                    self.rule_complemented_choquet(ass)
-                elif c_type == ConceptType.SUGENO_INTEGRAL:
-                    self.rule_sugeno(ass)
-                elif OperatorConcept.is_not_sugeno(ci):
-                    self.rule_complemented_sugeno(ass)
-                elif c_type == ConceptType.QUASI_SUGENO_INTEGRAL:
-                    self.rule_quasi_sugeno(ass)
-                elif OperatorConcept.is_not_quasi_sugeno(ci):
-                    self.rule_complemented_quasi_sugeno(ass)
-                elif c_type == ConceptType.W_MIN:
-                    self.rule_weighted_min(ass)
-                elif OperatorConcept.is_not_weighted_min(ci):
-                    self.rule_complemented_weighted_min(ass)
-                elif c_type == ConceptType.W_MAX:
-                    self.rule_weighted_max(ass)
-                elif OperatorConcept.is_not_weighted_max(ci):
-                    self.rule_complemented_weighted_max(ass)
-                elif c_type == ConceptType.SIGMA_CONCEPT:
-                    self.rule_sigma_concept(ass)
-                elif OperatorConcept.is_not_sigma_concept(ci):
-                    self.rule_complemented_sigma_concept(ass)
-                else:
+                handler: typing.Optional[typing.Callable[[Assertion], None]] = (
+                    self.rule_handlers.get(KnowledgeBase.get_rule_key(ci))
+                )
+                if handler is None:
                     Util.warning(f"Warning: Assertion with type {c_type}")
+                else:
+                    start: float = time.perf_counter()
+                    handler(ass)
+                    handler_name: str = handler.__name__
+                    self.rule_handler_time[handler_name] = (
+                        self.rule_handler_time.get(handler_name, 0.0)
+                        + time.perf_counter()
+                        - start
+                    )
+                    self.rule_handler_calls[handler_name] = (
+                        self.rule_handler_calls.get(handler_name, 0) + 1
+                    )
 
                 # For each node in labelsWithNodes, apply AssNom rule
                 nodes: set[str] = self.labels_with_nodes.get(str(ind))
@@ -5726,7 +5807,7 @@ class KnowledgeBase:
 
                 self.mark_process_assertion(ass)
                 ind.add_concept(ci)
-                if ConfigReader.DEBUG_PRINT:
+                if debug:
                     Util.debug(
                         f"{constants.SEPARATOR}Assertion completed{constants.SEPARATOR}"
                     )
@@ -6629,7 +6710,10 @@ class KnowledgeBase:
 
         x_c: Variable = self.milp.get_variable(ind)
         x_ass: Variable = self.milp.get_variable(ind, concept)
-        self.__add_crisp_concrete_concept_equations(concept, x_c, x_ass)
+        if not self.__add_fixed_concrete_concept_equation(
+            ind, concept, x_ass, ()
+        ):
+            self.__add_crisp_concrete_concept_equations(concept, x_c, x_ass)
 
     def __add_crisp_concrete_concept_equations(
         self, concept: CrispConcreteConcept, x_c: Variable, x_ass: Variable
@@ -6757,7 +6841,15 @@ class KnowledgeBase:
 
         x_c: Variable = self.milp.get_variable(ind)
         x_ass: Variable = self.milp.get_variable(ind, concept)
-        self.__add_left_concrete_concept_equations(concept, x_c, x_ass)
+        if not self.__add_fixed_concrete_concept_equation(
+            ind, concept, x_ass, (concept.a, concept.b)
+        ) and not self.__add_piecewise_linear_equation(
+            x_c,
+            x_ass,
+            [concept.k1, concept.a, concept.b, concept.k2],
+            [1.0, 1.0, 0.0, 0.0],
+        ):
+            self.__add_left_concrete_concept_equations(concept, x_c, x_ass)
 
     def __add_left_concrete_concept_equations(
         self, concept: LeftConcreteConcept, x_c: Variable, x_ass: Variable
@@ -6877,7 +6969,13 @@ class KnowledgeBase:
 
         x_A_is_C: Variable = self.milp.get_variable(ind)
         x_ass: Variable = self.milp.get_variable(ind, concept)
-        self.__add_linear_concrete_concept_equations(concept, x_A_is_C, x_ass)
+        if not self.__add_piecewise_linear_equation(
+            x_A_is_C,
+            x_ass,
+            [concept.k1, concept.a, concept.k2],
+            [0.0, concept.b, 1.0],
+        ):
+            self.__add_linear_concrete_concept_equations(concept, x_A_is_C, x_ass)
 
     def __add_linear_concrete_concept_equations(
         self, concept: LinearConcreteConcept, x_A_is_C: Variable, x_ass: Variable
@@ -6973,7 +7071,15 @@ class KnowledgeBase:
 
         x_c: Variable = self.milp.get_variable(ind)
         x_ass: Variable = self.milp.get_variable(ind, concept)
-        self.__add_right_concrete_concept_equations(concept, x_c, x_ass)
+        if not self.__add_fixed_concrete_concept_equation(
+            ind, concept, x_ass, (concept.a, concept.b)
+        ) and not self.__add_piecewise_linear_equation(
+            x_c,
+            x_ass,
+            [concept.k1, concept.a, concept.b, concept.k2],
+            [0.0, 0.0, 1.0, 1.0],
+        ):
+            self.__add_right_concrete_concept_equations(concept, x_c, x_ass)
 
     def __add_right_concrete_concept_equations(
         self, concept: RightConcreteConcept, x_c: Variable, x_ass: Variable
@@ -7095,7 +7201,15 @@ class KnowledgeBase:
 
         x_c: Variable = self.milp.get_variable(ind)
         x_ass: Variable = self.milp.get_variable(typing.cast(Individual, ind), concept)
-        self.__add_trapezoidal_concrete_concept_equations(concept, x_c, x_ass)
+        if not self.__add_fixed_concrete_concept_equation(
+            ind, concept, x_ass, (concept.a, concept.b, concept.c, concept.d)
+        ) and not self.__add_piecewise_linear_equation(
+            x_c,
+            x_ass,
+            [concept.k1, concept.a, concept.b, concept.c, concept.d, concept.k2],
+            [0.0, 0.0, 1.0, 1.0, 0.0, 0.0],
+        ):
+            self.__add_trapezoidal_concrete_concept_equations(concept, x_c, x_ass)
 
     def __add_trapezoidal_concrete_concept_equations(
         self, concept: TrapezoidalConcreteConcept, x_c: Variable, x_ass: Variable
@@ -7289,7 +7403,15 @@ class KnowledgeBase:
         x_ass: Variable = self.milp.get_variable(
             typing.cast(Individual, individual), concept
         )
-        self.__add_triangular_concrete_concept_equations(concept, x_c, x_ass)
+        if not self.__add_fixed_concrete_concept_equation(
+            individual, concept, x_ass, (concept.a, concept.b, concept.c)
+        ) and not self.__add_piecewise_linear_equation(
+            x_c,
+            x_ass,
+            [concept.k1, concept.a, concept.b, concept.c, concept.k2],
+            [0.0, 0.0, 1.0, 0.0, 0.0],
+        ):
+            self.__add_triangular_concrete_concept_equations(concept, x_c, x_ass)
 
     def __add_triangular_concrete_concept_equations(
         self, concept: TriangularConcreteConcept, x_c: Variable, x_ass: Variable
@@ -7494,6 +7616,10 @@ class KnowledgeBase:
             )
             x_A_is_mod_C: Variable = self.milp.get_variable(ind, modified)
 
+        if self.__add_piecewise_linear_equation(
+            x_A_is_C, x_A_is_mod_C, [0.0, modifier.a, 1.0], [0.0, modifier.b, 1.0]
+        ):
+            return
         # binary partition y (x_AisC <= a vs x_AisC >= a)
         y: Variable = self.milp.get_new_variable(VariableType.BINARY)
         # If y = 0, x_AisC <= a, x_AisC = a/b x_AisModC
@@ -7591,6 +7717,13 @@ class KnowledgeBase:
             self.add_assertion(individual, concept, DegreeVariable.get_degree(x_A_is_C))
             x_A_is_mod_C: Variable = self.milp.get_variable(individual, modified)
 
+        if self.__add_piecewise_linear_equation(
+            x_A_is_C,
+            x_A_is_mod_C,
+            [0.0, modifier.a, modifier.b, modifier.c, 1.0],
+            [0.0, 0.0, 1.0, 0.0, 0.0],
+        ):
+            return
         # binary region indicator y1 (x_AisC <= a, x_AisModC = 0)
         y1: Variable = self.milp.get_new_variable(VariableType.BINARY)
         # binary region indicator y2 (a <= x_AisC <= b, linear rising)
@@ -7706,6 +7839,145 @@ class KnowledgeBase:
             InequalityType.GREATER_THAN,
         )
 
+    def add_positive_datatype_restriction(self, ass: Assertion) -> None:
+        """
+        Stores an assertion representing a positive datatype restriction, namely an at-most, at-least or exact value restriction, in the list of positive concrete value assertions. These assertions are not expanded immediately: they are processed together by `solve_concrete_value_assertions` once all the other assertions have been solved. The literal value of an exact value assertion is recorded right away, so that the fuzzy concrete concepts of the filler solved in the meantime can already be evaluated on it.
+
+        :param ass: The assertion representing the positive datatype restriction.
+        :type ass: Assertion
+        """
+
+        self.positive_concrete_value_assertions.append(ass)
+        if ass.get_type() == ConceptType.EXACT_VALUE:
+            self.add_fixed_concrete_value(ass)
+
+    def add_fixed_concrete_value(self, ass: Assertion) -> None:
+        """
+        Records the literal value of a concrete feature of a named individual asserted by an exact value assertion, e.g. `(instance a (= hasAge 37))`. Once the assertion is processed by the datatype reasoner, the value variable of the filler is equal to the literal whenever the assertion has a positive degree, since the binary variable of the feature is then forced to 1. The value is therefore only recorded for assertions with a positive numeric lower degree on individuals that cannot be blocked, whose datatype assertions are always processed, and for numeric values of integer or real features. If different values are asserted for the same individual and feature, the value is marked as unknown.
+
+        :param ass: The exact value assertion.
+        :type ass: Assertion
+        """
+
+        a: Individual = ass.get_individual()
+        c: Concept = ass.get_concept()
+        assert isinstance(c, HasValueInterface)
+
+        deg: Degree = ass.get_lower_limit()
+        n: typing.Any = c.value
+        if (
+            a.is_blockable()
+            or not deg.is_numeric()
+            or typing.cast(DegreeNumeric, deg).get_numerical_value() <= 0.0
+            or isinstance(n, bool)
+            or not isinstance(n, constants.NUMBER)
+        ):
+            return
+        t: typing.Optional[ConcreteFeature] = self.concrete_features.get(c.role)
+        if t is None or t.get_type() == ConcreteFeatureType.BOOLEAN:
+            return
+        key: tuple[str, str] = (str(a), c.role)
+        if self.fixed_concrete_values.get(key, n) != n:
+            n = None
+        self.fixed_concrete_values[key] = n
+
+    def get_fixed_concrete_value(self, ind: Individual) -> typing.Optional[float]:
+        """
+        Returns the literal value of a concrete individual, namely the filler of a concrete feature of a named individual whose value has been recorded by `add_fixed_concrete_value`. The value is only returned for the filler used by the datatype reasoner, i.e., the first individual related to the named individual through the feature, and when the optimizations are enabled.
+
+        :param ind: The concrete individual.
+        :type ind: Individual
+
+        :return: The literal value of the individual, or None if it is unknown.
+
+        :rtype: typing.Optional[float]
+        """
+
+        if (
+            ConfigReader.OPTIMIZATIONS == 0
+            or not isinstance(ind, CreatedIndividual)
+            or not ind.is_concrete()
+            or ind.get_parent() is None
+        ):
+            return None
+        parent_name: str = ind.get_parent_name()
+        role: str = ind.get_role_name()
+        value: typing.Optional[float] = self.fixed_concrete_values.get(
+            (parent_name, role)
+        )
+        if value is None:
+            return None
+        parent: typing.Optional[Individual] = self.individuals.get(parent_name)
+        if parent is None:
+            return None
+        rels: list[Relation] = parent.role_relations.get(role, [])
+        if len(rels) == 0 or str(rels[0].get_object_individual()) != str(ind):
+            return None
+        return value
+
+    def __add_fixed_concrete_concept_equation(
+        self,
+        ind: Individual,
+        concept: FuzzyConcreteConcept,
+        x_ass: Variable,
+        breakpoints: tuple[float, ...],
+    ) -> bool:
+        """
+        Constant-folds the membership of a concrete individual with a literal value to a fuzzy concrete concept: the variable of the assertion is fixed to the membership degree of the value, computed by `get_membership_degree`, instead of encoding the membership function with binary region variables and big-M constraints. Nothing is added if the value of the individual is unknown, lies outside the definition interval of the concept or lies on a vertical edge of a piecewise linear membership function, i.e., on two equal breakpoints, where the full encoding leaves the degree free between both sides of the edge. In these cases the caller falls back to the full encoding.
+
+        :param ind: The concrete individual.
+        :type ind: Individual
+        :param concept: The fuzzy concrete concept.
+        :type concept: FuzzyConcreteConcept
+        :param x_ass: The variable of the assertion of the concept to the individual.
+        :type x_ass: Variable
+        :param breakpoints: The ordered breakpoints of the piecewise linear membership function of the concept, empty for crisp concepts.
+        :type breakpoints: tuple[float, ...]
+
+        :return: True if the membership degree has been fixed, False otherwise.
+
+        :rtype: bool
+        """
+
+        value: typing.Optional[float] = self.get_fixed_concrete_value(ind)
+        if value is None or not concept.k1 <= value <= concept.k2:
+            return False
+        if sum(1 for p in breakpoints if p == value) > 1:
+            return False
+        degree: float = concept.get_membership_degree(value)
+        if ConfigReader.DEBUG_PRINT:
+            Util.debug(f"{ind} has value {value}: {concept} = {degree}")
+        # xAss = mu_C(value)
+        self.milp.add_new_constraint(
+            Expression(Term(1.0, x_ass)), InequalityType.EQUAL, degree
+        )
+        return True
+
+    def __add_piecewise_linear_equation(
+        self, x: Variable, y: Variable, x_points: list[float], y_points: list[float]
+    ) -> bool:
+        """
+        Encodes a piecewise linear membership function, given by its breakpoints, as a single piecewise linear constraint of the MILP problem if the `MEMBERSHIP_ENCODING` setting selects the piecewise encoding, instead of the binary region variables and big-M constraints written by the callers. The constraint is handled natively by the providers that support it and lowered into a convex combination of the breakpoints for the other ones, whose linear relaxation is tighter than the one of the big-M encoding. Nothing is added if the big-M encoding is selected, and the caller falls back to it.
+
+        :param x: The variable of the argument of the membership function.
+        :type x: Variable
+        :param y: The variable of the membership degree.
+        :type y: Variable
+        :param x_points: The ordered abscissas of the breakpoints of the function, from the lower to the upper bound of its domain.
+        :type x_points: list[float]
+        :param y_points: The membership degrees at the breakpoints.
+        :type y_points: list[float]
+
+        :return: True if the piecewise linear constraint has been added, False otherwise.
+
+        :rtype: bool
+        """
+
+        if ConfigReader.MEMBERSHIP_ENCODING != MembershipEncoding.PIECEWISE:
+            return False
+        self.milp.add_piecewise_linear_constraint(x, y, x_points, y_points)
+        return True
+
     def add_negated_datatype_restriction(self, ass: Assertion) -> None:
         """
         Processes an assertion representing a negated datatype restriction and applies it to the associated individual within the knowledge base. It validates that the assertion's concept is a complement operator wrapping a concept that defines a role, ensuring the structure matches a logical negation of a datatype property. Upon successful validation, the method extracts the underlying role name and invokes the individual's concrete restriction mechanism to enforce the negation.
@@ -8508,19 +8780,14 @@ class KnowledgeBase:
         self.add_axioms_to_tg()
 
         # 3. Process GCI transformations until no GCI transformation can be applied
+        # The transformations never modify an axiom, they only create new ones in the
+        # tmp dictionaries: each round takes them over as its work list instead of
+        # cloning them, so that every axiom is only processed in the round after the
+        # one that produced it.
         self.axioms_to_do_A_is_a_B = dict()
-        self.axioms_to_do_A_is_a_C = {
-            k: set([c.clone() for c in v]) for k, v in self.axioms_A_is_a_C.items()
-        }
-        self.axioms_to_do_C_is_a_A = {
-            k: set([c.clone() for c in v]) for k, v in self.axioms_C_is_a_A.items()
-        }
-        self.axioms_to_do_C_is_a_D = {
-            k: set([c.clone() for c in v]) for k, v in self.axioms_C_is_a_D.items()
-        }
-        self.axioms_A_is_a_C.clear()
-        self.axioms_C_is_a_A.clear()
-        self.axioms_C_is_a_D.clear()
+        self.axioms_to_do_A_is_a_C, self.axioms_A_is_a_C = self.axioms_A_is_a_C, dict()
+        self.axioms_to_do_C_is_a_A, self.axioms_C_is_a_A = self.axioms_C_is_a_A, dict()
+        self.axioms_to_do_C_is_a_D, self.axioms_C_is_a_D = self.axioms_C_is_a_D, dict()
         self.axioms_to_do_tmp_A_is_a_C = dict()
         self.axioms_to_do_tmp_C_is_a_A = dict()
         self.axioms_to_do_tmp_C_is_a_D = dict()
@@ -8536,21 +8803,12 @@ class KnowledgeBase:
             # Select axiom tau in axioms_C_is_a_D that has not yet been processed
             self.gci_transformations_C_is_a_D()
 
-            self.axioms_to_do_A_is_a_C = {
-                k: set([c.clone() for c in v])
-                for k, v in self.axioms_to_do_tmp_A_is_a_C.items()
-            }
-            self.axioms_to_do_C_is_a_A = {
-                k: set([c.clone() for c in v])
-                for k, v in self.axioms_to_do_tmp_C_is_a_A.items()
-            }
-            self.axioms_to_do_C_is_a_D = {
-                k: set([c.clone() for c in v])
-                for k, v in self.axioms_to_do_tmp_C_is_a_D.items()
-            }
-            self.axioms_to_do_tmp_A_is_a_C.clear()
-            self.axioms_to_do_tmp_C_is_a_A.clear()
-            self.axioms_to_do_tmp_C_is_a_D.clear()
+            self.axioms_to_do_A_is_a_C = self.axioms_to_do_tmp_A_is_a_C
+            self.axioms_to_do_C_is_a_A = self.axioms_to_do_tmp_C_is_a_A
+            self.axioms_to_do_C_is_a_D = self.axioms_to_do_tmp_C_is_a_D
+            self.axioms_to_do_tmp_A_is_a_C = dict()
+            self.axioms_to_do_tmp_C_is_a_A = dict()
+            self.axioms_to_do_tmp_C_is_a_D = dict()
 
         # 4. Process the other absorptions
         # None of them can generate new axioms in the lists axioms_A_is_a_C, axioms_C_is_a_A, axioms_C_is_a_D
@@ -8569,8 +8827,7 @@ class KnowledgeBase:
 
         # Solve TBox
         for ind in self.individuals.values():
-            for gci in self.t_G:
-                self.solve_gci(ind, gci)
+            self.solve_gci(ind)
         self.solve_domain_and_range_axioms()
 
     def is_lazy_unfoldable(self) -> bool:
@@ -8922,7 +9179,7 @@ class KnowledgeBase:
         :type logic: FuzzyLogic
         """
 
-        constants.KNOWLEDGE_BASE_SEMANTICS = logic
+        ReasonerContext.current().semantics = logic
         if ConfigReader.DEBUG_PRINT:
             Util.debug(f"Fuzzy logic: {logic}")
 
@@ -8994,6 +9251,7 @@ class KnowledgeBase:
         :type ass: Assertion
         """
 
+        debug: bool = ConfigReader.DEBUG_PRINT
         ind: Individual = ass.get_individual()
         a: Concept = ass.get_concept()
         a_name: str = str(a)
@@ -9036,10 +9294,10 @@ class KnowledgeBase:
         # 2. A = B (syn)
         syns: set[str] = self.t_synonyms.get(a_name)
         if syns is not None:
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"Lazy unfolding for synonyms: {a_name}")
             for syn in syns:
-                if ConfigReader.DEBUG_PRINT:
+                if debug:
                     Util.debug(f"Synonym with: {syn}")
                 concept: Concept = self.atomic_concepts.get(syn)
                 ind_c: Variable = self.milp.get_variable(ind, concept)
@@ -9062,11 +9320,11 @@ class KnowledgeBase:
         # 4. Disjoint axioms
         disj_concs: set[str] = self.t_disjoints.get(a_name)
         if disj_concs is not None:
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"Lazy unfolding Disjoint axioms: {a_name}")
             hs2: set[str] = self.disjoint_variables.get(a_name, set())
             for name in disj_concs:
-                if ConfigReader.DEBUG_PRINT:
+                if debug:
                     Util.debug(f"Disjoint with: {name}")
                 # Add v : name
                 self.old_binary_variables += 1
@@ -10491,18 +10749,53 @@ class KnowledgeBase:
 
         return c.is_atomic() and self.is_crisp_concept(str(c))
 
-    def optimize(self, e: Expression) -> Solution:
+    def optimize(
+        self, e: Expression, limits: typing.Optional[SolverLimits] = None
+    ) -> Solution:
         """
-        Orchestrates the optimization of a given expression by configuring and invoking the internal Mixed-Integer Linear Programming (MILP) solver. Depending on the active knowledge base semantics, specifically when using Classical logic, the method enforces binary variable constraints before applying internal transformation rules and resolving cardinality constraints for pending tasks. Upon completion, it triggers a side effect of displaying optimization statistics and returns the computed optimal solution.
+        Orchestrates the optimization of a given expression by configuring and invoking the internal Mixed-Integer Linear Programming (MILP) solver. Depending on the active knowledge base semantics, specifically when using Classical logic, the method enforces binary variable constraints before applying internal transformation rules and resolving cardinality constraints for pending tasks. The solver runs with the time limit, MIP gap and cancellation flag of the given limits, which queries use to override the solver settings. Upon completion, it triggers a side effect of displaying optimization statistics and returns the computed optimal solution.
 
         :param e: The expression representing the objective function or target formula to be optimized.
         :type e: Expression
+        :param limits: The limits of the solver, or None to use the settings of `ConfigReader`.
+        :type limits: typing.Optional[SolverLimits]
 
         :return: The optimal solution for the given expression, computed by the underlying MILP solver.
 
         :rtype: Solution
         """
 
+        self.__prepare_optimization()
+        sol: Solution = self.milp.optimize(e, limits)
+        self.show_statistics()
+        return sol
+
+    def optimize_objectives(
+        self,
+        objectives: list[Expression],
+        limits: typing.Optional[SolverLimits] = None,
+    ) -> list[Solution]:
+        """
+        Optimizes several objective expressions over the same MILP model, which is completed only once with the nominal rules and the pending sigma-count tasks, exactly as done by `optimize`. This allows queries that share the whole tableau expansion and differ only in the objective, such as the retrieval of the instances of a concept, to build the model a single time instead of cloning and expanding the knowledge base once per objective. The optimization statistics are displayed once after all the objectives have been solved.
+
+        :param objectives: The expressions to be optimized, one at a time.
+        :type objectives: list[Expression]
+        :param limits: The limits of the solver, applied to every optimization, or None to use the settings of `ConfigReader`.
+        :type limits: typing.Optional[SolverLimits]
+
+        :return: The optimal solution for each expression, in the same order as the input list.
+
+        :rtype: list[Solution]
+        """
+
+        self.__prepare_optimization()
+        solutions: list[Solution] = [self.milp.optimize(e, limits) for e in objectives]
+        self.show_statistics()
+        return solutions
+
+    def __prepare_optimization(self) -> None:
+        """Completes the MILP model before optimizing it: binary variables are enforced under Classical semantics, the nominal rules n2 and n3 are applied and the pending sigma-count tasks are resolved. These steps add constraints and variables to the model, so they must be performed once per model, regardless of how many objectives are optimized."""
+
         if constants.KNOWLEDGE_BASE_SEMANTICS == FuzzyLogic.CLASSICAL:
             self.milp.set_binary_variables()
         self.rule_n2()
@@ -10511,10 +10804,6 @@ class KnowledgeBase:
         # Sigma-count pending tasks
         self.solve_cardinality_list()
 
-        sol: Solution = self.milp.optimize(e)
-        self.show_statistics()
-        return sol
-
     def solve_cardinality_list(self) -> None:
         """Iterates through the list of cardinality constraints defined in the associated MILP model to resolve pending sigma-count tasks. For each constraint in the collection, the method extracts the relevant variables, individuals, roles, and concepts, and delegates the actual resolution logic to the internal `__solve_cardinality` helper. This process modifies the internal state of the model or knowledge base to satisfy the cardinality constraints, and performs no operation if the list of cardinalities is empty."""
 
@@ -10639,6 +10928,15 @@ class KnowledgeBase:
         for rule, count in self.rules_applied.items():
             if count != 0:
                 Util.debug(f"\t\tRule {rule}: {count}")
+        Util.debug("Rule handlers:")
+        for handler_name, count in sorted(
+            self.rule_handler_calls.items(),
+            key=lambda item: self.rule_handler_time.get(item[0], 0.0),
+            reverse=True,
+        ):
+            Util.debug(
+                f"\t\t{handler_name}: {count} ({self.rule_handler_time.get(handler_name, 0.0):.6f} s)"
+            )
         Util.debug("Old calculus:")
         Util.debug(
             f"\t\t{{0,1}} binary variables (old calculus): {self.old_binary_variables}"
@@ -10728,23 +11026,446 @@ class KnowledgeBase:
 
     def is_classified(self) -> bool:
         """
-        Determines whether the knowledge base has been subjected to a classification process, verifying if its entries have been categorized or labeled. It returns a boolean flag indicating the current state, which can be used to ensure that operations requiring a classified structure are only performed after the necessary processing has occurred.
+        Determines whether the knowledge base has been subjected to a classification process, verifying if the hierarchy of its atomic concepts has been computed. It returns a boolean flag indicating the current state, which can be used to ensure that operations requiring a classified structure, such as answering subsumption queries between atomic concepts through lookups, are only performed after the necessary processing has occurred.
 
         :return: True if the knowledge base has already been classified, False otherwise.
 
         :rtype: bool
         """
 
-        return False
+        return self.CLASSIFIED
 
     def classify(self) -> None:
-        """Analyzes the items within the knowledge base to assign them to specific categories or classes based on their inherent properties. This operation is intended to modify the internal state of the knowledge base by updating metadata or tags associated with the stored entities, which can improve organization and retrieval efficiency. Note that this method is currently a stub and does not perform any actual processing or state changes."""
+        """Computes the subsumption hierarchy of the atomic concepts of the knowledge base and keeps it in memory, so that subsequent subsumption queries between atomic concepts become lookups. Concepts are inserted one at a time, in an order compatible with their told subsumers, using the enhanced traversal algorithm: a top search descends from the top concept to find the most specific subsumers of the new concept, and a bottom search ascends from the bottom concept to find its most general subsumees, testing a node only if all its parents (respectively children) passed the test. Told subsumers obtained from the atomic inclusions with degree 1 (`axioms_A_is_a_B` and `t_inclusions`) and from synonyms are accepted without solving any MILP problem, while the remaining tests compute the fuzzy subsumption degree once and store it in `subsumption_flags`. Unsatisfiable concepts are merged with the bottom concept and equivalent concepts share the same node. Calling the method again on a classified knowledge base has no effect, and an `InconsistentOntologyException` is raised if the ontology turns out to be inconsistent."""
+
+        if self.is_classified():
+            return
+
+        told_subsumers: dict[str, set[str]] = self.__get_told_subsumers()
+        top: ClassificationNode = ClassificationNode(str(TruthConcept.get_top()))
+        bottom: ClassificationNode = ClassificationNode(str(TruthConcept.get_bottom()))
+        top.add_input_edge(bottom, 1.0)
+        bottom.add_ouput_edge(top, 1.0)
+        self.nodes_classification = [top, bottom]
+        self.classification_index = {str(top): top, str(bottom): bottom}
+        self.classification_descendants = dict()
+
+        # Inserting told subsumers first keeps the bottom search short
+        names: list[str] = sorted(
+            self.atomic_concepts, key=lambda a: (len(told_subsumers.get(a, [])), a)
+        )
+        for name in names:
+            self.__classify_concept(name, told_subsumers)
+
+        self.CLASSIFIED = True
+        if ConfigReader.DEBUG_PRINT:
+            Util.debug(f"{constants.STAR_SEPARATOR}Classification{constants.STAR_SEPARATOR}")
+            for node in self.nodes_classification:
+                for parent in node.get_immediate_predecessors():
+                    Util.debug(f"\t\t{node.get_full_name()} isA {parent.get_full_name()}")
 
-        pass
+    def __get_told_subsumers(self) -> dict[str, set[str]]:
+        """
+        Collects, for every atomic concept, the transitive closure of its told subsumers, namely the atomic concepts that subsume it with degree 1 according to the atomic inclusions stored in `axioms_A_is_a_B` and `t_inclusions` and to the synonyms in `t_synonyms`. These subsumptions hold under every implication used for classification, so they can be accepted without solving any MILP problem.
+
+        :return: A dictionary mapping the name of each atomic concept with at least one told subsumer to the set of names of all its told subsumers.
 
-    def get_classification_node(name: str) -> typing.Optional[ClassificationNode]:
+        :rtype: dict[str, set[str]]
         """
-        Retrieves a specific classification node from the knowledge base by matching the provided name against existing node identifiers. It performs a lookup operation to locate the node associated with the given string, returning the corresponding ClassificationNode object if a match is found. If no node with the specified name exists within the knowledge base, the method returns None. This operation is read-only and does not modify the underlying data structure.
+
+        told: dict[str, set[str]] = dict()
+        for axioms in (self.axioms_A_is_a_B, self.t_inclusions):
+            for a, pcds in axioms.items():
+                for pcd in pcds:
+                    if pcd.get_degree() == 1.0 and pcd.get_definition().is_atomic():
+                        told.setdefault(a, set()).add(str(pcd.get_definition()))
+        for a, synonyms in self.t_synonyms.items():
+            told.setdefault(a, set()).update(synonyms)
+
+        closure: dict[str, set[str]] = dict()
+        for a in told:
+            visited: set[str] = set()
+            queue: deque[str] = deque(told[a])
+            while queue:
+                b: str = queue.popleft()
+                if b in visited or b == a:
+                    continue
+                visited.add(b)
+                queue.extend(told.get(b, []))
+            closure[a] = visited
+        return closure
+
+    def __classify_concept(self, name: str, told_subsumers: dict[str, set[str]]) -> None:
+        """
+        Inserts an atomic concept into the classification hierarchy computed so far. The concept is merged with the bottom node if it is unsatisfiable; otherwise, its most specific subsumers are computed with a top search and, if one of them is also subsumed by the concept, the concept is added as an equivalent name of that node. In the remaining cases a new node is created, its most general subsumees are computed with a bottom search restricted to the nodes below all its subsumers, and the edges of the hierarchy are updated accordingly.
+
+        :param name: The name of the atomic concept to be classified.
+        :type name: str
+        :param told_subsumers: The told subsumers of every atomic concept, as computed by `__get_told_subsumers`.
+        :type told_subsumers: dict[str, set[str]]
+        """
+
+        bottom: ClassificationNode = self.classification_index[
+            str(TruthConcept.get_bottom())
+        ]
+        if self.__is_subsumed(name, str(bottom), told_subsumers):
+            bottom.add_label(name)
+            self.classification_index[name] = bottom
+            return
+
+        top: ClassificationNode = self.classification_index[str(TruthConcept.get_top())]
+        parents: set[ClassificationNode] = self.__top_search(
+            name, top, dict(), told_subsumers
+        )
+        for parent in parents:
+            if not parent.is_thing() and self.__is_subsumed(
+                str(parent), name, told_subsumers
+            ):
+                parent.add_label(name)
+                self.classification_index[name] = parent
+                return
+
+        # A subsumee of the concept must be below all its subsumers
+        candidates: typing.Optional[set[ClassificationNode]] = None
+        for parent in parents:
+            below: set[ClassificationNode] = self.__get_descendants(parent)
+            candidates = below if candidates is None else candidates & below
+        children: set[ClassificationNode] = self.__bottom_search(
+            name, bottom, dict(), candidates, told_subsumers
+        )
+
+        node: ClassificationNode = ClassificationNode(name)
+        for parent in parents:
+            for child in children:
+                parent.remove_input_edge(child, 1.0)
+                child.remove_ouput_edge(parent, 1.0)
+            parent.add_input_edge(node, 1.0)
+            node.add_ouput_edge(parent, 1.0)
+        for child in children:
+            child.add_ouput_edge(node, 1.0)
+            node.add_input_edge(child, 1.0)
+        self.nodes_classification.append(node)
+        self.classification_index[name] = node
+
+    def __top_search(
+        self,
+        name: str,
+        node: ClassificationNode,
+        visited: dict[ClassificationNode, bool],
+        told_subsumers: dict[str, set[str]],
+    ) -> set[ClassificationNode]:
+        """
+        Top search phase of the enhanced traversal algorithm. Given a node known to subsume the concept, it looks for the children of the node that also subsume it and recursively descends through them; the node is returned as a most specific subsumer if none of its children subsumes the concept.
+
+        :param name: The name of the atomic concept being classified.
+        :type name: str
+        :param node: A node of the hierarchy known to subsume the concept.
+        :type node: ClassificationNode
+        :param visited: Cache with the result of the subsumption tests already performed during the current search.
+        :type visited: dict[ClassificationNode, bool]
+        :param told_subsumers: The told subsumers of every atomic concept.
+        :type told_subsumers: dict[str, set[str]]
+
+        :return: The set of most specific subsumers of the concept found below the given node.
+
+        :rtype: set[ClassificationNode]
+        """
+
+        positive: list[ClassificationNode] = [
+            child
+            for child in node.get_immediate_successors()
+            if not child.is_nothing()
+            and self.__enhanced_top_subs(name, child, visited, told_subsumers)
+        ]
+        if len(positive) == 0:
+            return {node}
+        result: set[ClassificationNode] = set()
+        for child in positive:
+            result.update(self.__top_search(name, child, visited, told_subsumers))
+        return result
+
+    def __enhanced_top_subs(
+        self,
+        name: str,
+        node: ClassificationNode,
+        visited: dict[ClassificationNode, bool],
+        told_subsumers: dict[str, set[str]],
+    ) -> bool:
+        """
+        Checks whether a node subsumes the concept being classified, performing the actual subsumption test only if all the parents of the node subsume the concept too. The result is cached in the visited dictionary so that each node is tested at most once per search.
+
+        :param name: The name of the atomic concept being classified.
+        :type name: str
+        :param node: The node to be tested.
+        :type node: ClassificationNode
+        :param visited: Cache with the result of the subsumption tests already performed during the current search.
+        :type visited: dict[ClassificationNode, bool]
+        :param told_subsumers: The told subsumers of every atomic concept.
+        :type told_subsumers: dict[str, set[str]]
+
+        :return: True if the node subsumes the concept, False otherwise.
+
+        :rtype: bool
+        """
+
+        result: typing.Optional[bool] = visited.get(node)
+        if result is None:
+            result = all(
+                parent.is_thing()
+                or self.__enhanced_top_subs(name, parent, visited, told_subsumers)
+                for parent in node.get_immediate_predecessors()
+            ) and self.__is_subsumed(name, str(node), told_subsumers)
+            visited[node] = result
+        return result
+
+    def __bottom_search(
+        self,
+        name: str,
+        node: ClassificationNode,
+        visited: dict[ClassificationNode, bool],
+        candidates: typing.Optional[set[ClassificationNode]],
+        told_subsumers: dict[str, set[str]],
+    ) -> set[ClassificationNode]:
+        """
+        Bottom search phase of the enhanced traversal algorithm, dual to `__top_search`. Given a node known to be subsumed by the concept, it looks for the parents of the node that are subsumed by the concept as well and recursively ascends through them; the node is returned as a most general subsumee if none of its parents is subsumed by the concept.
+
+        :param name: The name of the atomic concept being classified.
+        :type name: str
+        :param node: A node of the hierarchy known to be subsumed by the concept.
+        :type node: ClassificationNode
+        :param visited: Cache with the result of the subsumption tests already performed during the current search.
+        :type visited: dict[ClassificationNode, bool]
+        :param candidates: The nodes below all the subsumers of the concept, the only ones that can be subsumed by it, or None if there is no restriction.
+        :type candidates: typing.Optional[set[ClassificationNode]]
+        :param told_subsumers: The told subsumers of every atomic concept.
+        :type told_subsumers: dict[str, set[str]]
+
+        :return: The set of most general subsumees of the concept found above the given node.
+
+        :rtype: set[ClassificationNode]
+        """
+
+        positive: list[ClassificationNode] = [
+            parent
+            for parent in node.get_immediate_predecessors()
+            if not parent.is_thing()
+            and self.__enhanced_bottom_subs(
+                name, parent, visited, candidates, told_subsumers
+            )
+        ]
+        if len(positive) == 0:
+            return {node}
+        result: set[ClassificationNode] = set()
+        for parent in positive:
+            result.update(
+                self.__bottom_search(name, parent, visited, candidates, told_subsumers)
+            )
+        return result
+
+    def __enhanced_bottom_subs(
+        self,
+        name: str,
+        node: ClassificationNode,
+        visited: dict[ClassificationNode, bool],
+        candidates: typing.Optional[set[ClassificationNode]],
+        told_subsumers: dict[str, set[str]],
+    ) -> bool:
+        """
+        Checks whether a node is subsumed by the concept being classified, performing the actual subsumption test only if the node is a candidate and all its children are subsumed by the concept too. The result is cached in the visited dictionary so that each node is tested at most once per search.
+
+        :param name: The name of the atomic concept being classified.
+        :type name: str
+        :param node: The node to be tested.
+        :type node: ClassificationNode
+        :param visited: Cache with the result of the subsumption tests already performed during the current search.
+        :type visited: dict[ClassificationNode, bool]
+        :param candidates: The nodes below all the subsumers of the concept, or None if there is no restriction.
+        :type candidates: typing.Optional[set[ClassificationNode]]
+        :param told_subsumers: The told subsumers of every atomic concept.
+        :type told_subsumers: dict[str, set[str]]
+
+        :return: True if the node is subsumed by the concept, False otherwise.
+
+        :rtype: bool
+        """
+
+        result: typing.Optional[bool] = visited.get(node)
+        if result is None:
+            result = (
+                (candidates is None or node in candidates)
+                and all(
+                    child.is_nothing()
+                    or self.__enhanced_bottom_subs(
+                        name, child, visited, candidates, told_subsumers
+                    )
+                    for child in node.get_immediate_successors()
+                )
+                and self.__is_subsumed(str(node), name, told_subsumers)
+            )
+            visited[node] = result
+        return result
+
+    def __get_descendants(self, node: ClassificationNode) -> set[ClassificationNode]:
+        """
+        Computes the set of nodes strictly below the given node in the classification hierarchy by traversing the input edges.
+
+        :param node: The node whose descendants are computed.
+        :type node: ClassificationNode
+
+        :return: The set of nodes subsumed by the given node, excluding the node itself.
+
+        :rtype: set[ClassificationNode]
+        """
+
+        descendants: set[ClassificationNode] = set()
+        queue: deque[ClassificationNode] = deque(node.get_immediate_successors())
+        while queue:
+            current: ClassificationNode = queue.popleft()
+            if current in descendants:
+                continue
+            descendants.add(current)
+            queue.extend(current.get_immediate_successors())
+        return descendants
+
+    def __get_classified_descendants(
+        self, node: ClassificationNode
+    ) -> set[ClassificationNode]:
+        """
+        Returns the set of nodes strictly below the given node in the computed hierarchy, which must not change anymore. The sets are cached in `classification_descendants` and built bottom-up from the cached sets of the children, so every node of the hierarchy is traversed at most once over all the queries.
+
+        :param node: The node whose descendants are returned.
+        :type node: ClassificationNode
+
+        :return: The set of nodes subsumed by the given node, excluding the node itself.
+
+        :rtype: set[ClassificationNode]
+        """
+
+        cache: dict[ClassificationNode, set[ClassificationNode]] = (
+            self.classification_descendants
+        )
+        stack: list[ClassificationNode] = [node]
+        while stack:
+            current: ClassificationNode = stack[-1]
+            if current in cache:
+                stack.pop()
+                continue
+            children: set[ClassificationNode] = current.get_immediate_successors()
+            pending: list[ClassificationNode] = [c for c in children if c not in cache]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            descendants: set[ClassificationNode] = set(children)
+            for child in children:
+                descendants.update(cache[child])
+            cache[current] = descendants
+        return cache[node]
+
+    def __is_subsumed(
+        self, sub: str, sup: str, told_subsumers: dict[str, set[str]]
+    ) -> bool:
+        """
+        Crisp subsumption test used by the classification algorithm. Trivial cases and told subsumers are answered directly, storing a degree of 1 in `subsumption_flags`; otherwise the fuzzy subsumption degree is computed (or retrieved from the cache) and the subsumption is considered to hold if the degree is 1.
+
+        :param sub: The name of the subsumed concept.
+        :type sub: str
+        :param sup: The name of the subsuming concept.
+        :type sup: str
+        :param told_subsumers: The told subsumers of every atomic concept.
+        :type told_subsumers: dict[str, set[str]]
+
+        :return: True if the first concept is subsumed by the second one with degree 1, False otherwise.
+
+        :rtype: bool
+        """
+
+        if sup in told_subsumers.get(sub, []):
+            self.subsumption_flags.setdefault(sub, dict())[sup] = 1.0
+            return True
+        return self.__compute_subsumption_degree(sub, sup) >= 1.0 - ConfigReader.EPSILON
+
+    def __compute_subsumption_degree(self, sub: str, sup: str) -> float:
+        """
+        Returns the degree to which the atomic concept `sub` is subsumed by the atomic concept `sup`, using the implication returned by `get_subsumption_implication`. The degree is looked up in `subsumption_flags` and, if it has not been computed yet, it is obtained by solving a `MinSubsumesQuery` on the knowledge base and stored in the cache, so that every pair of concepts requires at most one MILP problem. An `InconsistentOntologyException` is raised if the ontology is inconsistent.
+
+        :param sub: The name of the subsumed concept.
+        :type sub: str
+        :param sup: The name of the subsuming concept.
+        :type sup: str
+
+        :return: The subsumption degree, a value in [0, 1].
+
+        :rtype: float
+        """
+
+        from fuzzy_dl_owl2.fuzzydl.query.min.min_subsumes_query import (
+            MinSubsumesQuery,
+        )
+
+        flags: dict[str, float] = self.subsumption_flags.setdefault(sub, dict())
+        degree: typing.Optional[float] = flags.get(sup)
+        if degree is not None:
+            return degree
+        if (
+            sub == sup
+            or sup == str(TruthConcept.get_top())
+            or sub == str(TruthConcept.get_bottom())
+        ):
+            flags[sup] = 1.0
+            return 1.0
+
+        c_sub: Concept = self.__get_classification_concept(sub)
+        c_sup: Concept = self.__get_classification_concept(sup)
+        # The query must not answer using the hierarchy being computed
+        classified: bool = self.CLASSIFIED
+        self.CLASSIFIED = False
+        try:
+            sol: Solution = MinSubsumesQuery(
+                c_sup, c_sub, self.get_subsumption_implication()
+            ).solve(self)
+        finally:
+            self.CLASSIFIED = classified
+        if not sol.is_consistent_kb():
+            raise InconsistentOntologyException("Inconsistent ontology")
+        degree = float(sol.get_solution())
+        flags[sup] = degree
+        return degree
+
+    def __get_classification_concept(self, name: str) -> Concept:
+        """
+        Maps a concept name used in the classification hierarchy to the corresponding concept, handling the names of the top and bottom concepts.
+
+        :param name: The name of the concept.
+        :type name: str
+
+        :return: The concept with the given name.
+
+        :rtype: Concept
+        """
+
+        if name == str(TruthConcept.get_top()):
+            return TruthConcept.get_top()
+        if name == str(TruthConcept.get_bottom()):
+            return TruthConcept.get_bottom()
+        return self.get_concept(name)
+
+    def get_subsumption_implication(self) -> LogicOperatorType:
+        """
+        Returns the fuzzy implication used to compute the subsumption degrees stored in the classification, which is the same one used by default by the subsumption queries: Łukasiewicz implication under Łukasiewicz semantics and Zadeh implication otherwise.
+
+        :return: The logic operator type of the implication used by the classification.
+
+        :rtype: LogicOperatorType
+        """
+
+        if self.get_logic() == FuzzyLogic.LUKASIEWICZ:
+            return LogicOperatorType.LUKASIEWICZ
+        return LogicOperatorType.ZADEH
+
+    def get_classification_node(self, name: str) -> typing.Optional[ClassificationNode]:
+        """
+        Retrieves a specific classification node from the knowledge base by matching the provided name against the names of the nodes of the computed hierarchy, including equivalent names. It performs a dictionary lookup to locate the node associated with the given string, returning the corresponding ClassificationNode object if a match is found. If no node with the specified name exists, for instance because the knowledge base has not been classified, the method returns None. This operation is read-only and does not modify the underlying data structure.
 
         :param name: The name of the classification node to retrieve.
         :type name: str
@@ -10754,23 +11475,30 @@ class KnowledgeBase:
         :rtype: typing.Optional[ClassificationNode]
         """
 
-        return None
+        return self.classification_index.get(name)
 
-    def get_subsumption_flags(a: ClassificationNode, b: ClassificationNode) -> float:
+    def get_subsumption_flags(self, a: ClassificationNode, b: ClassificationNode) -> float:
         """
-        Retrieves the numerical value representing the subsumption flags associated with the relationship between two classification nodes. This method evaluates the structural or logical connection between the first node and the second node, returning a float that encodes specific properties or a confidence score regarding the subsumption hierarchy. The result is typically used to inform classification decisions or to query the state of the relationship within the knowledge base.
+        Retrieves the degree to which the concept of the second classification node is subsumed by the concept of the first one, that is, the answer of a minimum subsumption query stating that the first node subsumes the second one. If one node is a subsumer of the other in the computed hierarchy, the degree is 1 and is answered by looking up the descendants of the first node, which are computed once and cached in `classification_descendants`; otherwise the degree cached in `subsumption_flags` during classification is returned, and degrees that were never needed by the classification algorithm are computed once and then cached.
 
-        :param a: The first classification node involved in the subsumption flags calculation.
+        :param a: The classification node representing the subsuming concept.
         :type a: ClassificationNode
-        :param b: The classification node to compare against the first node to determine subsumption properties.
+        :param b: The classification node representing the subsumed concept.
         :type b: ClassificationNode
 
-        :return: The subsumption flags value representing the relationship between the two classification nodes.
+        :return: The subsumption degree of the concept of `b` by the concept of `a`.
 
         :rtype: float
         """
 
-        return 0.0
+        if (
+            a is b
+            or a.is_thing()
+            or b.is_nothing()
+            or b in self.__get_classified_descendants(a)
+        ):
+            return 1.0
+        return self.__compute_subsumption_degree(str(b), str(a))
 
     def get_number_from_concept(self, concept_name: str) -> int:
         """
@@ -10906,8 +11634,7 @@ class KnowledgeBase:
                     )
                 )
         for ind in self.individuals.values():
-            for gci in self.t_G:
-                self.solve_gci(ind, gci)
+            self.solve_gci(ind)
         self.solve_domain_and_range_axioms()
 
     def print_tbox(self) -> None:
@@ -12701,6 +13428,8 @@ class ZadehSolver:
                                               && \text{(Gödel negation)}
         \end{aligned}
 
+    When the MILP provider supports minima, maxima or indicator constraints natively (see `MILPHelper.supports`), these operators are added to the problem as general constraints instead of their big-M linearisations.
+
     :raises ValueError: Raised when the arguments provided to the overloaded equation methods (such as `and_equation`, `and_geq_equation`, or `zadeh_implies_equation`) do not match the expected type signatures for any supported operation.
     """
 
@@ -12766,7 +13495,7 @@ class ZadehSolver:
         * ``and_equation(x_1, x_2, milp)``          → crisp disjointness
           $x_1 + x_2 \le 1$ (two-variable Zadeh AND for disjointness)
 
-        Every minimum is reified via Big-M linearisations.
+        Every minimum is reified via Big-M linearisations, unless the MILP provider supports minima natively, in which case it becomes a general constraint of the problem.
 
         :param args: Operands for the AND operation and the MILP solver helper, provided as a variable-length list. Valid configurations include three arguments (a list of variables, a variable or term, and a helper) or four arguments (two variables, a variable or number, and a helper).
         :type args: typing.Any
@@ -12804,7 +13533,7 @@ class ZadehSolver:
     @staticmethod
     def __and_equation_1(x: list[Variable], z: Variable, milp: MILPHelper) -> None:
         r"""
-        Encodes the logical constraint $z = x_1 \land x_2 \land \dots \land x_n$ into the Mixed-Integer Linear Programming (MILP) model provided. This method acts as a wrapper around the general `and_equation` function, passing the list of input variables and the output variable `z` formatted as a Term with a coefficient of 1.0. It modifies the `milp` object by adding the necessary linear inequalities to enforce that the result variable `z` is true only when all variables in the input list `x` are true.
+        Encodes the logical constraint $z = x_1 \land x_2 \land \dots \land x_n$ into the Mixed-Integer Linear Programming (MILP) model provided. This method acts as a wrapper around the general `and_equation` function, passing the list of input variables and the output variable `z` formatted as a Term with a coefficient of 1.0. It modifies the `milp` object by adding the necessary linear inequalities to enforce that the result variable `z` is true only when all variables in the input list `x` are true. If the MILP provider supports minima natively, the constraint $z = \min(x_1, \dots, x_n)$ is added as a general constraint instead.
 
         :param x: A list of variables representing the operands of the logical AND operation.
         :type x: list[Variable]
@@ -12814,6 +13543,9 @@ class ZadehSolver:
         :type milp: MILPHelper
         """
 
+        if MILPHelper.supports(SolverCapability.MIN_MAX):
+            milp.add_min_constraint(z, x)
+            return
         ZadehSolver.and_equation(x, Term(1.0, z), milp)
 
     @staticmethod
@@ -12866,7 +13598,7 @@ class ZadehSolver:
         z: Variable, x1: Variable, x2: float, milp: MILPHelper
     ) -> None:
         r"""
-        Encodes the logical AND operation $z = x_1 \land x_2$ into the Mixed-Integer Linear Programming (MILP) model, specifically for the scenario where the second operand $x_2$ is a constant float value. This method linearizes the non-linear logical relationship by introducing an auxiliary binary variable and adding four linear inequality constraints to the MILP helper. The constraints ensure that the result variable $z$ is bounded above by both inputs and that the inputs are bounded below by $z$ combined with the auxiliary variable, thereby enforcing the AND condition. As a side effect, this method modifies the state of the provided `MILPHelper` instance by registering the new auxiliary variable and appending the necessary constraints to the model.
+        Encodes the logical AND operation $z = x_1 \land x_2$ into the Mixed-Integer Linear Programming (MILP) model, specifically for the scenario where the second operand $x_2$ is a constant float value. This method linearizes the non-linear logical relationship by introducing an auxiliary binary variable and adding four linear inequality constraints to the MILP helper. The constraints ensure that the result variable $z$ is bounded above by both inputs and that the inputs are bounded below by $z$ combined with the auxiliary variable, thereby enforcing the AND condition. As a side effect, this method modifies the state of the provided `MILPHelper` instance by registering the new auxiliary variable and appending the necessary constraints to the model. If the MILP provider supports minima natively, the constraint $z = \min(x_1, x_2)$ is added as a general constraint instead.
 
         :param z: The variable representing the result of the logical AND operation between x1 and x2.
         :type z: Variable
@@ -12878,6 +13610,9 @@ class ZadehSolver:
         :type milp: MILPHelper
         """
 
+        if MILPHelper.supports(SolverCapability.MIN_MAX):
+            milp.add_min_constraint(z, [x1], x2)
+            return
         # auxiliary binary y
         y: Variable = milp.get_new_variable(VariableType.BINARY)
         # z <= x1
@@ -12902,7 +13637,7 @@ class ZadehSolver:
         z: Variable, x1: Variable, x2: Variable, milp: MILPHelper
     ) -> None:
         r"""
-        Encodes the logical AND operation $z = x_1 \land x_2$ into the MILP model using a specific linearization formulation that relies on an auxiliary binary variable. This method introduces a new binary variable $y$ and adds four linear inequality constraints to the MILP helper to enforce the relationship: $z \le x_1$, $z \le x_2$, $x_1 \le z + y$, and $x_2 \le z + 1 - y$. These constraints ensure that $z$ takes the value 1 only when both $x_1$ and $x_2$ are 1, provided the input variables are binary. The operation modifies the `milp` object by registering the new variable and appending the constraints, and it returns None.
+        Encodes the logical AND operation $z = x_1 \land x_2$ into the MILP model using a specific linearization formulation that relies on an auxiliary binary variable. This method introduces a new binary variable $y$ and adds four linear inequality constraints to the MILP helper to enforce the relationship: $z \le x_1$, $z \le x_2$, $x_1 \le z + y$, and $x_2 \le z + 1 - y$. These constraints ensure that $z$ takes the value 1 only when both $x_1$ and $x_2$ are 1, provided the input variables are binary. The operation modifies the `milp` object by registering the new variable and appending the constraints, and it returns None. If the MILP provider supports minima natively, the constraint $z = \min(x_1, x_2)$ is added as a general constraint instead.
 
         :param z: The variable representing the result of the logical AND operation between x1 and x2.
         :type z: Variable
@@ -12914,6 +13649,9 @@ class ZadehSolver:
         :type milp: MILPHelper
         """
 
+        if MILPHelper.supports(SolverCapability.MIN_MAX):
+            milp.add_min_constraint(z, [x1, x2])
+            return
         # auxiliary binary y
         y: Variable = milp.get_new_variable(VariableType.BINARY)
         # z <= x1
@@ -12965,7 +13703,7 @@ class ZadehSolver:
         z: Variable, x1: Variable, x2: float, milp: MILPHelper
     ) -> None:
         r"""
-        Encodes the logical relationship z = (1 - x1) AND x2 into the Mixed-Integer Linear Programming (MILP) model by adding linear constraints and an auxiliary binary variable. This method ensures that the binary variable z is 1 if and only if x1 is 0 and the float parameter x2 is 1, effectively linearizing the logical AND operation for the solver. It modifies the MILPHelper instance in place by creating a new binary variable and appending four inequality constraints that enforce the equivalence between the logical expression and the variable z.
+        Encodes the logical relationship z = (1 - x1) AND x2 into the Mixed-Integer Linear Programming (MILP) model by adding linear constraints and an auxiliary binary variable. This method ensures that the binary variable z is 1 if and only if x1 is 0 and the float parameter x2 is 1, effectively linearizing the logical AND operation for the solver. It modifies the MILPHelper instance in place by creating a new binary variable and appending four inequality constraints that enforce the equivalence between the logical expression and the variable z. If the MILP provider supports minima natively, an auxiliary variable $n = 1 - x_1$ is created instead and $z = \min(n, x_2)$ is added as a general constraint.
 
         :param z: The variable representing the result of the logical expression $(1 - x_1) \land x_2$.
         :type z: Variable
@@ -12977,6 +13715,14 @@ class ZadehSolver:
         :type milp: MILPHelper
         """
 
+        if MILPHelper.supports(SolverCapability.MIN_MAX):
+            # n = 1 - x1
+            n: Variable = milp.get_new_variable(VariableType.SEMI_CONTINUOUS)
+            milp.add_new_constraint(
+                Expression(Term(1.0, n), Term(1.0, x1)), InequalityType.EQUAL, 1.0
+            )
+            milp.add_min_constraint(z, [n], x2)
+            return
         # auxiliary binary y
         y: Variable = milp.get_new_variable(VariableType.BINARY)
         # z <= 1 - x1
@@ -13280,7 +14026,7 @@ class ZadehSolver:
         z: Variable, x1: Variable, x2: Variable, milp: MILPHelper
     ) -> None:
         r"""
-        Enforces the constraint that the variable `z` is less than or equal to the Kleene-Dienes implication of `x1` and `x2`, which is defined as $\max(1 - x_1, x_2)$. This method linearizes the non-linear maximum operation by introducing a new binary auxiliary variable into the MILP model, which acts as a switch to select the active term of the implication. Consequently, it adds two linear inequality constraints to the provided MILP helper instance to define the relationship between `z`, `x1`, `x2`, and the auxiliary variable. Note that this implementation only restricts `z` from above, meaning `z` may be strictly less than the implication value depending on the broader optimization context.
+        Enforces the constraint that the variable `z` is less than or equal to the Kleene-Dienes implication of `x1` and `x2`, which is defined as $\max(1 - x_1, x_2)$. This method linearizes the non-linear maximum operation by introducing a new binary auxiliary variable into the MILP model, which acts as a switch to select the active term of the implication. Consequently, it adds two linear inequality constraints to the provided MILP helper instance to define the relationship between `z`, `x1`, `x2`, and the auxiliary variable. Note that this implementation only restricts `z` from above, meaning `z` may be strictly less than the implication value depending on the broader optimization context. If the MILP provider supports maxima natively, the auxiliary variables $n = 1 - x_1$ and $w = \max(n, x_2)$ are created instead, $w$ being a general constraint, and $z \le w$ is enforced.
 
         :param z: The variable representing the result of the Kleene-Dienes implication operation.
         :type z: Variable
@@ -13292,6 +14038,20 @@ class ZadehSolver:
         :type milp: MILPHelper
         """
 
+        if MILPHelper.supports(SolverCapability.MIN_MAX):
+            # n = 1 - x1
+            n: Variable = milp.get_new_variable(VariableType.SEMI_CONTINUOUS)
+            milp.add_new_constraint(
+                Expression(Term(1.0, n), Term(1.0, x1)), InequalityType.EQUAL, 1.0
+            )
+            # w = max(n, x2)
+            w: Variable = milp.get_new_variable(VariableType.SEMI_CONTINUOUS)
+            milp.add_max_constraint(w, [n, x2])
+            # z <= w
+            milp.add_new_constraint(
+                Expression(Term(1.0, z), Term(-1.0, w)), InequalityType.LESS_THAN
+            )
+            return
         # auxiliary binary y
         y: Variable = milp.get_new_variable(VariableType.BINARY)
         # x2 + y >= z
@@ -13310,7 +14070,7 @@ class ZadehSolver:
         z: Variable, x1: Variable, x2: Variable, milp: MILPHelper
     ) -> None:
         """
-        Encodes the Gödel implication operation $z = x1 \rightarrow x2$ into the Mixed-Integer Linear Programming (MILP) model represented by the helper object. This logical operation is defined such that the result $z$ is 1 if $x1$ is less than or equal to $x2$, and $z$ is equal to $x2$ otherwise. To linearize this conditional relationship, the method introduces an auxiliary binary variable and adds five linear constraints to the MILP solver, effectively enforcing the correct value for $z$ based on the relationship between $x1$ and $x2$. The function modifies the state of the MILP helper by registering the new variable and constraints but does not return a value.
+        Encodes the Gödel implication operation $z = x1 \rightarrow x2$ into the Mixed-Integer Linear Programming (MILP) model represented by the helper object. This logical operation is defined such that the result $z$ is 1 if $x1$ is less than or equal to $x2$, and $z$ is equal to $x2$ otherwise. To linearize this conditional relationship, the method introduces an auxiliary binary variable and adds five linear constraints to the MILP solver, effectively enforcing the correct value for $z$ based on the relationship between $x1$ and $x2$. The function modifies the state of the MILP helper by registering the new variable and constraints but does not return a value. If the MILP provider supports indicator constraints natively, the binary variable selects the case through indicator constraints instead: $y = 1$ enforces $x1 \le x2$ and $z = 1$, whereas $y = 0$ enforces $x1 \ge x2 + \epsilon$ and $z = x2$.
 
         :param z: Variable to hold the result of the Gödel implication operation between x1 and x2.
         :type z: Variable
@@ -13324,6 +14084,25 @@ class ZadehSolver:
 
         # auxiliary binary y
         y: Variable = milp.get_new_variable(VariableType.BINARY)
+        if MILPHelper.supports(SolverCapability.INDICATOR):
+            # z >= y
+            milp.add_new_constraint(
+                Expression(Term(1.0, z), Term(-1.0, y)), InequalityType.GREATER_THAN
+            )
+            x1_minus_x2: Expression = Expression(Term(1.0, x1), Term(-1.0, x2))
+            # y = 1 -> x1 <= x2
+            milp.add_indicator_constraint(
+                y, 1, x1_minus_x2, InequalityType.LESS_THAN
+            )
+            # y = 0 -> x1 >= x2 + epsilon
+            milp.add_indicator_constraint(
+                y, 0, x1_minus_x2, InequalityType.GREATER_THAN, ConfigReader.EPSILON
+            )
+            # y = 0 -> z = x2
+            milp.add_indicator_constraint(
+                y, 0, Expression(Term(1.0, z), Term(-1.0, x2)), InequalityType.EQUAL
+            )
+            return
         # 2y + x1 >= x2 + epsilon
         milp.add_new_constraint(
             Expression(Term(2.0, y), Term(1.0, x1), Term(-1.0, x2)),
@@ -13515,7 +14294,7 @@ class ZadehSolver:
     @staticmethod
     def or_equation(*args) -> None:
         r"""
-        Encodes the logical OR operation as a set of linear constraints within a Mixed-Integer Linear Programming (MILP) model, allowing the solver to represent the relationship $z = x_1 \lor x_2 \lor \dots$. This static method acts as a dispatcher that validates the input arguments and delegates to the appropriate internal implementation based on the number of arguments provided. It supports two distinct signatures: a three-argument form accepting a list of input variables, a result variable, and a MILP helper, and a four-argument form accepting two input variables, a numeric constant, and a MILP helper. The method modifies the MILP model by adding constraints through the helper object and returns None. It raises an AssertionError if the arguments do not conform to the expected types or counts.
+        Encodes the logical OR operation as a set of linear constraints within a Mixed-Integer Linear Programming (MILP) model, allowing the solver to represent the relationship $z = x_1 \lor x_2 \lor \dots$. This static method acts as a dispatcher that validates the input arguments and delegates to the appropriate internal implementation based on the number of arguments provided. It supports two distinct signatures: a three-argument form accepting a list of input variables, a result variable, and a MILP helper, and a four-argument form accepting two input variables, a numeric constant, and a MILP helper. The method modifies the MILP model by adding constraints through the helper object, or a general constraint $z = \max(\dots)$ if the MILP provider supports maxima natively, and returns None. It raises an AssertionError if the arguments do not conform to the expected types or counts.
 
         :param args: Arguments for the OR operation, provided as either a list of input variables, the result variable, and a MILP helper, or as two input variables, a numeric constant, and a MILP helper.
         :type args: typing.Any
@@ -13528,13 +14307,19 @@ class ZadehSolver:
             )
             assert isinstance(args[1], Variable)
             assert isinstance(args[2], MILPHelper)
-            ZadehSolver.__or_equation_2(*args)
+            if MILPHelper.supports(SolverCapability.MIN_MAX):
+                args[2].add_max_constraint(args[1], args[0])
+            else:
+                ZadehSolver.__or_equation_2(*args)
         else:
             assert isinstance(args[0], Variable)
             assert isinstance(args[1], Variable)
             assert isinstance(args[2], constants.NUMBER)
             assert isinstance(args[3], MILPHelper)
-            ZadehSolver.__or_equation_1(*args)
+            if MILPHelper.supports(SolverCapability.MIN_MAX):
+                args[3].add_max_constraint(args[0], [args[1]], args[2])
+            else:
+                ZadehSolver.__or_equation_1(*args)
 
     @staticmethod
     def __or_equation_1(z: Variable, x1: Variable, x2: float, milp: MILPHelper) -> None:
@@ -14440,9 +15225,10 @@ class CreatedIndividualHandler:
         :rtype: bool
         """
 
+        debug: bool = ConfigReader.DEBUG_PRINT
         # Don't test if not deep enough in completion forest
         if current_individual.depth < 3:
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug("Depth < 3, node is not indirectly anywhere blocked")
             current_individual.indirectly_blocked = (
                 CreatedIndividualBlockingType.NOT_BLOCKED
@@ -14453,14 +15239,14 @@ class CreatedIndividualHandler:
             current_individual.indirectly_blocked
             == CreatedIndividualBlockingType.BLOCKED
         ):
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug("Already checked if indirectly blocked, node IS blocked")
             return True
         if (
             current_individual.indirectly_blocked
             == CreatedIndividualBlockingType.NOT_BLOCKED
         ):
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug("Already checked if indirectly blocked, node is not blocked")
             return False
         # Proceed, assuming indirectlyBlocked == UNCHECKED holds
@@ -14470,7 +15256,7 @@ class CreatedIndividualHandler:
         anc: typing.Optional[Individual] = current_individual.get_parent()
         while anc and anc.is_blockable():
             ancestor: CreatedIndividual = typing.cast(CreatedIndividual, anc)
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(
                     f"Indirect blocking: check if directly blocked {ancestor.name} at depth {ancestor.depth}"
                 )
@@ -14479,7 +15265,7 @@ class CreatedIndividualHandler:
                     CreatedIndividualBlockingType.BLOCKED
                 )
                 current_individual.blocking_ancestor = str(ancestor)
-                if ConfigReader.DEBUG_PRINT:
+                if debug:
                     Util.debug(
                         f"{current_individual.name} IS INDIRECTLY anywhere simple blocked by {ancestor}"
                     )
@@ -14777,21 +15563,22 @@ class CreatedIndividualHandler:
         :rtype: bool
         """
 
-        if ConfigReader.DEBUG_PRINT:
+        debug: bool = ConfigReader.DEBUG_PRINT
+        if debug:
             Util.debug(
                 f"Directly Anywhere Simple blocking status {current_individual.directly_blocked}"
             )
         node_id: int = current_individual.get_integer_id()
         # Don't test if not deep enough in completion forest
         if node_id <= 1:
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"Node ID : {node_id} <= 1 : node is not blocked")
             current_individual.directly_blocked = (
                 CreatedIndividualBlockingType.NOT_BLOCKED
             )
             return False
         if current_individual.depth < 2:
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug("Depth < 2, node is not blocked")
             current_individual.directly_blocked = (
                 CreatedIndividualBlockingType.NOT_BLOCKED
@@ -14799,7 +15586,7 @@ class CreatedIndividualHandler:
             return False
         # If already blocked don't test again
         if current_individual.directly_blocked == CreatedIndividualBlockingType.BLOCKED:
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(
                     f"Already directly blocked by {current_individual.blocking_ancestor}"
                 )
@@ -14808,19 +15595,19 @@ class CreatedIndividualHandler:
             current_individual.directly_blocked
             == CreatedIndividualBlockingType.NOT_BLOCKED
         ):
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug("Already checked if directly blocked, node is not blocked")
             return False
         # Proceed, assuming directlyBlocked == UNCHECKED holds
         # Direct blocking
         current_individual.directly_blocked = CreatedIndividualBlockingType.NOT_BLOCKED
-        if ConfigReader.DEBUG_PRINT:
+        if debug:
             Util.debug(f"Testing direct anywhere blocking: {current_individual}")
         # Find anywhere blocking node
         candidate_ind: SortedSet[CreatedIndividual] = (
             CreatedIndividualHandler.matching_individual(current_individual, kb)
         )
-        if ConfigReader.DEBUG_PRINT:
+        if debug:
             Util.debug(f"Anywhere blocking: Found individuals: {candidate_ind}")
         # Check if we found one
         if len(candidate_ind) > 0:
@@ -14834,14 +15621,14 @@ class CreatedIndividualHandler:
             if current_individual.name not in blocked_children:
                 blocked_children.append(current_individual.name)
             kb.directly_blocked_children[str(anc)] = blocked_children
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(
                     f"{current_individual.name} IS DIRECTLY ANYWHERE blocked by {anc}"
                 )
             # Mark all descendants as indirectly blocked
             current_individual.mark_indirectly_blocked()
         else:
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(
                     f"{current_individual.name} IS NOT directly ANYWHERE blocked"
                 )
@@ -15185,96 +15972,69 @@ class CreatedIndividualHandler:
         current_individual: CreatedIndividual, kb: KnowledgeBase
     ) -> SortedSet[CreatedIndividual]:
         """
-        This static method searches the knowledge base for existing individuals that match the provided current individual, primarily to determine if blocking conditions are met. It begins by identifying candidates associated with the first concept of the current individual, filtering them to ensure they were created earlier, are not blocked, and meet size requirements based on the configured blocking dynamic type (subset or set equality). If this initial candidate set is empty, the method returns an empty set immediately. For each subsequent concept, the method checks for an intersection between the candidate set and individuals possessing that concept; if a non-empty intersection is found, it is returned right away. If the loop completes without finding such an intersection, the initial candidate set is returned. The operation is read-only with respect to the knowledge base and the individual, though it generates debug logs.
+        This static method searches the knowledge base for existing individuals that can block the provided current individual under anywhere simple blocking. The candidates are the individuals having the concept of the current label that is shared by the fewest individuals, since every label equal to or containing the current one contains that concept. A candidate is kept only if it was created earlier, it is not blocked, and its label covers the label of the current individual, that is, it contains it for subset blocking or is equal to it for set blocking, which is checked on the bitset encoding of the labels. Candidates are resolved by name in the knowledge base, so that the current state of the individuals is used. If the current individual has an empty label, no individual is returned. The operation is read-only with respect to the knowledge base and the individual, though it generates debug logs.
 
         :param current_individual: The individual for which matching candidates are sought within the knowledge base.
         :type current_individual: CreatedIndividual
         :param kb: The knowledge base providing the existing individuals and blocking configuration for the match check.
         :type kb: KnowledgeBase
 
-        :return: A sorted set of individuals from the knowledge base that share all concepts with the current individual, were created earlier, are not blocked, and satisfy the specific blocking type constraints. Returns an empty set if no matches are found.
+        :return: A sorted set of individuals from the knowledge base whose label covers the label of the current individual, that were created earlier and are not blocked. Returns an empty set if no matches are found.
 
         :rtype: SortedSet[CreatedIndividual]
         """
 
-        if ConfigReader.DEBUG_PRINT:
+        debug: bool = ConfigReader.DEBUG_PRINT
+        if debug:
             Util.debug(
                 f"Find matching individual for : {current_individual.name} ID : {current_individual.get_integer_id()} size : {len(current_individual.concept_list)}"
             )
-        if ConfigReader.DEBUG_PRINT:
+        if debug:
             Util.debug(f"Concept list: {current_individual.concept_list}")
-        type: BlockingDynamicType = kb.blocking_type
-        first_concept: bool = True
         candidate_set: SortedSet[CreatedIndividual] = SortedSet()
-        for concept in current_individual.concept_list:
-            if ConfigReader.DEBUG_PRINT:
+        if len(current_individual.concept_list) == 0:
+            return candidate_set
+        type: BlockingDynamicType = kb.blocking_type
+        # Any label covering the current one contains its least used concept
+        concept: int = min(
+            current_individual.concept_list,
+            key=lambda c: len(kb.concept_individual_list.get(c, ())),
+        )
+        if debug:
+            Util.debug(
+                f"Process concept {concept}: {kb.get_concept_from_number(concept)}"
+            )
+        node_id: int = current_individual.get_integer_id()
+        for candidate in kb.concept_individual_list.get(concept, ()):
+            if candidate.get_integer_id() >= node_id:
+                break
+            ind: typing.Optional[Individual] = kb.individuals.get(candidate.name)
+            if not isinstance(ind, CreatedIndividual):
+                continue
+            if debug:
                 Util.debug(
-                    f"Process concept {concept}: {kb.get_concept_from_number(concept)}"
+                    f"Individual {ind.name} ID : {ind.get_integer_id()} size : {len(ind.concept_list)}"
                 )
-            current_ind: SortedSet[CreatedIndividual] = kb.concept_individual_list.get(
-                concept, SortedSet()
+            # Node should be created earlier and node is not blocked
+            is_blocked: bool = (
+                ind.directly_blocked == CreatedIndividualBlockingType.BLOCKED
+                or ind.indirectly_blocked == CreatedIndividualBlockingType.BLOCKED
             )
-            if ConfigReader.DEBUG_PRINT:
-                Util.debug(f"Individuals List -> {current_ind}")
-            if not first_concept:
-                tmp_current_ind: SortedSet[CreatedIndividual] = (
-                    current_individual.individual_set_intersection_of(
-                        candidate_set, current_ind
-                    )
-                )
-                # If empty, exit immediately
-                if len(tmp_current_ind) == 0:
-                    continue
-                return tmp_current_ind
-
-            # Drop no good individuals:
-            # 1. created later
-            # 2. node label size is not ok
-            # 3. is not blocked
-            #
-            # Do it only for the fist concept
-            candidate_set: SortedSet[CreatedIndividual] = SortedSet()
-            for ind in current_ind:
-                assert isinstance(ind, CreatedIndividual)
-
-                if ind.get_integer_id() >= current_individual.get_integer_id():
-                    break
-                if ConfigReader.DEBUG_PRINT:
-                    Util.debug(
-                        f"Individual {ind.name} ID : {ind.get_integer_id()} size : {len(ind.concept_list)}"
-                    )
-                if ConfigReader.DEBUG_PRINT:
-                    Util.debug(f"Concept list -> {ind.concept_list}")
-                # Node should be created earlier and node is not blocked
-                is_blocked: bool = (
-                    ind.directly_blocked == CreatedIndividualBlockingType.BLOCKED
-                    or ind.indirectly_blocked == CreatedIndividualBlockingType.BLOCKED
-                )
-                if ConfigReader.DEBUG_PRINT:
-                    Util.debug(f"Blocked? -> {is_blocked}")
-                if (
-                    ind.get_integer_id() >= current_individual.get_integer_id()
-                    or is_blocked
+            if debug:
+                Util.debug(f"Blocked? -> {is_blocked}")
+            if is_blocked:
+                continue
+            if type == BlockingDynamicType.ANYWHERE_SET_BLOCKING:
+                if CreatedIndividualHandler.match_set_concept_labels(
+                    current_individual, ind
                 ):
-                    continue
-                if type == BlockingDynamicType.ANYWHERE_SUBSET_BLOCKING and len(
-                    ind.concept_list
-                ) >= len(
-                    current_individual.concept_list
-                ):  # subset blocking
-                    candidate_set.add(ind)
-                elif type == BlockingDynamicType.ANYWHERE_SET_BLOCKING and len(
-                    ind.concept_list
-                ) == len(
-                    current_individual.concept_list
-                ):  # set blocking
                     candidate_set.add(ind)
-            if ConfigReader.DEBUG_PRINT:
-                Util.debug(f"Candidate set -> {candidate_set}")
-            # For concept c, there is no candidate, so return immediately false
-            if len(candidate_set) == 0:
-                return candidate_set
-            first_concept = False
+            elif CreatedIndividualHandler.match_subset_concept_labels(
+                current_individual, ind
+            ):
+                candidate_set.add(ind)
+        if debug:
+            Util.debug(f"Candidate set -> {candidate_set}")
         return candidate_set
 
     @staticmethod
@@ -15304,13 +16064,10 @@ class CreatedIndividualHandler:
             Util.debug(
                 f"Individual {current_individual.name} size: {len(current_individual.concept_list)}"
             )
-        for l1 in current_individual.concept_list:
-            if ConfigReader.DEBUG_PRINT:
+            for l1 in current_individual.concept_list:
                 Util.debug(f"Concept {l1}: {kb.get_concept_from_number(l1)}")
-        if ConfigReader.DEBUG_PRINT:
             Util.debug(f"Individual {b.name} size: {len(b.concept_list)}")
-        for l2 in b.concept_list:
-            if ConfigReader.DEBUG_PRINT:
+            for l2 in b.concept_list:
                 Util.debug(f"Concept {l2}: {kb.get_concept_from_number(l2)}")
         type: BlockingDynamicType = kb.blocking_type
         # indirect blocking applies only if we have dynamic blocking
@@ -15334,7 +16091,7 @@ class CreatedIndividualHandler:
         current_individual: CreatedIndividual, b: CreatedIndividual
     ) -> bool:
         """
-        Determines whether the set of concept labels associated with the first individual is entirely contained within the set of concept labels associated with the second individual. This method performs a subset check on the `concept_list` attributes of the provided `CreatedIndividual` instances. It returns `True` only if the second individual is not `None` and all concepts from the first individual are present in the second; otherwise, it returns `False`.
+        Determines whether the set of concept labels associated with the first individual is entirely contained within the set of concept labels associated with the second individual. This method performs a subset check on the bitset encodings of the labels of the provided `CreatedIndividual` instances, which takes a bitwise operation on their words instead of a lookup per concept. It returns `True` only if the second individual is not `None` and all concepts from the first individual are present in the second; otherwise, it returns `False`.
 
         :param current_individual: The individual whose concept list is checked to verify if it is a subset of the other individual's concept list.
         :type current_individual: CreatedIndividual
@@ -15348,14 +16105,14 @@ class CreatedIndividualHandler:
 
         if b is None:
             return False
-        return current_individual.concept_list.issubset(b.concept_list)
+        return current_individual.label_is_subset_of(b)
 
     @staticmethod
     def match_set_concept_labels(
         current_individual: CreatedIndividual, b: CreatedIndividual
     ) -> bool:
         """
-        Compares the concept lists of two `CreatedIndividual` instances to determine if they are identical. The method evaluates the equality of the `concept_list` attribute belonging to the `current_individual` against that of the second individual, `b`. If the second individual is `None`, the method returns `False` rather than raising an error, ensuring safe comparison against missing or uninitialized data.
+        Compares the concept lists of two `CreatedIndividual` instances to determine if they are identical. The method compares the cached hashes of both labels first and then the bitset encodings of the labels of the `current_individual` and of the second individual, `b`. If the second individual is `None`, the method returns `False` rather than raising an error, ensuring safe comparison against missing or uninitialized data.
 
         :param current_individual: The individual whose concept list is compared against the other individual.
         :type current_individual: CreatedIndividual
@@ -15369,7 +16126,7 @@ class CreatedIndividualHandler:
 
         if b is None:
             return False
-        return current_individual.concept_list == b.concept_list
+        return current_individual.label_equals(b)
 
     @staticmethod
     def unblock_directly_blocked(
@@ -4,4 +4,6 @@ from .term import Term  # Term
 from .expression import Expression
 from .inequation import Inequation  # Inequation
 from .show_variables_helper import ShowVariablesHelper  # Variable
+from .piecewise_linear_constraint import PiecewiseLinearConstraint
+from .general_constraint import GeneralConstraint
 from .milp_helper import MILPHelper
@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+import typing
+
+import numpy as np
+
+from fuzzy_dl_owl2.fuzzydl.milp.inequation import Inequation
+from fuzzy_dl_owl2.fuzzydl.util.constants import InequalityType
+
+
+class ConstraintStore:
+    """
+    This class stores the linear constraints of a MILP problem in a columnar, compressed sparse row (CSR) layout made of numpy arrays, so that the solver backends can load the whole constraint matrix in bulk instead of walking the `Inequation`, `Expression` and `Term` objects of every constraint. Row `i` of the store holds the identifiers of the variables of the `i`-th constraint (see `Variable.id`) in `cols[row_ptr[i]:row_ptr[i + 1]]`, their coefficients in the same slice of `coefs`, the relational operator in `senses[i]` and the right-hand side in `rhs[i]`, so that the constraint reads `sum(coefs * x[cols]) senses[i] rhs[i]`. The arrays grow geometrically as rows are appended. Rows are normalized when they are appended: the coefficients of a variable occurring several times are added up, null coefficients are dropped and the variables are sorted by identifier, so that every row has a canonical form. The canonical form is used as the key of the row, which allows appending every distinct constraint only once, and rows that are trivially satisfied, such as `a * x - a * x >= 0`, are not stored at all. Since rows are never modified once added, `clone` shares the arrays with the copy, and the first helper that appends a new row makes a private copy of them beforehand. Similarly, the keys of the rows stored before a call to `clone` are frozen in a layer shared by both stores, while each store records the keys of its new rows in a set of its own, so that cloning takes constant time.
+
+    :param SENSES: The relational operators, indexed by the codes stored in `senses`.
+    :type SENSES: tuple[InequalityType, ...]
+    :param row_ptr: Offsets of the rows in `cols` and `coefs`; only the first `num_rows + 1` entries are meaningful.
+    :type row_ptr: np.ndarray
+    :param cols: Identifiers of the variables of the rows, stored row after row.
+    :type cols: np.ndarray
+    :param coefs: Coefficients of the variables of the rows, aligned with `cols`.
+    :type coefs: np.ndarray
+    :param senses: Code of the relational operator of every row, as an index of `SENSES`.
+    :type senses: np.ndarray
+    :param rhs: Right-hand side of every row.
+    :type rhs: np.ndarray
+    :param num_rows: Number of rows in the store.
+    :type num_rows: int
+    :param shared: Whether the arrays may be shared with another store created by `clone`, in which case they are copied before appending a new row.
+    :type shared: bool
+    :param keys: Keys of the rows appended since the store was created or last cloned, or None if they have not been computed yet, as for stores built by `select` or unpickled.
+    :type keys: typing.Optional[set[tuple]]
+    :param frozen_keys: Layers with the keys of the rows stored before the store was cloned, which are shared with the clones and never modified.
+    :type frozen_keys: tuple[set[tuple], ...]
+    """
+
+    SENSES: tuple[InequalityType, ...] = (
+        InequalityType.EQUAL,
+        InequalityType.LESS_THAN,
+        InequalityType.GREATER_THAN,
+    )
+
+    def __init__(self) -> None:
+        """Initializes an empty store with room for a few rows, whose arrays grow as new rows are appended."""
+
+        self.row_ptr: np.ndarray = np.zeros(17, dtype=np.int64)
+        self.cols: np.ndarray = np.empty(64, dtype=np.int64)
+        self.coefs: np.ndarray = np.empty(64, dtype=np.float64)
+        self.senses: np.ndarray = np.empty(16, dtype=np.int8)
+        self.rhs: np.ndarray = np.empty(16, dtype=np.float64)
+        self.num_rows: int = 0
+        self.shared: bool = False
+        self.keys: typing.Optional[set[tuple]] = set()
+        self.frozen_keys: tuple[set[tuple], ...] = ()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of rows in the store.
+
+        :return: The number of rows.
+
+        :rtype: int
+        """
+
+        return self.num_rows
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        """
+        Returns the state of the store to be pickled. The arrays are stored as plain lists, so that knowledge bases containing a store can be restored by the restricted unpickler, which does not accept numpy classes.
+
+        :return: A dictionary with the used part of every array.
+
+        :rtype: dict[str, typing.Any]
+        """
+
+        nnz: int = self.num_nonzeros()
+        return {
+            "row_ptr": self.row_ptr[: self.num_rows + 1].tolist(),
+            "cols": self.cols[:nnz].tolist(),
+            "coefs": self.coefs[:nnz].tolist(),
+            "senses": self.senses[: self.num_rows].tolist(),
+            "rhs": self.rhs[: self.num_rows].tolist(),
+        }
+
+    def __setstate__(self, state: dict[str, typing.Any]) -> None:
+        """
+        Restores a store from the state returned by `__getstate__`.
+
+        :param state: A dictionary with the used part of every array.
+        :type state: dict[str, typing.Any]
+        """
+
+        self.row_ptr = np.array(state["row_ptr"], dtype=np.int64)
+        self.cols = np.array(state["cols"], dtype=np.int64)
+        self.coefs = np.array(state["coefs"], dtype=np.float64)
+        self.senses = np.array(state["senses"], dtype=np.int8)
+        self.rhs = np.array(state["rhs"], dtype=np.float64)
+        self.num_rows = len(self.senses)
+        self.shared = False
+        self.keys = None
+        self.frozen_keys = ()
+
+    def clone(self) -> typing.Self:
+        """
+        Creates a copy-on-write snapshot of the store. The copy shares the arrays with the original store, and both of them copy the arrays before appending their next row. The keys of the current rows are moved to a frozen layer shared by both stores.
+
+        :return: A snapshot of the store.
+
+        :rtype: typing.Self
+        """
+
+        store: ConstraintStore = ConstraintStore()
+        store.row_ptr = self.row_ptr
+        store.cols = self.cols
+        store.coefs = self.coefs
+        store.senses = self.senses
+        store.rhs = self.rhs
+        store.num_rows = self.num_rows
+        self.shared = store.shared = True
+        if self.keys is None:
+            self.__build_keys()
+        if self.keys:
+            self.frozen_keys = self.frozen_keys + (self.keys,)
+            self.keys = set()
+        store.frozen_keys = self.frozen_keys
+        return store
+
+    def num_nonzeros(self) -> int:
+        """
+        Returns the number of entries of the constraint matrix stored so far.
+
+        :return: The total number of terms of the rows.
+
+        :rtype: int
+        """
+
+        return int(self.row_ptr[self.num_rows])
+
+    def __build_keys(self) -> None:
+        """
+        Computes the keys of all the rows of the store, which must be in canonical form, and stores them in `keys` as a single layer.
+        """
+
+        nnz: int = self.num_nonzeros()
+        row_ptr: list[int] = self.row_ptr[: self.num_rows + 1].tolist()
+        cols: list[int] = self.cols[:nnz].tolist()
+        coefs: list[float] = self.coefs[:nnz].tolist()
+        senses: list[int] = self.senses[: self.num_rows].tolist()
+        rhs: list[float] = self.rhs[: self.num_rows].tolist()
+        self.keys = {
+            (
+                senses[i],
+                rhs[i],
+                tuple(cols[row_ptr[i] : row_ptr[i + 1]]),
+                tuple(coefs[row_ptr[i] : row_ptr[i + 1]]),
+            )
+            for i in range(self.num_rows)
+        }
+        self.frozen_keys = ()
+
+    def __contains_key(self, key: tuple) -> bool:
+        """
+        Checks whether a row with the given key is already in the store.
+
+        :param key: The key of the row.
+        :type key: tuple
+
+        :return: True if the row is in the store, False otherwise.
+
+        :rtype: bool
+        """
+
+        if self.keys is None:
+            self.__build_keys()
+        return key in self.keys or any(key in layer for layer in self.frozen_keys)
+
+    @staticmethod
+    def __grow(array: np.ndarray, size: int, copy: bool) -> np.ndarray:
+        """
+        Returns an array with room for at least `size` entries containing the entries of the given one, doubling the capacity when it is exceeded. A new array with the same capacity is returned if `copy` is True and the capacity is enough.
+
+        :param array: The array to grow.
+        :type array: np.ndarray
+        :param size: The number of entries the array must be able to hold.
+        :type size: int
+        :param copy: Whether a new array must be returned even if the capacity is enough.
+        :type copy: bool
+
+        :return: The grown array.
+
+        :rtype: np.ndarray
+        """
+
+        if size <= len(array):
+            if not copy:
+                return array
+            capacity: int = len(array)
+        else:
+            capacity: int = max(size, 2 * len(array))
+        grown: np.ndarray = np.empty(capacity, dtype=array.dtype)
+        grown[: len(array)] = array
+        return grown
+
+    def append(
+        self,
+        cols: list[int],
+        coefs: list[float],
+        sense: InequalityType,
+        rhs: float,
+    ) -> bool:
+        """
+        Appends a row to the store, copying the arrays first if they are shared with a snapshot. The row is normalized into its canonical form and is only appended if it is not already in the store and it is not trivially satisfied, i.e., if it has some non-null coefficient or if its right-hand side makes it unsatisfiable, as in `0 >= 1`, in which case it is kept so that the solvers detect the inconsistency.
+
+        :param cols: The identifiers of the variables of the row.
+        :type cols: list[int]
+        :param coefs: The coefficients of the variables, aligned with `cols`.
+        :type coefs: list[float]
+        :param sense: The relational operator of the row.
+        :type sense: InequalityType
+        :param rhs: The right-hand side of the row.
+        :type rhs: float
+
+        :return: True if the row has been appended, False if it has been discarded.
+
+        :rtype: bool
+        """
+
+        merged: dict[int, float] = dict()
+        for j, c in zip(cols, coefs):
+            merged[j] = merged.get(j, 0.0) + c
+        row: list[tuple[int, float]] = sorted(
+            (j, c) for j, c in merged.items() if c != 0
+        )
+        # Adding 0.0 turns -0.0 into 0.0, so that both give the same key
+        rhs = float(rhs) + 0.0
+        if not row and (
+            rhs == 0
+            or (sense == InequalityType.LESS_THAN and rhs > 0)
+            or (sense == InequalityType.GREATER_THAN and rhs < 0)
+        ):
+            return False
+        code: int = self.SENSES.index(sense)
+        cols = [j for j, _ in row]
+        coefs = [c for _, c in row]
+        key: tuple = (code, rhs, tuple(cols), tuple(coefs))
+        if self.__contains_key(key):
+            return False
+        self.keys.add(key)
+
+        start: int = self.num_nonzeros()
+        end: int = start + len(cols)
+        n: int = self.num_rows
+        copy: bool = self.shared
+        self.row_ptr = self.__grow(self.row_ptr, n + 2, copy)
+        self.cols = self.__grow(self.cols, end, copy)
+        self.coefs = self.__grow(self.coefs, end, copy)
+        self.senses = self.__grow(self.senses, n + 1, copy)
+        self.rhs = self.__grow(self.rhs, n + 1, copy)
+        self.shared = False
+
+        self.cols[start:end] = cols
+        self.coefs[start:end] = coefs
+        self.senses[n] = code
+        self.rhs[n] = rhs
+        self.row_ptr[n + 1] = end
+        self.num_rows = n + 1
+        return True
+
+    def append_inequation(self, constraint: Inequation) -> bool:
+        """
+        Appends the row corresponding to the given constraint, whose variables must already have been registered in the MILP problem, unless it is a duplicate or it is trivially satisfied.
+
+        :param constraint: The constraint to append.
+        :type constraint: Inequation
+
+        :return: True if the row has been appended, False if it has been discarded.
+
+        :rtype: bool
+        """
+
+        terms = constraint.get_terms()
+        return self.append(
+            [term.get_var().id for term in terms],
+            [term.get_coeff() for term in terms],
+            constraint.get_type(),
+            constraint.get_constant(),
+        )
+
+    def select(self, rows: typing.Sequence[int]) -> typing.Self:
+        """
+        Builds a new store containing the given rows of this store, in the given order. The keys of the rows of the new store are only computed if a row is appended to it.
+
+        :param rows: The indices of the rows to keep.
+        :type rows: typing.Sequence[int]
+
+        :return: A new store with the selected rows.
+
+        :rtype: typing.Self
+        """
+
+        rows_array: np.ndarray = np.asarray(rows, dtype=np.int64)
+        starts: np.ndarray = self.row_ptr[rows_array]
+        lengths: np.ndarray = self.row_ptr[rows_array + 1] - starts
+        row_ptr: np.ndarray = np.zeros(len(rows_array) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=row_ptr[1:])
+        # Position of every selected entry in the original arrays
+        entries: np.ndarray = np.repeat(starts - row_ptr[:-1], lengths) + np.arange(
+            row_ptr[-1], dtype=np.int64
+        )
+
+        store: ConstraintStore = ConstraintStore()
+        store.row_ptr = row_ptr
+        store.cols = self.cols[entries]
+        store.coefs = self.coefs[entries]
+        store.senses = self.senses[rows_array]
+        store.rhs = self.rhs[rows_array]
+        store.num_rows = len(rows_array)
+        store.keys = None
+        return store
+
+    def get_row(self, i: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the identifiers of the variables and the coefficients of a row of the store.
+
+        :param i: The index of the row.
+        :type i: int
+
+        :return: A pair of read-only views with the identifiers of the variables and their coefficients.
+
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+
+        start, end = self.row_ptr[i], self.row_ptr[i + 1]
+        return self.cols[start:end], self.coefs[start:end]
+
+    def get_sense(self, i: int) -> InequalityType:
+        """
+        Returns the relational operator of a row of the store.
+
+        :param i: The index of the row.
+        :type i: int
+
+        :return: The relational operator of the row.
+
+        :rtype: InequalityType
+        """
+
+        return self.SENSES[self.senses[i]]
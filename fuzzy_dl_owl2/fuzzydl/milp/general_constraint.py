@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import typing
+
+from fuzzy_dl_owl2.fuzzydl.milp.inequation import Inequation
+from fuzzy_dl_owl2.fuzzydl.milp.term import Term
+from fuzzy_dl_owl2.fuzzydl.milp.variable import Variable
+from fuzzy_dl_owl2.fuzzydl.util.constants import GeneralConstraintType, InequalityType
+
+
+class GeneralConstraint:
+    r"""
+    Encodes a general constraint of the MILP problem, namely a constraint that is not linear but that some solver backends handle natively, which avoids the auxiliary binary variables and big-M constraints of its linearisation:
+
+    * ``MIN``:  $z = \min(x_1, \dots, x_n, c)$,
+    * ``MAX``:  $z = \max(x_1, \dots, x_n, c)$,
+    * ``INDICATOR``:  $y = v \Rightarrow E \bowtie 0$,  where $y$ is a binary variable and $v \in \{0, 1\}$,
+
+    where the constant $c$ is optional. Like `Inequation` objects, general constraints are never modified once created, so they are shared by the helpers created by `MILPHelper.clone`. The providers that do not support a kind of general constraint get the linear constraints built by `MILPHelper.lower_general_constraints` instead.
+
+    :param type: The kind of general constraint.
+    :type type: GeneralConstraintType
+    :param var: The result variable $z$ of a minimum or a maximum, or the binary variable $y$ of an indicator constraint.
+    :type var: Variable
+    :param operands: The operands $x_i$ of a minimum or a maximum, empty for indicator constraints.
+    :type operands: list[Variable]
+    :param constant: The constant operand $c$ of a minimum or a maximum, or None if there is none.
+    :type constant: typing.Optional[float]
+    :param value: The value $v$ of the binary variable activating an indicator constraint.
+    :type value: int
+    :param inequation: The linear constraint  $E \bowtie 0$  enforced by an indicator constraint, or None for minima and maxima.
+    :type inequation: typing.Optional[Inequation]
+    """
+
+    def __init__(
+        self,
+        constraint_type: GeneralConstraintType,
+        var: Variable,
+        operands: list[Variable],
+        constant: typing.Optional[float] = None,
+        value: int = 1,
+        inequation: typing.Optional[Inequation] = None,
+    ) -> None:
+        """
+        Constructs a general constraint. Minima and maxima need at least one operand, either a variable or the constant, whereas indicator constraints need the linear constraint they enforce and an activating value of 0 or 1.
+
+        :param constraint_type: The kind of general constraint.
+        :type constraint_type: GeneralConstraintType
+        :param var: The result variable of a minimum or a maximum, or the binary variable of an indicator constraint.
+        :type var: Variable
+        :param operands: The variable operands of a minimum or a maximum.
+        :type operands: list[Variable]
+        :param constant: The constant operand of a minimum or a maximum, if any.
+        :type constant: typing.Optional[float]
+        :param value: The value of the binary variable activating an indicator constraint.
+        :type value: int
+        :param inequation: The linear constraint enforced by an indicator constraint.
+        :type inequation: typing.Optional[Inequation]
+
+        :raises ValueError: Raised if a minimum or a maximum has no operand, or if an indicator constraint has no linear constraint or an activating value other than 0 or 1.
+        """
+
+        if constraint_type == GeneralConstraintType.INDICATOR:
+            if inequation is None or value not in (0, 1):
+                raise ValueError(
+                    f"Invalid indicator constraint: {var} = {value} -> {inequation}"
+                )
+        elif len(operands) == 0 and constant is None:
+            raise ValueError(f"The {constraint_type} of {var} has no operands")
+        self.type: GeneralConstraintType = constraint_type
+        self.var: Variable = var
+        self.operands: list[Variable] = list(operands)
+        self.constant: typing.Optional[float] = (
+            None if constant is None else float(constant)
+        )
+        self.value: int = value
+        self.inequation: typing.Optional[Inequation] = inequation
+
+    def get_type(self) -> GeneralConstraintType:
+        """
+        Returns the kind of the general constraint.
+
+        :return: The kind of the constraint.
+
+        :rtype: GeneralConstraintType
+        """
+
+        return self.type
+
+    def get_var(self) -> Variable:
+        """
+        Returns the result variable of a minimum or a maximum, or the binary variable of an indicator constraint.
+
+        :return: The main variable of the constraint.
+
+        :rtype: Variable
+        """
+
+        return self.var
+
+    def get_operands(self) -> list[Variable]:
+        """
+        Returns the variable operands of a minimum or a maximum.
+
+        :return: The operands of the constraint, empty for indicator constraints.
+
+        :rtype: list[Variable]
+        """
+
+        return self.operands
+
+    def get_constant(self) -> typing.Optional[float]:
+        """
+        Returns the constant operand of a minimum or a maximum.
+
+        :return: The constant operand, or None if there is none.
+
+        :rtype: typing.Optional[float]
+        """
+
+        return self.constant
+
+    def get_value(self) -> int:
+        """
+        Returns the value of the binary variable activating an indicator constraint.
+
+        :return: The activating value, 0 or 1.
+
+        :rtype: int
+        """
+
+        return self.value
+
+    def get_inequation(self) -> typing.Optional[Inequation]:
+        """
+        Returns the linear constraint enforced by an indicator constraint.
+
+        :return: The enforced constraint, or None for minima and maxima.
+
+        :rtype: typing.Optional[Inequation]
+        """
+
+        return self.inequation
+
+    def get_variables(self) -> list[Variable]:
+        """
+        Returns all the variables appearing in the constraint, starting with the main one, which are the variables that must be solved together when the problem is partitioned.
+
+        :return: The variables of the constraint.
+
+        :rtype: list[Variable]
+        """
+
+        if self.inequation is not None:
+            return [self.var] + [t.get_var() for t in self.inequation.get_terms()]
+        return [self.var] + self.operands
+
+    def add_gurobi(
+        self,
+        model: typing.Any,
+        get_var: typing.Callable[[Variable], typing.Any],
+        name: str,
+    ) -> typing.Any:
+        """
+        Adds the constraint to a Gurobi model as a native general constraint, namely a minimum, a maximum or an indicator constraint, so that Gurobi can use its own formulation and bound tightening instead of a fixed big-M linearisation.
+
+        :param model: The Gurobi model.
+        :type model: typing.Any
+        :param get_var: Function returning the handle in the model of a variable of the MILP problem.
+        :type get_var: typing.Callable[[Variable], typing.Any]
+        :param name: The name of the constraint in the model.
+        :type name: str
+
+        :return: The handle of the general constraint in the model.
+
+        :rtype: typing.Any
+        """
+
+        import gurobipy as gp
+        from gurobipy import GRB
+
+        if self.type == GeneralConstraintType.INDICATOR:
+            senses: dict[InequalityType, str] = {
+                InequalityType.EQUAL: GRB.EQUAL,
+                InequalityType.LESS_THAN: GRB.LESS_EQUAL,
+                InequalityType.GREATER_THAN: GRB.GREATER_EQUAL,
+            }
+            terms: list[Term] = [
+                t for t in self.inequation.get_terms() if t.get_coeff() != 0
+            ]
+            return model.addGenConstrIndicator(
+                get_var(self.var),
+                self.value == 1,
+                gp.LinExpr(
+                    [t.get_coeff() for t in terms],
+                    [get_var(t.get_var()) for t in terms],
+                ),
+                senses[self.inequation.get_type()],
+                self.inequation.get_constant(),
+                name,
+            )
+        add: typing.Callable = (
+            model.addGenConstrMin
+            if self.type == GeneralConstraintType.MIN
+            else model.addGenConstrMax
+        )
+        return add(
+            get_var(self.var), [get_var(x) for x in self.operands], self.constant, name
+        )
+
+    def __str__(self) -> str:
+        """
+        Returns a readable representation of the constraint.
+
+        :return: The constraint as `z = min(...)`, `z = max(...)` or `y = v -> E`.
+
+        :rtype: str
+        """
+
+        if self.type == GeneralConstraintType.INDICATOR:
+            return f"{self.var} = {self.value} -> {self.inequation}"
+        args: list[str] = [str(x) for x in self.operands]
+        if self.constant is not None:
+            args.append(str(self.constant))
+        return f"{self.var} = {self.type}({', '.join(args)})"
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import concurrent.futures
+import math
 import os
 import re
 import time
 import traceback
 import typing
 
-import networkx as nx
+import numpy as np
 
 from fuzzy_dl_owl2.fuzzydl.assertion.assertion import Assertion
 from fuzzy_dl_owl2.fuzzydl.concept.concept import Concept
@@ -19,13 +21,23 @@ from fuzzy_dl_owl2.fuzzydl.degree.degree_numeric import DegreeNumeric
 from fuzzy_dl_owl2.fuzzydl.degree.degree_variable import DegreeVariable  # Variable
 from fuzzy_dl_owl2.fuzzydl.individual.created_individual import CreatedIndividual
 from fuzzy_dl_owl2.fuzzydl.individual.individual import Individual
+from fuzzy_dl_owl2.fuzzydl.milp.constraint_store import ConstraintStore
 from fuzzy_dl_owl2.fuzzydl.milp.expression import Expression
+from fuzzy_dl_owl2.fuzzydl.milp.general_constraint import GeneralConstraint
 from fuzzy_dl_owl2.fuzzydl.milp.inequation import Inequation  # Inequation
+from fuzzy_dl_owl2.fuzzydl.milp.piecewise_linear_constraint import (
+    PiecewiseLinearConstraint,
+)
+from fuzzy_dl_owl2.fuzzydl.milp.presolve import Presolver
 from fuzzy_dl_owl2.fuzzydl.milp.show_variables_helper import (
     ShowVariablesHelper,
 )  # Variable
 from fuzzy_dl_owl2.fuzzydl.milp.solution import Solution
+from fuzzy_dl_owl2.fuzzydl.milp.solver_artifacts import SolverArtifacts
+from fuzzy_dl_owl2.fuzzydl.milp.solver_limits import SolverLimits
+from fuzzy_dl_owl2.fuzzydl.milp.solver_session import SolverSession
 from fuzzy_dl_owl2.fuzzydl.milp.term import Term  # Term
+from fuzzy_dl_owl2.fuzzydl.milp.union_find import UnionFind
 from fuzzy_dl_owl2.fuzzydl.milp.variable import Variable  # Variable
 from fuzzy_dl_owl2.fuzzydl.relation import Relation
 from fuzzy_dl_owl2.fuzzydl.restriction.restriction import Restriction
@@ -34,9 +46,13 @@ from fuzzy_dl_owl2.fuzzydl.util.config_reader import ConfigReader
 from fuzzy_dl_owl2.fuzzydl.util.constants import VariableType  # Variable
 from fuzzy_dl_owl2.fuzzydl.util.constants import (
     ConceptType,
+    GeneralConstraintType,
     InequalityType,
     MILPProvider,
+    SolutionStatus,
+    SolverCapability,
 )
+from fuzzy_dl_owl2.fuzzydl.util.reasoner_context import ReasonerContext
 from fuzzy_dl_owl2.fuzzydl.util.util import Util
 
 
@@ -98,11 +114,13 @@ class MILPHelper:
     """
     This class serves as a comprehensive manager for Mixed-Integer Linear Programming (MILP) problems, functioning as an interface that translates high-level logical constructs—such as fuzzy concepts, roles, and individuals—into mathematical optimization models. It allows users to construct problems by retrieving or creating variables associated with specific domain entities, adding linear constraints or inequalities, and defining objective functions. The `optimize` method orchestrates the solving process by delegating to various external solver backends, including Gurobi, MIP, and PuLP, while also offering an optional partitioning strategy to handle complex problem structures. Beyond standard MILP operations, it provides specialized handling for "crisp" concepts and roles (enforcing binary variables), nominal variables, and string features, along with utilities to clone the problem state or output variable values and linguistic label memberships for analysis.
 
+    :param CAPABILITIES: The high-level constraints that every MILP provider handles natively; the other ones are lowered into linear constraints before the model is built.
+    :type CAPABILITIES: dict[MILPProvider, frozenset[SolverCapability]]
     :param PARTITION: Flag to enable a partitioning strategy that decomposes the MILP problem into smaller sub-problems based on variable connectivity.
     :type PARTITION: bool
-    :param PRINT_LABELS: Determines whether to display the membership degrees of variables to linguistic labels.
+    :param PRINT_LABELS: Determines whether to display the membership degrees of variables to linguistic labels. The class attribute is the default, which a query can override on the helpers it solves.
     :type PRINT_LABELS: bool
-    :param PRINT_VARIABLES: Controls whether the values of the variables are printed to the debug output.
+    :param PRINT_VARIABLES: Controls whether the values of the variables are printed to the debug output. The class attribute is the default, which a query can override on the helpers it solves.
     :type PRINT_VARIABLES: bool
     :param nominal_variables: Controls whether variables representing nominal concepts (e.g., `a:{a}`) are retained in the MILP problem. If False, these variables and their associated constraints are removed prior to optimization.
     :type nominal_variables: bool
@@ -110,11 +128,17 @@ class MILPHelper:
     :type cardinalities: list[SigmaCount]
     :param constraints: A list of `Inequation` objects representing the linear constraints defining the feasible region of the MILP problem.
     :type constraints: list[Inequation]
+    :param constraint_store: Columnar copy of `constraints` in compressed sparse row format, aligned row by row with `constraints`, from which the solver backends load the constraint matrix.
+    :type constraint_store: ConstraintStore
+    :param piecewise_constraints: The piecewise linear constraints of the MILP problem, which are handled natively by the providers supporting them and lowered into linear constraints for the other ones.
+    :type piecewise_constraints: list[PiecewiseLinearConstraint]
+    :param general_constraints: The minima, maxima and indicator constraints of the MILP problem, which are handled natively by the providers supporting them and lowered into linear constraints for the other ones.
+    :type general_constraints: list[GeneralConstraint]
     :param crisp_concepts: A set of concept names that are restricted to binary values (0 or 1), ensuring that any variables representing these concepts in the MILP problem are defined as binary variables.
     :type crisp_concepts: set[str]
     :param crisp_roles: A set of role names that are restricted to binary values (0 or 1), ensuring their corresponding variables in the MILP problem are binary.
     :type crisp_roles: set[str]
-    :param number_of_variables: Maps variable names to their integer indices, ensuring uniqueness and enabling efficient variable lookup.
+    :param number_of_variables: Maps variable names to the integer identifiers of the variables (see `Variable.id`), ensuring uniqueness and enabling efficient variable lookup. Identifiers are assigned in creation order and are never reused, even if the variable is later removed from the problem.
     :type number_of_variables: dict[str, int]
     :param show_vars: Helper instance that tracks variables designated for output and manages their association with linguistic labels for displaying membership degrees.
     :type show_vars: ShowVariablesHelper
@@ -122,12 +146,41 @@ class MILPHelper:
     :type string_features: set[str]
     :param string_values: Maps integer encodings to their corresponding string values, used to handle string features within the MILP problem.
     :type string_values: dict[int, str]
-    :param variables: Stores the decision variables for the MILP problem in creation order, serving as the primary source for model construction and result mapping.
+    :param variables: Stores the decision variables for the MILP problem in creation order, serving as the primary source for model construction and result mapping. The position of a variable in this list is its identifier, unless nominal variables have been removed from the problem.
     :type variables: list[Variable]
+    :param positions: Maps the identifier of every variable to its position in `variables`, or to -1 if the variable has been removed; None while identifiers and positions coincide, that is, until nominal variables are removed.
+    :type positions: typing.Optional[list[int]]
+    :param assertion_variables: Secondary index mapping pairs (individual name, concept name) to the identifier of the variable representing the corresponding concept assertion, which avoids building the name of the variable on every lookup.
+    :type assertion_variables: dict[tuple[str, str], int]
+    :param shared_variables: Number of identifiers that may be shared with other helpers created by `clone`; the variables with a lower identifier are copied before being handed out for modification.
+    :type shared_variables: int
+    :param copied_variables: Identifiers of the shared variables that have already been replaced by a private copy.
+    :type copied_variables: set[int]
+    :param changed_variables: Identifiers of the variables of the base problem of the solver session that have been replaced by a private copy since the session was created, either by this helper or by the helpers it was cloned from; unlike `copied_variables`, it is not cleared by `clone`.
+    :type changed_variables: set[int]
+    :param session: Persistent solver session shared by the snapshots created by `clone` when persistent solver sessions are enabled, keeping the model of the base problem alive across queries.
+    :type session: typing.Optional[SolverSession]
+    :param limits: Time limit, MIP gap and cancellation flag of the current optimization, set by `optimize`; None uses the settings of `ConfigReader`.
+    :type limits: typing.Optional[SolverLimits]
+    :param components: Union-find forest over the identifiers of the variables that groups together the variables appearing in a common constraint, used to partition the MILP problem into independent sub-problems.
+    :type components: UnionFind
+    :param merged_constraints: Number of leading entries of `constraints` whose variables have already been merged in `components`.
+    :type merged_constraints: int
 
     :raises ValueError: Raised if the configured MILP provider is unsupported or if methods are called with invalid arguments.
     """
 
+    # High-level constraints handled natively by every provider
+    CAPABILITIES: dict[MILPProvider, frozenset[SolverCapability]] = {
+        MILPProvider.GUROBI: frozenset(
+            {
+                SolverCapability.PIECEWISE_LINEAR,
+                SolverCapability.MIN_MAX,
+                SolverCapability.INDICATOR,
+            }
+        ),
+        MILPProvider.MIP: frozenset({SolverCapability.PIECEWISE_LINEAR}),
+    }
     PARTITION: bool = False
     # Indicates whether we want to show the membership degrees to linguistic labels or not.
     PRINT_LABELS: bool = True
@@ -140,6 +193,9 @@ class MILPHelper:
         self.nominal_variables: bool = False
         self.cardinalities: list[SigmaCount] = list()
         self.constraints: list[Inequation] = list()  # Inequation
+        self.constraint_store: ConstraintStore = ConstraintStore()
+        self.piecewise_constraints: list[PiecewiseLinearConstraint] = list()
+        self.general_constraints: list[GeneralConstraint] = list()
         self.crisp_concepts: set[str] = set()
         self.crisp_roles: set[str] = set()
         self.number_of_variables: dict[str, int] = dict()
@@ -147,40 +203,271 @@ class MILPHelper:
         self.string_features: set[str] = set()
         self.string_values: dict[int, str] = dict()
         self.variables: list[Variable] = []  # Variable
+        self.positions: typing.Optional[list[int]] = None
+        self.assertion_variables: dict[tuple[str, str], int] = dict()
+        self.shared_variables: int = 0
+        self.copied_variables: set[int] = set()
+        self.changed_variables: set[int] = set()
+        self.session: typing.Optional[SolverSession] = None
+        self.limits: typing.Optional[SolverLimits] = None
+        self.components: UnionFind = UnionFind()
+        self.merged_constraints: int = 0
 
     def clone(self) -> typing.Self:
         """
-        Creates and returns a deep copy of the current `MILPHelper` instance. The method constructs a new object and populates it by recursively cloning lists of complex objects such as `cardinalities`, `constraints`, and `variables`, while using `copy.deepcopy` for other mutable structures like `crisp_concepts` and `string_features`. This ensures that the returned instance is independent of the original for most attributes, though it is important to note that `nominal_variables` is assigned by reference rather than copied, meaning modifications to this specific attribute in the clone will affect the original object.
+        Creates and returns a copy-on-write snapshot of the current `MILPHelper` instance. Constraints are never modified once added, so the new object shares the existing `Inequation`, `PiecewiseLinearConstraint` and `GeneralConstraint` objects and the arrays of the constraint store with the original one and only records the constraints it adds afterwards. Variables are shared as well: both helpers mark all the current variables as shared, and `get_variable` replaces a shared variable with a private copy the first time it is requested, so type changes made by one helper never leak into the other and the cost of the snapshot is proportional to the number of variables actually used by the query. The remaining collections, such as `crisp_concepts`, `number_of_variables` or the index of assertion variables, are copied shallowly, the union-find forest of the connected components of the variables is copied if it has already been built, while `nominal_variables` and the `PRINT_LABELS` and `PRINT_VARIABLES` flags are assigned by value. If persistent solver sessions are enabled, the current instance becomes the base problem of a solver session (unless it already derives from the base problem of its session), which is shared with the snapshot so that solving the snapshot only requires applying its delta to the live solver model; the snapshot inherits the identifiers of the base variables changed so far, so that the session also applies the changes made before cloning.
 
-        :return: A deep copy of the current instance.
+        :return: A copy-on-write snapshot of the current instance.
 
         :rtype: typing.Self
         """
 
         milp: MILPHelper = MILPHelper()
         milp.nominal_variables = self.nominal_variables
+        milp.PRINT_LABELS = self.PRINT_LABELS
+        milp.PRINT_VARIABLES = self.PRINT_VARIABLES
         milp.cardinalities = [c.clone() for c in self.cardinalities]
-        milp.constraints = [c.clone() for c in self.constraints]
-        # milp.crisp_concepts = copy.deepcopy(self.crisp_concepts)
-        # milp.crisp_roles = copy.deepcopy(self.crisp_roles)
-        # milp.number_of_variables = copy.deepcopy(self.number_of_variables)
+        milp.constraints = list(self.constraints)
+        milp.constraint_store = self.constraint_store.clone()
+        milp.piecewise_constraints = list(self.piecewise_constraints)
+        milp.general_constraints = list(self.general_constraints)
         milp.crisp_concepts = set(self.crisp_concepts)
         milp.crisp_roles = set(self.crisp_roles)
         milp.number_of_variables = dict(self.number_of_variables)
         milp.show_vars = self.show_vars.clone()
-        # milp.string_features = copy.deepcopy(self.string_features)
-        # milp.string_values = copy.deepcopy(self.string_values)
         milp.string_features = set(self.string_features)
         milp.string_values = dict(self.string_values)
-        milp.variables = [v.clone() for v in self.variables]
+        milp.variables = list(self.variables)
+        if self.positions is not None:
+            milp.positions = list(self.positions)
+        milp.assertion_variables = dict(self.assertion_variables)
+        if self.merged_constraints > 0:
+            milp.components = self.components.clone()
+            milp.merged_constraints = self.merged_constraints
+        # From now on, both helpers must copy a variable before modifying it
+        self.shared_variables = milp.shared_variables = len(self.number_of_variables)
+        self.copied_variables = set()
+        if (
+            ConfigReader.PERSISTENT_SOLVER_SESSIONS
+            and self.positions is None
+            and SolverSession.supports(ConfigReader.MILP_PROVIDER)
+        ):
+            if self.session is None or not self.session.is_prefix_of(self):
+                self.session = SolverSession.create(self)
+                self.changed_variables = set()
+            milp.session = self.session
+            # The snapshot inherits the changes made to the base problem so far
+            milp.changed_variables = set(self.changed_variables)
         return milp
 
-    def optimize(self, objective: Expression) -> typing.Optional[Solution]:
+    def get_position(self, var_id: int) -> int:
+        """
+        Returns the position in `variables` of the variable with the given identifier. Identifiers and positions coincide until nominal variables are removed from the problem; after that, the position is read from `positions`.
+
+        :param var_id: The identifier of the variable.
+        :type var_id: int
+
+        :return: The position of the variable in `variables`, or -1 if the variable has been removed from the problem.
+
+        :rtype: int
+        """
+
+        if self.positions is None:
+            return var_id
+        return self.positions[var_id]
+
+    def __get_variable_position(self, var: Variable) -> int:
+        """
+        Returns the position in `variables` of the given variable, which must belong to the MILP problem.
+
+        :param var: The variable whose position is requested.
+        :type var: Variable
+
+        :raises ValueError: Raised if the variable is not part of the MILP problem.
+
+        :return: The position of the variable in `variables`.
+
+        :rtype: int
+        """
+
+        i: int = self.get_position(var.id) if var.id >= 0 else -1
+        if i < 0:
+            raise ValueError(f"{var} is not a variable of the MILP problem")
+        return i
+
+    def __get_model_rows(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Computes the bounds of the variables and the constraints that have to be added to a solver model. Constraints with a single variable, such as `2 * x >= 1`, are not sent to the solvers as rows but folded into the bounds of their variable, which are tightened with vectorized operations and rounded inwards for integer variables; the bounds of the `Variable` objects are left untouched, so that later changes of their types, which reset their bounds, cannot lose the folded constraints. If the folded constraints of a variable contradict each other, they are kept as rows and its bounds are not tightened, so that the solvers report the inconsistency as usual.
+
+        :return: A tuple with the indices of the rows of `constraint_store` to add to the model, and the lower and upper bounds of the variables, indexed by their positions in `variables`.
+
+        :rtype: tuple[np.ndarray, np.ndarray, np.ndarray]
+        """
+
+        store: ConstraintStore = self.constraint_store
+        n: int = len(store)
+        lower: np.ndarray = np.array(
+            [var.get_lower_bound() for var in self.variables], dtype=np.float64
+        )
+        upper: np.ndarray = np.array(
+            [var.get_upper_bound() for var in self.variables], dtype=np.float64
+        )
+        row_ptr: np.ndarray = store.row_ptr[: n + 1]
+        single: np.ndarray = np.flatnonzero(np.diff(row_ptr) == 1)
+        if len(single) == 0:
+            return np.arange(n), lower, upper
+
+        entries: np.ndarray = row_ptr[single]
+        positions: np.ndarray = store.cols[entries]
+        if self.positions is not None:
+            positions = np.asarray(self.positions, dtype=np.int64)[positions]
+        coefs: np.ndarray = store.coefs[entries]
+        values: np.ndarray = store.rhs[single] / coefs
+        senses: np.ndarray = store.senses[single]
+        equal: np.ndarray = senses == ConstraintStore.SENSES.index(InequalityType.EQUAL)
+        greater: np.ndarray = senses == ConstraintStore.SENSES.index(
+            InequalityType.GREATER_THAN
+        )
+        # a * x >= b bounds x from below if a > 0, and a * x <= b if a < 0
+        raises_lower: np.ndarray = equal | (greater == (coefs > 0))
+        lowers_upper: np.ndarray = equal | ~raises_lower
+        new_lower: np.ndarray = lower.copy()
+        new_upper: np.ndarray = upper.copy()
+        np.maximum.at(new_lower, positions[raises_lower], values[raises_lower])
+        np.minimum.at(new_upper, positions[lowers_upper], values[lowers_upper])
+        # The bounds of integer variables are rounded inwards, as some presolvers mishandle fractional ones
+        integer: np.ndarray = np.array(
+            [
+                var.get_type() in (VariableType.BINARY, VariableType.INTEGER)
+                for var in self.variables
+            ],
+            dtype=bool,
+        )
+        new_lower[integer] = np.ceil(new_lower[integer] - 1e-9)
+        new_upper[integer] = np.floor(new_upper[integer] + 1e-9)
+
+        conflict: np.ndarray = new_lower > new_upper
+        new_lower[conflict] = lower[conflict]
+        new_upper[conflict] = upper[conflict]
+        kept: np.ndarray = np.ones(n, dtype=bool)
+        kept[single[~conflict[positions]]] = False
+        return np.flatnonzero(kept), new_lower, new_upper
+
+    def __get_constraint_rows(
+        self, rows: np.ndarray
+    ) -> typing.Iterator[tuple[int, list[int], list[float], InequalityType, float]]:
+        """
+        Yields the given constraints, read from the columnar `constraint_store` instead of the `Inequation` objects. The identifiers of the variables are translated into positions in `variables` with a single vectorized lookup, so that the solver backends can build every row from plain lists.
+
+        :param rows: The indices of the rows to yield, as returned by `__get_model_rows`.
+        :type rows: np.ndarray
+
+        :return: An iterator over tuples with the index of the constraint in `constraints`, the positions of its variables, their coefficients, its relational operator and its right-hand side.
+
+        :rtype: typing.Iterator[tuple[int, list[int], list[float], InequalityType, float]]
+        """
+
+        store: ConstraintStore = self.constraint_store
+        nnz: int = store.num_nonzeros()
+        cols: np.ndarray = store.cols[:nnz]
+        if self.positions is not None:
+            cols = np.asarray(self.positions, dtype=np.int64)[cols]
+        positions: list[int] = cols.tolist()
+        coefs: list[float] = store.coefs[:nnz].tolist()
+        row_ptr: list[int] = store.row_ptr[: len(store) + 1].tolist()
+        rhs: list[float] = store.rhs[: len(store)].tolist()
+        for i in rows.tolist():
+            start, end = row_ptr[i], row_ptr[i + 1]
+            yield (
+                i,
+                positions[start:end],
+                coefs[start:end],
+                store.get_sense(i),
+                rhs[i],
+            )
+
+    def __get_constraint_matrix(
+        self, rows: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Builds the matrix of the given constraints in compressed sparse row form directly from the columnar `constraint_store`, translating the identifiers of the variables into positions in `variables`, so that the arrays can be passed in bulk to a solver. The rows of the store are already normalized, so they contain neither repeated variables nor null coefficients. Unsatisfiable constraints without variables are kept as empty rows, so that the solver can detect their infeasibility. The relational operator of every row is encoded in its lower and upper limits, which are infinite when the row is unbounded on that side.
+
+        :param rows: The indices of the rows of the matrix, as returned by `__get_model_rows`.
+        :type rows: np.ndarray
+
+        :return: A tuple with the offsets of the rows, the positions of the variables, their coefficients, and the lower and upper limits of the rows.
+
+        :rtype: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+        """
+
+        store: ConstraintStore = self.constraint_store.select(rows)
+        num_rows: int = len(store)
+        cols: np.ndarray = store.cols
+        if self.positions is not None:
+            cols = np.asarray(self.positions, dtype=np.int64)[cols]
+
+        lower: np.ndarray = np.full(num_rows, -np.inf)
+        upper: np.ndarray = np.full(num_rows, np.inf)
+        equal: np.ndarray = store.senses == ConstraintStore.SENSES.index(
+            InequalityType.EQUAL
+        )
+        less: np.ndarray = store.senses == ConstraintStore.SENSES.index(
+            InequalityType.LESS_THAN
+        )
+        lower[~less] = store.rhs[~less]
+        upper[equal | less] = store.rhs[equal | less]
+        return store.row_ptr, cols, store.coefs, lower, upper
+
+    def __get_own_variable(self, var_id: int) -> Variable:
+        """
+        Returns the variable with the given identifier, making sure that it is not shared with any other helper. If the variable was inherited from a snapshot and has not been copied yet, it is replaced by a private clone, which keeps the same identifier and is then returned.
+
+        :param var_id: The identifier of the variable.
+        :type var_id: int
+
+        :return: A variable owned by this helper that can be safely modified.
+
+        :rtype: Variable
+        """
+
+        i: int = self.get_position(var_id)
+        var: Variable = self.variables[i]
+        if var_id < self.shared_variables and var_id not in self.copied_variables:
+            var = var.clone()
+            self.variables[i] = var
+            self.copied_variables.add(var_id)
+            self.changed_variables.add(var_id)
+        return var
+
+    def __add_variable(self, var: Variable) -> Variable:
+        """
+        Registers a new variable in the MILP problem, assigning it the next free identifier, appending it to `variables` and recording its name in `number_of_variables`.
+
+        :param var: The variable to register.
+        :type var: Variable
+
+        :return: The registered variable.
+
+        :rtype: Variable
+        """
+
+        var.id = len(self.number_of_variables)
+        self.number_of_variables[str(var)] = var.id
+        if self.positions is not None:
+            self.positions.append(len(self.variables))
+        self.variables.append(var)
+        return var
+
+    def optimize(
+        self, objective: Expression, limits: typing.Optional[SolverLimits] = None
+    ) -> typing.Optional[Solution]:
         """
-        Optimizes the provided objective expression by dispatching the problem to a specific Mixed-Integer Linear Programming (MILP) solver defined in the global configuration. The method inspects the `MILP_PROVIDER` setting to select the appropriate backend, supporting options such as Gurobi, Python-MIP, and various PuLP interfaces. It delegates the actual solving process to the corresponding internal method and returns the resulting solution object. If the configured provider is not recognized or supported, a `ValueError` is raised.
+        Optimizes the provided objective expression by dispatching the problem to a specific Mixed-Integer Linear Programming (MILP) solver defined in the global configuration. The method inspects the `MILP_PROVIDER` setting to select the appropriate backend, supporting options such as Gurobi, Python-MIP, and various PuLP interfaces. It delegates the actual solving process to the corresponding internal method and returns the resulting solution object. If partitioned solving is enabled, either through the `PARTITION` flag or the `MILP_PARTITION` setting, the problem is decomposed into independent sub-problems solved in parallel by `solve_using_partitions`. Otherwise, when the helper shares a persistent solver session with the problem it was cloned from, and the problem still derives from the base model of the session, the session solves the problem instead by applying only its delta to the live model. Every backend applies the time limit and the MIP gap of the given limits; if the solver stops before proving optimality, a bounded Solution is returned, and if the limits have already been cancelled, the solver is not called at all. The piecewise linear and general constraints are lowered into linear constraints beforehand if the provider does not support them natively, as are the piecewise linear constraints added to a snapshot solved by a persistent session. If the configured provider is not recognized or supported, a `ValueError` is raised.
 
         :param objective: The mathematical expression or model to be optimized using the configured MILP solver.
         :type objective: Expression
+        :param limits: The time limit, MIP gap and cancellation flag of the optimization, or None to use the settings of `ConfigReader`.
+        :type limits: typing.Optional[SolverLimits]
 
         :raises ValueError: Raised when the configured MILP provider is unsupported or unrecognized.
 
@@ -191,10 +478,65 @@ class MILPHelper:
 
         if ConfigReader.DEBUG_PRINT:
             Util.debug(f"Running MILP solver: {ConfigReader.MILP_PROVIDER.name}")
+        self.limits = limits
+        if limits is not None and limits.is_cancelled():
+            return Solution.get_bounded(SolutionStatus.CANCELLED)
+        if not MILPHelper.supports(SolverCapability.PIECEWISE_LINEAR):
+            self.lower_piecewise_linear_constraints()
+        self.lower_general_constraints()
+        if MILPHelper.PARTITION or ConfigReader.MILP_PARTITION:
+            return self.solve_using_partitions(objective)
+        if self.session is not None and self.session.is_prefix_of(self):
+            # The session only keeps the piecewise linear constraints of its base model
+            self.lower_piecewise_linear_constraints(
+                self.session.num_piecewise_constraints
+            )
+            return self.session.solve(self, objective)
+        return self.solve_model(objective)
+
+    def solve_model(self, objective: Expression) -> typing.Optional[Solution]:
+        """
+        Optimizes the provided objective expression by building a single model for the whole MILP problem with the backend selected by the `MILP_PROVIDER` setting, namely Gurobi, Python-MIP, HiGHS or one of the PuLP interfaces. The piecewise linear and general constraints are lowered into linear constraints first if the provider does not support them natively, and the problem is simplified by `solve_presolved` if the `MILP_PRESOLVE` setting is enabled. If the configured provider is not recognized or supported, a `ValueError` is raised.
+
+        :param objective: The linear expression to minimize.
+        :type objective: Expression
+
+        :raises ValueError: Raised when the configured MILP provider is unsupported or unrecognized.
+
+        :return: The optimal solution for the given objective expression, or None if no solution is found.
+
+        :rtype: typing.Optional[Solution]
+        """
+
+        if not MILPHelper.supports(SolverCapability.PIECEWISE_LINEAR):
+            self.lower_piecewise_linear_constraints()
+        self.lower_general_constraints()
+        if ConfigReader.MILP_PRESOLVE:
+            return self.solve_presolved(objective)
+        return self.__solve_with_provider(objective)
+
+    def __solve_with_provider(
+        self, objective: Expression
+    ) -> typing.Optional[Solution]:
+        """
+        Builds and solves a single model for the whole MILP problem with the backend selected by the `MILP_PROVIDER` setting, whose piecewise linear and general constraints must already be supported by the provider.
+
+        :param objective: The linear expression to minimize.
+        :type objective: Expression
+
+        :raises ValueError: Raised when the configured MILP provider is unsupported or unrecognized.
+
+        :return: The optimal solution for the given objective expression, or None if no solution is found.
+
+        :rtype: typing.Optional[Solution]
+        """
+
         if ConfigReader.MILP_PROVIDER == MILPProvider.GUROBI:
             return self.solve_gurobi(objective)
         elif ConfigReader.MILP_PROVIDER == MILPProvider.MIP:
             return self.solve_mip(objective)
+        elif ConfigReader.MILP_PROVIDER == MILPProvider.HIGHS:
+            return self.solve_highs(objective)
         elif ConfigReader.MILP_PROVIDER in [
             MILPProvider.PULP,
             MILPProvider.PULP_GLPK,
@@ -209,6 +551,17 @@ class MILPHelper:
                 f"Unsupported MILP provider: {ConfigReader.MILP_PROVIDER.name}"
             )
 
+    def get_limits(self) -> SolverLimits:
+        """
+        Returns the limits of the current optimization, namely the ones passed to `optimize`, or new limits following the settings of `ConfigReader` if none were given.
+
+        :return: The limits applied by the solver backends.
+
+        :rtype: SolverLimits
+        """
+
+        return SolverLimits() if self.limits is None else self.limits
+
     @typing.overload
     def print_instance_of_labels(
         self, f_name: str, ind_name: str, value: float
@@ -274,7 +627,7 @@ class MILPHelper:
 
     def get_new_variable(self, v_type: VariableType) -> Variable:  # Variable
         """
-        Creates a new variable of the specified type and registers it within the MILP helper instance. The method guarantees a unique variable name by checking against the internal registry of existing variables; if a name collision is detected, it regenerates the variable until a unique identifier is found. As a side effect, the new variable is appended to the internal list of variables, and its name is recorded in the tracking dictionary with its corresponding index.
+        Creates a new variable of the specified type and registers it within the MILP helper instance. The method guarantees a unique variable name by checking against the internal registry of existing variables; if a name collision is detected, it regenerates the variable until a unique identifier is found. As a side effect, the new variable is appended to the internal list of variables, and its name is recorded in the tracking dictionary with its identifier.
 
         :param v_type: The type of the variable to create.
         :type v_type: VariableType
@@ -290,9 +643,7 @@ class MILPHelper:
             if var_name not in self.number_of_variables:
                 break
 
-        self.variables.append(new_var)
-        self.number_of_variables[var_name] = len(self.variables)
-        return new_var
+        return self.__add_variable(new_var)
 
     @typing.overload
     def get_variable(self, var_name: str) -> Variable: ...  # Variable
@@ -428,13 +779,12 @@ class MILPHelper:
         :rtype: Variable
         """
 
-        idx: int | None = self.number_of_variables.get(var_name)
-        if idx is not None:
-            return self.variables[idx - 1]
-        var: Variable = Variable(var_name, VariableType.SEMI_CONTINUOUS)  # Variable
-        self.variables.append(var)
-        self.number_of_variables[var_name] = len(self.variables)
-        return var
+        var_id: typing.Optional[int] = self.number_of_variables.get(var_name)
+        if var_id is not None and self.get_position(var_id) >= 0:
+            return self.__get_own_variable(var_id)
+        return self.__add_variable(
+            Variable(var_name, VariableType.SEMI_CONTINUOUS)  # Variable
+        )
 
     def __get_variable_2(
         self, var_name: str, v_type: VariableType
@@ -538,7 +888,7 @@ class MILPHelper:
         self, ind: Individual, concept_name: str
     ) -> Variable:  # Variable
         """
-        Retrieves a variable representing the truth value of a concept assertion for a specific individual, identified by the combination of the individual and concept name. If the concept is defined as a crisp concept, the method ensures the variable is configured as a binary variable. Additionally, if the display settings are configured to show either the specific individual or the concept, the variable is added to the display tracker. The method returns the resulting variable object.
+        Retrieves a variable representing the truth value of a concept assertion for a specific individual, identified by the combination of the individual and concept name. Variables that have already been retrieved are found through the (individual name, concept name) index, without building the name of the variable again. If the concept is defined as a crisp concept, the method ensures the variable is configured as a binary variable. Additionally, if the display settings are configured to show either the specific individual or the concept, the variable is added to the display tracker. The method returns the resulting variable object.
 
         :param ind: The individual entity for which the concept assertion variable is defined.
         :type ind: Individual
@@ -550,7 +900,13 @@ class MILPHelper:
         :rtype: Variable
         """
 
-        var: Variable = self.get_variable(f"{ind}:{concept_name}")  # Variable
+        key: tuple[str, str] = (str(ind), concept_name)
+        var_id: typing.Optional[int] = self.assertion_variables.get(key)
+        if var_id is not None and self.get_position(var_id) >= 0:
+            var: Variable = self.__get_own_variable(var_id)  # Variable
+        else:
+            var: Variable = self.get_variable(f"{ind}:{concept_name}")  # Variable
+            self.assertion_variables[key] = var.id
         if concept_name in self.crisp_concepts:
             var.set_binary_variable()
         if self.show_vars.show_individuals(str(ind)) or self.show_vars.show_concepts(
@@ -854,7 +1210,7 @@ class MILPHelper:
 
     def exists_nominal_variable(self, i: str) -> bool:
         """
-        Determines whether a variable representing the nominal concept for a specific individual `i` is currently defined within the model. The method constructs the expected variable name based on the individual's identifier and checks for its presence in the internal collection of variables. This is a read-only operation that returns a boolean indicating whether the specific nominal variable has been instantiated.
+        Determines whether a variable representing the nominal concept for a specific individual `i` is currently defined within the model. The method constructs the expected variable name based on the individual's identifier and looks up its identifier in `number_of_variables`, so the check takes constant time; a variable removed from the problem together with the other nominal variables does not count as defined. This is a read-only operation that returns a boolean indicating whether the specific nominal variable has been instantiated.
 
         :param i: The identifier of the individual to check for the existence of a corresponding nominal variable.
         :type i: str
@@ -865,7 +1221,8 @@ class MILPHelper:
         """
 
         var_name: str = f"{i}:{{ {i} }}"
-        return var_name in list(map(str, self.variables))
+        var_id: typing.Optional[int] = self.number_of_variables.get(var_name)
+        return var_id is not None and self.get_position(var_id) >= 0
 
     def get_negated_nominal_variable(self, i1: str, i2: str) -> Variable:  # Variable
         r"""
@@ -888,7 +1245,8 @@ class MILPHelper:
         """
 
         var_name: str = f"{i1}: not {{ {i2} }}"
-        flag: bool = var_name in list(map(str, self.variables))
+        var_id: typing.Optional[int] = self.number_of_variables.get(var_name)
+        flag: bool = var_id is not None and self.get_position(var_id) >= 0
         v: Variable = self.get_variable(var_name)  # Variable
         # First time the variable is created, x_{a:{o} } = 1 - x_{a: not {o} }
         if not flag:
@@ -1003,7 +1361,7 @@ class MILPHelper:
         :type constraint_type: InequalityType
         """
 
-        self.constraints.append(Inequation(expr, constraint_type))  # Inequation
+        self.__add_constraint(Inequation(expr, constraint_type))  # Inequation
 
     def __add_new_constraint_2(self, x: Variable, n: float) -> None:  # Variable
         """
@@ -1080,10 +1438,21 @@ class MILPHelper:
         :type degree: Degree
         """
 
-        self.constraints.append(
+        self.__add_constraint(
             degree.create_inequality_with_degree_rhs(expr, constraint_type)
         )
 
+    def __add_constraint(self, constraint: Inequation) -> None:
+        """
+        Appends a constraint to the MILP problem, adding its normalized row to the columnar `constraint_store` and the `Inequation` object to `constraints`, so that both stay aligned. Constraints that are already in the problem or that are trivially satisfied are discarded by the store and are not added to `constraints` either.
+
+        :param constraint: The constraint to add.
+        :type constraint: Inequation
+        """
+
+        if self.constraint_store.append_inequation(constraint):
+            self.constraints.append(constraint)
+
     def __add_new_constraint_7(
         self, expr: Expression, constraint_type: InequalityType, n: float
     ) -> None:
@@ -1120,6 +1489,350 @@ class MILPHelper:
             Expression(Term(1.0, var1), Term(-1.0, var2)), InequalityType.EQUAL  # Term
         )
 
+    def add_piecewise_linear_constraint(
+        self, x: Variable, y: Variable, x_points: list[float], y_points: list[float]
+    ) -> None:
+        r"""
+        Enforces  $y = f(x)$, where $f$ interpolates linearly the given breakpoints, by adding a `PiecewiseLinearConstraint` to the problem. Consecutive repeated breakpoints are dropped, and $x$ is restricted to $[x_0, x_n]$ with two single-variable constraints, which become bounds of the variable, since Gurobi extends the function beyond its first and last breakpoints.
+
+        :param x: The variable of the argument of the function.
+        :type x: Variable
+        :param y: The variable of the value of the function.
+        :type y: Variable
+        :param x_points: The abscissas of the breakpoints, in non-decreasing order.
+        :type x_points: list[float]
+        :param y_points: The ordinates of the breakpoints, aligned with `x_points`.
+        :type y_points: list[float]
+        """
+
+        points: list[tuple[float, float]] = []
+        for point in zip(x_points, y_points):
+            if len(points) == 0 or points[-1] != point:
+                points.append(point)
+        if len(points) == 1:
+            points.append(points[0])
+        constraint: PiecewiseLinearConstraint = PiecewiseLinearConstraint(
+            x, y, [p[0] for p in points], [p[1] for p in points]
+        )
+        # x >= x_0, x <= x_n
+        self.add_new_constraint(
+            Expression(Term(1.0, x)), InequalityType.GREATER_THAN, points[0][0]
+        )
+        self.add_new_constraint(
+            Expression(Term(1.0, x)), InequalityType.LESS_THAN, points[-1][0]
+        )
+        self.piecewise_constraints.append(constraint)
+        if ConfigReader.DEBUG_PRINT:
+            Util.debug(f"Piecewise linear constraint: {constraint}")
+
+    @staticmethod
+    def supports(
+        capability: SolverCapability, provider: typing.Optional[MILPProvider] = None
+    ) -> bool:
+        """
+        Checks whether a MILP provider handles a kind of high-level constraint natively, according to `CAPABILITIES`. Gurobi supports piecewise linear constraints, minima, maxima and indicator constraints through its general constraints, and Python-MIP supports piecewise linear constraints through special ordered sets of type 2; the constraints that a provider does not support are lowered by `lower_piecewise_linear_constraints` and `lower_general_constraints`. The encoders of the fuzzy operators query this method to emit a general constraint only when the configured provider supports it, and their usual linearisation otherwise.
+
+        :param capability: The kind of constraint to check.
+        :type capability: SolverCapability
+        :param provider: The MILP provider to check, or None for the one selected by the `MILP_PROVIDER` setting.
+        :type provider: typing.Optional[MILPProvider]
+
+        :return: True if the provider supports the constraints natively, False otherwise.
+
+        :rtype: bool
+        """
+
+        if provider is None:
+            provider = ConfigReader.MILP_PROVIDER
+        return capability in MILPHelper.CAPABILITIES.get(provider, frozenset())
+
+    def lower_piecewise_linear_constraints(self, start: int = 0) -> None:
+        r"""
+        Replaces the piecewise linear constraints from the given position onwards with their convex combination formulation, made of linear constraints. Every breakpoint $i$ gets a weight $\lambda_i \in [0, 1]$ and every segment $j$ between breakpoints $j$ and $j+1$ a binary variable $z_j$, so that only the two weights of the selected segment can be positive:
+
+        .. math::
+            \sum_i \lambda_i = 1, \quad \sum_j z_j = 1, \quad
+            \lambda_i \le z_{i-1} + z_i, \quad
+            x = \sum_i \lambda_i x_i, \quad y = \sum_i \lambda_i y_i
+
+        Unlike the big-M encodings of the membership functions, no coefficient depends on the bounds of the domain, so the linear relaxation is the convex hull of the function on every segment. A function with a single segment needs no binary variable.
+
+        :param start: The position in `piecewise_constraints` of the first constraint to lower.
+        :type start: int
+        """
+
+        for constraint in self.piecewise_constraints[start:]:
+            x_points: list[float] = constraint.get_x_points()
+            y_points: list[float] = constraint.get_y_points()
+            n: int = len(x_points)
+            weights: list[Variable] = [
+                self.get_new_variable(VariableType.SEMI_CONTINUOUS) for _ in range(n)
+            ]
+            # sum_i lambda_i = 1
+            self.add_new_constraint(
+                Expression(*[Term(1.0, w) for w in weights]),
+                InequalityType.EQUAL,
+                1.0,
+            )
+            # x = sum_i lambda_i x_i
+            self.add_new_constraint(
+                Expression(
+                    Term(1.0, constraint.get_x()),
+                    *[Term(-p, w) for p, w in zip(x_points, weights) if p != 0],
+                ),
+                InequalityType.EQUAL,
+            )
+            # y = sum_i lambda_i y_i
+            self.add_new_constraint(
+                Expression(
+                    Term(1.0, constraint.get_y()),
+                    *[Term(-p, w) for p, w in zip(y_points, weights) if p != 0],
+                ),
+                InequalityType.EQUAL,
+            )
+            if n == 2:
+                continue
+            segments: list[Variable] = [
+                self.get_new_variable(VariableType.BINARY) for _ in range(n - 1)
+            ]
+            # sum_j z_j = 1
+            self.add_new_constraint(
+                Expression(*[Term(1.0, z) for z in segments]),
+                InequalityType.EQUAL,
+                1.0,
+            )
+            # lambda_i <= z_{i-1} + z_i
+            for i, w in enumerate(weights):
+                self.add_new_constraint(
+                    Expression(
+                        Term(1.0, w),
+                        *[Term(-1.0, segments[j]) for j in (i - 1, i) if 0 <= j < n - 1],
+                    ),
+                    InequalityType.LESS_THAN,
+                )
+        del self.piecewise_constraints[start:]
+
+    def add_min_constraint(
+        self, z: Variable, x: list[Variable], constant: typing.Optional[float] = None
+    ) -> None:
+        r"""
+        Enforces  $z = \min(x_1, \dots, x_n, c)$  by adding a `GeneralConstraint` to the problem, where the constant $c$ is optional.
+
+        :param z: The result variable.
+        :type z: Variable
+        :param x: The variable operands.
+        :type x: list[Variable]
+        :param constant: The constant operand, if any.
+        :type constant: typing.Optional[float]
+        """
+
+        self.__add_general_constraint(
+            GeneralConstraint(GeneralConstraintType.MIN, z, x, constant)
+        )
+
+    def add_max_constraint(
+        self, z: Variable, x: list[Variable], constant: typing.Optional[float] = None
+    ) -> None:
+        r"""
+        Enforces  $z = \max(x_1, \dots, x_n, c)$  by adding a `GeneralConstraint` to the problem, where the constant $c$ is optional.
+
+        :param z: The result variable.
+        :type z: Variable
+        :param x: The variable operands.
+        :type x: list[Variable]
+        :param constant: The constant operand, if any.
+        :type constant: typing.Optional[float]
+        """
+
+        self.__add_general_constraint(
+            GeneralConstraint(GeneralConstraintType.MAX, z, x, constant)
+        )
+
+    def add_indicator_constraint(
+        self,
+        y: Variable,
+        value: int,
+        expr: Expression,
+        constraint_type: InequalityType,
+        n: float = 0.0,
+    ) -> None:
+        r"""
+        Enforces  $y = v \Rightarrow E \bowtie n$, where $y$ is a binary variable, by adding a `GeneralConstraint` to the problem. The right-hand side is moved into the expression, as in `add_new_constraint`.
+
+        :param y: The binary variable activating the constraint.
+        :type y: Variable
+        :param value: The value of `y`, 0 or 1, activating the constraint.
+        :type value: int
+        :param expr: The left-hand side of the enforced constraint.
+        :type expr: Expression
+        :param constraint_type: The type of the enforced constraint.
+        :type constraint_type: InequalityType
+        :param n: The right-hand side of the enforced constraint.
+        :type n: float
+        """
+
+        self.__add_general_constraint(
+            GeneralConstraint(
+                GeneralConstraintType.INDICATOR,
+                y,
+                [],
+                value=value,
+                inequation=DegreeNumeric.get_degree(
+                    n
+                ).create_inequality_with_degree_rhs(expr, constraint_type),
+            )
+        )
+
+    def __add_general_constraint(self, constraint: GeneralConstraint) -> None:
+        """
+        Appends a general constraint to the problem.
+
+        :param constraint: The general constraint to add.
+        :type constraint: GeneralConstraint
+        """
+
+        self.general_constraints.append(constraint)
+        if ConfigReader.DEBUG_PRINT:
+            Util.debug(f"General constraint: {constraint}")
+
+    def lower_general_constraints(self) -> None:
+        r"""
+        Replaces the general constraints that the provider selected by the `MILP_PROVIDER` setting does not support natively with linear constraints. Every operand $x_i$ of a minimum gets a binary variable $b_i$ selecting the operand equal to the result, and the big-M coefficients are computed from the bounds of the variables:
+
+        .. math::
+            z \le x_i, \quad x_i \le z + (u_{x_i} - l_z)(1 - b_i), \quad \sum_i b_i = 1
+
+        Maxima are lowered symmetrically, and the constant operand is handled as an operand whose bounds are equal. An indicator constraint  $y = v \Rightarrow E \le 0$  becomes  $E \le u_E (1 - y)$  if $v = 1$, or  $E \le u_E\, y$  if $v = 0$, where $u_E$ is the maximum of $E$ over the bounds of its variables; constraints  $E \ge 0$  are lowered with the minimum of $E$, and equalities as a pair of inequalities.
+
+        :raises ValueError: Raised if a big-M coefficient cannot be computed because some variable is unbounded.
+        """
+
+        kept: list[GeneralConstraint] = []
+        for constraint in self.general_constraints:
+            if constraint.get_type() == GeneralConstraintType.INDICATOR:
+                if MILPHelper.supports(SolverCapability.INDICATOR):
+                    kept.append(constraint)
+                else:
+                    self.__lower_indicator_constraint(constraint)
+            elif MILPHelper.supports(SolverCapability.MIN_MAX):
+                kept.append(constraint)
+            else:
+                self.__lower_min_max_constraint(constraint)
+        self.general_constraints = kept
+
+    def __get_bounds(self, var: Variable) -> tuple[float, float]:
+        """
+        Returns the bounds of a variable of the problem, read from the variable currently stored in `variables`, which may be a private copy of the given one.
+
+        :param var: The variable.
+        :type var: Variable
+
+        :return: The lower and upper bounds of the variable.
+
+        :rtype: tuple[float, float]
+        """
+
+        current: Variable = self.variables[self.__get_variable_position(var)]
+        return current.get_lower_bound(), current.get_upper_bound()
+
+    def __lower_min_max_constraint(self, constraint: GeneralConstraint) -> None:
+        """
+        Adds the linear constraints replacing a minimum or a maximum, as described in `lower_general_constraints`.
+
+        :param constraint: The minimum or maximum to lower.
+        :type constraint: GeneralConstraint
+
+        :raises ValueError: Raised if some variable of the constraint is unbounded.
+        """
+
+        z: Variable = constraint.get_var()
+        is_min: bool = constraint.get_type() == GeneralConstraintType.MIN
+        # min: z <= x_i, max: z >= x_i
+        sense: InequalityType = (
+            InequalityType.LESS_THAN if is_min else InequalityType.GREATER_THAN
+        )
+        z_lb, z_ub = self.__get_bounds(z)
+        operands: list[tuple[typing.Optional[Variable], float, float]] = [
+            (x, *self.__get_bounds(x)) for x in constraint.get_operands()
+        ]
+        c: typing.Optional[float] = constraint.get_constant()
+        if c is not None:
+            operands.append((None, c, c))
+        selectors: list[Variable] = [
+            self.get_new_variable(VariableType.BINARY) for _ in operands
+        ]
+        # sum_i b_i = 1
+        self.add_new_constraint(
+            Expression(*[Term(1.0, b) for b in selectors]), InequalityType.EQUAL, 1.0
+        )
+        for (x, lb, ub), b in zip(operands, selectors):
+            big_m: float = ub - z_lb if is_min else z_ub - lb
+            if math.isinf(big_m):
+                raise ValueError(f"Cannot lower {constraint}: unbounded variables")
+            # min: z - x_i <= 0, max: z - x_i >= 0
+            expr: Expression = Expression(Term(1.0, z))
+            if x is not None:
+                expr.add_term(Term(-1.0, x))
+            self.add_new_constraint(expr, sense, lb if x is None else 0.0)
+            # min: z - x_i - M b_i >= -M, max: z - x_i + M b_i <= M
+            expr = Expression(Term(1.0, z), Term(-big_m if is_min else big_m, b))
+            if x is not None:
+                expr.add_term(Term(-1.0, x))
+            self.add_new_constraint(
+                expr,
+                InequalityType.GREATER_THAN if is_min else InequalityType.LESS_THAN,
+                (-big_m if is_min else big_m) + (lb if x is None else 0.0),
+            )
+
+    def __lower_indicator_constraint(self, constraint: GeneralConstraint) -> None:
+        """
+        Adds the linear constraints replacing an indicator constraint, as described in `lower_general_constraints`.
+
+        :param constraint: The indicator constraint to lower.
+        :type constraint: GeneralConstraint
+
+        :raises ValueError: Raised if some variable of the enforced constraint is unbounded.
+        """
+
+        y: Variable = constraint.get_var()
+        inequation: Inequation = constraint.get_inequation()
+        terms: list[Term] = inequation.get_terms()
+        # E = sum_j a_j x_j - rhs
+        rhs: float = inequation.get_constant()
+        e_min: float = -rhs
+        e_max: float = -rhs
+        for term in terms:
+            lb, ub = self.__get_bounds(term.get_var())
+            a: float = term.get_coeff()
+            e_min += min(a * lb, a * ub)
+            e_max += max(a * lb, a * ub)
+        if math.isinf(e_min) or math.isinf(e_max):
+            raise ValueError(f"Cannot lower {constraint}: unbounded variables")
+        # Coefficient of y and constant making the constraint redundant when inactive
+        sign: float = 1.0 if constraint.get_value() == 1 else -1.0
+        offset: float = 1.0 if constraint.get_value() == 1 else 0.0
+        constraint_type: InequalityType = inequation.get_type()
+        if constraint_type in (InequalityType.LESS_THAN, InequalityType.EQUAL):
+            # E <= u_E (1 - y) if v = 1, E <= u_E y if v = 0
+            self.add_new_constraint(
+                Expression(
+                    *[Term(t.get_coeff(), t.get_var()) for t in terms],
+                    Term(sign * e_max, y),
+                ),
+                InequalityType.LESS_THAN,
+                rhs + offset * e_max,
+            )
+        if constraint_type in (InequalityType.GREATER_THAN, InequalityType.EQUAL):
+            # E >= l_E (1 - y) if v = 1, E >= l_E y if v = 0
+            self.add_new_constraint(
+                Expression(
+                    *[Term(t.get_coeff(), t.get_var()) for t in terms],
+                    Term(sign * e_min, y),
+                ),
+                InequalityType.GREATER_THAN,
+                rhs + offset * e_min,
+            )
+
     def add_string_feature(self, role: str) -> None:
         """
         Appends a specified string role to the internal collection of string features maintained by the helper. This operation modifies the object's state by adding the input to the `string_features` set. If the provided role is already present in the collection, the set ensures that no duplicate entry is created, making the operation idempotent.
@@ -1372,72 +2085,6 @@ class MILPHelper:
             self.add_new_constraint(exp, InequalityType.EQUAL)
         return y
 
-    def __bfs(self, graph: nx.Graph, solution: dict[int, int]) -> int:
-        # Number of nodes
-        """
-        Identifies connected components within the graph using a Breadth-First Search (BFS) approach and assigns partition identifiers to nodes. The method initializes the provided solution dictionary, mapping all nodes to a default partition of 0, and then iterates through the nodes to find unvisited starting points. For each unvisited node, it invokes the `__compute_partition` helper method to traverse the graph and assign the current partition ID to all reachable nodes. The `solution` dictionary is modified in place to reflect these assignments, and the method returns the total count of partitions found.
-
-        :param graph: The graph structure to be traversed and partitioned.
-        :type graph: nx.Graph
-        :param solution: Dictionary mapping node indices to their assigned partition IDs, modified in place to store the result.
-        :type solution: dict[int, int]
-
-        :return: The total number of partitions identified in the graph.
-
-        :rtype: int
-        """
-
-        n: int = graph.number_of_nodes()
-
-        # Solution is a mapping: variable -> partition
-        # Initial partition value is 0
-        for i in range(n):
-            solution[i] = 0
-
-        # Number of partition
-        p: int = 1
-
-        # Iterate over not processed nodes
-        queue: list[int] = list()
-        for i in range(n - 1):
-            # Skip node if processed
-            if solution[i] != 0:
-                continue
-            queue = [i]
-            solution[i] = p
-            self.__compute_partition(queue, solution, p, graph)
-
-            # Next partition
-            p += 1
-        return p - 1
-
-    def __compute_partition(
-        self, queue: list[int], solution: dict[int, int], p: int, graph: nx.Graph
-    ) -> None:
-        """
-        Propagates a partition identifier through a graph starting from the nodes provided in the queue. The method iteratively processes nodes, assigning the specified partition ID `p` to all adjacent neighbors that have not yet been assigned a value in the solution dictionary. This traversal continues until the queue is exhausted, effectively marking a connected region of the graph. The `solution` dictionary is modified in-place to reflect these assignments, and the input `queue` is consumed during the operation.
-
-        :param queue: List of node identifiers to be processed, used to traverse the graph and assign the partition ID to connected neighbors.
-        :type queue: list[int]
-        :param solution: Dictionary mapping node IDs to partition assignments, where a value of 0 indicates an unassigned node. Updated in place to assign the partition ID `p` to reachable nodes.
-        :type solution: dict[int, int]
-        :param p: The partition identifier or label to assign to nodes.
-        :type p: int
-        :param graph: The graph structure defining the connectivity between nodes, used to identify neighbors during the partition traversal.
-        :type graph: nx.Graph
-        """
-
-        while len(queue) > 0:
-            current: int = queue.pop()
-            neighbors: list[int] = list(graph.neighbors(current))
-            if len(neighbors) == 0:
-                continue
-            for j in neighbors:
-                if solution[j] != 0:
-                    continue
-                solution[j] = p
-                queue.append(j)
-
     def set_nominal_variables(self, value: bool) -> None:
         """
         Updates the configuration of the MILP helper instance by setting the flag that determines whether nominal variables are used. This method accepts a boolean value, which is assigned to the instance's internal state, thereby influencing the formulation of the optimization problem in subsequent operations. The operation modifies the object in-place and does not return a value.
@@ -1449,7 +2096,7 @@ class MILPHelper:
         self.nominal_variables = value
 
     def __remove_nominal_variables(self) -> None:
-        """This method purges nominal variables and any constraints that depend on them from the object's internal state. It iterates through the existing constraints to identify those containing nominal terms and scans the variables to determine which are nominal. Once the indices of these elements are collected, the method reconstructs the `constraints` and `variables` lists, excluding the identified items. This process mutates the object's state by reassigning these attributes, effectively removing data that is incompatible with the solver's requirements. If no nominal variables or dependent constraints are present, the lists remain unchanged."""
+        """This method purges nominal variables and any constraints that depend on them from the object's internal state. It iterates through the existing constraints to identify those containing nominal terms and scans the variables to determine which are nominal. Once the indices of these elements are collected, the method reconstructs the `constraints` and `variables` lists and the constraint store, excluding the identified items. This process mutates the object's state by reassigning these attributes, effectively removing data that is incompatible with the solver's requirements. The remaining variables keep their identifiers, but since their positions change, the mapping from identifiers to positions is stored in `positions`, and the union-find forest of connected components is discarded so that it is rebuilt from the remaining constraints. If no nominal variables or dependent constraints are present, the lists remain unchanged."""
 
         constraints_to_remove: set[int] = set()
         variable_to_remove: set[int] = set()
@@ -1461,362 +2108,406 @@ class MILPHelper:
             if self.is_nominal_variable(str(variable)):
                 variable_to_remove.add(i)
 
-        self.constraints = [
-            constraint
-            for i, constraint in enumerate(self.constraints)
-            if i not in constraints_to_remove
-        ]
+        if len(constraints_to_remove) > 0:
+            kept: list[int] = [
+                i for i in range(len(self.constraints)) if i not in constraints_to_remove
+            ]
+            self.constraints = [self.constraints[i] for i in kept]
+            self.constraint_store = self.constraint_store.select(kept)
         self.variables = [
             variable
             for i, variable in enumerate(self.variables)
             if i not in variable_to_remove
         ]
+        if len(variable_to_remove) > 0 or len(constraints_to_remove) > 0:
+            # Identifiers are kept, but they no longer match the positions
+            self.positions = [-1] * len(self.number_of_variables)
+            for i, variable in enumerate(self.variables):
+                self.positions[variable.id] = i
+            self.components = UnionFind()
+            self.merged_constraints = 0
 
-    def __get_graph(self) -> nx.Graph:
+    def __update_components(self) -> None:
         """
-        Constructs a NetworkX graph representing the relationships between variables based on the defined constraints. Nodes are added for each variable in the internal list, indexed by their order. Edges are created by iterating through the constraints; for each constraint containing multiple terms, the method connects the first variable to every subsequent variable in that constraint, effectively creating a star topology for each constraint. Each edge is labeled with a unique sequential number. The method returns the newly created graph without modifying the state of the MILP helper instance, and it skips constraints that contain no terms.
-
-        :return: A NetworkX graph where nodes represent variables and edges connect variables that appear together in a constraint. Each edge is assigned a unique sequential number.
-
-        :rtype: nx.Graph
+        Brings the union-find forest `components` up to date with the variables and constraints of the MILP problem. The elements of the forest are the identifiers of the variables. The forest is extended with a singleton for every new variable, and the variables of every constraint added since the last update are merged with the first variable of the constraint, read directly from the arrays of the constraint store, so that the components of the forest are the connected components of the graph in which two variables are adjacent if they appear together in a constraint. The forest is built incrementally: the constraints that were already merged, including the ones inherited from the helper this one was cloned from, are never processed again, and all the new pairs of variables are merged in a single vectorized batch.
         """
 
-        g: nx.Graph = nx.Graph()
+        self.components.grow(len(self.number_of_variables))
+        store: ConstraintStore = self.constraint_store
+        if self.merged_constraints >= len(store):
+            return
+        # Pair every entry of the new rows with the first entry of its row
+        row_ptr: np.ndarray = store.row_ptr[self.merged_constraints : len(store) + 1]
+        start: int = int(row_ptr[0])
+        end: int = int(row_ptr[-1])
+        first_vars: np.ndarray = np.repeat(store.cols[row_ptr[:-1]], np.diff(row_ptr))
+        self.merged_constraints = len(store)
+        self.components.union(first_vars, store.cols[start:end].copy())
 
-        # Create nodes
-        n: int = len(self.variables)
-        for i in range(n):
-            g.add_node(i)
-
-        # Index variables for O(1) lookup
-        var_idx: dict[Variable, int] = {
-            v: i for i, v in enumerate(self.variables)
-        }  # Variable
+    def __get_partition_bins(self, num_bins: int) -> list[list[int]]:
+        """
+        Splits the variables of the MILP problem into at most `num_bins` groups of connected components of the variable graph, so that no constraint involves variables of two different groups; the variables of every piecewise linear and general constraint are adjacent as well. The connected components are read from the union-find forest maintained by `__update_components` and are then distributed among the groups with a greedy largest-first strategy, which assigns every component to the group with the fewest variables so far. The result is a list of groups, each of them being the sorted list of the positions of its variables in `variables`; empty groups are omitted.
 
-        # Create edges
-        edge: int = 0
-        for constraint in self.constraints:
-            terms: list[Term] = constraint.get_terms()  # Term
-            if len(terms) == 0:
-                continue
-            first_var: int = var_idx[terms[0].get_var()]
-            for term in terms[1:]:
-                other_var: int = var_idx[term.get_var()]
-                # Edges between first and other
-                edge += 1
-                g.add_edge(first_var, other_var, number=edge)
+        :param num_bins: The maximum number of groups to create.
+        :type num_bins: int
 
-        return g
+        :return: The list of groups of variable indices.
 
-    def __common_partition_part(
-        self, objective: Expression
-    ) -> tuple[list[Variable], dict[int, int], int, list[int], int, int]:  # Variable
+        :rtype: list[list[int]]
         """
-        Performs a graph-based partitioning of the variables involved in the provided objective expression to analyze their distribution across the problem structure. It utilizes a breadth-first search (BFS) algorithm on the internal graph to group variables into partitions, then maps the specific variables from the objective to these partitions. The method returns a tuple containing the list of objective variables, the mapping of variable indices to partition IDs, the total number of partitions, a breakdown of variable counts per partition, and statistics identifying partitions that contain multiple objective variables. This operation relies on the internal graph and variable list, logs the execution time for debugging, and assumes that all variables found in the objective are present within the graph structure.
-
-        :param objective: The objective function expression used to extract variables for partition analysis.
-        :type objective: Expression
-
-        :return: A tuple containing the list of objective variables, a mapping of variable indices to partition IDs, the total number of partitions, a list of variable counts per partition, the number of partitions containing multiple variables, and the total count of variables within those partitions.
-
-        :rtype: tuple[list[Variable], dict[int, int], int, list[int], int, int]
-        """
-
-        objectives: list[Variable] = list()  # Variable
 
         # Partition time
         init_time: int = time.perf_counter_ns()
 
-        # Graph
-        solution: dict[int, int] = dict()
-        num_partitions: int = self.__bfs(self.__get_graph(), solution)
-
-        # Mapping partition -> number of objective variables in partition
-        num_variables_in_partition: list[int] = [0] * num_partitions
-
-        # Compute objective coefficients
-        for term in objective.get_terms():
-            v: Variable = term.get_var()  # Variable
-            objectives.append(v)
-            index: int = self.variables.index(v)
-            num_partition: int = solution.get(index) - 1
-            num_variables_in_partition[num_partition] += 1
-
-        # Compute two or more partitions
-        two_or_more: int = 0
-        count: int = 0
-        for i in range(num_partitions):
-            if num_variables_in_partition[i] > 1:
-                two_or_more += 1
-                count += num_variables_in_partition[i]
+        # Mapping partition -> variables in partition
+        self.__update_components()
+        if len(self.piecewise_constraints) > 0:
+            self.components.union(
+                np.array([c.get_x().id for c in self.piecewise_constraints]),
+                np.array([c.get_y().id for c in self.piecewise_constraints]),
+            )
+        if len(self.general_constraints) > 0:
+            pairs: list[tuple[int, int]] = [
+                (c.get_var().id, v.id)
+                for c in self.general_constraints
+                for v in c.get_variables()[1:]
+            ]
+            self.components.union(
+                np.array([u for u, _ in pairs], dtype=np.int64),
+                np.array([v for _, v in pairs], dtype=np.int64),
+            )
+        ids: np.ndarray = np.fromiter(
+            (v.id for v in self.variables), dtype=np.int64, count=len(self.variables)
+        )
+        _, labels = np.unique(self.components.roots()[ids], return_inverse=True)
+        order: np.ndarray = np.argsort(labels, kind="stable")
+        bounds: np.ndarray = np.cumsum(np.bincount(labels))
+        components: list[list[int]] = [
+            c.tolist() for c in np.split(order, bounds[:-1]) if len(c) > 0
+        ]
+
+        # Greedy largest-first assignment of the components to the bins
+        bins: list[list[int]] = [[] for _ in range(min(num_bins, len(components)))]
+        for component in sorted(components, key=len, reverse=True):
+            min(bins, key=len).extend(component)
 
         end_time: int = time.perf_counter_ns()
-        total_time: float = (end_time - init_time) * 1e-9
         if ConfigReader.DEBUG_PRINT:
-            Util.debug(f"Partition time: {total_time} s")
-        return (
-            objectives,
-            solution,
-            num_partitions,
-            num_variables_in_partition,
-            two_or_more,
-            count,
-        )
+            Util.debug(
+                f"Partition time: {(end_time - init_time) * 1e-9} s -- {len(components)} partitions in {len(bins)} groups"
+            )
+        return [sorted(b) for b in bins if len(b) > 0]
 
-    def __solve_gurobi_using_partitions(
-        self, objective: Expression
-    ) -> typing.Optional[Solution]:
+    def __get_partition_problem(
+        self, variables: list[int], partition: dict[int, int], p: int
+    ) -> MILPHelper:
         """
-        This method solves a Mixed-Integer Linear Programming (MILP) problem by decomposing it into smaller sub-problems based on variable partitions, utilizing the Gurobi optimizer. It begins by determining the partition structure of the variables relative to the objective; if no partition contains more than one variable, it disables the partitioning strategy and delegates to the standard solver. The algorithm proceeds in two phases: first, it solves a model containing only variables from partitions with zero or one variable to check for immediate infeasibility. Second, for each variable in the objective that belongs to a partition with multiple variables, it constructs and optimizes a separate Gurobi model restricted to that partition, effectively optimizing for that specific variable within its local constraints. The results are aggregated into a Solution object, which is returned unless a sub-problem is infeasible (resulting in an inconsistent knowledge base indicator) or a Gurobi error occurs (resulting in None).
+        Builds the MILP problem restricted to a group of variables computed by `__get_partition_bins`. The new helper contains the given variables, the constraints, the piecewise linear constraints and the general constraints whose first variable belongs to the group (all the variables of a constraint always belong to the same group), and the variables to show that belong to the group. The variables keep their identifiers, so the positions of the sub-problem are given by an explicit mapping. Nominal variables are assumed to have been removed already, and the membership degrees to linguistic labels are not printed by the sub-problem, since they are printed once the partial solutions have been merged.
 
-        :param objective: The mathematical expression representing the objective function to be optimized. It is analyzed to determine variable partitions and defines the optimization target for the sub-problems.
-        :type objective: Expression
+        :param variables: The sorted positions in `variables` of the variables of the group.
+        :type variables: list[int]
+        :param partition: Maps the identifier of every variable to the group it belongs to.
+        :type partition: dict[int, int]
+        :param p: The identifier of the group.
+        :type p: int
 
-        :return: A Solution object representing the optimization result, or None if a Gurobi error occurs. If the model is infeasible, the Solution indicates an inconsistent knowledge base.
+        :return: A MILP helper representing the sub-problem of the group.
 
-        :rtype: typing.Optional[Solution]
+        :rtype: MILPHelper
         """
 
-        import gurobipy as gp
-        from gurobipy import GRB
-
-        (
-            objectives,
-            solution,
-            num_partitions,
-            num_variables_in_partition,
-            two_or_more,
-            count,
-        ) = self.__common_partition_part(objective)
-
-        if two_or_more == 0:
-            MILPHelper.PARTITION = False
-            return self.solve_gurobi(objective)
-
-        # Specific algorithm starts here
-        try:
-            if ConfigReader.DEBUG_PRINT:
-                Util.debug(
-                    f"There are {two_or_more} partitions with {count} dependent objective variables"
-                )
-
-            # PROBLEMS with 1 or less
-            env = gp.Env(empty=True)
-            if not ConfigReader.DEBUG_PRINT:
-                env.setParam("OutputFlag", 0)
-
-            env.setParam("IntFeasTol", 1e-9)
-            env.setParam("BarConvTol", 0)
-            env.start()
-
-            model: gp.Model = gp.Model("partition-model-1-or-less", env=env)
-
-            # Create variables
-            vars_gurobi: dict[str, gp.Var] = dict()
-
-            var_types: dict[VariableType, str] = {  # Variable
-                VariableType.BINARY: GRB.BINARY,  # Variable
-                VariableType.INTEGER: GRB.INTEGER,  # Variable
-                VariableType.CONTINUOUS: GRB.CONTINUOUS,  # Variable
-                VariableType.SEMI_CONTINUOUS: GRB.SEMICONT,  # Variable
-            }
-            var_name_map: dict[str, str] = {
-                str(v): f"x{i}" for i, v in enumerate(self.variables)
-            }
-            for i, curr_variable in enumerate(self.variables):
-                num_partition: int = solution.get(i) - 1
-                if num_variables_in_partition[num_partition] > 1:
-                    continue  # Next variable
-                v_type: VariableType = curr_variable.get_type()  # Variable
-
-                if ConfigReader.DEBUG_PRINT:
-                    Util.debug(
-                        (
-                            f"Variable -- "  # Variable
-                            f"[{curr_variable.get_lower_bound()}, {curr_variable.get_upper_bound()}] - "
-                            f"Obj value = 0 - "
-                            f"Var type = {v_type.name} -- "
-                            f"Var = {curr_variable}"
-                        )
-                    )
-
-                vars_gurobi[var_name_map[str(curr_variable)]] = model.addVar(
-                    lb=curr_variable.get_lower_bound(),
-                    ub=curr_variable.get_upper_bound(),
-                    obj=0,
-                    vtype=var_types[v_type],
-                    name=var_name_map[str(curr_variable)],
-                )
-
-            # Integrate new variables
-            model.update()
+        milp: MILPHelper = MILPHelper()
+        milp.nominal_variables = True
+        milp.PRINT_LABELS = False
+        milp.variables = [self.variables[i] for i in variables]
+        milp.number_of_variables = {str(v): v.id for v in milp.variables}
+        milp.positions = [-1] * len(self.number_of_variables)
+        for i, var in enumerate(milp.variables):
+            milp.positions[var.id] = i
+        rows: list[int] = [
+            i
+            for i, constraint in enumerate(self.constraints)
+            if len(constraint.get_terms()) > 0
+            and partition[constraint.get_terms()[0].get_var().id] == p
+        ]
+        milp.constraints = [self.constraints[i] for i in rows]
+        milp.constraint_store = self.constraint_store.select(rows)
+        milp.piecewise_constraints = [
+            c for c in self.piecewise_constraints if partition[c.get_x().id] == p
+        ]
+        milp.general_constraints = [
+            c for c in self.general_constraints if partition[c.get_var().id] == p
+        ]
+        for var, name in self.show_vars.variables.items():
+            if partition.get(var.id) == p:
+                milp.show_vars.add_variable(var, name)
+        return milp
 
-            constraint_name: str = "constraint"
-            # Add constraints
-            seen_constraints: set[str] = set()
-            for i, constraint in enumerate(self.constraints):
-                _ck: str = str(constraint)
-                if _ck in seen_constraints:
-                    continue
-                seen_constraints.add(_ck)
-                if constraint.is_zero():
-                    continue
+    def solve_using_partitions(
+        self, objective: Expression
+    ) -> typing.Optional[Solution]:
+        """
+        Solves the MILP problem by decomposing it into independent sub-problems, using the MILP solver selected by the `MILP_PROVIDER` setting for each of them. The variables are grouped into connected components of the variable graph, which are distributed among at most `MILP_PARTITION_WORKERS` groups (the number of available processors if the setting is not positive). Since no constraint involves variables of two different groups, the minimum of the objective function is the sum of the minima of its restrictions to the groups, so every group is solved as a separate MILP problem in a pool of processes, and the partial results are merged into a single `Solution`: its value is computed from the values of the objective variables in the partial solutions, and its variables to show are the union of the ones of the partial solutions. If any sub-problem is infeasible, the whole problem is infeasible and a Solution indicating inconsistency is returned; if any sub-problem fails, None is returned. If the solver stops before proving the optimality of some sub-problem, the merged Solution is bounded, without a bound since the bounds of the sub-problems are not combined, and it has no value if some sub-problem has no feasible solution. The sub-problems are solved with the time limit and MIP gap of the current limits, but they cannot be cancelled once submitted to the pool of processes. If the problem cannot be decomposed, it is solved as a single model.
 
-                curr_name: str = f"{constraint_name}_{i + 1}"
-                expr: gp.LinExpr = gp.LinExpr()
-                for term in constraint.get_terms():
-                    index: int = self.variables.index(term.get_var())
-                    num_partition: int = solution.get(index) - 1
-                    if num_variables_in_partition[num_partition] > 1:
-                        break  # Exit for term loop
-                    v: gp.Var = vars_gurobi[var_name_map[str(term.get_var())]]
-                    c: float = term.get_coeff()
-                    if c == 0:
-                        continue
-                    expr.add(v, c)
-
-                if expr.size() == 0:
-                    continue
+        :param objective: The linear expression to minimize.
+        :type objective: Expression
 
-                if constraint.get_type() == InequalityType.EQUAL:
-                    gp_constraint: gp.Constr = expr == constraint.get_constant()
-                elif constraint.get_type() == InequalityType.LESS_THAN:
-                    gp_constraint: gp.Constr = expr <= constraint.get_constant()
-                elif constraint.get_type() == InequalityType.GREATER_THAN:
-                    gp_constraint: gp.Constr = expr >= constraint.get_constant()
+        :return: The merged Solution, a Solution indicating inconsistency if some sub-problem is infeasible, or None if an error occurs.
 
-                model.addConstr(gp_constraint, curr_name)
-                if ConfigReader.DEBUG_PRINT:
-                    Util.debug(f"{curr_name}: {constraint}")
+        :rtype: typing.Optional[Solution]
+        """
 
-            # Integrate new constraints
-            model.update()
+        if not self.nominal_variables:
+            self.__remove_nominal_variables()
 
-            # Optimize model
-            model.optimize()
-            if ConfigReader.DEBUG_PRINT:
-                Util.debug(f"Model:")
+        workers: int = ConfigReader.MILP_PARTITION_WORKERS
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+        bins: list[list[int]] = (
+            self.__get_partition_bins(workers) if workers > 1 else []
+        )
+        if len(bins) <= 1:
+            return self.solve_model(objective)
+
+        partition: dict[int, int] = {
+            self.variables[i].id: p for p, b in enumerate(bins) for i in b
+        }
+        problems: list[MILPHelper] = [
+            self.__get_partition_problem(b, partition, p) for p, b in enumerate(bins)
+        ]
+        for problem in problems:
+            problem.limits = self.limits
+        objectives: list[Expression] = [Expression(0.0) for _ in bins]
+        objective_terms: list[Term] = [] if objective is None else objective.get_terms()
+        for term in objective_terms:
+            p: int = partition[term.get_var().id]
+            objectives[p].add_term(Term(term.get_coeff(), term.get_var()))
+            # The value of the objective variables is needed to merge the solutions
+            problems[p].show_vars.add_variable(term.get_var(), str(term.get_var()))
+
+        settings: dict[str, typing.Any] = _get_solver_settings()
+        solutions: list[typing.Optional[Solution]] = list(
+            _get_partition_executor(len(bins)).map(
+                _solve_partition,
+                problems,
+                objectives,
+                [settings] * len(bins),
+            )
+        )
 
-            # Return solution
-            if model.Status == GRB.INFEASIBLE:
-                return Solution(Solution.INCONSISTENT_KB)
+        if any(sol is None for sol in solutions):
+            return None
+        if any(not sol.is_consistent_kb() for sol in solutions):
+            return Solution(Solution.INCONSISTENT_KB)
+        bounded: list[Solution] = [sol for sol in solutions if sol.is_bounded()]
+        if any(math.isnan(sol.get_solution()) for sol in bounded):
+            return Solution.get_bounded(bounded[0].get_status())
+
+        values: dict[str, float] = dict()
+        for sol in solutions:
+            values.update(sol.get_showed_variables())
+        result: float = sum(
+            term.get_coeff() * values[str(term.get_var())] for term in objective_terms
+        )
+        sol: Solution = Solution(Util.round(abs(result)))
+        if len(bounded) > 0:
+            # The bounds of the sub-problems cannot be combined after rounding their absolute values
+            sol.set_bounded(bounded[0].get_status())
+        for var in self.show_vars.get_variables():
+            name: str = str(var)
+            if name not in values:
+                continue
+            sol.add_showed_variable(name, values[name])
+            if self.PRINT_LABELS:
+                self.print_instance_of_labels(name, values[name])
+        return sol
 
-            # One for each partition with two or more variables, plus one for the rest (all partitions with 0 and 1)
-            sol: Solution = Solution(1.0)
+    def __get_presolved_problem(
+        self, objective: Expression
+    ) -> typing.Optional[tuple[MILPHelper, Presolver]]:
+        """
+        Simplifies the MILP problem with a `Presolver` and builds the reduced problem. The presolver starts from the rows and bounds computed by `__get_model_rows`, so constraints with a single variable are already folded into bounds. The variables of the objective function and of the piecewise linear and general constraints are protected, and so are nominal variables if they are to be removed by the backend, whose rows are frozen so that removing them afterwards leaves the same problem as before. The reduced helper contains copies of the kept variables with the tightened bounds, which keep their identifiers, so the positions of the reduced problem are given by an explicit mapping, as for the sub-problems of a partition. The rows that have not been modified keep their `Inequation` objects, while the other ones are rebuilt from the reduced rows. The variables to show are the kept ones and the variables that the removed ones have been replaced by, and the membership degrees to linguistic labels are not printed by the reduced problem, since they are printed once the values of the removed variables have been restored.
 
-            # PROBLEMS with 2 or more
-            for obj_var in objectives:
-                env = gp.Env(empty=True)
-                if not ConfigReader.DEBUG_PRINT:
-                    env.setParam("OutputFlag", 0)
+        :param objective: The linear expression to minimize.
+        :type objective: Expression
 
-                env.setParam("IntFeasTol", 1e-9)
-                env.setParam("BarConvTol", 0)
-                env.start()
+        :return: A tuple with the reduced problem and the presolver holding the postsolve map, or None if the problem could not be reduced or the presolver proved it infeasible.
+
+        :rtype: typing.Optional[tuple[MILPHelper, Presolver]]
+        """
+
+        rows, lower, upper = self.__get_model_rows()
+        size: int = len(self.variables)
+        protected: list[bool] = [False] * size
+        objective_terms: list[Term] = [] if objective is None else objective.get_terms()
+        for term in objective_terms:
+            protected[self.__get_variable_position(term.get_var())] = True
+        for c in self.piecewise_constraints:
+            protected[self.__get_variable_position(c.get_x())] = True
+            protected[self.__get_variable_position(c.get_y())] = True
+        for c in self.general_constraints:
+            for var in c.get_variables():
+                protected[self.__get_variable_position(var)] = True
+        nominal: list[bool] = [
+            not self.nominal_variables and self.is_nominal_variable(str(var))
+            for var in self.variables
+        ]
+        presolver: Presolver = Presolver(
+            lower.tolist(),
+            upper.tolist(),
+            [
+                var.get_type() in (VariableType.BINARY, VariableType.INTEGER)
+                for var in self.variables
+            ],
+            [p or n for p, n in zip(protected, nominal)],
+        )
+        for i, positions, coefs, sense, rhs in self.__get_constraint_rows(rows):
+            presolver.add_row(
+                i, positions, coefs, sense, rhs, any(nominal[j] for j in positions)
+            )
+        if not presolver.presolve() or not presolver.changed:
+            return None
 
-                model: gp.Model = gp.Model("partition-model-2-or-more", env=env)
+        milp: MILPHelper = MILPHelper()
+        milp.nominal_variables = self.nominal_variables
+        milp.PRINT_LABELS = False
+        milp.PRINT_VARIABLES = self.PRINT_VARIABLES
+        milp.piecewise_constraints = list(self.piecewise_constraints)
+        milp.general_constraints = list(self.general_constraints)
+        milp.number_of_variables = dict(self.number_of_variables)
+        # The sub-problems of a partition only register their own variables
+        milp.positions = [-1] * (
+            len(self.number_of_variables)
+            if self.positions is None
+            else len(self.positions)
+        )
+        milp.limits = self.limits
+        for j, var in enumerate(self.variables):
+            if presolver.is_removed(j):
+                continue
+            var = var.clone()
+            var.lower_bound = presolver.lower[j]
+            var.upper_bound = presolver.upper[j]
+            milp.positions[var.id] = len(milp.variables)
+            milp.variables.append(var)
+        for i, positions, coefs, sense, rhs, modified in presolver.get_rows():
+            variables: list[Variable] = [
+                milp.variables[milp.positions[self.variables[j].id]] for j in positions
+            ]
+            if not milp.constraint_store.append(
+                [var.id for var in variables], coefs, sense, rhs
+            ):
+                continue
+            milp.constraints.append(
+                Inequation(
+                    Expression(-rhs, *(Term(c, v) for c, v in zip(coefs, variables))),
+                    sense,
+                )
+                if modified
+                else self.constraints[i]
+            )
+        for var, name in self.show_vars.variables.items():
+            t: int = presolver.get_substitution(self.__get_variable_position(var))[2]
+            if t >= 0:
+                kept: Variable = milp.variables[milp.positions[self.variables[t].id]]
+                milp.show_vars.add_variable(kept, str(kept))
 
-                index: int = self.variables.index(obj_var)
-                problem: int = solution.get(index) - 1
+        if ConfigReader.DEBUG_PRINT:
+            Util.debug(
+                f"Presolve: {len(milp.variables)} of {size} variables, "
+                f"{len(milp.constraints)} of {len(rows)} constraints"
+            )
+        return milp, presolver
 
-                vars_gurobi: dict[str, gp.Var] = dict()
+    def solve_presolved(self, objective: Expression) -> typing.Optional[Solution]:
+        """
+        Solves the MILP problem after simplifying it, using the MILP solver selected by the `MILP_PROVIDER` setting. The bounds of the variables are propagated through the constraints, the variables that are fixed or equal to an affine function of another variable, as the ones linked by `add_equality`, are substituted, and the redundant constraints and the variables that are no longer used are dropped, as described in `Presolver`. The reduced problem is solved as a single model, and the values of the removed variables are then restored from the postsolve map, so that the returned Solution reports every variable to show, in the same order as if the original problem had been solved. If the problem cannot be reduced, or if the presolver proves it infeasible, the original problem is solved instead, so that the solver reports the inconsistency as usual. The piecewise linear and general constraints must already be supported by the provider.
 
-                # Create variables
-                for i, curr_variable in enumerate(self.variables):
-                    num_partition: int = solution.get(i) - 1
-                    if num_partition != problem:
-                        continue
+        :param objective: The linear expression to minimize.
+        :type objective: Expression
 
-                    v_type: VariableType = curr_variable.get_type()  # Variable
-                    ov: float = 1.0 if i == self.variables.index(obj_var) else 0.0
+        :raises ValueError: Raised when the configured MILP provider is unsupported or unrecognized.
 
-                if ConfigReader.DEBUG_PRINT:
-                    Util.debug(
-                        (
-                            f"Variable -- "  # Variable
-                            f"[{curr_variable.get_lower_bound()}, {curr_variable.get_upper_bound()}] - "
-                            f"Obj value = {ov} - "
-                            f"Var type = {v_type.name} -- "
-                            f"Var = {curr_variable}"
-                        )
-                    )
+        :return: The optimal solution for the given objective expression, or None if no solution is found.
 
-                vars_gurobi[var_name_map[str(curr_variable)]] = model.addVar(
-                    lb=curr_variable.get_lower_bound(),
-                    ub=curr_variable.get_upper_bound(),
-                    obj=ov,
-                    vtype=var_types[v_type],
-                    name=var_name_map[str(curr_variable)],
-                )
+        :rtype: typing.Optional[Solution]
+        """
 
-                # Integrate new variables
-                model.update()
-
-                constraint_name: str = "constraint"
-                # Add constraints
-                seen_constraints: set[str] = set()
-                for i, constraint in enumerate(self.constraints):
-                    _ck: str = str(constraint)
-                    if _ck in seen_constraints:
-                        continue
-                    seen_constraints.add(_ck)
-                    if constraint.is_zero():
-                        continue
-
-                    curr_name: str = f"{constraint_name}_{i + 1}"
-                    expr: gp.LinExpr = gp.LinExpr()
-                    for term in constraint.get_terms():
-                        index: int = self.variables.index(term.get_var())
-                        num_partition: int = solution.get(index) - 1
-                        if num_partition != problem:
-                            break  # Exit for term loop
-                        v: gp.Var = vars_gurobi[var_name_map[str(term.get_var())]]
-                        c: float = term.get_coeff()
-                        if c == 0:
-                            continue
-                        expr.add(v, c)
-
-                    if expr.size() == 0:
-                        continue
-
-                    if constraint.get_type() == InequalityType.EQUAL:
-                        gp_constraint: gp.Constr = expr == constraint.get_constant()
-                    elif constraint.get_type() == InequalityType.LESS_THAN:
-                        gp_constraint: gp.Constr = expr <= constraint.get_constant()
-                    elif constraint.get_type() == InequalityType.GREATER_THAN:
-                        gp_constraint: gp.Constr = expr >= constraint.get_constant()
-
-                    model.addConstr(gp_constraint, curr_name)
-                    if ConfigReader.DEBUG_PRINT:
-                        Util.debug(f"{curr_name}: {constraint}")
-
-                # Integrate new constraints
-                model.update()
-
-                # Optimize model
-                model.optimize()
+        problem: typing.Optional[tuple[MILPHelper, Presolver]] = (
+            self.__get_presolved_problem(objective)
+        )
+        if problem is None:
+            return self.__solve_with_provider(objective)
+        milp, presolver = problem
+        sol: typing.Optional[Solution] = milp.__solve_with_provider(objective)
+        if sol is None or not sol.is_consistent_kb():
+            return sol
+        if sol.is_bounded() and math.isnan(sol.get_solution()):
+            return sol
 
-                # Return solution
-                if model.Status == GRB.INFEASIBLE:
-                    return Solution(Solution.INCONSISTENT_KB)
-                else:
-                    result: float = Util.round(abs(model.ObjVal))
-                    sol = Solution(result)
-                    name: str = str(obj_var)
-                    sol.add_showed_variable(name, result)
+        values: dict[str, float] = sol.get_showed_variables()
+        result: Solution = Solution(sol.get_solution())
+        if sol.is_bounded():
+            result.set_bounded(sol.get_status(), sol.get_bound())
+        shown: set[str] = {str(var) for var in self.show_vars.get_variables()}
+        for j, var in enumerate(self.variables):
+            name: str = str(var)
+            if name not in shown:
+                continue
+            c, k, t = presolver.get_substitution(j)
+            if t < 0:
+                value: float = round(c, 6)
+            elif str(self.variables[t]) in values:
+                value = round(c + k * values[str(self.variables[t])], 6)
+            else:
+                continue
+            result.add_showed_variable(name, value)
+            if ConfigReader.DEBUG_PRINT:
+                Util.debug(f"{name} = {value}")
+            if self.PRINT_LABELS:
+                self.print_instance_of_labels(name, value)
+        return result
+
+    def set_showed_values(
+        self,
+        sol: Solution,
+        show_variable: list[bool],
+        get_values: typing.Callable[[list[int]], typing.Sequence[float]],
+    ) -> None:
+        """
+        Hands over the values of the variables to show to a Solution computed by a solver backend or a persistent solver session. Whether a variable has to be shown is checked by identifier with `ShowVariablesHelper.show_variable` when the model is built. The values are read from the solver in a single call and stored in the Solution as a numpy array, whose names are only built if they are requested. The values of all the variables are printed to the debug output if `DEBUG_PRINT` is enabled, and the membership degrees of the variables to show to their linguistic labels are printed if `PRINT_LABELS` is enabled and some label has been defined; otherwise, no name is built at all.
 
-                if ConfigReader.DEBUG_PRINT:
-                    model.printQuality()
-                    model.printStats()
+        :param sol: The Solution computed by the backend.
+        :type sol: Solution
+        :param show_variable: Whether the variable at every position of `variables` has to be shown.
+        :type show_variable: list[bool]
+        :param get_values: Function returning the values found by the solver for the variables at the given positions.
+        :type get_values: typing.Callable[[list[int]], typing.Sequence[float]]
+        """
 
-            return sol
-        except gp.GurobiError as e:
-            Util.error(f"Error code: {e.errno}. {e.message}")
-            return None
+        shown: list[int] = [i for i, show in enumerate(show_variable) if show]
+        sol.set_showed_values(
+            [self.variables[i] for i in shown],
+            np.asarray(get_values(shown), dtype=np.float64),
+        )
+        if ConfigReader.DEBUG_PRINT:
+            printed: list[int] = list(range(len(self.variables)))
+        elif self.PRINT_LABELS and len(self.show_vars.labels_for_fillers) > 0:
+            printed = shown
+        else:
+            return
+        for i, raw_value in zip(printed, list(get_values(printed))):
+            name: str = self.variables[i].name
+            value: float = round(float(raw_value), 6)
+            # if self.PRINT_VARIABLES:
+            if ConfigReader.DEBUG_PRINT:
+                Util.debug(f"{name} = {value}")
+            if self.PRINT_LABELS:
+                self.print_instance_of_labels(name, value)
 
     def solve_gurobi(self, objective: Expression) -> typing.Optional[Solution]:
         """
-        Constructs and optimizes a Mixed-Integer Linear Programming (MILP) model using the Gurobi solver based on the variables and constraints defined in the current instance. It translates the provided objective expression into Gurobi coefficients and handles various variable types, including binary, integer, continuous, and semi-continuous, while respecting their bounds. The method filters out duplicate or zero constraints before optimization and delegates to a partition-based solver if the `PARTITION` flag is enabled. Upon completion, it writes the model and solution files to the results directory and prints statistics or debug information if configured. If the model is infeasible, it returns a Solution object indicating inconsistency; if a Gurobi error occurs, it logs the exception and returns None.
+        Constructs and optimizes a Mixed-Integer Linear Programming (MILP) model using the Gurobi solver based on the variables and constraints defined in the current instance. It translates the provided objective expression into Gurobi coefficients and handles various variable types, including binary, integer, continuous, and semi-continuous, while respecting their bounds. The method filters out duplicate or zero constraints before optimization. The solver stops at the time limit and MIP gap of the current limits, and it can be interrupted by cancelling them from another thread, in which case a bounded Solution reporting the best bound of the objective is returned. Upon completion, it writes the model and solution files to the results directory if required by the `SOLVER_ARTIFACTS` setting and prints statistics or debug information if configured. If the model is infeasible, it returns a Solution object indicating inconsistency; if a Gurobi error occurs, it logs the exception and returns None.
 
         :param objective: The linear expression representing the objective function to be optimized.
         :type objective: Expression
@@ -1829,14 +2520,12 @@ class MILPHelper:
         import gurobipy as gp
         from gurobipy import GRB
 
+        debug: bool = ConfigReader.DEBUG_PRINT
         if not self.nominal_variables:
             self.__remove_nominal_variables()
 
-        if MILPHelper.PARTITION:
-            return self.__solve_gurobi_using_partitions(objective)
-
         try:
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"Objective function -> {objective}")
 
             num_binary_vars: int = 0
@@ -1849,22 +2538,28 @@ class MILPHelper:
             if objective is not None:
                 for term in objective.get_terms():
                     # Compute objective coefficients
-                    index = self.variables.index(term.get_var())
+                    index = self.__get_variable_position(term.get_var())
                     objective_value[index] += term.get_coeff()
 
             env = gp.Env(empty=True)
-            if not ConfigReader.DEBUG_PRINT:
+            if not debug:
                 env.setParam("OutputFlag", 0)
 
             env.setParam("IntFeasTol", 1e-9)
             env.setParam("BarConvTol", 0)
+            limits: SolverLimits = self.get_limits()
+            time_limit: typing.Optional[float] = limits.get_time_limit()
+            if time_limit is not None:
+                env.setParam("TimeLimit", time_limit)
+            mip_gap: typing.Optional[float] = limits.get_mip_gap()
+            if mip_gap is not None:
+                env.setParam("MIPGap", mip_gap)
             env.start()
 
             model: gp.Model = gp.Model("model", env=env)
-            vars_gurobi: dict[str, gp.Var] = dict()
+            vars_gurobi: list[gp.Var] = []
             show_variable: list[bool] = [False] * size
 
-            my_vars: list[Variable] = self.show_vars.get_variables()  # Variable
 
             var_types: dict[VariableType, str] = {  # Variable
                 VariableType.BINARY: GRB.BINARY,  # Variable
@@ -1872,35 +2567,42 @@ class MILPHelper:
                 VariableType.CONTINUOUS: GRB.CONTINUOUS,  # Variable
                 VariableType.SEMI_CONTINUOUS: GRB.SEMICONT,  # Variable
             }
-            var_name_map: dict[str, str] = {
-                str(v): f"x{i}" for i, v in enumerate(self.variables)
-            }
+
+            rows, lower_bounds, upper_bounds = self.__get_model_rows()
 
             # Create variables
             for i, curr_variable in enumerate(self.variables):
                 v_type: VariableType = curr_variable.get_type()  # Variable
                 ov: float = objective_value[i]
 
-                if ConfigReader.DEBUG_PRINT:
+                if debug:
                     Util.debug(
                         (
                             f"Variable -- "  # Variable
-                            f"[{curr_variable.get_lower_bound()}, {curr_variable.get_upper_bound()}] - "
+                            f"[{lower_bounds[i]}, {upper_bounds[i]}] - "
                             f"Obj value = {ov} - "
                             f"Var type = {v_type.name} -- "
                             f"Var = {curr_variable}"
                         )
                     )
 
-                vars_gurobi[var_name_map[str(curr_variable)]] = model.addVar(
-                    lb=curr_variable.get_lower_bound(),
-                    ub=curr_variable.get_upper_bound(),
-                    obj=ov,
-                    vtype=var_types[v_type],
-                    name=var_name_map[str(curr_variable)],
+                # A semi-continuous variable could be 0 despite a folded positive lower bound
+                vtype: str = (
+                    GRB.CONTINUOUS
+                    if v_type == VariableType.SEMI_CONTINUOUS and lower_bounds[i] > 0
+                    else var_types[v_type]
+                )
+                vars_gurobi.append(
+                    model.addVar(
+                        lb=lower_bounds[i],
+                        ub=upper_bounds[i],
+                        obj=ov,
+                        vtype=vtype,
+                        name=f"x{i}",
+                    )
                 )
 
-                if curr_variable in my_vars:
+                if self.show_vars.show_variable(curr_variable):
                     show_variable[i] = True
 
                 if v_type == VariableType.BINARY:  # Variable
@@ -1915,100 +2617,107 @@ class MILPHelper:
             # Integrate new variables
             model.update()
 
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"# constraints -> {len(self.constraints)}")
             constraint_name: str = "constraint"
             # Add constraints
-            seen_constraints: set[str] = set()
-            for i, constraint in enumerate(self.constraints):
-                _ck: str = str(constraint)
-                if _ck in seen_constraints:
-                    continue
-                seen_constraints.add(_ck)
-                if constraint.is_zero():
+            gp_sense: dict[InequalityType, str] = {
+                InequalityType.EQUAL: GRB.EQUAL,
+                InequalityType.LESS_THAN: GRB.LESS_EQUAL,
+                InequalityType.GREATER_THAN: GRB.GREATER_EQUAL,
+            }
+            for i, positions, coefs, sense, rhs in self.__get_constraint_rows(rows):
+                if not any(coefs):
                     continue
-
                 curr_name: str = f"{constraint_name}_{i + 1}"
-                expr: gp.LinExpr = gp.LinExpr()
-                for term in constraint.get_terms():
-                    v: gp.Var = vars_gurobi[var_name_map[str(term.get_var())]]
-                    c: float = term.get_coeff()
-                    if c == 0:
-                        continue
-                    expr.add(v, c)
-
-                if expr.size() == 0:
-                    continue
-
-                if constraint.get_type() == InequalityType.EQUAL:
-                    gp_constraint: gp.Constr = expr == constraint.get_constant()
-                elif constraint.get_type() == InequalityType.LESS_THAN:
-                    gp_constraint: gp.Constr = expr <= constraint.get_constant()
-                elif constraint.get_type() == InequalityType.GREATER_THAN:
-                    gp_constraint: gp.Constr = expr >= constraint.get_constant()
-
-                model.addConstr(gp_constraint, curr_name)
-                if ConfigReader.DEBUG_PRINT:
-                    Util.debug(f"{curr_name}: {constraint}")
+                expr: gp.LinExpr = gp.LinExpr(
+                    [c for c in coefs if c != 0],
+                    [vars_gurobi[j] for j, c in zip(positions, coefs) if c != 0],
+                )
+                model.addLConstr(expr, gp_sense[sense], rhs, curr_name)
+            for i, constraint in enumerate(self.piecewise_constraints):
+                model.addGenConstrPWL(
+                    vars_gurobi[self.__get_variable_position(constraint.get_x())],
+                    vars_gurobi[self.__get_variable_position(constraint.get_y())],
+                    constraint.get_x_points(),
+                    constraint.get_y_points(),
+                    f"piecewise_{i + 1}",
+                )
+                if debug:
+                    Util.debug(f"piecewise_{i + 1}: {constraint}")
+            for i, constraint in enumerate(self.general_constraints):
+                constraint.add_gurobi(
+                    model,
+                    lambda v: vars_gurobi[self.__get_variable_position(v)],
+                    f"general_{i + 1}",
+                )
+                if debug:
+                    Util.debug(f"general_{i + 1}: {constraint}")
 
             # Integrate new constraints
             model.update()
 
             # Optimize model
-            model.optimize()
+            with limits.interruptible(model.terminate):
+                model.optimize()
 
-            model.write(os.path.join(constants.ensure_results_dir(), "gurobi_model.lp"))
-            model.write(
-                os.path.join(constants.ensure_results_dir(), "gurobi_solution.json")
-            )
+            if SolverArtifacts.enabled(model.Status != GRB.OPTIMAL):
+                writers: dict[str, typing.Callable[[str], None]] = {
+                    "_model.lp": model.write
+                }
+                if model.SolCount > 0:
+                    writers["_solution.json"] = model.write
+                SolverArtifacts.dump(SolverArtifacts.new_prefix("gurobi"), writers)
 
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"Model:")
             sol: Solution = None
             # if model.Status == GRB.INFEASIBLE and ConfigReader.RELAX_MILP:
             #     self.__gurobi_handle_model_infeasibility(model)
 
+            status: typing.Optional[SolutionStatus] = {
+                GRB.TIME_LIMIT: SolutionStatus.TIME_LIMIT,
+                GRB.INTERRUPTED: SolutionStatus.CANCELLED,
+            }.get(model.Status)
             # Return solution
             if model.Status == GRB.INFEASIBLE:
                 sol = Solution(Solution.INCONSISTENT_KB)
+            elif status is not None and model.SolCount == 0:
+                sol = Solution.get_bounded(status, None, _get_gurobi_bound(model))
             else:
                 result: float = Util.round(abs(model.ObjVal))
                 sol = Solution(result)
-                for i in range(size):
-                    if ConfigReader.DEBUG_PRINT or show_variable[i]:
-                        name: str = self.variables[i].name
-                        value: float = round(vars_gurobi[var_name_map[name]].X, 6)
-                        if show_variable[i]:
-                            sol.add_showed_variable(name, value)
-                        # if self.PRINT_VARIABLES:
-                        if ConfigReader.DEBUG_PRINT:
-                            Util.debug(f"{name} = {value}")
-                        if self.PRINT_LABELS:
-                            self.print_instance_of_labels(name, value)
+                if status is not None:
+                    sol.set_bounded(status, _get_gurobi_bound(model))
+                self.set_showed_values(
+                    sol,
+                    show_variable,
+                    lambda rows: model.getAttr("X", [vars_gurobi[i] for i in rows]),
+                )
 
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 model.printQuality()
                 model.printStats()
 
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(
                     f"{constants.STAR_SEPARATOR}Statistics{constants.STAR_SEPARATOR}"
                 )
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug("MILP problem:")
             # Show number of variables
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"\t\tSemi continuous variables: {num_up_vars}")
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"\t\tBinary variables: {num_binary_vars}")
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"\t\tContinuous variables: {num_free_vars}")
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"\t\tInteger variables: {num_integer_vars}")
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"\t\tTotal variables: {len(self.variables)}")
             # Show number of constraints
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"\t\tConstraints: {len(self.constraints)}")
             return sol
         except gp.GurobiError as e:
@@ -2044,7 +2753,7 @@ class MILPHelper:
 
     def solve_mip(self, objective: Expression) -> typing.Optional[Solution]:
         """
-        Constructs and solves a Mixed-Integer Linear Programming (MIP) model using the CBC solver to minimize the provided objective expression. The method translates internal variable definitions and constraints into a `mip.Model`, handling binary, integer, continuous, and semi-continuous variable types while respecting their bounds. It returns a `Solution` object containing the optimal objective value and variable values, or a specific solution indicating an inconsistent knowledge base if the problem is infeasible. If an exception occurs during the process, the method returns `None`. Side effects include writing the generated model and solution files to the results directory and logging debug information regarding the model's structure and optimization statistics.
+        Constructs and solves a Mixed-Integer Linear Programming (MIP) model using the CBC solver to minimize the provided objective expression. The method translates internal variable definitions and constraints into a `mip.Model`, handling binary, integer, continuous, and semi-continuous variable types while respecting their bounds. It returns a `Solution` object containing the optimal objective value and variable values, or a specific solution indicating an inconsistent knowledge base if the problem is infeasible. CBC stops at the time limit and MIP gap of the current limits, in which case a bounded Solution reporting the best bound of the objective is returned; since it cannot be interrupted, a cancellation has no effect once the solver has started. If an exception occurs during the process, the method returns `None`. Side effects include writing the generated model and solution files to the results directory, if required by the `SOLVER_ARTIFACTS` setting, and logging debug information regarding the model's structure and optimization statistics.
 
         :param objective: The linear expression defining the objective function to be minimized by the MIP solver.
         :type objective: Expression
@@ -2056,8 +2765,9 @@ class MILPHelper:
 
         import mip
 
+        debug: bool = ConfigReader.DEBUG_PRINT
         try:
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"Objective function -> {objective}")
 
             num_binary_vars: int = 0
@@ -2069,7 +2779,7 @@ class MILPHelper:
 
             if objective is not None:
                 for term in objective.get_terms():
-                    index = self.variables.index(term.get_var())
+                    index = self.__get_variable_position(term.get_var())
                     objective_value[index] += term.get_coeff()
 
             model: mip.Model = mip.Model(
@@ -2078,54 +2788,56 @@ class MILPHelper:
             model.verbose = 0
             model.infeas_tol = 1e-9
             model.integer_tol = 1e-9
-            model.max_mip_gap = ConfigReader.EPSILON
+            limits: SolverLimits = self.get_limits()
+            mip_gap: typing.Optional[float] = limits.get_mip_gap()
+            model.max_mip_gap = ConfigReader.EPSILON if mip_gap is None else mip_gap
             model.emphasis = mip.SearchEmphasis.OPTIMALITY
             model.opt_tol = 0
-            model.preprocess = 1
+            # The preprocessing of CBC crashes on some models with special ordered sets
+            model.preprocess = 0 if len(self.piecewise_constraints) > 0 else 1
 
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 model.verbose = 1
             else:
                 model.verbose = 0
 
-            vars_mip: dict[str, mip.Var] = dict()
+            vars_mip: list[mip.Var] = []
             show_variable: list[bool] = [False] * size
 
-            my_vars: list[Variable] = self.show_vars.get_variables()  # Variable
             var_types: dict[VariableType, str] = {  # Variable
                 VariableType.BINARY: mip.BINARY,  # Variable
                 VariableType.INTEGER: mip.INTEGER,  # Variable
                 VariableType.CONTINUOUS: mip.CONTINUOUS,  # Variable
                 VariableType.SEMI_CONTINUOUS: mip.CONTINUOUS,  # Variable
             }
-            var_name_map: dict[str, str] = {
-                str(v): f"x{i}" for i, v in enumerate(self.variables)
-            }
 
+            rows, lower_bounds, upper_bounds = self.__get_model_rows()
             for i, curr_variable in enumerate(self.variables):
                 v_type: VariableType = curr_variable.get_type()  # Variable
                 ov: float = objective_value[i]
 
-                if ConfigReader.DEBUG_PRINT:
+                if debug:
                     Util.debug(
                         (
                             f"Variable -- "  # Variable
-                            f"[{curr_variable.get_lower_bound()}, {curr_variable.get_upper_bound()}] - "
+                            f"[{lower_bounds[i]}, {upper_bounds[i]}] - "
                             f"Obj value = {ov} - "
                             f"Var type = {v_type.name} -- "
                             f"Var = {curr_variable}"
                         )
                     )
 
-                vars_mip[var_name_map[str(curr_variable)]] = model.add_var(
-                    name=var_name_map[str(curr_variable)],
-                    var_type=var_types[v_type],
-                    lb=curr_variable.get_lower_bound(),
-                    ub=curr_variable.get_upper_bound(),
-                    obj=ov,
+                vars_mip.append(
+                    model.add_var(
+                        name=f"x{i}",
+                        var_type=var_types[v_type],
+                        lb=lower_bounds[i],
+                        ub=upper_bounds[i],
+                        obj=ov,
+                    )
                 )
 
-                if curr_variable in my_vars:
+                if self.show_vars.show_variable(curr_variable):
                     show_variable[i] = True
 
                 if v_type == VariableType.BINARY:  # Variable
@@ -2137,60 +2849,74 @@ class MILPHelper:
                 elif v_type == VariableType.SEMI_CONTINUOUS:  # Variable
                     num_up_vars += 1
 
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"# constraints -> {len(self.constraints)}")
             constraint_name: str = "constraint"
-            seen_constraints: set[str] = set()
-            for i, constraint in enumerate(self.constraints):
-                _ck: str = str(constraint)
-                if _ck in seen_constraints:
-                    continue
-                seen_constraints.add(_ck)
-                if constraint.is_zero():
-                    continue
+            for i, positions, coefs, sense, rhs in self.__get_constraint_rows(rows):
                 curr_name: str = f"{constraint_name}_{i + 1}"
                 expr: mip.LinExpr = mip.xsum(
-                    term.get_coeff() * vars_mip[var_name_map[str(term.get_var())]]
-                    for term in constraint.get_terms()
+                    c * vars_mip[j] for j, c in zip(positions, coefs)
                 )
 
-                if constraint.get_type() == InequalityType.EQUAL:
-                    gp_constraint: mip.Constr = expr == constraint.get_constant()
-                elif constraint.get_type() == InequalityType.LESS_THAN:
-                    gp_constraint: mip.Constr = expr <= constraint.get_constant()
-                elif constraint.get_type() == InequalityType.GREATER_THAN:
-                    gp_constraint: mip.Constr = expr >= constraint.get_constant()
+                if sense == InequalityType.EQUAL:
+                    gp_constraint: mip.Constr = expr == rhs
+                elif sense == InequalityType.LESS_THAN:
+                    gp_constraint: mip.Constr = expr <= rhs
+                elif sense == InequalityType.GREATER_THAN:
+                    gp_constraint: mip.Constr = expr >= rhs
 
                 model.add_constr(gp_constraint, curr_name)
-                if ConfigReader.DEBUG_PRINT:
-                    Util.debug(f"{curr_name}: {constraint}")
+            for constraint in self.piecewise_constraints:
+                constraint.add_sos2(
+                    model,
+                    vars_mip[self.__get_variable_position(constraint.get_x())],
+                    vars_mip[self.__get_variable_position(constraint.get_y())],
+                )
+                if debug:
+                    Util.debug(f"{curr_name}: {self.constraints[i]}")
 
             model.objective = mip.xsum(
-                ov * vars_mip[var_name_map[str(self.variables[i])]]
+                ov * vars_mip[i]
                 for i, ov in enumerate(objective_value)
                 if ov != 0
             )
 
             # model.optimize(relax=ConfigReader.RELAX_MILP)
-            model.optimize()
+            time_limit: typing.Optional[float] = limits.get_time_limit()
+            if time_limit is None:
+                model.optimize()
+            else:
+                model.optimize(max_seconds=time_limit)
 
             # CBC's writer segfaults on an empty model (no columns), so the
             # debug dumps below are skipped when there is nothing to write.
-            if model.num_cols > 0:
-                model.write(
-                    os.path.join(constants.ensure_results_dir(), "mip_model.lp")
-                )
-
-            if ConfigReader.DEBUG_PRINT:
+            if model.num_cols > 0 and SolverArtifacts.enabled(
+                model.status != mip.OptimizationStatus.OPTIMAL
+            ):
+                writers: dict[str, typing.Callable[[str], None]] = {
+                    "_model.lp": model.write
+                }
+                if model.num_solutions > 0:
+                    writers["_solution.sol"] = model.write
+                SolverArtifacts.dump(SolverArtifacts.new_prefix("mip"), writers)
+
+            if debug:
                 Util.debug(f"Model:")
             sol: Solution = None
+            # CBC only stops before optimality when it reaches the time limit
+            stopped: bool = time_limit is not None and model.status in (
+                mip.OptimizationStatus.FEASIBLE,
+                mip.OptimizationStatus.NO_SOLUTION_FOUND,
+            )
             if model.status == mip.OptimizationStatus.INFEASIBLE:
                 sol = Solution(Solution.INCONSISTENT_KB)
+            elif stopped and model.status == mip.OptimizationStatus.NO_SOLUTION_FOUND:
+                sol = Solution.get_bounded(
+                    SolutionStatus.TIME_LIMIT,
+                    None,
+                    _round_bound(model.objective_bound),
+                )
             else:
-                if model.num_cols > 0:
-                    model.write(
-                        os.path.join(constants.ensure_results_dir(), "mip_solution.sol")
-                    )
                 # An empty model (no variables / constraints) is trivially
                 # consistent with objective 0; mip leaves objective_value None.
                 obj_value: float = (
@@ -2198,35 +2924,226 @@ class MILPHelper:
                 )
                 result: float = Util.round(abs(obj_value))
                 sol = Solution(result)
-                for i in range(size):
-                    if ConfigReader.DEBUG_PRINT or show_variable[i]:
-                        name: str = self.variables[i].name
-                        value: float = round(vars_mip[var_name_map[name]].x, 6)
-                        if show_variable[i]:
-                            sol.add_showed_variable(name, value)
-                        # if self.PRINT_VARIABLES:
-                        if ConfigReader.DEBUG_PRINT:
-                            Util.debug(f"{name} = {value}")
-                        if self.PRINT_LABELS:
-                            self.print_instance_of_labels(name, value)
+                if stopped:
+                    sol.set_bounded(
+                        SolutionStatus.TIME_LIMIT, _round_bound(model.objective_bound)
+                    )
+                self.set_showed_values(
+                    sol, show_variable, lambda rows: [vars_mip[i].x for i in rows]
+                )
 
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(
                     f"{constants.STAR_SEPARATOR}Statistics{constants.STAR_SEPARATOR}"
                 )
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug("MILP problem:")
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"\t\tSemi continuous variables: {num_up_vars}")
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"\t\tBinary variables: {num_binary_vars}")
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"\t\tContinuous variables: {num_free_vars}")
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"\t\tInteger variables: {num_integer_vars}")
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"\t\tTotal variables: {len(self.variables)}")
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
+                Util.debug(f"\t\tConstraints: {len(self.constraints)}")
+            return sol
+        except Exception as e:
+            Util.error(f"Error: {e} {traceback.format_exc()}")
+            return None
+
+    def solve_highs(self, objective: Expression) -> typing.Optional[Solution]:
+        """
+        Constructs and solves a Mixed-Integer Linear Programming (MILP) model with the HiGHS solver to minimize the provided objective expression, driving it in memory through its `highspy` bindings. Unlike the `PULP_HIGHS` provider, which writes the model to an LP file, runs the HiGHS executable and parses its solution file back, the bounds, costs and types of the variables are gathered into numpy arrays and passed to `highspy.Highs` together with the compressed sparse row constraint matrix built by `__get_constraint_matrix`, so that the whole model is loaded with a single call and no process is spawned. The model and the solution are only written to the results directory if required by the `SOLVER_ARTIFACTS` setting. Binary and integer variables are declared as integer columns, whereas continuous and semi-continuous variables are declared as continuous ones. It returns a `Solution` object containing the optimal objective value and the values of the variables to show, or a specific solution indicating an inconsistent knowledge base if the problem is infeasible. The solver stops at the time limit and MIP gap of the current limits, and it can be interrupted by cancelling them from another thread, in which case a bounded Solution reporting the best bound of the objective is returned. If the solver stops for any other reason or an exception occurs during the process, the method returns `None`.
+
+        :param objective: The linear expression defining the objective function to be minimized by the HiGHS solver.
+        :type objective: Expression
+
+        :return: A Solution object containing the optimization result, including the objective value and variable assignments if feasible, or a status indicating inconsistency if the model is infeasible. Returns None if an error occurs during the solving process.
+
+        :rtype: typing.Optional[Solution]
+        """
+
+        import highspy
+
+        debug: bool = ConfigReader.DEBUG_PRINT
+        try:
+            if debug:
+                Util.debug(f"Objective function -> {objective}")
+
+            num_binary_vars: int = 0
+            num_free_vars: int = 0
+            num_integer_vars: int = 0
+            num_up_vars: int = 0
+            size: int = len(self.variables)
+            objective_value: np.ndarray = np.zeros(size)
+
+            if objective is not None:
+                for term in objective.get_terms():
+                    index = self.__get_variable_position(term.get_var())
+                    objective_value[index] += term.get_coeff()
+
+            model: highspy.Highs = highspy.Highs()
+            model.setOptionValue("output_flag", debug)
+            limits: SolverLimits = self.get_limits()
+            mip_gap: typing.Optional[float] = limits.get_mip_gap()
+            model.setOptionValue("mip_rel_gap", 1e-6 if mip_gap is None else mip_gap)
+            time_limit: typing.Optional[float] = limits.get_time_limit()
+            if time_limit is not None:
+                model.setOptionValue("time_limit", float(time_limit))
+            # Lets cancelSolve interrupt the solver from another thread
+            model.HandleUserInterrupt = True
+            model.setOptionValue("primal_feasibility_tolerance", 1e-6)
+            model.setOptionValue("dual_feasibility_tolerance", 1e-6)
+            model.setOptionValue("mip_feasibility_tolerance", 1e-6)
+            model.setOptionValue("presolve", "on")
+            if debug:
+                model.setOptionValue(
+                    "log_file", os.path.join(".", "logs", "highs.log")
+                )
+
+            rows, lower_bounds, upper_bounds = self.__get_model_rows()
+            integrality: np.ndarray = np.empty(size, dtype=np.int32)
+            show_variable: list[bool] = [False] * size
+
+            var_types: dict[VariableType, highspy.HighsVarType] = {  # Variable
+                VariableType.BINARY: highspy.HighsVarType.kInteger,  # Variable
+                VariableType.INTEGER: highspy.HighsVarType.kInteger,  # Variable
+                VariableType.CONTINUOUS: highspy.HighsVarType.kContinuous,  # Variable
+                VariableType.SEMI_CONTINUOUS: highspy.HighsVarType.kContinuous,  # Variable
+            }
+
+            for i, curr_variable in enumerate(self.variables):
+                v_type: VariableType = curr_variable.get_type()  # Variable
+
+                if debug:
+                    Util.debug(
+                        (
+                            f"Variable -- "  # Variable
+                            f"[{lower_bounds[i]}, {upper_bounds[i]}] - "
+                            f"Obj value = {objective_value[i]} - "
+                            f"Var type = {v_type.name} -- "
+                            f"Var = {curr_variable}"
+                        )
+                    )
+
+                integrality[i] = int(var_types[v_type])
+
+                if self.show_vars.show_variable(curr_variable):
+                    show_variable[i] = True
+
+                if v_type == VariableType.BINARY:  # Variable
+                    num_binary_vars += 1
+                elif v_type == VariableType.CONTINUOUS:  # Variable
+                    num_free_vars += 1
+                elif v_type == VariableType.INTEGER:  # Variable
+                    num_integer_vars += 1
+                elif v_type == VariableType.SEMI_CONTINUOUS:  # Variable
+                    num_up_vars += 1
+
+            if debug:
+                Util.debug(f"# constraints -> {len(self.constraints)}")
+            row_ptr, positions, coefs, row_lower, row_upper = (
+                self.__get_constraint_matrix(rows)
+            )
+            if debug:
+                for i in rows.tolist():
+                    Util.debug(f"constraint_{i + 1}: {self.constraints[i]}")
+
+            model.passModel(
+                size,
+                len(rows),
+                len(coefs),
+                int(highspy.MatrixFormat.kRowwise),
+                int(highspy.ObjSense.kMinimize),
+                0.0,
+                objective_value,
+                lower_bounds,
+                upper_bounds,
+                row_lower,
+                row_upper,
+                row_ptr[:-1].astype(np.int32),
+                positions.astype(np.int32),
+                coefs,
+                integrality,
+            )
+            with limits.interruptible(model.cancelSolve):
+                model.run()
+
+            status: highspy.HighsModelStatus = model.getModelStatus()
+            stopped: typing.Optional[SolutionStatus] = {
+                highspy.HighsModelStatus.kTimeLimit: SolutionStatus.TIME_LIMIT,
+                highspy.HighsModelStatus.kInterrupt: SolutionStatus.CANCELLED,
+            }.get(status)
+            if SolverArtifacts.enabled(status != highspy.HighsModelStatus.kOptimal):
+                writers: dict[str, typing.Callable[[str], typing.Any]] = {
+                    "_model.lp": model.writeModel
+                }
+                if status == highspy.HighsModelStatus.kOptimal:
+                    writers["_solution.sol"] = lambda path: model.writeSolution(
+                        path, 1
+                    )
+                SolverArtifacts.dump(SolverArtifacts.new_prefix("highs"), writers)
+
+            if debug:
+                Util.debug(f"Model:")
+            sol: Solution = None
+            if status in (
+                highspy.HighsModelStatus.kInfeasible,
+                highspy.HighsModelStatus.kUnboundedOrInfeasible,
+            ):
+                sol = Solution(Solution.INCONSISTENT_KB)
+            elif stopped is not None and model.getInfo().primal_solution_status == 0:
+                sol = Solution.get_bounded(
+                    stopped, None, _round_bound(model.getInfo().mip_dual_bound)
+                )
+            elif status in (
+                highspy.HighsModelStatus.kOptimal,
+                highspy.HighsModelStatus.kModelEmpty,
+            ) or stopped is not None:
+                # An empty model (no variables / constraints) is trivially
+                # consistent with objective 0.
+                obj_value: float = (
+                    0.0
+                    if status == highspy.HighsModelStatus.kModelEmpty
+                    else model.getInfo().objective_function_value
+                )
+                result: float = Util.round(abs(obj_value))
+                sol = Solution(result)
+                if stopped is not None:
+                    sol.set_bounded(stopped, _round_bound(model.getInfo().mip_dual_bound))
+                values: np.ndarray = np.asarray(
+                    model.getSolution().col_value, dtype=np.float64
+                )
+                self.set_showed_values(
+                    sol, show_variable, lambda rows: values[rows]
+                )
+            else:
+                Util.error(
+                    f"Error: HiGHS stopped with status {model.modelStatusToString(status)}"
+                )
+                return None
+
+            if debug:
+                Util.debug(
+                    f"{constants.STAR_SEPARATOR}Statistics{constants.STAR_SEPARATOR}"
+                )
+            if debug:
+                Util.debug("MILP problem:")
+            if debug:
+                Util.debug(f"\t\tSemi continuous variables: {num_up_vars}")
+            if debug:
+                Util.debug(f"\t\tBinary variables: {num_binary_vars}")
+            if debug:
+                Util.debug(f"\t\tContinuous variables: {num_free_vars}")
+            if debug:
+                Util.debug(f"\t\tInteger variables: {num_integer_vars}")
+            if debug:
+                Util.debug(f"\t\tTotal variables: {len(self.variables)}")
+            if debug:
                 Util.debug(f"\t\tConstraints: {len(self.constraints)}")
             return sol
         except Exception as e:
@@ -2235,7 +3152,7 @@ class MILPHelper:
 
     def solve_pulp(self, objective: Expression) -> typing.Optional[Solution]:
         """
-        Solves the defined Mixed-Integer Linear Programming (MILP) problem using the PuLP library to minimize the provided objective expression. The method constructs a PuLP model by mapping internal variables to PuLP variables, supporting binary, integer, continuous, and semi-continuous types. Specifically, for semi-continuous variables when using GLPK or CPLEX, it introduces auxiliary binary variables and linear constraints to enforce the semi-continuous domain. It iterates through the helper's constraints to populate the model, skipping zero or duplicate entries. The solver is selected and configured dynamically based on the `MILP_PROVIDER` setting, with specific tolerances and logging options applied for CBC, GLPK, HiGHS, and CPLEX. Upon completion, it returns a `Solution` object containing the optimal objective value and variable assignments, or a specific solution indicating inconsistency if the problem is infeasible. If an exception occurs during the process, the method returns `None`. Side effects include generating debug logs, writing temporary log and model files to disk, and cleaning up specific temporary files created by CPLEX.
+        Solves the defined Mixed-Integer Linear Programming (MILP) problem using the PuLP library to minimize the provided objective expression. The method constructs a PuLP model by mapping internal variables to PuLP variables, supporting binary, integer, continuous, and semi-continuous types. Specifically, for semi-continuous variables when using GLPK or CPLEX, it introduces auxiliary binary variables and linear constraints to enforce the semi-continuous domain. It iterates through the helper's constraints to populate the model, skipping zero or duplicate entries. The solver is selected and configured dynamically based on the `MILP_PROVIDER` setting, with specific tolerances and logging options applied for CBC, GLPK, HiGHS, and CPLEX. Upon completion, it returns a `Solution` object containing the optimal objective value and variable assignments, or a specific solution indicating inconsistency if the problem is infeasible. Every solver stops at the time limit and MIP gap of the current limits, in which case a bounded Solution is returned, without a bound since PuLP does not report it; since the solvers run as external processes that cannot be interrupted, a cancellation has no effect once the solver has started. If an exception occurs during the process, the method returns `None`. Side effects include generating debug logs, writing temporary log and model files to disk, writing the model and the solution to the results directory if required by the `SOLVER_ARTIFACTS` setting, and cleaning up specific temporary files created by CPLEX.
 
         :param objective: The linear expression defining the objective function to be minimized.
         :type objective: Expression
@@ -2247,8 +3164,9 @@ class MILPHelper:
 
         import pulp
 
+        debug: bool = ConfigReader.DEBUG_PRINT
         try:
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"Objective function -> {objective}")
 
             num_binary_vars: int = 0
@@ -2258,62 +3176,60 @@ class MILPHelper:
             size: int = len(self.variables)
             objective_value: list[float] = [0.0] * size
             show_variable: list[bool] = [False] * size
-            my_vars: list[Variable] = self.show_vars.get_variables()  # Variable
 
             if objective is not None:
                 for term in objective.get_terms():
                     objective_value[
-                        self.variables.index(term.get_var())
+                        self.__get_variable_position(term.get_var())
                     ] += term.get_coeff()
 
             model = pulp.LpProblem(
                 f"FuzzyDL-{ConfigReader.MILP_PROVIDER.upper()}", pulp.LpMinimize
             )
 
+            # PuLP resets the bounds of binary variables to [0, 1], which would drop the folded ones
             var_types: dict[VariableType, str] = {  # Variable
-                VariableType.BINARY: pulp.LpBinary,  # Variable
+                VariableType.BINARY: pulp.LpInteger,  # Variable
                 VariableType.INTEGER: pulp.LpInteger,  # Variable
                 VariableType.CONTINUOUS: pulp.LpContinuous,  # Variable
                 VariableType.SEMI_CONTINUOUS: pulp.LpContinuous,  # Variable
             }
 
-            vars_pulp: dict[str, pulp.LpVariable] = dict()  # Variable
-            var_name_map: dict[str, str] = {
-                str(v): f"x{i}" for i, v in enumerate(self.variables)
-            }
+            vars_pulp: list[pulp.LpVariable] = []  # Variable
             semicontinuous_var_counter: int = 1
             semicontinuous_var_name: str = "semic_z"
+            rows, lower_bounds, upper_bounds = self.__get_model_rows()
             for i, curr_variable in enumerate(self.variables):
                 v_type: VariableType = curr_variable.get_type()  # Variable
-                if ConfigReader.DEBUG_PRINT:
+                if debug:
                     Util.debug(
                         (
                             f"Variable -- "  # Variable
-                            f"[{curr_variable.get_lower_bound()}, {curr_variable.get_upper_bound()}] - "
+                            f"[{lower_bounds[i]}, {upper_bounds[i]}] - "
                             f"Obj value = {objective_value[i]} - "
                             f"Var type = {v_type.name} -- "
                             f"Var = {curr_variable}"
                         )
                     )
 
-                vars_pulp[var_name_map[str(curr_variable)]] = (
+                vars_pulp.append(
                     pulp.LpVariable(  # Variable
-                        name=var_name_map[str(curr_variable)],
+                        name=f"x{i}",
                         lowBound=(
-                            curr_variable.get_lower_bound()
-                            if curr_variable.get_lower_bound() != float("-inf")
+                            lower_bounds[i]
+                            if lower_bounds[i] != float("-inf")
                             else None
                         ),
                         upBound=(
-                            curr_variable.get_upper_bound()
-                            if curr_variable.get_upper_bound() != float("inf")
+                            upper_bounds[i]
+                            if upper_bounds[i] != float("inf")
                             else None
                         ),
                         cat=var_types[v_type],
                     )
                 )
 
-                if curr_variable in my_vars:
+                if self.show_vars.show_variable(curr_variable):
                     show_variable[i] = True
 
                 if (
@@ -2332,11 +3248,11 @@ class MILPHelper:
                         cat=pulp.LpBinary,
                     )
                     constraint_1 = (
-                        vars_pulp[var_name_map[str(curr_variable)]]
+                        vars_pulp[i]
                         >= bin_var * curr_variable.get_lower_bound()
                     )
                     constraint_2 = (
-                        vars_pulp[var_name_map[str(curr_variable)]]
+                        vars_pulp[i]
                         <= bin_var * curr_variable.get_upper_bound()
                     )
                     if constraint_1 not in model.constraints.values():
@@ -2348,7 +3264,7 @@ class MILPHelper:
                             constraint_2, name=f"constraint_{bin_var.name}_2"
                         )
                     semicontinuous_var_counter += 1
-                    if ConfigReader.DEBUG_PRINT:
+                    if debug:
                         Util.debug(
                             (
                                 f"New Variable -- "  # Variable
@@ -2357,9 +3273,9 @@ class MILPHelper:
                                 f"Var = {bin_var.name}"
                             )
                         )
-                    if ConfigReader.DEBUG_PRINT:
+                    if debug:
                         Util.debug(f"New Constraint 1 -- {constraint_1}")
-                    if ConfigReader.DEBUG_PRINT:
+                    if debug:
                         Util.debug(f"New Constraint 2 -- {constraint_2}")
 
                 if v_type == VariableType.BINARY:  # Variable
@@ -2371,7 +3287,7 @@ class MILPHelper:
                 elif v_type == VariableType.SEMI_CONTINUOUS:  # Variable
                     num_up_vars += 1
 
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"# constraints -> {len(self.constraints)}")
             constraint_name: str = "constraint"
             pulp_sense: dict[InequalityType, int] = {
@@ -2379,25 +3295,15 @@ class MILPHelper:
                 InequalityType.LESS_THAN: pulp.LpConstraintLE,
                 InequalityType.GREATER_THAN: pulp.LpConstraintGE,
             }
-            seen_constraints: set[str] = set()
-            for i, constraint in enumerate(self.constraints):
-                _ck: str = str(constraint)
-                if _ck in seen_constraints:
-                    continue
-                seen_constraints.add(_ck)
-                # ignore zero constraints
-                if constraint.is_zero():
-                    continue
-
+            for i, positions, coefs, sense, rhs in self.__get_constraint_rows(rows):
                 curr_name: str = f"{constraint_name}_{i + 1}"
                 pulp_expr: pulp.LpAffineExpression = pulp.lpSum(
-                    term.get_coeff() * vars_pulp[var_name_map[str(term.get_var())]]
-                    for term in constraint.get_terms()
+                    c * vars_pulp[j] for j, c in zip(positions, coefs)
                 )
                 pulp_constraint: pulp.LpConstraint = pulp.LpConstraint(
                     e=pulp_expr,
-                    sense=pulp_sense[constraint.get_type()],
-                    rhs=constraint.get_constant(),
+                    sense=pulp_sense[sense],
+                    rhs=rhs,
                 )
 
                 # ignore zero constraints of type a * x - a * x
@@ -2409,19 +3315,23 @@ class MILPHelper:
                     continue
 
                 model.addConstraint(pulp_constraint, name=curr_name)
-                if ConfigReader.DEBUG_PRINT:
-                    Util.debug(f"{curr_name}: {constraint}")
+                if debug:
+                    Util.debug(f"{curr_name}: {self.constraints[i]}")
 
+            limits: SolverLimits = self.get_limits()
+            time_limit: typing.Optional[float] = limits.get_time_limit()
+            mip_gap: typing.Optional[float] = limits.get_mip_gap()
             if ConfigReader.MILP_PROVIDER == MILPProvider.PULP:
                 solver = pulp.PULP_CBC_CMD(
                     mip=True,
-                    msg=ConfigReader.DEBUG_PRINT,
-                    gapRel=1e-9,
+                    msg=debug,
+                    timeLimit=time_limit,
+                    gapRel=1e-9 if mip_gap is None else mip_gap,
                     presolve=True,
-                    keepFiles=False,  # ConfigReader.DEBUG_PRINT,
+                    keepFiles=False,  # debug,
                     logPath=(
                         os.path.join(".", "logs", f"pulp_{pulp.PULP_CBC_CMD.name}.log")
-                        if ConfigReader.DEBUG_PRINT
+                        if debug
                         else None
                     ),
                     options=[
@@ -2430,7 +3340,7 @@ class MILPHelper:
                         "--integerTolerance",  # integer feasibility tolerance
                         "1e-9",
                         "--ratioGap",  # relative mip gap
-                        str(ConfigReader.EPSILON),
+                        str(ConfigReader.EPSILON if mip_gap is None else mip_gap),
                         "--allowableGap",  # optimality gap tolerance
                         "0",
                         "--preprocess",  # enable preprocessing
@@ -2440,8 +3350,9 @@ class MILPHelper:
             elif ConfigReader.MILP_PROVIDER == MILPProvider.PULP_GLPK:
                 solver = pulp.GLPK_CMD(
                     mip=True,
-                    msg=ConfigReader.DEBUG_PRINT,
-                    keepFiles=False,  # ConfigReader.DEBUG_PRINT,
+                    msg=debug,
+                    timeLimit=time_limit,
+                    keepFiles=False,  # debug,
                     options=[
                         "--presol",  # use presolver (default; assumes --scale and --adv)
                         "--exact",  # use simplex method based on exact arithmetic
@@ -2449,7 +3360,7 @@ class MILPHelper:
                         "--intopt",  # enforce MIP (Mixed Integer Programming)
                         "--mipgap",
                         str(
-                            ConfigReader.EPSILON
+                            ConfigReader.EPSILON if mip_gap is None else mip_gap
                         ),  # no relative gap between primal & best bound
                     ]
                     + (
@@ -2457,18 +3368,19 @@ class MILPHelper:
                             "--log",
                             os.path.join(".", "logs", f"pulp_{pulp.GLPK_CMD.name}.log"),
                         ]
-                        if ConfigReader.DEBUG_PRINT
+                        if debug
                         else []
                     ),
                 )
             elif ConfigReader.MILP_PROVIDER == MILPProvider.PULP_HIGHS:
                 solver = pulp.HiGHS(
                     mip=True,
-                    msg=ConfigReader.DEBUG_PRINT,
-                    gapRel=1e-6,
+                    msg=debug,
+                    timeLimit=time_limit,
+                    gapRel=1e-6 if mip_gap is None else mip_gap,
                     log_file=(
                         os.path.join(".", "logs", f"pulp_{pulp.HiGHS.name}.log")
-                        if ConfigReader.DEBUG_PRINT
+                        if debug
                         else None
                     ),
                     primal_feasibility_tolerance=1e-6,
@@ -2476,32 +3388,25 @@ class MILPHelper:
                     mip_feasibility_tolerance=1e-6,
                     presolve="on",
                     parallel="on",
-                    write_solution_to_file=True,
-                    write_solution_style=1,
-                    solution_file=os.path.join(
-                        constants.ensure_results_dir(), "highs_solution.sol"
-                    ),
-                    write_model_file=os.path.join(
-                        constants.ensure_results_dir(), "highs_model.lp"
-                    ),
                 )
             elif ConfigReader.MILP_PROVIDER == MILPProvider.PULP_CPLEX:
                 cplex_path = _find_cplex_executable()
                 solver = pulp.CPLEX_CMD(
                     path=cplex_path,
                     mip=True,
-                    msg=ConfigReader.DEBUG_PRINT,
-                    gapRel=1e-9,
-                    keepFiles=False,  # ConfigReader.DEBUG_PRINT,
+                    msg=debug,
+                    timeLimit=time_limit,
+                    gapRel=1e-9 if mip_gap is None else mip_gap,
+                    keepFiles=False,  # debug,
                     logPath=(
                         os.path.join(".", "logs", f"pulp_{pulp.CPLEX_CMD.name}.log")
-                        if ConfigReader.DEBUG_PRINT
+                        if debug
                         else None
                     ),
                 )
 
             model.objective = pulp.lpSum(
-                ov * vars_pulp[var_name_map[str(self.variables[i])]]
+                ov * vars_pulp[i]
                 for i, ov in enumerate(objective_value)
                 if ov != 0
             )
@@ -2510,11 +3415,24 @@ class MILPHelper:
                 for file in os.listdir("./"):
                     if "clone" in file:
                         os.remove(file)
+            if SolverArtifacts.enabled(result != pulp.LpStatusOptimal):
+                writers: dict[str, typing.Callable[[str], typing.Any]] = {
+                    "_model.lp": model.writeLP
+                }
+                if result == pulp.LpStatusOptimal:
+                    writers["_solution.json"] = model.to_json
+                SolverArtifacts.dump(
+                    SolverArtifacts.new_prefix(ConfigReader.MILP_PROVIDER.value),
+                    writers,
+                )
 
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"Model:")
             sol: Solution = None
-            if result != pulp.LpStatusOptimal:
+            if time_limit is not None and result == pulp.LpStatusNotSolved:
+                # The solver reached the time limit without a feasible solution
+                sol = Solution.get_bounded(SolutionStatus.TIME_LIMIT)
+            elif result != pulp.LpStatusOptimal:
                 sol = Solution(Solution.INCONSISTENT_KB)
             else:
                 obj_val = model.objective.value()
@@ -2525,43 +3443,38 @@ class MILPHelper:
                     obj_val = 1.0
                 result: float = Util.round(abs(obj_val))
                 sol = Solution(result)
-                var_dict: dict[str, pulp.LpVariable] = model.variablesDict()  # Variable
-                for i in range(size):
-                    if ConfigReader.DEBUG_PRINT or show_variable[i]:
-                        name: str = self.variables[i].name
-                        raw_value = (
-                            var_dict[var_name_map[name]].value()
-                            if var_name_map[name] in var_dict
-                            else 0.0
-                        )
-                        value: float = round(
-                            raw_value if raw_value is not None else 0.0, 6
-                        )
-                        if show_variable[i]:
-                            sol.add_showed_variable(name, value)
-                        # if self.PRINT_VARIABLES:
-                        if ConfigReader.DEBUG_PRINT:
-                            Util.debug(f"{name} = {value}")
-                        if self.PRINT_LABELS:
-                            self.print_instance_of_labels(name, value)
+                if (
+                    time_limit is not None
+                    and model.sol_status == pulp.LpSolutionIntegerFeasible
+                ):
+                    sol.set_bounded(SolutionStatus.TIME_LIMIT)
+                # Variables left out of the model by PuLP have no value
+                self.set_showed_values(
+                    sol,
+                    show_variable,
+                    lambda rows: [
+                        0.0 if vars_pulp[i].value() is None else vars_pulp[i].value()
+                        for i in rows
+                    ],
+                )
 
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(
                     f"{constants.STAR_SEPARATOR}Statistics{constants.STAR_SEPARATOR}"
                 )
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug("MILP problem:")
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"\t\tSemi continuous variables: {num_up_vars}")
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"\t\tBinary variables: {num_binary_vars}")
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"\t\tContinuous variables: {num_free_vars}")
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"\t\tInteger variables: {num_integer_vars}")
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"\t\tTotal variables: {len(self.variables)}")
-            if ConfigReader.DEBUG_PRINT:
+            if debug:
                 Util.debug(f"\t\tConstraints: {len(self.constraints)}")
             return sol
         except Exception as e:
@@ -2793,17 +3706,18 @@ class MILPHelper:
         # set all variables binary, except
         #   - those that hold the value of a datatype filler
         #   - free variables in constraints
-        for v in self.variables:
+        for i, v in enumerate(self.variables):
             if v.get_datatype_filler_type() or v.get_type() in (
                 VariableType.CONTINUOUS,  # Variable
                 VariableType.INTEGER,  # Variable
+                VariableType.BINARY,  # Variable
             ):
                 continue
-            v.set_binary_variable()
+            self.__get_own_variable(v.id).set_binary_variable()
 
     def get_name_for_integer(self, i: int) -> typing.Optional[str]:
         """
-        Retrieves the symbolic name associated with a specific integer index by performing a reverse lookup on the internal mapping of variable names to their integer identifiers. If the provided integer corresponds to a known variable index, the method returns the associated name string; otherwise, it returns None to indicate that no variable is currently mapped to that value. This is a read-only operation that does not modify the state of the object.
+        Retrieves the symbolic name of the variable with the given integer identifier. Since identifiers are assigned in creation order, the variable is found by position in `variables` instead of by a reverse lookup on the mapping of variable names. If the provided integer is not the identifier of a variable of the problem, the method returns None. This is a read-only operation that does not modify the state of the object.
 
         :param i: The integer identifier of the variable to look up.
         :type i: int
@@ -2813,14 +3727,14 @@ class MILPHelper:
         :rtype: typing.Optional[str]
         """
 
-        for name, i2 in self.number_of_variables.items():
-            if i == i2:
-                return name
-        return None
+        if i < 0 or i >= len(self.number_of_variables):
+            return None
+        position: int = self.get_position(i)
+        return self.variables[position].name if position >= 0 else None
 
     def get_number_for_assertion(self, ass: Assertion) -> int:
         """
-        Retrieves the integer codification associated with a given assertion by first resolving the assertion to its variable representation and then looking up the corresponding integer value in the internal variable mapping. This method serves as a bridge between logical assertions and their numerical identifiers used in the MILP formulation, performing a read-only operation without modifying the underlying data structures. If the assertion has not been previously registered in the mapping, the method returns None.
+        Retrieves the integer codification associated with a given assertion, namely the identifier of the variable representing the assertion. This method serves as a bridge between logical assertions and their numerical identifiers used in the MILP formulation. The variable is resolved through the (individual, concept) index, so no variable name is built for assertions that have already been seen; if the assertion has no variable yet, a new one is created.
 
         :param ass: The assertion to be converted into an integer codification.
         :type ass: Assertion
@@ -2830,12 +3744,15 @@ class MILPHelper:
         :rtype: int
         """
 
-        return self.number_of_variables.get(str(self.get_variable(ass)))
+        return self.get_variable(ass).id
 
     def add_contradiction(self) -> None:
         r"""Forces the KB into an unsatisfiable state by emitting $1 = 0$."""
 
         self.constraints.clear()
+        self.constraint_store = ConstraintStore()
+        self.components = UnionFind()
+        self.merged_constraints = 0
         # 1 = 0  (forced contradiction)
         self.add_new_constraint(Expression(1.0), InequalityType.EQUAL)
 
@@ -2848,3 +3765,125 @@ class MILPHelper:
         """
 
         self.cardinalities.append(sc)
+
+
+# Pool of processes used to solve the partitions of a MILP problem
+_partition_executor: typing.Optional[concurrent.futures.ProcessPoolExecutor] = None
+_partition_executor_workers: int = 0
+
+
+def _get_partition_executor(workers: int) -> concurrent.futures.ProcessPoolExecutor:
+    """
+    Returns the pool of processes used to solve the partitions of the MILP problems, creating it on first use. The pool is reused across optimizations, and it is only recreated when more workers than the ones of the current pool are requested.
+
+    :param workers: The number of processes needed.
+    :type workers: int
+
+    :return: A pool of at least `workers` processes.
+
+    :rtype: concurrent.futures.ProcessPoolExecutor
+    """
+
+    global _partition_executor, _partition_executor_workers
+
+    if _partition_executor is None or _partition_executor_workers < workers:
+        if _partition_executor is not None:
+            _partition_executor.shutdown(wait=False)
+        _partition_executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+        _partition_executor_workers = workers
+    return _partition_executor
+
+
+def _reset_partition_executor() -> None:
+    """Forgets the pool of processes used to solve the partitions of the MILP problems in a forked process, whose worker processes belong to the parent process, so that a new pool is created on first use."""
+
+    global _partition_executor, _partition_executor_workers
+
+    _partition_executor = None
+    _partition_executor_workers = 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_partition_executor)
+
+
+def _get_solver_settings() -> dict[str, typing.Any]:
+    """
+    Takes a snapshot of the settings that affect the MILP solvers, namely the values of the `ConfigReader` parameters and the numerical limits in `constants`, so that they can be restored in the worker processes solving the partitions.
+
+    :return: A dictionary mapping the names of the settings to their current values.
+
+    :rtype: dict[str, typing.Any]
+    """
+
+    context: ReasonerContext = ReasonerContext.current()
+    settings: dict[str, typing.Any] = dict(context.settings)
+    settings["constants.MAXVAL"] = context.maxval
+    settings["constants.MAXVAL2"] = context.maxval2
+    return settings
+
+
+def _solve_partition(
+    milp: MILPHelper, objective: Expression, settings: dict[str, typing.Any]
+) -> typing.Optional[Solution]:
+    """
+    Solves the MILP problem of a partition in a worker process. The settings of the parent process are restored first, and the problem is then solved as a single model with the configured MILP provider.
+
+    :param milp: The MILP problem of the partition.
+    :type milp: MILPHelper
+    :param objective: The restriction of the objective function to the partition.
+    :type objective: Expression
+    :param settings: The solver settings of the parent process, as returned by `_get_solver_settings`.
+    :type settings: dict[str, typing.Any]
+
+    :return: The Solution of the partition, or None if an error occurs.
+
+    :rtype: typing.Optional[Solution]
+    """
+
+    context: ReasonerContext = ReasonerContext.current()
+    for k, v in settings.items():
+        if k == "constants.MAXVAL":
+            context.maxval = v
+        elif k == "constants.MAXVAL2":
+            context.maxval2 = v
+        else:
+            context.settings[k] = v
+    return milp.solve_model(objective)
+
+
+def _round_bound(bound: typing.Optional[float]) -> typing.Optional[float]:
+    """
+    Converts the best bound of the objective reported by a solver to the scale of the value of a `Solution`, which is the rounded absolute value of the objective.
+
+    :param bound: The best bound reported by the solver, or None if it is not available.
+    :type bound: typing.Optional[float]
+
+    :return: The rounded absolute value of the bound, or None if the bound is not available, not finite or not below `constants.MAXVAL`, since some solvers such as CBC report a huge finite value (1e30) when they have no bound.
+
+    :rtype: typing.Optional[float]
+    """
+
+    if bound is None or not math.isfinite(bound) or abs(bound) >= constants.MAXVAL:
+        return None
+    return Util.round(abs(bound))
+
+
+def _get_gurobi_bound(model: typing.Any) -> typing.Optional[float]:
+    """
+    Returns the best bound of the objective of a Gurobi model that stopped before proving optimality, on the scale of the value of a `Solution`.
+
+    :param model: The Gurobi model.
+    :type model: typing.Any
+
+    :return: The rounded best bound, or None if the model has no bound, e.g. because it is a linear program.
+
+    :rtype: typing.Optional[float]
+    """
+
+    import gurobipy as gp
+
+    try:
+        return _round_bound(model.ObjBound)
+    except (AttributeError, gp.GurobiError):
+        return None
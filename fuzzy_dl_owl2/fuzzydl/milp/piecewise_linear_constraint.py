@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import typing
+
+from fuzzy_dl_owl2.fuzzydl.milp.variable import Variable
+
+
+class PiecewiseLinearConstraint:
+    r"""
+    Encodes a piecewise linear constraint  $y = f(x)$, where $f$ interpolates linearly the breakpoints $(x_i, y_i)$ and $x$ is restricted to the interval $[x_0, x_n]$ between the first and the last abscissa. The abscissas must be non-decreasing, and two consecutive breakpoints with the same abscissa describe a jump of the function. Like `Inequation` objects, piecewise linear constraints are never modified once created, so they are shared by the helpers created by `MILPHelper.clone`. The solver backends lower them in their own way: Gurobi uses a native piecewise linear general constraint, Python-MIP a special ordered set of type 2 over the weights of the breakpoints, and the other providers the convex combination formulation built by `MILPHelper.lower_piecewise_linear_constraints`.
+
+    :param x: The variable of the argument of the function.
+    :type x: Variable
+    :param y: The variable of the value of the function.
+    :type y: Variable
+    :param x_points: The abscissas of the breakpoints, in non-decreasing order.
+    :type x_points: list[float]
+    :param y_points: The ordinates of the breakpoints, aligned with `x_points`.
+    :type y_points: list[float]
+    """
+
+    def __init__(
+        self,
+        x: Variable,
+        y: Variable,
+        x_points: list[float],
+        y_points: list[float],
+    ) -> None:
+        """
+        Constructs a piecewise linear constraint from its variables and breakpoints, validating that there are at least two breakpoints and that their abscissas are non-decreasing.
+
+        :param x: The variable of the argument of the function.
+        :type x: Variable
+        :param y: The variable of the value of the function.
+        :type y: Variable
+        :param x_points: The abscissas of the breakpoints, in non-decreasing order.
+        :type x_points: list[float]
+        :param y_points: The ordinates of the breakpoints, aligned with `x_points`.
+        :type y_points: list[float]
+
+        :raises ValueError: Raised if there are fewer than two breakpoints, if the lists of abscissas and ordinates have different lengths, or if the abscissas decrease.
+        """
+
+        if len(x_points) < 2 or len(x_points) != len(y_points):
+            raise ValueError(
+                f"Piecewise linear constraints require at least two breakpoints: {x_points}, {y_points}"
+            )
+        if any(x1 > x2 for x1, x2 in zip(x_points, x_points[1:])):
+            raise ValueError(
+                f"The breakpoints of a piecewise linear constraint must be non-decreasing: {x_points}"
+            )
+        self.x: Variable = x
+        self.y: Variable = y
+        self.x_points: list[float] = [float(p) for p in x_points]
+        self.y_points: list[float] = [float(p) for p in y_points]
+
+    def get_x(self) -> Variable:
+        """
+        Returns the variable of the argument of the function.
+
+        :return: The variable $x$.
+
+        :rtype: Variable
+        """
+
+        return self.x
+
+    def get_y(self) -> Variable:
+        """
+        Returns the variable of the value of the function.
+
+        :return: The variable $y$.
+
+        :rtype: Variable
+        """
+
+        return self.y
+
+    def get_x_points(self) -> list[float]:
+        """
+        Returns the abscissas of the breakpoints.
+
+        :return: The non-decreasing abscissas of the breakpoints.
+
+        :rtype: list[float]
+        """
+
+        return self.x_points
+
+    def get_y_points(self) -> list[float]:
+        """
+        Returns the ordinates of the breakpoints.
+
+        :return: The ordinates of the breakpoints, aligned with the abscissas.
+
+        :rtype: list[float]
+        """
+
+        return self.y_points
+
+    def add_sos2(self, model: typing.Any, x: typing.Any, y: typing.Any) -> None:
+        r"""
+        Adds the constraint to a Python-MIP model as a convex combination of the breakpoints whose weights form a special ordered set of type 2, so that at most two consecutive weights are positive and CBC branches on the set instead of on binary variables:
+
+        .. math::
+            \sum_i \lambda_i = 1, \quad x = \sum_i \lambda_i x_i, \quad y = \sum_i \lambda_i y_i, \quad \lambda \in \text{SOS2}
+
+        The weights are continuous variables of the model that are not part of the MILP problem.
+
+        :param model: The Python-MIP model.
+        :type model: typing.Any
+        :param x: The handle of the variable of the argument in the model.
+        :type x: typing.Any
+        :param y: The handle of the variable of the value in the model.
+        :type y: typing.Any
+        """
+
+        import mip
+
+        weights: list[mip.Var] = [
+            model.add_var(lb=0.0, ub=1.0) for _ in range(len(self.x_points))
+        ]
+        model.add_constr(mip.xsum(weights) == 1.0)
+        model.add_constr(
+            x == mip.xsum(p * w for p, w in zip(self.x_points, weights) if p != 0)
+        )
+        model.add_constr(
+            y == mip.xsum(p * w for p, w in zip(self.y_points, weights) if p != 0)
+        )
+        model.add_sos([(w, i) for i, w in enumerate(weights)], 2)
+
+    def __str__(self) -> str:
+        """
+        Returns a readable representation of the constraint, listing its breakpoints.
+
+        :return: The constraint as `y = pwl(x; (x0, y0), ...)`.
+
+        :rtype: str
+        """
+
+        points: str = ", ".join(
+            f"({x}, {y})" for x, y in zip(self.x_points, self.y_points)
+        )
+        return f"{self.y} = pwl({self.x}; {points})"
@@ -0,0 +1,535 @@
+from __future__ import annotations
+
+import math
+import typing
+
+from fuzzy_dl_owl2.fuzzydl.util.constants import InequalityType
+
+
+class Presolver:
+    """
+    This class simplifies a MILP problem before it is handed to a solver backend, working on plain lists indexed by the positions of the variables so that it does not depend on the `Variable` and `Inequation` objects of the problem. The bounds of the variables are propagated through the rows, computing for every row the minimum and maximum activity allowed by the current bounds, which tightens the bounds of its variables and detects the rows that can no longer be violated, which are dropped; rows with a single variable become bounds. Variables whose bounds meet are fixed and substituted into their rows, and equalities `a * x + b * y = c` between two variables, such as the ones added by `add_equality`, are used to replace `x` by `c / a - (b / a) * y` everywhere, transferring the bounds of `x` to `y`; an integer variable is only replaced by another integer variable with a unit ratio and an integral offset, so that no integrality is lost. These steps are repeated until nothing changes, and the variables that are left without rows are finally dropped with a value within their bounds. Protected variables, such as the ones of the objective function or of the piecewise linear and general constraints, are never removed, although their bounds may be tightened, and frozen rows, such as the ones with nominal variables that some backends drop, are not used to tighten bounds. Every removed variable is recorded in a postsolve map as an affine function of a kept variable or as a constant, from which its value is restored once the reduced problem has been solved.
+
+    :param TOLERANCE: Absolute tolerance below which a row is considered redundant, a variable fixed or a coefficient null. It does not scale with the right-hand side of the rows, since the big-M constraints of the reasoner compare activities of the order of `MAXVAL` with offsets of the order of `EPSILON`.
+    :type TOLERANCE: float
+    :param FEASIBILITY_TOLERANCE: Absolute tolerance, in the order of the ones of the solvers, by which a row or a pair of bounds may be violated before the problem is deemed infeasible, which also absorbs the rounding errors of the bounds derived from big-M constraints before rounding the bounds of integer variables.
+    :type FEASIBILITY_TOLERANCE: float
+    :param MIN_IMPROVEMENT: Relative improvement of a bound below which the rows of its variable are not propagated again, which prevents endless sequences of tiny tightenings of continuous variables.
+    :type MIN_IMPROVEMENT: float
+    :param MAX_ROUNDS: Maximum number of rounds of bound propagation and substitution.
+    :type MAX_ROUNDS: int
+    :param lower: Lower bound of every variable.
+    :type lower: list[float]
+    :param upper: Upper bound of every variable.
+    :type upper: list[float]
+    :param integer: Whether every variable is binary or integer.
+    :type integer: list[bool]
+    :param protected: Whether every variable must be kept in the reduced problem.
+    :type protected: list[bool]
+    :param rows: The rows of the problem, mapping the positions of their variables to their coefficients, or None for the rows that have been dropped.
+    :type rows: list[typing.Optional[dict[int, float]]]
+    :param indices: The index of every row in the original problem.
+    :type indices: list[int]
+    :param senses: The relational operator of every row.
+    :type senses: list[InequalityType]
+    :param rhs: The right-hand side of every row.
+    :type rhs: list[float]
+    :param frozen: Whether every row is frozen.
+    :type frozen: list[bool]
+    :param modified: Whether every row differs from the original one after the substitutions.
+    :type modified: list[bool]
+    :param col_rows: The indices of the rows in which every variable appears.
+    :type col_rows: list[set[int]]
+    :param removed: Whether every variable has been removed from the problem.
+    :type removed: list[bool]
+    :param substitutions: Postsolve map from the position of every removed variable to a tuple `(c, k, j)` meaning that its value is `c + k * x[j]`, or just `c` if `j` is -1.
+    :type substitutions: dict[int, tuple[float, float, int]]
+    :param dirty: Rows whose variables have changed since they were last propagated.
+    :type dirty: set[int]
+    :param changed: Whether the presolver has reduced the problem.
+    :type changed: bool
+    :param infeasible: Whether the presolver has proved that the problem is infeasible.
+    :type infeasible: bool
+    """
+
+    TOLERANCE: float = 1e-9
+    FEASIBILITY_TOLERANCE: float = 1e-6
+    MIN_IMPROVEMENT: float = 1e-6
+    MAX_ROUNDS: int = 20
+
+    def __init__(
+        self,
+        lower: list[float],
+        upper: list[float],
+        integer: list[bool],
+        protected: list[bool],
+    ) -> None:
+        """
+        Initializes a presolver for a problem without rows over the variables with the given bounds, integrality and protection flags, all of them indexed by the positions of the variables.
+
+        :param lower: Lower bound of every variable.
+        :type lower: list[float]
+        :param upper: Upper bound of every variable.
+        :type upper: list[float]
+        :param integer: Whether every variable is binary or integer.
+        :type integer: list[bool]
+        :param protected: Whether every variable must be kept in the reduced problem.
+        :type protected: list[bool]
+        """
+
+        self.lower: list[float] = list(lower)
+        self.upper: list[float] = list(upper)
+        self.integer: list[bool] = list(integer)
+        self.protected: list[bool] = list(protected)
+        self.rows: list[typing.Optional[dict[int, float]]] = []
+        self.indices: list[int] = []
+        self.senses: list[InequalityType] = []
+        self.rhs: list[float] = []
+        self.frozen: list[bool] = []
+        self.modified: list[bool] = []
+        self.col_rows: list[set[int]] = [set() for _ in lower]
+        self.removed: list[bool] = [False] * len(lower)
+        self.substitutions: dict[int, tuple[float, float, int]] = dict()
+        self.dirty: set[int] = set()
+        self.changed: bool = False
+        self.infeasible: bool = False
+
+    def add_row(
+        self,
+        index: int,
+        cols: list[int],
+        coefs: list[float],
+        sense: InequalityType,
+        rhs: float,
+        frozen: bool = False,
+    ) -> None:
+        """
+        Adds the row `sum(coefs * x[cols]) sense rhs` to the problem. The variables of the row must be distinct and their coefficients non-null, as in the rows of a `ConstraintStore`.
+
+        :param index: The index of the row in the original problem, reported back by `get_rows`.
+        :type index: int
+        :param cols: The positions of the variables of the row.
+        :type cols: list[int]
+        :param coefs: The coefficients of the variables, aligned with `cols`.
+        :type coefs: list[float]
+        :param sense: The relational operator of the row.
+        :type sense: InequalityType
+        :param rhs: The right-hand side of the row.
+        :type rhs: float
+        :param frozen: Whether the row must not be used to tighten bounds.
+        :type frozen: bool
+        """
+
+        i: int = len(self.rows)
+        self.rows.append(dict(zip(cols, coefs)))
+        self.indices.append(index)
+        self.senses.append(sense)
+        self.rhs.append(rhs)
+        self.frozen.append(frozen)
+        self.modified.append(False)
+        for j in cols:
+            self.col_rows[j].add(i)
+        self.dirty.add(i)
+
+    def presolve(self) -> bool:
+        """
+        Reduces the problem, alternating rounds of bound propagation, substitution of fixed variables and substitution of aliased variables until a round changes nothing or `MAX_ROUNDS` rounds have been performed, and then drops the variables that no longer appear in any row. If the problem turns out to be infeasible, the presolver stops and the original problem should be solved instead, so that the solver reports the inconsistency as usual.
+
+        :return: True if the problem has been reduced without detecting its infeasibility, False otherwise.
+
+        :rtype: bool
+        """
+
+        for _ in range(Presolver.MAX_ROUNDS):
+            changed: bool = self.__propagate_bounds()
+            if not self.infeasible:
+                changed = self.__substitute_fixed_variables() or changed
+                changed = self.__substitute_aliases() or changed
+            if self.infeasible:
+                return False
+            if not changed:
+                break
+        self.__remove_empty_variables()
+        return True
+
+    def is_removed(self, j: int) -> bool:
+        """
+        Checks whether the variable at the given position has been removed from the problem.
+
+        :param j: The position of the variable.
+        :type j: int
+
+        :return: True if the variable has been removed, False otherwise.
+
+        :rtype: bool
+        """
+
+        return self.removed[j]
+
+    def get_substitution(self, j: int) -> tuple[float, float, int]:
+        """
+        Returns the value of the variable at the given position as an affine function `c + k * x[t]` of a variable `x[t]` kept in the reduced problem, following the chains of substitutions of the postsolve map. Kept variables are returned as `(0, 1, j)`, and variables with a constant value as `(c, 0, -1)`.
+
+        :param j: The position of the variable.
+        :type j: int
+
+        :return: A tuple with the constant `c`, the coefficient `k` and the position `t` of the kept variable, or -1 if the value is constant.
+
+        :rtype: tuple[float, float, int]
+        """
+
+        c, k, t = 0.0, 1.0, j
+        while t >= 0 and self.removed[t]:
+            d, m, t = self.substitutions[t]
+            c, k = c + k * d, k * m
+        return c, k, t
+
+    def get_rows(
+        self,
+    ) -> typing.Iterator[
+        tuple[int, list[int], list[float], InequalityType, float, bool]
+    ]:
+        """
+        Yields the rows of the reduced problem, with their variables sorted by position.
+
+        :return: An iterator over tuples with the index of the row in the original problem, the positions of its variables, their coefficients, its relational operator, its right-hand side, and whether the row differs from the original one.
+
+        :rtype: typing.Iterator[tuple[int, list[int], list[float], InequalityType, float, bool]]
+        """
+
+        for i, row in enumerate(self.rows):
+            if row is None:
+                continue
+            cols: list[int] = sorted(row)
+            yield (
+                self.indices[i],
+                cols,
+                [row[j] for j in cols],
+                self.senses[i],
+                self.rhs[i],
+                self.modified[i],
+            )
+
+    def __get_activity(self, i: int) -> tuple[float, float, int, int]:
+        """
+        Computes the minimum and maximum activity of a row under the current bounds of its variables. The infinite contributions are counted apart, so that the activity of the row without one of its variables can be derived in constant time.
+
+        :param i: The index of the row.
+        :type i: int
+
+        :return: A tuple with the finite parts of the minimum and maximum activities, and the numbers of infinite contributions to each of them.
+
+        :rtype: tuple[float, float, int, int]
+        """
+
+        min_act: float = 0.0
+        max_act: float = 0.0
+        min_inf: int = 0
+        max_inf: int = 0
+        for j, a in self.rows[i].items():
+            low: float = a * (self.lower[j] if a > 0 else self.upper[j])
+            high: float = a * (self.upper[j] if a > 0 else self.lower[j])
+            if math.isinf(low):
+                min_inf += 1
+            else:
+                min_act += low
+            if math.isinf(high):
+                max_inf += 1
+            else:
+                max_act += high
+        return min_act, max_act, min_inf, max_inf
+
+    def __remove_row(self, i: int) -> None:
+        """
+        Drops a row from the problem.
+
+        :param i: The index of the row.
+        :type i: int
+        """
+
+        for j in self.rows[i]:
+            self.col_rows[j].discard(i)
+        self.rows[i] = None
+        self.dirty.discard(i)
+        self.changed = True
+
+    def __tighten(
+        self, j: int, lower: float, upper: float, coef: float = 1.0
+    ) -> bool:
+        """
+        Intersects the bounds of a variable with the given ones, rounding them inwards if the variable is integer. A fractional bound is only rounded outwards instead if the resulting violation of the row it comes from, that is, its distance to the integer times the coefficient of the variable in the row, is within `FEASIBILITY_TOLERANCE`, so that a big-M constraint such as `M * y >= EPSILON` still forces `y` to 1. If the new bounds cross each other by less than `FEASIBILITY_TOLERANCE`, the variable is fixed at its lower bound; if they cross by more, the problem is marked as infeasible. The rows of the variable are propagated again if some bound has improved significantly.
+
+        :param j: The position of the variable.
+        :type j: int
+        :param lower: The new lower bound.
+        :type lower: float
+        :param upper: The new upper bound.
+        :type upper: float
+        :param coef: The coefficient of the variable in the row the bounds come from.
+        :type coef: float
+
+        :return: True if some bound has improved significantly, False otherwise.
+
+        :rtype: bool
+        """
+
+        if self.integer[j]:
+            tol: float = Presolver.FEASIBILITY_TOLERANCE / max(1.0, abs(coef))
+            if math.isfinite(lower):
+                lower = math.ceil(lower - tol)
+            if math.isfinite(upper):
+                upper = math.floor(upper + tol)
+        significant: bool = False
+        if lower > self.lower[j]:
+            significant = math.isinf(self.lower[j]) or (
+                lower - self.lower[j]
+                > Presolver.MIN_IMPROVEMENT * max(1.0, abs(lower))
+            )
+            self.lower[j] = lower
+        if upper < self.upper[j]:
+            significant = significant or (
+                math.isinf(self.upper[j])
+                or self.upper[j] - upper
+                > Presolver.MIN_IMPROVEMENT * max(1.0, abs(upper))
+            )
+            self.upper[j] = upper
+        if self.lower[j] > self.upper[j]:
+            if self.lower[j] - self.upper[j] > Presolver.FEASIBILITY_TOLERANCE:
+                self.infeasible = True
+                return False
+            self.upper[j] = self.lower[j]
+        if significant:
+            self.dirty.update(self.col_rows[j])
+            self.changed = True
+        return significant
+
+    def __propagate_row(self, i: int) -> bool:
+        """
+        Propagates the bounds of the variables of a row. The row is dropped if its activity bounds show that it always holds, or if it has no variables left and it only fails by less than `FEASIBILITY_TOLERANCE`, and the problem is marked as infeasible if they show that it can never hold. Otherwise, unless the row is frozen, the bound that the row imposes on every variable given the bounds of the other ones is intersected with the bounds of the variable; rows with a single variable are dropped afterwards, since they are then equivalent to the bounds of their variable.
+
+        :param i: The index of the row.
+        :type i: int
+
+        :return: True if the row has been dropped or some bound has improved significantly, False otherwise.
+
+        :rtype: bool
+        """
+
+        row: dict[int, float] = self.rows[i]
+        sense: InequalityType = self.senses[i]
+        b: float = self.rhs[i]
+        tol: float = Presolver.TOLERANCE
+        min_act, max_act, min_inf, max_inf = self.__get_activity(i)
+        # Whether the row cannot be violated from above (<=) or from below (>=)
+        upper_holds: bool = sense == InequalityType.GREATER_THAN or (
+            max_inf == 0 and max_act <= b + tol
+        )
+        lower_holds: bool = sense == InequalityType.LESS_THAN or (
+            min_inf == 0 and min_act >= b - tol
+        )
+        if upper_holds and lower_holds:
+            self.__remove_row(i)
+            return True
+        feas_tol: float = Presolver.FEASIBILITY_TOLERANCE
+        if (
+            sense != InequalityType.LESS_THAN
+            and max_inf == 0
+            and max_act < b - feas_tol
+        ) or (
+            sense != InequalityType.GREATER_THAN
+            and min_inf == 0
+            and min_act > b + feas_tol
+        ):
+            self.infeasible = True
+            return False
+        if len(row) == 0:
+            # Rounding errors of the substitutions within the feasibility tolerance
+            self.__remove_row(i)
+            return True
+        if self.frozen[i]:
+            return False
+
+        changed: bool = False
+        for j, a in list(row.items()):
+            lower: float = -math.inf
+            upper: float = math.inf
+            if sense != InequalityType.GREATER_THAN:
+                # a * x[j] <= b - (minimum activity of the other variables)
+                low: float = a * (self.lower[j] if a > 0 else self.upper[j])
+                if math.isinf(low):
+                    rest = min_act if min_inf == 1 else None
+                else:
+                    rest = min_act - low if min_inf == 0 else None
+                if rest is not None:
+                    if a > 0:
+                        upper = (b - rest) / a
+                    else:
+                        lower = (b - rest) / a
+            if sense != InequalityType.LESS_THAN:
+                # a * x[j] >= b - (maximum activity of the other variables)
+                high: float = a * (self.upper[j] if a > 0 else self.lower[j])
+                if math.isinf(high):
+                    rest = max_act if max_inf == 1 else None
+                else:
+                    rest = max_act - high if max_inf == 0 else None
+                if rest is not None:
+                    if a > 0:
+                        lower = (b - rest) / a
+                    else:
+                        upper = (b - rest) / a
+            if lower > self.lower[j] or upper < self.upper[j]:
+                changed = self.__tighten(j, lower, upper, a) or changed
+                if self.infeasible:
+                    return False
+        if len(row) == 1:
+            self.__remove_row(i)
+            return True
+        return changed
+
+    def __propagate_bounds(self) -> bool:
+        """
+        Propagates once every row whose variables have changed since it was last propagated; the rows affected by the tightenings of this sweep are left for the next round.
+
+        :return: True if some row has been dropped or some bound has improved significantly, False otherwise.
+
+        :rtype: bool
+        """
+
+        rows: list[int] = sorted(self.dirty)
+        self.dirty = set()
+        changed: bool = False
+        for i in rows:
+            if self.rows[i] is None:
+                continue
+            changed = self.__propagate_row(i) or changed
+            if self.infeasible:
+                break
+        return changed
+
+    def __substitute(self, j: int, c: float, k: float, t: int) -> None:
+        """
+        Removes a variable from the problem, replacing it by `c + k * x[t]` in all its rows, or by the constant `c` if `t` is -1, and records the substitution in the postsolve map.
+
+        :param j: The position of the removed variable.
+        :type j: int
+        :param c: The constant of the substitution.
+        :type c: float
+        :param k: The coefficient of the kept variable.
+        :type k: float
+        :param t: The position of the kept variable, or -1.
+        :type t: int
+        """
+
+        for i in self.col_rows[j]:
+            row: dict[int, float] = self.rows[i]
+            a: float = row.pop(j)
+            self.rhs[i] -= a * c
+            if t >= 0:
+                coef: float = row.get(t, 0.0) + a * k
+                if abs(coef) <= Presolver.TOLERANCE:
+                    row.pop(t, None)
+                    self.col_rows[t].discard(i)
+                else:
+                    row[t] = coef
+                    self.col_rows[t].add(i)
+            self.modified[i] = True
+            self.dirty.add(i)
+        self.col_rows[j] = set()
+        self.removed[j] = True
+        self.substitutions[j] = (c, k, t)
+        self.changed = True
+
+    def __substitute_fixed_variables(self) -> bool:
+        """
+        Substitutes the variables whose bounds meet into their rows, unless they are protected.
+
+        :return: True if some variable has been substituted, False otherwise.
+
+        :rtype: bool
+        """
+
+        changed: bool = False
+        for j in range(len(self.lower)):
+            if (
+                self.removed[j]
+                or self.protected[j]
+                or self.upper[j] - self.lower[j] > Presolver.TOLERANCE
+            ):
+                continue
+            self.__substitute(j, self.lower[j], 0.0, -1)
+            changed = True
+        return changed
+
+    def __can_replace(self, e: int, k: float, c: float, t: int) -> bool:
+        """
+        Checks whether a variable can be replaced by `c + k * x[t]`. Protected variables are never replaced, and integer variables are only replaced by integer variables with a unit ratio and an integral offset, so that their integrality is implied.
+
+        :param e: The position of the variable to replace.
+        :type e: int
+        :param k: The coefficient of the kept variable.
+        :type k: float
+        :param c: The constant of the substitution.
+        :type c: float
+        :param t: The position of the kept variable.
+        :type t: int
+
+        :return: True if the variable can be replaced, False otherwise.
+
+        :rtype: bool
+        """
+
+        if self.protected[e]:
+            return False
+        if not self.integer[e]:
+            return True
+        return (
+            self.integer[t]
+            and abs(abs(k) - 1.0) <= Presolver.TOLERANCE
+            and abs(c - round(c)) <= Presolver.TOLERANCE
+        )
+
+    def __substitute_aliases(self) -> bool:
+        """
+        Eliminates the equalities `a * x + b * y = c` between two variables that are not frozen, replacing `x` (or `y` if `x` cannot be replaced) by `c / a - (b / a) * y` in all its rows. The bounds of the replaced variable are transferred to the kept one before the substitution.
+
+        :return: True if some variable has been substituted, False otherwise.
+
+        :rtype: bool
+        """
+
+        changed: bool = False
+        for i, row in enumerate(self.rows):
+            if (
+                row is None
+                or len(row) != 2
+                or self.frozen[i]
+                or self.senses[i] != InequalityType.EQUAL
+            ):
+                continue
+            (x, a), (y, b) = row.items()
+            for e, ae, t, at in ((x, a, y, b), (y, b, x, a)):
+                c: float = self.rhs[i] / ae
+                k: float = -at / ae
+                if self.__can_replace(e, k, c, t):
+                    break
+            else:
+                continue
+            self.__remove_row(i)
+            lower: float = (self.lower[e] - c) / k
+            upper: float = (self.upper[e] - c) / k
+            self.__tighten(t, min(lower, upper), max(lower, upper))
+            if self.infeasible:
+                return changed
+            self.__substitute(e, c, k, t)
+            changed = True
+        return changed
+
+    def __remove_empty_variables(self) -> None:
+        """
+        Removes the variables that are not protected and no longer appear in any row, giving them the value within their bounds closest to 0.
+        """
+
+        for j in range(len(self.lower)):
+            if self.removed[j] or self.protected[j] or len(self.col_rows[j]) > 0:
+                continue
+            self.__substitute(j, min(max(0.0, self.lower[j]), self.upper[j]), 0.0, -1)
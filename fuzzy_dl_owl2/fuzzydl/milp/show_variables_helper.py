@@ -29,6 +29,8 @@ class ShowVariablesHelper:  # Variable
     :type labels_for_fillers: dict[str, list[FuzzyConcreteConcept]]
     :param variables: Stores the variables to be displayed, mapping each variable object to its corresponding display name string.
     :type variables: dict[Variable, str]
+    :param variable_ids: Identifiers of the variables to be displayed (see `Variable.id`), which allow checking whether a variable has to be displayed without hashing its name.
+    :type variable_ids: set[int]
     """
 
 
@@ -51,6 +53,8 @@ class ShowVariablesHelper:  # Variable
         self.labels_for_fillers: dict[str, list[FuzzyConcreteConcept]] = dict()
         # Show these variables
         self.variables: dict[Variable, str] = dict()  # Variable
+        # Identifiers of the variables to show
+        self.variable_ids: set[int] = set()
 
     def clone(self) -> typing.Self:
         """
@@ -78,6 +82,7 @@ class ShowVariablesHelper:  # Variable
             k: [c for c in v] for k, v in self.labels_for_fillers.items()
         }
         s.variables = {k: v for k, v in self.variables.items()}
+        s.variable_ids = set(self.variable_ids)
         return s
 
     def get_name(self, var: Variable) -> str:  # Variable
@@ -96,7 +101,7 @@ class ShowVariablesHelper:  # Variable
 
     def show_variable(self, var: Variable) -> bool:  # Variable
         """
-        Determines whether a specific variable is present within the internal collection managed by the helper. It performs a membership check against the stored variables and returns a boolean value indicating if the variable is currently tracked. This method is a read-only operation and does not modify the state of the helper or the variable itself.
+        Determines whether a specific variable is present within the internal collection managed by the helper. Variables registered in a MILP problem are looked up by identifier in `variable_ids`, which takes constant time and does not hash their names, while the remaining ones are looked up in `variables`. This method is a read-only operation and does not modify the state of the helper or the variable itself.
 
         :param var: The variable to check for existence.
         :type var: Variable
@@ -106,6 +111,8 @@ class ShowVariablesHelper:  # Variable
         :rtype: bool
         """
 
+        if var.id >= 0:
+            return var.id in self.variable_ids
         return var in self.variables
 
     def add_individual_to_show(self, ind_name: str) -> None:
@@ -345,7 +352,7 @@ class ShowVariablesHelper:  # Variable
 
     def add_variable(self, var: Variable, name_to_show: str) -> None:  # Variable
         """
-        Registers a specific `Variable` instance for display, associating it with a custom string label to be used when rendering or presenting the variable. This method updates the internal state of the helper by storing the mapping between the variable object and its designated display name. If the variable is already present in the collection, the existing display name will be overwritten with the new value, ensuring that the most recent label is retained.
+        Registers a specific `Variable` instance for display, associating it with a custom string label to be used when rendering or presenting the variable. This method updates the internal state of the helper by storing the mapping between the variable object and its designated display name, and the identifier of the variable if it is registered in a MILP problem. If the variable is already present in the collection, the existing display name will be overwritten with the new value, ensuring that the most recent label is retained.
 
         :param var: The variable object to be added for display.
         :type var: Variable
@@ -354,6 +361,8 @@ class ShowVariablesHelper:  # Variable
         """
 
         self.variables[var] = name_to_show
+        if var.id >= 0:
+            self.variable_ids.add(var.id)
 
     def get_variables(self) -> list[Variable]:  # Variable
         """
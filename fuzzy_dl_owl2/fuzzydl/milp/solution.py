@@ -1,12 +1,21 @@
+from __future__ import annotations
+
+import math
 import typing
 
+import numpy as np
+
 from fuzzy_dl_owl2.fuzzydl.util import constants
+from fuzzy_dl_owl2.fuzzydl.util.constants import SolutionStatus
+
+if typing.TYPE_CHECKING:
+    from fuzzy_dl_owl2.fuzzydl.milp.variable import Variable
 
 
 class Solution:
 
     """
-    This class encapsulates the outcome of a query performed on a fuzzy knowledge base, distinguishing between a numerical degree of satisfaction and the consistency status of the base itself. When initialized with a floating-point number, it represents a valid query result where the knowledge base is consistent, storing the satisfaction value and allowing the retrieval of specific variable bindings. Alternatively, it can be instantiated with a boolean flag to explicitly represent an inconsistent knowledge base, in which case the satisfaction value is disregarded. Users can access the consistency status, the numerical solution, and any associated variable values through dedicated accessor methods, while the string representation provides a human-readable summary of the result.
+    This class encapsulates the outcome of a query performed on a fuzzy knowledge base, distinguishing between a numerical degree of satisfaction and the consistency status of the base itself. When initialized with a floating-point number, it represents a valid query result where the knowledge base is consistent, storing the satisfaction value and allowing the retrieval of specific variable bindings. Alternatively, it can be instantiated with a boolean flag to explicitly represent an inconsistent knowledge base, in which case the satisfaction value is disregarded. Users can access the consistency status, the numerical solution, and any associated variable values through dedicated accessor methods, while the string representation provides a human-readable summary of the result. The values of the variables to show are usually handed over by the solver backends as a compact numpy array together with their variables, and their names are only built when they are requested, so that callers that only need the value of the solution do not pay for them. When the solver stops before proving optimality, because of a time limit or a cancellation, the solution is bounded: its value is the best feasible solution found, or NaN if none was found, and it also reports the status of the solver and the best bound of the objective, on the same scale as the value.
 
     :param CONSISTENT_KB: Constant indicating a consistent fuzzy Knowledge Base.
     :type CONSISTENT_KB: bool
@@ -51,7 +60,7 @@ class Solution:
     def __solution_init_1(self, consistent: bool) -> None:
         # Numerical value of the solution
         """
-        Initializes the core state attributes for a solution instance, setting the numerical solution value (`sol`) to a default float of 0.0 and assigning the provided boolean consistency status to the `consistent` attribute. Additionally, it creates an empty dictionary to store variable values (`showed_variables`). This method effectively resets or establishes the initial state of these specific instance variables, overwriting any pre-existing data.
+        Initializes the core state attributes for a solution instance, setting the numerical solution value (`sol`) to a default float of 0.0 and assigning the provided boolean consistency status to the `consistent` attribute. Additionally, it creates empty containers to store variable values (`showed_variables`, and `pending_variables` and `pending_values` until their names are resolved). This method effectively resets or establishes the initial state of these specific instance variables, overwriting any pre-existing data.
 
         :param consistent: Indicates whether the fuzzy knowledge base is consistent.
         :type consistent: bool
@@ -62,11 +71,18 @@ class Solution:
         self.consistent: bool = consistent
         # Value of the showed variables
         self.showed_variables: dict[str, float] = dict()
+        # Variables to show whose values have not been named yet, and their values
+        self.pending_variables: list[Variable] = []
+        self.pending_values: np.ndarray = np.empty(0, dtype=np.float64)
+        # Reason why the solver stopped
+        self.status: SolutionStatus = SolutionStatus.OPTIMAL
+        # Best bound of the objective if the solver stopped before optimality
+        self.bound: typing.Optional[float] = None
 
     def __solution_init_2(self, sol: float) -> None:
         # Numerical value of the solution
         """
-        Initializes the internal state of the solution object by setting the numerical solution value, establishing the consistency of the fuzzy knowledge base, and preparing a container for displayed variables. It assigns the provided numerical value to the solution attribute, defaults the consistency flag to true, and creates an empty dictionary to track the values of variables that have been shown. This method serves as a secondary initialization routine to reset or configure the object's state before further operations.
+        Initializes the internal state of the solution object by setting the numerical solution value, establishing the consistency of the fuzzy knowledge base, and preparing a container for displayed variables. It assigns the provided numerical value to the solution attribute, defaults the consistency flag to true, and creates empty containers to track the values of variables that have been shown. This method serves as a secondary initialization routine to reset or configure the object's state before further operations.
 
         :param sol: Numerical value of the solution.
         :type sol: float
@@ -77,6 +93,13 @@ class Solution:
         self.consistent: bool = True
         # Value of the showed variables
         self.showed_variables: dict[str, float] = dict()
+        # Variables to show whose values have not been named yet, and their values
+        self.pending_variables: list[Variable] = []
+        self.pending_values: np.ndarray = np.empty(0, dtype=np.float64)
+        # Reason why the solver stopped
+        self.status: SolutionStatus = SolutionStatus.OPTIMAL
+        # Best bound of the objective if the solver stopped before optimality
+        self.bound: typing.Optional[float] = None
 
     def is_consistent_kb(self) -> bool:
         """
@@ -100,15 +123,100 @@ class Solution:
 
         return self.sol
 
+    def get_status(self) -> SolutionStatus:
+        """
+        Returns the reason why the solver stopped when computing this solution, which is `SolutionStatus.OPTIMAL` unless the solver reached its time limit or was cancelled.
+
+        :return: The status of the solver.
+
+        :rtype: SolutionStatus
+        """
+
+        return self.status
+
+    def is_bounded(self) -> bool:
+        """
+        Checks whether the solver stopped before proving that the solution is optimal, in which case the value of the solution is only the best feasible solution found and `get_bound` returns the best bound of the objective.
+
+        :return: True if the solution is not proven optimal, False otherwise.
+
+        :rtype: bool
+        """
+
+        return self.status != SolutionStatus.OPTIMAL
+
+    def get_bound(self) -> typing.Optional[float]:
+        """
+        Returns the best bound of the objective proven by the solver when it stopped before optimality, on the same scale as the value of the solution. Together with the value of the solution, it brackets the optimal value of the query.
+
+        :return: The best bound of the objective, or None if the solution is optimal or the solver does not report a bound.
+
+        :rtype: typing.Optional[float]
+        """
+
+        return self.bound
+
+    def set_bounded(
+        self, status: SolutionStatus, bound: typing.Optional[float] = None
+    ) -> None:
+        """
+        Marks the solution as bounded, recording why the solver stopped before proving optimality and the best bound of the objective that it reported.
+
+        :param status: The reason why the solver stopped.
+        :type status: SolutionStatus
+        :param bound: The best bound of the objective, or None if the solver does not report it.
+        :type bound: typing.Optional[float]
+        """
+
+        self.status = status
+        self.bound = bound
+
+    @staticmethod
+    def get_bounded(
+        status: SolutionStatus,
+        incumbent: typing.Optional[float] = None,
+        bound: typing.Optional[float] = None,
+    ) -> "Solution":
+        """
+        Creates a bounded solution of a consistent knowledge base, for a solver that stopped before proving optimality.
+
+        :param status: The reason why the solver stopped.
+        :type status: SolutionStatus
+        :param incumbent: The value of the best feasible solution found, or None if none was found.
+        :type incumbent: typing.Optional[float]
+        :param bound: The best bound of the objective, or None if the solver does not report it.
+        :type bound: typing.Optional[float]
+
+        :return: The bounded solution, whose value is NaN if no feasible solution was found.
+
+        :rtype: Solution
+        """
+
+        sol: Solution = Solution(math.nan if incumbent is None else incumbent)
+        sol.set_bounded(status, bound)
+        return sol
+
     def get_showed_variables(self) -> dict[str, float]:
         """
-        Returns a dictionary containing the values of variables that were highlighted or determined during the query resolution process. This method is intended to be used after a query has been successfully solved over a consistent Knowledge Base. The keys of the dictionary are variable names, and the values are their corresponding floating-point representations. Note that this method returns a direct reference to the internal dictionary, so modifying the returned object will affect the state of the Solution instance.
+        Returns a dictionary containing the values of variables that were highlighted or determined during the query resolution process. The values handed over by `set_showed_values` are named and rounded to six decimal places on the first call. This method is intended to be used after a query has been successfully solved over a consistent Knowledge Base. The keys of the dictionary are variable names, and the values are their corresponding floating-point representations. Note that this method returns a direct reference to the internal dictionary, so modifying the returned object will affect the state of the Solution instance.
 
         :return: A dictionary mapping variable names to their float values, representing the variables resulting from a solved query over a consistent knowledge base.
 
         :rtype: dict[str, float]
         """
 
+        if len(self.pending_variables) > 0:
+            # Values added one by one take precedence over the ones named lazily
+            showed: dict[str, float] = {
+                str(var): round(value, 6)
+                for var, value in zip(
+                    self.pending_variables, self.pending_values.tolist()
+                )
+            }
+            showed.update(self.showed_variables)
+            self.showed_variables = showed
+            self.pending_variables = []
+            self.pending_values = np.empty(0, dtype=np.float64)
         return self.showed_variables
 
     def add_showed_variable(self, var_name: str, value: float) -> None:
@@ -123,6 +231,46 @@ class Solution:
 
         self.showed_variables[var_name] = value
 
+    def set_showed_values(self, variables: list[Variable], values: np.ndarray) -> None:
+        """
+        Records the values of the variables to show as returned by the solver, in a compact numpy array aligned with the given variables. No name is built and no value is rounded until `get_showed_variables` is called, so this method takes constant time; values recorded with `add_showed_variable` take precedence over the ones recorded here.
+
+        :param variables: The variables to show, in the order in which they must be reported.
+        :type variables: list[Variable]
+        :param values: The values of the variables, aligned with `variables`.
+        :type values: np.ndarray
+        """
+
+        self.pending_variables = variables
+        self.pending_values = np.asarray(values, dtype=np.float64)
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        """
+        Returns the state of the solution to be pickled. The pending values are named first, so that the pickled state only holds plain Python objects and solutions sent by the workers of a query executor can be restored by the restricted unpickler, which does not accept numpy classes.
+
+        :return: A dictionary with the attributes of the solution.
+
+        :rtype: dict[str, typing.Any]
+        """
+
+        self.get_showed_variables()
+        state: dict[str, typing.Any] = self.__dict__.copy()
+        del state["pending_variables"]
+        del state["pending_values"]
+        return state
+
+    def __setstate__(self, state: dict[str, typing.Any]) -> None:
+        """
+        Restores a solution from the state returned by `__getstate__`.
+
+        :param state: A dictionary with the attributes of the solution.
+        :type state: dict[str, typing.Any]
+        """
+
+        self.__dict__.update(state)
+        self.pending_variables = []
+        self.pending_values = np.empty(0, dtype=np.float64)
+
     def __hash__(self) -> int:
         """
         Calculates the hash value for the instance by hashing its string representation, enabling the object to be used as a key in dictionaries or as an element in sets. This implementation relies on the `__str__` method to determine the object's identity for hashing purposes. It is important to note that if the object is mutable and its string representation changes after it has been added to a hash-based collection, the hash value will change, potentially causing the object to become lost or inaccessible within that collection.
@@ -132,7 +280,15 @@ class Solution:
         :rtype: int
         """
         # return hash(str(self))
-        return hash((self.sol, self.consistent, frozenset(self.showed_variables.items())))
+        return hash(
+            (
+                self.sol,
+                self.consistent,
+                self.status,
+                self.bound,
+                frozenset(self.get_showed_variables().items()),
+            )
+        )
 
     def __repr__(self) -> str:
         """
@@ -147,13 +303,15 @@ class Solution:
 
     def __str__(self) -> str:
         """
-        Returns a human-readable string representation of the solution object, which varies based on the consistency of the underlying knowledge base. If the solution is consistent, the method returns the string representation of the solution itself; otherwise, it returns a message indicating that the knowledge base is inconsistent.
+        Returns a human-readable string representation of the solution object, which varies based on the consistency of the underlying knowledge base. If the solution is consistent, the method returns the string representation of the solution itself, followed by the status of the solver and the best bound if the solution is bounded; otherwise, it returns a message indicating that the knowledge base is inconsistent.
 
         :return: Returns the string representation of the solution if the knowledge base is consistent, or 'Inconsistent KB' otherwise.
 
         :rtype: str
         """
 
+        if self.consistent and self.is_bounded():
+            return f"{self.sol} ({self.status}, bound {self.bound})"
         if self.consistent:
             return str(self.sol)
         return "Inconsistent KB"
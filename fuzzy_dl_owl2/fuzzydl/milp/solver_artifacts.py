@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import gzip
+import itertools
+import os
+import shutil
+import time
+import typing
+
+from fuzzy_dl_owl2.fuzzydl.util import constants
+from fuzzy_dl_owl2.fuzzydl.util.config_reader import ConfigReader
+from fuzzy_dl_owl2.fuzzydl.util.constants import ArtifactPolicy
+from fuzzy_dl_owl2.fuzzydl.util.util import Util
+
+
+class SolverArtifacts:
+    """
+    This class decides whether the MILP solver backends dump the model they built and the solution they found, according to the `SOLVER_ARTIFACTS` setting, and writes the files. Since several optimizations may run one after the other or in concurrent workers, every optimization receives its own file names in the results directory, made of the name of the backend, a timestamp, the identifier of the process and a counter, so that no dump overwrites another one. The files are written by callbacks of the backends, which know how to serialize their models, and are then compressed with gzip if the `SOLVER_ARTIFACTS_COMPRESS` setting is enabled. Failures while writing a dump are logged as warnings and never affect the result of the optimization.
+
+    :param counter: Counter of the optimizations of the current process that dumped some files.
+    :type counter: itertools.count
+    """
+
+    counter: itertools.count = itertools.count()
+
+    @staticmethod
+    def enabled(failed: bool) -> bool:
+        """
+        Checks whether the files of an optimization have to be written according to the `SOLVER_ARTIFACTS` setting.
+
+        :param failed: Whether the optimization did not find an optimal solution.
+        :type failed: bool
+
+        :return: True if the files have to be written, False otherwise.
+
+        :rtype: bool
+        """
+
+        return ConfigReader.SOLVER_ARTIFACTS == ArtifactPolicy.ALWAYS or (
+            failed and ConfigReader.SOLVER_ARTIFACTS == ArtifactPolicy.ON_FAILURE
+        )
+
+    @staticmethod
+    def new_prefix(backend: str) -> str:
+        """
+        Returns a path prefix in the results directory that is unique to an optimization, to which the backends append the kind and the extension of each file they write.
+
+        :param backend: The name of the solver backend.
+        :type backend: str
+
+        :return: The path prefix of the files of the optimization.
+
+        :rtype: str
+        """
+
+        return os.path.join(
+            constants.ensure_results_dir(),
+            f"{backend}_{time.strftime('%Y%m%d-%H%M%S')}_{os.getpid()}_{next(SolverArtifacts.counter)}",
+        )
+
+    @staticmethod
+    def dump(
+        prefix: str, writers: dict[str, typing.Callable[[str], typing.Any]]
+    ) -> list[str]:
+        """
+        Writes the files of an optimization. Every writer receives the path of its file, obtained by appending its suffix to the prefix returned by `new_prefix`, and the file is then replaced by its gzip version if compression is enabled.
+
+        :param prefix: The path prefix of the files of the optimization.
+        :type prefix: str
+        :param writers: The functions writing each file, indexed by the suffix of the file name, such as "_model.lp".
+        :type writers: dict[str, typing.Callable[[str], typing.Any]]
+
+        :return: The paths of the files written.
+
+        :rtype: list[str]
+        """
+
+        paths: list[str] = []
+        for suffix, write in writers.items():
+            path: str = f"{prefix}{suffix}"
+            try:
+                write(path)
+                if ConfigReader.SOLVER_ARTIFACTS_COMPRESS:
+                    with open(path, "rb") as source, gzip.open(f"{path}.gz", "wb") as target:
+                        shutil.copyfileobj(source, target)
+                    os.remove(path)
+                    path = f"{path}.gz"
+                paths.append(path)
+            except Exception as e:
+                Util.warning(f"Cannot write solver artifact {path}: {e}")
+        return paths
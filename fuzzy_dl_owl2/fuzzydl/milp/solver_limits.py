@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import contextlib
+import threading
+import typing
+
+from fuzzy_dl_owl2.fuzzydl.util.config_reader import ConfigReader
+
+
+class SolverLimits:
+    """
+    This class holds the limits applied by the MILP solver backends to the optimizations of a query, namely the maximum number of seconds spent on every optimization and the relative MIP gap at which the solver stops, together with a flag used to cancel the optimizations cooperatively from another thread. A limit set to None falls back to the corresponding setting of `ConfigReader` in the context that runs the optimization, so that the default instance of every query follows the `SOLVER_TIME_LIMIT` and `SOLVER_MIP_GAP` settings. Cancelling the limits stops the optimization currently running with them, if its backend can be interrupted, and makes every later optimization return a cancelled solution without calling the solver, until the limits are reset. Gurobi and HiGHS are interrupted while solving; the backends that cannot be interrupted, namely Python-MIP and the PuLP solvers, only honour the cancellation before they start. The cancellation flag belongs to the current process: a pickled instance, e.g. one sent to the processes of a `QueryExecutor`, keeps its limits but starts uncancelled.
+
+    :param time_limit: Maximum number of seconds spent on a single optimization, where a value that is not positive means no limit and None uses the `SOLVER_TIME_LIMIT` setting.
+    :type time_limit: typing.Optional[float]
+    :param mip_gap: Relative MIP gap at which the solver stops, where a negative value keeps the default gap of each provider and None uses the `SOLVER_MIP_GAP` setting.
+    :type mip_gap: typing.Optional[float]
+    :param cancelled: Event set when the optimizations are cancelled.
+    :type cancelled: threading.Event
+    :param interrupts: Functions interrupting the optimizations currently running with these limits.
+    :type interrupts: list[typing.Callable[[], typing.Any]]
+    :param lock: Lock protecting the registration of the interrupting functions against a concurrent cancellation.
+    :type lock: threading.Lock
+    """
+
+    def __init__(
+        self,
+        time_limit: typing.Optional[float] = None,
+        mip_gap: typing.Optional[float] = None,
+    ) -> None:
+        """
+        Initializes the limits of the optimizations of a query, which start uncancelled.
+
+        :param time_limit: Maximum number of seconds spent on a single optimization, or None to use the `SOLVER_TIME_LIMIT` setting.
+        :type time_limit: typing.Optional[float]
+        :param mip_gap: Relative MIP gap at which the solver stops, or None to use the `SOLVER_MIP_GAP` setting.
+        :type mip_gap: typing.Optional[float]
+        """
+
+        self.time_limit: typing.Optional[float] = time_limit
+        self.mip_gap: typing.Optional[float] = mip_gap
+        self.cancelled: threading.Event = threading.Event()
+        self.interrupts: list[typing.Callable[[], typing.Any]] = []
+        self.lock: threading.Lock = threading.Lock()
+
+    def get_time_limit(self) -> typing.Optional[float]:
+        """
+        Returns the maximum number of seconds that the solver can spend on a single optimization, taken from the `SOLVER_TIME_LIMIT` setting if no limit has been set.
+
+        :return: The time limit in seconds, or None if the optimizations are not limited in time.
+
+        :rtype: typing.Optional[float]
+        """
+
+        value: float = (
+            ConfigReader.SOLVER_TIME_LIMIT if self.time_limit is None else self.time_limit
+        )
+        return value if value > 0 else None
+
+    def get_mip_gap(self) -> typing.Optional[float]:
+        """
+        Returns the relative MIP gap at which the solver stops, taken from the `SOLVER_MIP_GAP` setting if no gap has been set.
+
+        :return: The relative MIP gap, or None if every provider keeps its default gap.
+
+        :rtype: typing.Optional[float]
+        """
+
+        value: float = ConfigReader.SOLVER_MIP_GAP if self.mip_gap is None else self.mip_gap
+        return value if value >= 0 else None
+
+    def cancel(self) -> None:
+        """Cancels the optimizations running with these limits, interrupting the solvers that support it, and the ones started later. This method can be called from any thread."""
+
+        with self.lock:
+            self.cancelled.set()
+            interrupts: list[typing.Callable[[], typing.Any]] = list(self.interrupts)
+        for interrupt in interrupts:
+            interrupt()
+
+    def is_cancelled(self) -> bool:
+        """
+        Checks whether the optimizations have been cancelled.
+
+        :return: True if `cancel` has been called since the last reset, False otherwise.
+
+        :rtype: bool
+        """
+
+        return self.cancelled.is_set()
+
+    def reset(self) -> None:
+        """Clears the cancellation, so that the next optimizations run normally."""
+
+        self.cancelled.clear()
+
+    @contextlib.contextmanager
+    def interruptible(
+        self, interrupt: typing.Callable[[], typing.Any]
+    ) -> typing.Iterator[None]:
+        """
+        Registers a function interrupting the solver for the duration of a `with` statement wrapping an optimization, so that `cancel` can stop it from another thread. If the limits are already cancelled when the statement starts, the function is called immediately.
+
+        :param interrupt: A thread-safe function interrupting the running optimization.
+        :type interrupt: typing.Callable[[], typing.Any]
+
+        :return: An iterator yielding once, while the function is registered.
+
+        :rtype: typing.Iterator[None]
+        """
+
+        with self.lock:
+            self.interrupts.append(interrupt)
+            cancelled: bool = self.cancelled.is_set()
+        if cancelled:
+            interrupt()
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.interrupts.remove(interrupt)
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        """
+        Returns the state of the limits to pickle, which only keeps the time limit and the MIP gap.
+
+        :return: The picklable state of the limits.
+
+        :rtype: dict[str, typing.Any]
+        """
+
+        return {"time_limit": self.time_limit, "mip_gap": self.mip_gap}
+
+    def __setstate__(self, state: dict[str, typing.Any]) -> None:
+        """
+        Restores pickled limits, which start uncancelled.
+
+        :param state: The state returned by `__getstate__`.
+        :type state: dict[str, typing.Any]
+        """
+
+        self.__init__(state["time_limit"], state["mip_gap"])
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the limits, for debugging purposes.
+
+        :return: The time limit, the MIP gap and whether the limits are cancelled.
+
+        :rtype: str
+        """
+
+        return f"SolverLimits(time_limit={self.time_limit}, mip_gap={self.mip_gap}, cancelled={self.is_cancelled()})"
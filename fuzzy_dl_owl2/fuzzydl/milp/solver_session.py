@@ -0,0 +1,892 @@
+from __future__ import annotations
+
+import math
+import re
+import traceback
+import typing
+from abc import ABC, abstractmethod
+
+from fuzzy_dl_owl2.fuzzydl.milp.expression import Expression
+from fuzzy_dl_owl2.fuzzydl.milp.general_constraint import GeneralConstraint
+from fuzzy_dl_owl2.fuzzydl.milp.inequation import Inequation
+from fuzzy_dl_owl2.fuzzydl.milp.piecewise_linear_constraint import (
+    PiecewiseLinearConstraint,
+)
+from fuzzy_dl_owl2.fuzzydl.milp.solution import Solution
+from fuzzy_dl_owl2.fuzzydl.milp.solver_limits import SolverLimits
+from fuzzy_dl_owl2.fuzzydl.milp.variable import Variable
+from fuzzy_dl_owl2.fuzzydl.util.config_reader import ConfigReader
+from fuzzy_dl_owl2.fuzzydl.util.constants import (
+    InequalityType,
+    MILPProvider,
+    SolutionStatus,
+    VariableType,
+)
+from fuzzy_dl_owl2.fuzzydl.util.util import Util
+
+if typing.TYPE_CHECKING:
+    from fuzzy_dl_owl2.fuzzydl.milp.milp_helper import MILPHelper
+
+
+class SolverSession(ABC):
+    """
+    This abstract class keeps a solver model alive across several optimizations of the MILP problems derived from the same base problem, typically the problem obtained after expanding the ABox of a knowledge base, which is later cloned once per query. The base model, containing the variables and constraints that the base `MILPHelper` had when the session was created, is built only once, the first time that one of its snapshots is solved. Every call to `solve` temporarily applies the delta of the snapshot being solved, namely the variables and constraints added after the snapshot was taken and the shared variables whose type or bounds were changed, replaces the objective function, warm-starts the solver from the values of the previous solution, and finally reverts the delta, leaving the base model ready for the next query. The piecewise linear constraints of the base problem are added natively to the base model, whereas the ones added by a snapshot are lowered into linear constraints by `MILPHelper` before the delta is applied. The general constraints, namely minima, maxima and indicator constraints, only reach a session whose backend supports them natively, and both the base ones and the ones added by a snapshot are added to the model as general constraints. A session can only be used with the snapshots whose variables and constraints start with the ones of the base problem, which is checked by `is_prefix_of`; the other problems must be solved by rebuilding the whole model. Concrete subclasses implement the hooks that talk to a specific solver backend.
+
+    :param provider: The MILP provider of the session; the session is not used if the configured provider changes.
+    :type provider: MILPProvider
+    :param base_variables: Snapshot of the variables of the base problem, which are shared with all the helpers created by cloning it.
+    :type base_variables: list[Variable]
+    :param num_constraints: Number of constraints of the base problem.
+    :type num_constraints: int
+    :param first_constraint: First constraint of the base problem, used to check that a problem derives from it.
+    :type first_constraint: typing.Optional[Inequation]
+    :param last_constraint: Last constraint of the base problem, used to check that a problem derives from it.
+    :type last_constraint: typing.Optional[Inequation]
+    :param base_constraints: Constraints of the base problem, kept only until the base model is built.
+    :type base_constraints: list[Inequation]
+    :param num_piecewise_constraints: Number of piecewise linear constraints of the base problem.
+    :type num_piecewise_constraints: int
+    :param last_piecewise_constraint: Last piecewise linear constraint of the base problem, used to check that a problem derives from it.
+    :type last_piecewise_constraint: typing.Optional[PiecewiseLinearConstraint]
+    :param base_piecewise_constraints: Piecewise linear constraints of the base problem, kept only until the base model is built.
+    :type base_piecewise_constraints: list[PiecewiseLinearConstraint]
+    :param num_general_constraints: Number of general constraints of the base problem.
+    :type num_general_constraints: int
+    :param last_general_constraint: Last general constraint of the base problem, used to check that a problem derives from it.
+    :type last_general_constraint: typing.Optional[GeneralConstraint]
+    :param base_general_constraints: General constraints of the base problem, kept only until the base model is built.
+    :type base_general_constraints: list[GeneralConstraint]
+    :param nominal_variables: Whether the variables representing nominal concepts and their constraints are kept in the model.
+    :type nominal_variables: bool
+    :param built: Whether the base model has already been built in the solver.
+    :type built: bool
+    :param solver_variables: Solver handles of the variables of the base problem, aligned with `base_variables`; the entries of removed nominal variables are None.
+    :type solver_variables: list[typing.Any]
+    :param last_values: Values of the variables of the base problem in the last solution found, used to warm-start the next optimization.
+    :type last_values: typing.Optional[list[float]]
+    :param num_solves: Number of optimizations performed with this session.
+    :type num_solves: int
+    :param status: Reason why the solver stopped in the last optimization.
+    :type status: SolutionStatus
+    :param bound: Best bound of the objective reported by the solver in the last optimization if it stopped before proving optimality, or None if it is not available.
+    :type bound: typing.Optional[float]
+    :param failed: Whether the session has been reset after an error, in which case it cannot be used anymore.
+    :type failed: bool
+    """
+
+    NOMINAL_PATTERN: re.Pattern = re.compile(r"([^:]+):\{\1\}")
+
+    def __init__(self, milp: MILPHelper) -> None:
+        """
+        Initializes a session for the current state of the given MILP helper, which becomes the base problem of the session. Only the bookkeeping needed to recognize the snapshots of the base problem is computed here; the solver model itself is built lazily by `solve`.
+
+        :param milp: The MILP helper whose current variables and constraints define the base problem.
+        :type milp: MILPHelper
+        """
+
+        self.provider: MILPProvider = ConfigReader.MILP_PROVIDER
+        self.base_variables: list[Variable] = list(milp.variables)
+        self.num_constraints: int = len(milp.constraints)
+        self.first_constraint: typing.Optional[Inequation] = (
+            milp.constraints[0] if milp.constraints else None
+        )
+        self.last_constraint: typing.Optional[Inequation] = (
+            milp.constraints[-1] if milp.constraints else None
+        )
+        self.base_constraints: list[Inequation] = list(milp.constraints)
+        self.num_piecewise_constraints: int = len(milp.piecewise_constraints)
+        self.last_piecewise_constraint: typing.Optional[PiecewiseLinearConstraint] = (
+            milp.piecewise_constraints[-1] if milp.piecewise_constraints else None
+        )
+        self.base_piecewise_constraints: list[PiecewiseLinearConstraint] = list(
+            milp.piecewise_constraints
+        )
+        self.num_general_constraints: int = len(milp.general_constraints)
+        self.last_general_constraint: typing.Optional[GeneralConstraint] = (
+            milp.general_constraints[-1] if milp.general_constraints else None
+        )
+        self.base_general_constraints: list[GeneralConstraint] = list(
+            milp.general_constraints
+        )
+        self.nominal_variables: bool = milp.nominal_variables
+        self.built: bool = False
+        self.solver_variables: list[typing.Any] = []
+        self.last_values: typing.Optional[list[float]] = None
+        self.num_solves: int = 0
+        self.status: SolutionStatus = SolutionStatus.OPTIMAL
+        self.bound: typing.Optional[float] = None
+        self.failed: bool = False
+
+    @staticmethod
+    def supports(provider: MILPProvider) -> bool:
+        """
+        Checks whether persistent solver sessions are available for the given MILP provider. Only the backends whose models can be modified in place, namely Gurobi and Python-MIP, support them; the other providers always rebuild the model from scratch.
+
+        :param provider: The MILP provider to check.
+        :type provider: MILPProvider
+
+        :return: True if a session can be created for the provider, False otherwise.
+
+        :rtype: bool
+        """
+
+        return provider in (MILPProvider.GUROBI, MILPProvider.MIP)
+
+    @staticmethod
+    def create(milp: MILPHelper) -> typing.Optional[SolverSession]:
+        """
+        Creates a session for the given MILP helper using the backend selected by the `MILP_PROVIDER` setting. If the provider does not support persistent sessions, None is returned and the caller must solve the problem by rebuilding the whole model.
+
+        :param milp: The MILP helper defining the base problem of the session.
+        :type milp: MILPHelper
+
+        :return: A new session for the configured backend, or None if the backend does not support sessions.
+
+        :rtype: typing.Optional[SolverSession]
+        """
+
+        if ConfigReader.MILP_PROVIDER == MILPProvider.GUROBI:
+            return GurobiSolverSession(milp)
+        elif ConfigReader.MILP_PROVIDER == MILPProvider.MIP:
+            return MIPSolverSession(milp)
+        return None
+
+    def is_prefix_of(self, milp: MILPHelper) -> bool:
+        """
+        Checks whether the given MILP problem derives from the base problem of the session, that is, whether its lists of variables and constraints start with the ones of the base problem. Since the helpers created by `MILPHelper.clone` share the constraint objects with the original problem, the check compares the identity of the first and last base constraints, the identity of the last base piecewise linear and general constraints and the names of the first and last base variables, which makes it independent of the size of the problem. Problems from which nominal variables have been removed are rejected, since the positions of their variables no longer match their identifiers. A session that failed, or whose provider is no longer the configured one, cannot be used for any problem.
+
+        :param milp: The MILP problem to check.
+        :type milp: MILPHelper
+
+        :return: True if the problem can be solved by applying a delta to the base model of the session, False otherwise.
+
+        :rtype: bool
+        """
+
+        if (
+            self.failed
+            or self.provider != ConfigReader.MILP_PROVIDER
+            or milp.nominal_variables != self.nominal_variables
+            or milp.positions is not None
+        ):
+            return False
+        n: int = len(self.base_variables)
+        if len(milp.variables) < n or len(milp.constraints) < self.num_constraints:
+            return False
+        if n > 0 and (
+            str(milp.variables[0]) != str(self.base_variables[0])
+            or str(milp.variables[n - 1]) != str(self.base_variables[n - 1])
+        ):
+            return False
+        if self.num_constraints > 0 and (
+            milp.constraints[0] is not self.first_constraint
+            or milp.constraints[self.num_constraints - 1] is not self.last_constraint
+        ):
+            return False
+        if len(milp.piecewise_constraints) < self.num_piecewise_constraints or (
+            self.num_piecewise_constraints > 0
+            and milp.piecewise_constraints[self.num_piecewise_constraints - 1]
+            is not self.last_piecewise_constraint
+        ):
+            return False
+        if len(milp.general_constraints) < self.num_general_constraints or (
+            self.num_general_constraints > 0
+            and milp.general_constraints[self.num_general_constraints - 1]
+            is not self.last_general_constraint
+        ):
+            return False
+        return True
+
+    def is_nominal_variable(self, var: Variable) -> bool:
+        """
+        Checks whether the given variable represents a nominal concept, following the naming convention `name:{name}`, and must therefore be left out of the model because nominal variables are not kept.
+
+        :param var: The variable to check.
+        :type var: Variable
+
+        :return: True if the variable must be skipped, False otherwise.
+
+        :rtype: bool
+        """
+
+        return not self.nominal_variables and (
+            self.NOMINAL_PATTERN.search(str(var)) is not None
+        )
+
+    def get_terms(
+        self, constraint: Inequation
+    ) -> typing.Optional[list[tuple[int, float]]]:
+        """
+        Translates the terms of a constraint into a list of pairs containing the position of each variable, which is its identifier, and its coefficient, dropping the terms with a zero coefficient. None is returned if the constraint has to be skipped, either because it mentions a nominal variable that is not kept in the model or because it has no terms left.
+
+        :param constraint: The constraint to translate.
+        :type constraint: Inequation
+
+        :return: The list of (position, coefficient) pairs of the constraint, or None if the constraint must not be added to the model.
+
+        :rtype: typing.Optional[list[tuple[int, float]]]
+        """
+
+        terms: list[tuple[int, float]] = []
+        for term in constraint.get_terms():
+            var: Variable = term.get_var()
+            if self.is_nominal_variable(var):
+                return None
+            c: float = term.get_coeff()
+            if c == 0:
+                continue
+            terms.append((var.id, c))
+        if len(terms) == 0:
+            return None
+        return terms
+
+    def build(self) -> None:
+        """
+        Builds the base model of the session in the solver, adding the variables, the constraints, the piecewise linear constraints and the general constraints of the base problem. Duplicated and trivial constraints never reach the problem, since `MILPHelper` discards them when they are added, whereas constraints involving removed nominal variables are skipped. The objective function is left empty, since it is set by every call to `solve`.
+        """
+
+        self.create_model()
+        for i, var in enumerate(self.base_variables):
+            if self.is_nominal_variable(var):
+                self.solver_variables.append(None)
+                continue
+            self.solver_variables.append(self.add_variable(var, f"x{i}"))
+        for i, constraint in enumerate(self.base_constraints):
+            terms: typing.Optional[list[tuple[int, float]]] = self.get_terms(
+                constraint
+            )
+            if terms is None:
+                continue
+            self.add_constraint(
+                [(self.solver_variables[j], c) for j, c in terms],
+                constraint.get_type(),
+                constraint.get_constant(),
+                f"constraint_{i + 1}",
+            )
+        for i, constraint in enumerate(self.base_piecewise_constraints):
+            self.add_piecewise_linear_constraint(
+                self.solver_variables[constraint.get_x().id],
+                self.solver_variables[constraint.get_y().id],
+                constraint,
+                f"piecewise_{i + 1}",
+            )
+        for i, constraint in enumerate(self.base_general_constraints):
+            self.add_general_constraint(
+                self.solver_variables, constraint, f"general_{i + 1}"
+            )
+        self.base_constraints = []
+        self.base_piecewise_constraints = []
+        self.base_general_constraints = []
+        self.built = True
+        if ConfigReader.DEBUG_PRINT:
+            Util.debug(
+                f"Solver session built with {len(self.base_variables)} variables and {self.num_constraints} constraints"
+            )
+
+    def reset(self) -> None:
+        """
+        Discards the solver model of the session, for instance after an error left it in an unknown state. The session cannot be used anymore, and the following optimizations rebuild the whole model.
+        """
+
+        self.built = False
+        self.solver_variables = []
+        self.last_values = None
+        self.failed = True
+        self.discard_model()
+
+    def solve(
+        self, milp: MILPHelper, objective: Expression
+    ) -> typing.Optional[Solution]:
+        """
+        Minimizes the given objective expression subject to the variables and constraints of the given MILP problem, which must derive from the base problem of the session. The base model is built on the first call; then the delta of the problem is applied, the objective function is replaced, the solver is warm-started with the values of the previous solution, and the model is optimized with the time limit and MIP gap of the current limits of the problem, which can also interrupt the solver when they are cancelled. The resulting `Solution` is built exactly as in the non-persistent solvers, bounded if the solver stopped before proving optimality, including the values of the variables to show and the membership degrees to linguistic labels. Before returning, the delta is removed from the model, so the session is ready to solve the next snapshot of the base problem. If an error occurs, the session is reset, the error is logged and None is returned.
+
+        :param milp: The MILP problem to solve, derived from the base problem of the session.
+        :type milp: MILPHelper
+        :param objective: The linear expression to minimize.
+        :type objective: Expression
+
+        :return: A Solution object with the optimal value and the variables to show, a Solution indicating inconsistency if the problem is infeasible, or None if an error occurs.
+
+        :rtype: typing.Optional[Solution]
+        """
+
+        try:
+            if not self.built:
+                self.build()
+            if ConfigReader.DEBUG_PRINT:
+                Util.debug(f"Objective function -> {objective}")
+
+            n: int = len(self.base_variables)
+            handles: list[typing.Any] = list(self.solver_variables)
+            new_vars: list[typing.Any] = []
+            new_constraints: list[typing.Any] = []
+            changed_vars: list[int] = []
+            try:
+                # Base variables whose type or bounds have been changed by the snapshot
+                for i in milp.changed_variables:
+                    if i >= n or handles[i] is None:
+                        continue
+                    var: Variable = milp.variables[i]
+                    if self.get_spec(var) != self.get_spec(self.base_variables[i]):
+                        changed_vars.append(i)
+                        self.update_variable(handles[i], var)
+
+                # New variables
+                if len(milp.variables) > n:
+                    for i in range(n, len(milp.variables)):
+                        var: Variable = milp.variables[i]
+                        if self.is_nominal_variable(var):
+                            handles.append(None)
+                            continue
+                        handle: typing.Any = self.add_variable(var, f"x{i}")
+                        handles.append(handle)
+                        new_vars.append(handle)
+
+                # New constraints
+                for i in range(self.num_constraints, len(milp.constraints)):
+                    constraint: Inequation = milp.constraints[i]
+                    terms: typing.Optional[list[tuple[int, float]]] = self.get_terms(
+                        constraint
+                    )
+                    if terms is None:
+                        continue
+                    new_constraints.append(
+                        self.add_constraint(
+                            [(handles[j], c) for j, c in terms],
+                            constraint.get_type(),
+                            constraint.get_constant(),
+                            f"constraint_{i + 1}",
+                        )
+                    )
+
+                # New general constraints
+                for i in range(
+                    self.num_general_constraints, len(milp.general_constraints)
+                ):
+                    handle = self.add_general_constraint(
+                        handles, milp.general_constraints[i], f"general_{i + 1}"
+                    )
+                    if handle is not None:
+                        new_constraints.append(handle)
+
+                # Objective function
+                coeffs: dict[int, float] = dict()
+                if objective is not None:
+                    for term in objective.get_terms():
+                        j: int = term.get_var().id
+                        coeffs[j] = coeffs.get(j, 0.0) + term.get_coeff()
+                self.set_objective(
+                    [(handles[j], c) for j, c in coeffs.items() if c != 0]
+                )
+
+                # Warm start from the previous solution
+                if self.last_values is not None:
+                    self.set_start(
+                        [
+                            (handles[j], self.last_values[j])
+                            for j in range(n)
+                            if handles[j] is not None and j not in changed_vars
+                        ]
+                    )
+
+                if ConfigReader.DEBUG_PRINT:
+                    Util.debug(
+                        f"Solver session: {len(new_vars)} new variables, {len(new_constraints)} new constraints, {len(changed_vars)} changed variables"
+                    )
+                obj_value: typing.Optional[float] = self.optimize(milp.get_limits())
+                self.num_solves += 1
+
+                if obj_value is None:
+                    return Solution(Solution.INCONSISTENT_KB)
+                bound: typing.Optional[float] = (
+                    Util.round(abs(self.bound))
+                    if self.bound is not None and math.isfinite(self.bound)
+                    else None
+                )
+                if math.isnan(obj_value):
+                    return Solution.get_bounded(self.status, None, bound)
+                sol: Solution = Solution(Util.round(abs(obj_value)))
+                if self.status != SolutionStatus.OPTIMAL:
+                    sol.set_bounded(self.status, bound)
+                # Nominal variables removed from the model are neither shown nor solved
+                milp.set_showed_values(
+                    sol,
+                    [
+                        h is not None and milp.show_vars.show_variable(var)
+                        for h, var in zip(handles, milp.variables)
+                    ],
+                    lambda rows: [
+                        0.0 if handles[i] is None else self.get_value(handles[i])
+                        for i in rows
+                    ],
+                )
+                self.last_values = [
+                    0.0 if h is None else self.get_value(h) for h in handles[:n]
+                ]
+                return sol
+            finally:
+                if self.built:
+                    self.remove(new_vars, new_constraints)
+                    for i in changed_vars:
+                        self.update_variable(handles[i], self.base_variables[i])
+        except Exception as e:
+            self.reset()
+            Util.error(f"Error: {e} {traceback.format_exc()}")
+            return None
+
+    @staticmethod
+    def get_spec(var: Variable) -> tuple[VariableType, float, float]:
+        """
+        Returns the part of a variable that is reflected in the solver model, namely its type and its bounds.
+
+        :param var: The variable to inspect.
+        :type var: Variable
+
+        :return: A tuple with the type, the lower bound and the upper bound of the variable.
+
+        :rtype: tuple[VariableType, float, float]
+        """
+
+        return var.get_type(), var.get_lower_bound(), var.get_upper_bound()
+
+    @abstractmethod
+    def create_model(self) -> None:
+        """Creates an empty minimization model in the solver backend, configured with the same parameters used when the model is rebuilt for every query."""
+        pass
+
+    @abstractmethod
+    def discard_model(self) -> None:
+        """Releases the model of the solver backend and any resource associated with it."""
+        pass
+
+    @abstractmethod
+    def add_variable(self, var: Variable, name: str) -> typing.Any:
+        """
+        Adds a variable with the type and bounds of the given variable to the model and returns its solver handle.
+
+        :param var: The variable to add.
+        :type var: Variable
+        :param name: The name of the variable in the solver model.
+        :type name: str
+
+        :return: The handle of the new variable in the solver backend.
+
+        :rtype: typing.Any
+        """
+        pass
+
+    @abstractmethod
+    def update_variable(self, handle: typing.Any, var: Variable) -> None:
+        """
+        Changes the type and bounds of an existing solver variable to the ones of the given variable.
+
+        :param handle: The handle of the solver variable to update.
+        :type handle: typing.Any
+        :param var: The variable defining the new type and bounds.
+        :type var: Variable
+        """
+        pass
+
+    @abstractmethod
+    def add_constraint(
+        self,
+        terms: list[tuple[typing.Any, float]],
+        constraint_type: InequalityType,
+        constant: float,
+        name: str,
+    ) -> typing.Any:
+        """
+        Adds a linear constraint to the model and returns its solver handle.
+
+        :param terms: The (variable handle, coefficient) pairs of the left-hand side of the constraint.
+        :type terms: list[tuple[typing.Any, float]]
+        :param constraint_type: The type of the constraint.
+        :type constraint_type: InequalityType
+        :param constant: The right-hand side of the constraint.
+        :type constant: float
+        :param name: The name of the constraint in the solver model.
+        :type name: str
+
+        :return: The handle of the new constraint in the solver backend.
+
+        :rtype: typing.Any
+        """
+        pass
+
+    @abstractmethod
+    def add_piecewise_linear_constraint(
+        self,
+        x: typing.Any,
+        y: typing.Any,
+        constraint: PiecewiseLinearConstraint,
+        name: str,
+    ) -> None:
+        """
+        Adds a piecewise linear constraint of the base problem to the model, using the native support of the solver backend.
+
+        :param x: The handle of the variable of the argument of the function.
+        :type x: typing.Any
+        :param y: The handle of the variable of the value of the function.
+        :type y: typing.Any
+        :param constraint: The piecewise linear constraint to add.
+        :type constraint: PiecewiseLinearConstraint
+        :param name: The name of the constraint in the solver model.
+        :type name: str
+        """
+        pass
+
+    def add_general_constraint(
+        self,
+        handles: list[typing.Any],
+        constraint: GeneralConstraint,
+        name: str,
+    ) -> typing.Any:
+        """
+        Adds a general constraint to the model, using the native support of the solver backend. Constraints involving removed nominal variables are skipped. The backends that do not support general constraints never receive them, since `MILPHelper` lowers them into linear constraints beforehand, so the default implementation raises an error.
+
+        :param handles: Handles of the variables of the problem, indexed by their identifiers; the entries of removed nominal variables are None.
+        :type handles: list[typing.Any]
+        :param constraint: The general constraint to add.
+        :type constraint: GeneralConstraint
+        :param name: The name of the constraint in the solver model.
+        :type name: str
+
+        :raises ValueError: Raised if the backend does not support general constraints.
+
+        :return: The handle of the new constraint, or None if it has been skipped.
+
+        :rtype: typing.Any
+        """
+        raise ValueError(
+            f"General constraints are not supported by {self.provider.name}: {constraint}"
+        )
+
+    @abstractmethod
+    def remove(self, variables: list[typing.Any], constraints: list[typing.Any]) -> None:
+        """
+        Removes the given variables and constraints from the model.
+
+        :param variables: Handles of the variables to remove.
+        :type variables: list[typing.Any]
+        :param constraints: Handles of the constraints to remove.
+        :type constraints: list[typing.Any]
+        """
+        pass
+
+    @abstractmethod
+    def set_objective(self, terms: list[tuple[typing.Any, float]]) -> None:
+        """
+        Replaces the objective function of the model, which is always minimized.
+
+        :param terms: The (variable handle, coefficient) pairs of the objective function.
+        :type terms: list[tuple[typing.Any, float]]
+        """
+        pass
+
+    @abstractmethod
+    def set_start(self, values: list[tuple[typing.Any, float]]) -> None:
+        """
+        Provides the solver with a (partial) starting solution for the next optimization.
+
+        :param values: The (variable handle, value) pairs of the starting solution.
+        :type values: list[tuple[typing.Any, float]]
+        """
+        pass
+
+    @abstractmethod
+    def optimize(self, limits: SolverLimits) -> typing.Optional[float]:
+        """
+        Optimizes the current model with the time limit and MIP gap of the given limits, interrupting the solver if they are cancelled and the backend supports it, and records in `status` and `bound` why the solver stopped and the best bound of the objective.
+
+        :param limits: The limits of the optimization.
+        :type limits: SolverLimits
+
+        :return: The value of the objective function in the best solution found, NaN if the solver stopped before finding a feasible solution, or None if the model is infeasible.
+
+        :rtype: typing.Optional[float]
+        """
+        pass
+
+    @abstractmethod
+    def get_value(self, handle: typing.Any) -> float:
+        """
+        Returns the value of a variable in the last solution found.
+
+        :param handle: The handle of the solver variable.
+        :type handle: typing.Any
+
+        :return: The value of the variable.
+
+        :rtype: float
+        """
+        pass
+
+
+class GurobiSolverSession(SolverSession):
+    """
+    Persistent solver session backed by a Gurobi model. The model is created with the same environment parameters used by `MILPHelper.solve_gurobi`, and the delta of every query is integrated through Gurobi's lazy model updates, so the base model is never rebuilt. The piecewise linear constraints of the base problem become piecewise linear general constraints of Gurobi, and the minima, maxima and indicator constraints of the problem become the corresponding general constraints.
+
+    :param env: The Gurobi environment owning the model.
+    :type env: typing.Any
+    :param model: The persistent Gurobi model.
+    :type model: typing.Any
+    """
+
+    def __init__(self, milp: MILPHelper) -> None:
+        super().__init__(milp)
+        self.env: typing.Any = None
+        self.model: typing.Any = None
+
+    def create_model(self) -> None:
+        import gurobipy as gp
+
+        self.env = gp.Env(empty=True)
+        if not ConfigReader.DEBUG_PRINT:
+            self.env.setParam("OutputFlag", 0)
+        self.env.setParam("IntFeasTol", 1e-9)
+        self.env.setParam("BarConvTol", 0)
+        self.env.start()
+        self.model = gp.Model("model", env=self.env)
+
+    def discard_model(self) -> None:
+        if self.model is not None:
+            self.model.dispose()
+        if self.env is not None:
+            self.env.dispose()
+        self.model = None
+        self.env = None
+
+    def __var_type(self, v_type: VariableType) -> str:
+        from gurobipy import GRB
+
+        return {
+            VariableType.BINARY: GRB.BINARY,
+            VariableType.INTEGER: GRB.INTEGER,
+            VariableType.CONTINUOUS: GRB.CONTINUOUS,
+            VariableType.SEMI_CONTINUOUS: GRB.SEMICONT,
+        }[v_type]
+
+    def add_variable(self, var: Variable, name: str) -> typing.Any:
+        return self.model.addVar(
+            lb=var.get_lower_bound(),
+            ub=var.get_upper_bound(),
+            vtype=self.__var_type(var.get_type()),
+            name=name,
+        )
+
+    def update_variable(self, handle: typing.Any, var: Variable) -> None:
+        handle.LB = var.get_lower_bound()
+        handle.UB = var.get_upper_bound()
+        handle.VType = self.__var_type(var.get_type())
+
+    def add_constraint(
+        self,
+        terms: list[tuple[typing.Any, float]],
+        constraint_type: InequalityType,
+        constant: float,
+        name: str,
+    ) -> typing.Any:
+        import gurobipy as gp
+
+        expr: gp.LinExpr = gp.LinExpr([c for _, c in terms], [v for v, _ in terms])
+        if constraint_type == InequalityType.EQUAL:
+            return self.model.addConstr(expr == constant, name)
+        elif constraint_type == InequalityType.LESS_THAN:
+            return self.model.addConstr(expr <= constant, name)
+        return self.model.addConstr(expr >= constant, name)
+
+    def add_piecewise_linear_constraint(
+        self,
+        x: typing.Any,
+        y: typing.Any,
+        constraint: PiecewiseLinearConstraint,
+        name: str,
+    ) -> None:
+        self.model.addGenConstrPWL(
+            x, y, constraint.get_x_points(), constraint.get_y_points(), name
+        )
+
+    def add_general_constraint(
+        self,
+        handles: list[typing.Any],
+        constraint: GeneralConstraint,
+        name: str,
+    ) -> typing.Any:
+        if any(self.is_nominal_variable(v) for v in constraint.get_variables()):
+            return None
+        return constraint.add_gurobi(self.model, lambda v: handles[v.id], name)
+
+    def remove(self, variables: list[typing.Any], constraints: list[typing.Any]) -> None:
+        if len(constraints) > 0:
+            self.model.remove(constraints)
+        if len(variables) > 0:
+            self.model.remove(variables)
+        self.model.update()
+
+    def set_objective(self, terms: list[tuple[typing.Any, float]]) -> None:
+        import gurobipy as gp
+        from gurobipy import GRB
+
+        self.model.setObjective(
+            gp.LinExpr([c for _, c in terms], [v for v, _ in terms]), GRB.MINIMIZE
+        )
+
+    def set_start(self, values: list[tuple[typing.Any, float]]) -> None:
+        if len(values) > 0:
+            self.model.update()
+            self.model.setAttr(
+                "Start", [v for v, _ in values], [value for _, value in values]
+            )
+
+    def optimize(self, limits: SolverLimits) -> typing.Optional[float]:
+        import gurobipy as gp
+        from gurobipy import GRB
+
+        time_limit: typing.Optional[float] = limits.get_time_limit()
+        mip_gap: typing.Optional[float] = limits.get_mip_gap()
+        self.model.Params.TimeLimit = GRB.INFINITY if time_limit is None else time_limit
+        self.model.Params.MIPGap = (
+            self.model.getParamInfo("MIPGap")[-1] if mip_gap is None else mip_gap
+        )
+        with limits.interruptible(self.model.terminate):
+            self.model.optimize()
+        if self.model.Status == GRB.INFEASIBLE:
+            return None
+        self.status = {
+            GRB.TIME_LIMIT: SolutionStatus.TIME_LIMIT,
+            GRB.INTERRUPTED: SolutionStatus.CANCELLED,
+        }.get(self.model.Status, SolutionStatus.OPTIMAL)
+        self.bound = None
+        if self.status != SolutionStatus.OPTIMAL:
+            try:
+                self.bound = self.model.ObjBound
+            except (AttributeError, gp.GurobiError):
+                pass
+            if self.model.SolCount == 0:
+                return math.nan
+        return self.model.ObjVal
+
+    def get_value(self, handle: typing.Any) -> float:
+        return handle.X
+
+
+class MIPSolverSession(SolverSession):
+    """
+    Persistent solver session backed by a Python-MIP model solved with CBC, configured with the same parameters used by `MILPHelper.solve_mip`. Semi-continuous variables are handled as continuous ones and the piecewise linear constraints of the base problem become special ordered sets of type 2, as in the non-persistent solver.
+
+    :param model: The persistent Python-MIP model.
+    :type model: typing.Any
+    """
+
+    def __init__(self, milp: MILPHelper) -> None:
+        super().__init__(milp)
+        self.model: typing.Any = None
+
+    def create_model(self) -> None:
+        import mip
+
+        self.model = mip.Model(name="FuzzyDL", sense=mip.MINIMIZE, solver_name=mip.CBC)
+        self.model.infeas_tol = 1e-9
+        self.model.integer_tol = 1e-9
+        self.model.max_mip_gap = ConfigReader.EPSILON
+        self.model.emphasis = mip.SearchEmphasis.OPTIMALITY
+        self.model.opt_tol = 0
+        # The preprocessing of CBC crashes on some models with special ordered sets
+        self.model.preprocess = 0 if len(self.base_piecewise_constraints) > 0 else 1
+        self.model.verbose = 1 if ConfigReader.DEBUG_PRINT else 0
+
+    def discard_model(self) -> None:
+        self.model = None
+
+    def __var_type(self, v_type: VariableType) -> str:
+        import mip
+
+        return {
+            VariableType.BINARY: mip.BINARY,
+            VariableType.INTEGER: mip.INTEGER,
+            VariableType.CONTINUOUS: mip.CONTINUOUS,
+            VariableType.SEMI_CONTINUOUS: mip.CONTINUOUS,
+        }[v_type]
+
+    def add_variable(self, var: Variable, name: str) -> typing.Any:
+        return self.model.add_var(
+            name=name,
+            var_type=self.__var_type(var.get_type()),
+            lb=var.get_lower_bound(),
+            ub=var.get_upper_bound(),
+        )
+
+    def update_variable(self, handle: typing.Any, var: Variable) -> None:
+        handle.lb = var.get_lower_bound()
+        handle.ub = var.get_upper_bound()
+        handle.var_type = self.__var_type(var.get_type())
+
+    def add_constraint(
+        self,
+        terms: list[tuple[typing.Any, float]],
+        constraint_type: InequalityType,
+        constant: float,
+        name: str,
+    ) -> typing.Any:
+        import mip
+
+        expr: mip.LinExpr = mip.xsum(c * v for v, c in terms)
+        if constraint_type == InequalityType.EQUAL:
+            return self.model.add_constr(expr == constant, name)
+        elif constraint_type == InequalityType.LESS_THAN:
+            return self.model.add_constr(expr <= constant, name)
+        return self.model.add_constr(expr >= constant, name)
+
+    def add_piecewise_linear_constraint(
+        self,
+        x: typing.Any,
+        y: typing.Any,
+        constraint: PiecewiseLinearConstraint,
+        name: str,
+    ) -> None:
+        constraint.add_sos2(self.model, x, y)
+
+    def remove(self, variables: list[typing.Any], constraints: list[typing.Any]) -> None:
+        if len(constraints) > 0:
+            self.model.remove(constraints)
+        if len(variables) > 0:
+            self.model.remove(variables)
+
+    def set_objective(self, terms: list[tuple[typing.Any, float]]) -> None:
+        import mip
+
+        self.model.objective = mip.minimize(mip.xsum(c * v for v, c in terms))
+
+    def set_start(self, values: list[tuple[typing.Any, float]]) -> None:
+        self.model.start = values
+
+    def optimize(self, limits: SolverLimits) -> typing.Optional[float]:
+        import mip
+
+        time_limit: typing.Optional[float] = limits.get_time_limit()
+        mip_gap: typing.Optional[float] = limits.get_mip_gap()
+        self.model.max_mip_gap = ConfigReader.EPSILON if mip_gap is None else mip_gap
+        if time_limit is None:
+            self.model.optimize()
+        else:
+            self.model.optimize(max_seconds=time_limit)
+        if self.model.status == mip.OptimizationStatus.INFEASIBLE:
+            return None
+        # CBC only stops before optimality when it reaches the time limit
+        self.status = SolutionStatus.OPTIMAL
+        self.bound = None
+        if time_limit is not None and self.model.status in (
+            mip.OptimizationStatus.FEASIBLE,
+            mip.OptimizationStatus.NO_SOLUTION_FOUND,
+        ):
+            self.status = SolutionStatus.TIME_LIMIT
+            self.bound = self.model.objective_bound
+            if self.model.status == mip.OptimizationStatus.NO_SOLUTION_FOUND:
+                return math.nan
+        # An empty model is trivially consistent with objective 0
+        if self.model.objective_value is None:
+            return 0.0
+        return self.model.objective_value
+
+    def get_value(self, handle: typing.Any) -> float:
+        return handle.x
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import typing
+
+import numpy as np
+
+
+class UnionFind:
+    """
+    This class implements a disjoint-set forest over the integer identifiers of the variables of a MILP problem, used to compute the connected components of the graph in which two variables are adjacent whenever they appear together in a constraint. The forest is stored in a numpy array of parent pointers that grows as new elements are added. Unions are performed in batches and fully vectorized: the roots of both ends of every pair are computed with pointer jumping, which also compresses all the paths of the forest, and the larger root is then hooked to the smaller one, repeating until all the pairs share a root. Since a root is always hooked to a root with a lower index, the forest never contains cycles, and the root of every component is its element with the lowest index.
+
+    :param parent: Parent pointers of the forest; an element is a root if it is its own parent. Only the first `size` entries are meaningful.
+    :type parent: np.ndarray
+    :param size: Number of elements in the forest.
+    :type size: int
+    """
+
+    def __init__(self, size: int = 0) -> None:
+        """
+        Initializes a forest of singletons containing the elements from 0 to `size` - 1.
+
+        :param size: The initial number of elements.
+        :type size: int
+        """
+
+        self.parent: np.ndarray = np.arange(max(size, 16), dtype=np.int64)
+        self.size: int = size
+
+    def clone(self) -> typing.Self:
+        """
+        Creates an independent copy of the forest, so that subsequent unions performed on one of them do not affect the other.
+
+        :return: A copy of the forest.
+
+        :rtype: typing.Self
+        """
+
+        uf: UnionFind = UnionFind()
+        uf.parent = self.parent.copy()
+        uf.size = self.size
+        return uf
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        """
+        Returns the state of the forest to be pickled. The parent pointers are stored as a plain list of integers, so that knowledge bases containing a forest can be restored by the restricted unpickler, which does not accept numpy classes.
+
+        :return: A dictionary with the parent pointers and the size of the forest.
+
+        :rtype: dict[str, typing.Any]
+        """
+
+        return {"parent": self.parent[: self.size].tolist(), "size": self.size}
+
+    def __setstate__(self, state: dict[str, typing.Any]) -> None:
+        """
+        Restores a forest from the state returned by `__getstate__`.
+
+        :param state: A dictionary with the parent pointers and the size of the forest.
+        :type state: dict[str, typing.Any]
+        """
+
+        self.size = state["size"]
+        self.parent = np.arange(max(self.size, 16), dtype=np.int64)
+        self.parent[: self.size] = state["parent"]
+
+    def grow(self, size: int) -> None:
+        """
+        Extends the forest with singletons until it contains `size` elements. The underlying array doubles its capacity whenever it is full, so adding elements one at a time takes amortized constant time.
+
+        :param size: The new number of elements of the forest. Nothing is done if it is not greater than the current size.
+        :type size: int
+        """
+
+        if size <= self.size:
+            return
+        capacity: int = len(self.parent)
+        if size > capacity:
+            new_capacity: int = max(size, 2 * capacity)
+            self.parent = np.concatenate(
+                (self.parent, np.arange(capacity, new_capacity, dtype=np.int64))
+            )
+        self.size = size
+
+    def roots(self) -> np.ndarray:
+        """
+        Computes the root of every element of the forest with pointer jumping, replacing each parent pointer by the pointer of the parent until all the elements point directly to their roots. The compressed pointers are stored back in the forest.
+
+        :return: An array with the root of each element, i.e., its component label.
+
+        :rtype: np.ndarray
+        """
+
+        parent: np.ndarray = self.parent[: self.size]
+        while True:
+            grandparent: np.ndarray = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+        self.parent[: self.size] = parent
+        return parent.copy()
+
+    def union(self, u: np.ndarray, v: np.ndarray) -> None:
+        """
+        Merges the components of the elements `u[k]` and `v[k]` for every position `k` of the given arrays.
+
+        :param u: Indices of the first elements of the pairs.
+        :type u: np.ndarray
+        :param v: Indices of the second elements of the pairs, aligned with `u`.
+        :type v: np.ndarray
+        """
+
+        if len(u) == 0:
+            return
+        while True:
+            roots: np.ndarray = self.roots()
+            ru: np.ndarray = roots[u]
+            rv: np.ndarray = roots[v]
+            different: np.ndarray = ru != rv
+            if not different.any():
+                break
+            # Hook the larger root to the smaller one; on conflicts, the lowest root wins
+            np.minimum.at(
+                self.parent,
+                np.maximum(ru, rv)[different],
+                np.minimum(ru, rv)[different],
+            )
+            u = u[different]
+            v = v[different]
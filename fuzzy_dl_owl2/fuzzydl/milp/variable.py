@@ -1,15 +1,16 @@
 import typing
 
 from fuzzy_dl_owl2.fuzzydl.util.constants import VariableType  # Variable
+from fuzzy_dl_owl2.fuzzydl.util.reasoner_context import VariableCounterMeta
 
 
-class Variable:  # Variable
+class Variable(metaclass=VariableCounterMeta):  # Variable
     """
     This class models a symbolic variable used within linear expressions, typically to represent degrees of satisfaction in fuzzy description logic ontologies. It encapsulates properties such as a unique name, a specific type (e.g., binary, integer, or continuous), and corresponding lower and upper bounds that are automatically adjusted based on the variable type. Users can instantiate variables directly or utilize static factory methods to create specific variable types, while a class-level counter facilitates the automatic generation of unique sequential names. Additionally, the class provides functionality to flag variables as datatype fillers and supports cloning for creating independent copies.
 
     :param VARIABLE_NAME: Default prefix used for generating names of new variables.
     :type VARIABLE_NAME: str
-    :param VARIABLE_NUMBER: Counter used to generate unique identifiers for automatically created variables.
+    :param VARIABLE_NUMBER: Counter used to generate unique identifiers for automatically created variables, stored in the active `ReasonerContext`.
     :type VARIABLE_NUMBER: int
     :param lower_bound: The minimum value the variable can assume.
     :type lower_bound: float
@@ -21,17 +22,17 @@ class Variable:  # Variable
     :type type: VariableType
     :param datatype_filler: Flag indicating whether the variable is a filler value for a datatype restriction.
     :type datatype_filler: bool
+    :param id: Integer identifier assigned by the MILP helper when the variable is registered, which never changes afterwards and is kept by the copies of the variable, or -1 if the variable has not been registered yet.
+    :type id: int
     """
 
     # Name of new variables
     VARIABLE_NAME: str = "y"
-    # Number of new variables
-    VARIABLE_NUMBER: int = 0
 
     def __init__(self, name: str, v_type: VariableType) -> None:  # Variable
         # Lower bound of the variable
         """
-        Constructs a new Variable instance, assigning the provided name and initializing the variable's type via the set_type method. The method establishes default numeric constraints by setting both the lower and upper bounds to 0.0. Additionally, it initializes the datatype_filler attribute to False, indicating that the variable is not currently serving as a placeholder for a datatype restriction.
+        Constructs a new Variable instance, assigning the provided name and initializing the variable's type via the set_type method. The method establishes default numeric constraints by setting both the lower and upper bounds to 0.0. Additionally, it initializes the datatype_filler attribute to False, indicating that the variable is not currently serving as a placeholder for a datatype restriction, and marks the variable as not registered by setting its identifier to -1.
 
         :param name: The identifier for the variable instance.
         :type name: str
@@ -48,6 +49,8 @@ class Variable:  # Variable
         self.type: VariableType = None  # Variable
         # Variable is filler value of datatype restriction
         self.datatype_filler: bool = False
+        # Identifier assigned by the MILP helper
+        self.id: int = -1
         self.set_type(v_type)
 
     @staticmethod
@@ -211,14 +214,19 @@ class Variable:  # Variable
 
     def clone(self) -> typing.Self:
         """
-        Creates and returns a new `Variable` instance that is a copy of the current object. The new instance is initialized with the same `name` and `type` attributes as the original, ensuring that the two objects are distinct but share the same initial data. This method does not modify the original `Variable` instance; however, if the `name` or `type` attributes are mutable objects, the clone will reference the same underlying objects rather than creating deep copies of them.
+        Creates and returns a new `Variable` instance that is a copy of the current object. The new instance has the same `name`, `type`, bounds, datatype filler flag and identifier as the original, ensuring that the two objects are distinct but share the same initial data. This method does not modify the original `Variable` instance.
 
         :return: A new instance of the class that is a copy of the current object.
 
         :rtype: typing.Self
         """
 
-        return Variable(self.name, self.type)  # Variable
+        var: Variable = Variable(self.name, self.type)  # Variable
+        var.lower_bound = self.lower_bound
+        var.upper_bound = self.upper_bound
+        var.datatype_filler = self.datatype_filler
+        var.id = self.id
+        return var
 
     def __eq__(self, value: typing.Self) -> bool:
         """
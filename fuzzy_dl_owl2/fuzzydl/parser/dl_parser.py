@@ -75,6 +75,7 @@ from fuzzy_dl_owl2.fuzzydl.knowledge_base import KnowledgeBase
 from fuzzy_dl_owl2.fuzzydl.milp.expression import Expression
 from fuzzy_dl_owl2.fuzzydl.milp.inequation import Inequation  # Inequation
 from fuzzy_dl_owl2.fuzzydl.milp.solution import Solution
+from fuzzy_dl_owl2.fuzzydl.parser.kb_cache import KBCache
 from fuzzy_dl_owl2.fuzzydl.milp.term import Term  # Term
 from fuzzy_dl_owl2.fuzzydl.milp.variable import Variable  # Variable
 from fuzzy_dl_owl2.fuzzydl.modifier.linear_modifier import LinearModifier
@@ -109,6 +110,10 @@ from fuzzy_dl_owl2.fuzzydl.util.constants import (
     LogicOperatorType,
     RestrictionType,
 )
+from fuzzy_dl_owl2.fuzzydl.util.reasoner_context import (
+    ParserSessionMeta,
+    ReasonerContext,
+)
 from fuzzy_dl_owl2.fuzzydl.util.util import Util
 from fuzzy_dl_owl2.fuzzydl.util.utils import class_debugging
 
@@ -132,19 +137,16 @@ def _ensure_parser_log_path() -> str:
 
 
 @class_debugging()
-class DLParser(object):
+class DLParser(object, metaclass=ParserSessionMeta):
     """
     This class serves as a specialized parser for Fuzzy Description Logic, designed to interpret textual input and construct a corresponding knowledge base and set of queries. It utilizes the `pyparsing` library to define a comprehensive grammar that covers various fuzzy logic constructs, including concepts, roles, modifiers, axioms, and complex query types. The parser operates primarily through static methods that act as callbacks during the parsing process, transforming raw string tokens into domain-specific objects such as `Concept`, `Individual`, and `Degree` instances. Users typically interact with this class by calling the `get_kb` method, which accepts a file path, initializes the internal state, parses the file content, and returns the populated `KnowledgeBase` and a list of `Query` objects. The class handles semantic validation and logic-specific constraints (e.g., distinguishing between Zadeh and Lukasiewicz logic) during parsing, ensuring that the constructed knowledge base adheres to the specified fuzzy logic semantics. Additionally, it provides a `main` entry point to execute the parsing, solve the knowledge base, and process the resulting queries sequentially.
 
-    :param kb: The KnowledgeBase instance constructed and populated by the parser with the parsed domain model.
+    :param kb: The KnowledgeBase instance constructed and populated by the parser with the parsed domain model, stored in the active `ReasonerContext` like `queries_list`, so that several threads can parse at the same time.
     :type kb: KnowledgeBase
     :param queries_list: Accumulates Query objects extracted from the input during parsing, which are subsequently returned for execution against the knowledge base.
     :type queries_list: list[Query]
     """
 
-    kb: KnowledgeBase = None
-    queries_list: list[Query] = []
-
     @staticmethod
     def _is_non_decreasing(v: list[typing.Any]) -> bool:
         """
@@ -1845,7 +1847,9 @@ class DLParser(object):
         list_tokens: list[str] = tokens.as_list()[0]
 
         if list_tokens[0] == FuzzyDLKeyword.ALL_INSTANCES_QUERY:
-            DLParser.queries_list.append(AllInstancesQuery(list_tokens[1]))
+            DLParser.queries_list.append(
+                AllInstancesQuery(list_tokens[1], ConfigReader.BATCHED_ALL_INSTANCES)
+            )
         elif list_tokens[0] == FuzzyDLKeyword.SAT_QUERY:
             DLParser.queries_list.append(KbSatisfiableQuery())
         elif list_tokens[0] in (
@@ -2816,12 +2820,16 @@ class DLParser(object):
         ConfigReader.load_parameters(os.path.join(os.getcwd(), "CONFIG.ini"), **kwargs)
 
     @staticmethod
-    def get_kb(file_path: str, **kwargs) -> tuple[KnowledgeBase, list[Query]]:
+    def get_kb(
+        file_path: str, solve: bool = False, **kwargs
+    ) -> tuple[KnowledgeBase, list[Query]]:
         """
-        Parses the input file specified by the arguments to construct a Knowledge Base and a list of Queries, initializing the necessary configuration and internal state. This method resets the class-level knowledge base and query list, sets the global logic semantics to Łukasiewicz fuzzy logic, and processes the file content using either a verbose line-by-line approach or an optimized path based on the debug configuration. It returns a tuple containing the populated `KnowledgeBase` object and the list of `Query` objects. Significant side effects include updates to class attributes and global constants. A missing input file is logged and re-raised as `FileNotFoundError`; any other parsing failure is logged and re-raised wrapped in a `FuzzyOntologyException`.
+        Parses the input file specified by the arguments to construct a Knowledge Base and a list of Queries, initializing the necessary configuration and internal state. This method resets the class-level knowledge base and query list, sets the global logic semantics to Łukasiewicz fuzzy logic, and processes the file content using either a verbose line-by-line approach or an optimized path based on the debug configuration. If `solve` is True, the knowledge base is also preprocessed with `KnowledgeBase.solve_kb`. When the `KB_CACHE_DIR` setting is not empty, the knowledge base and the queries are loaded from the compiled knowledge base cache if the file, the version of the library and the relevant settings did not change since they were stored, and are stored in the cache otherwise. It returns a tuple containing the populated `KnowledgeBase` object and the list of `Query` objects. Significant side effects include updates to class attributes and global constants. A missing input file is logged and re-raised as `FileNotFoundError`; any other parsing failure is logged and re-raised wrapped in a `FuzzyOntologyException`.
 
         :param file_path: Path to the input file.
         :type file_path: str
+        :param solve: Whether the knowledge base is preprocessed before being returned.
+        :type solve: bool
         :param kwargs: Additional configuration parameters to load.
         :type kwargs: typing.Any
 
@@ -2835,9 +2843,18 @@ class DLParser(object):
 
         starting_time: float = time.perf_counter_ns()
         DLParser.load_config(**kwargs)
+        if KBCache.enabled():
+            try:
+                cached = KBCache.load(file_path, solve)
+            except FileNotFoundError:
+                Util.warning(f"File {file_path} not found.")
+                raise
+            if cached is not None:
+                DLParser.kb, DLParser.queries_list = cached
+                return DLParser.kb, DLParser.queries_list
         DLParser.kb = KnowledgeBase()
         DLParser.queries_list = []
-        constants.KNOWLEDGE_BASE_SEMANTICS = FuzzyLogic.LUKASIEWICZ
+        ReasonerContext.current().semantics = FuzzyLogic.LUKASIEWICZ
 
         try:
             if ConfigReader.DEBUG_PRINT:
@@ -2860,6 +2877,10 @@ class DLParser(object):
 
         ending_time: float = time.perf_counter_ns() - starting_time
         Util.info(f"Knowledge Base parsed in {(ending_time * 1e-9)}s")
+        if solve:
+            DLParser.kb.solve_kb()
+        if KBCache.enabled():
+            KBCache.store(file_path, solve, DLParser.kb, DLParser.queries_list)
         return DLParser.kb, DLParser.queries_list
 
     @staticmethod
@@ -2874,8 +2895,7 @@ class DLParser(object):
         """
 
         try:
-            kb, queries = DLParser.get_kb(file_path, **kwargs)
-            kb.solve_kb()
+            kb, queries = DLParser.get_kb(file_path, solve=True, **kwargs)
             for query in queries:
                 if (
                     isinstance(query, AllInstancesQuery)
@@ -97,24 +97,22 @@ from fuzzy_dl_owl2.fuzzydl.util.constants import (
     LogicOperatorType,
     RestrictionType,
 )
+from fuzzy_dl_owl2.fuzzydl.util.reasoner_context import ParserSessionMeta
 from fuzzy_dl_owl2.fuzzydl.util.util import Util
 from fuzzy_dl_owl2.fuzzydl.util.utils import class_debugging
 
 
 @class_debugging()
-class DLParser(object):
+class DLParser(object, metaclass=ParserSessionMeta):
     """
     This class holds the semantic callbacks for the Fuzzy Description Logic parser, transforming raw string tokens into domain-specific objects such as `Concept`, `Individual`, and `Degree` instances. It is pyparsing-free: each static `_parse_*` method consumes a token list and either returns a constructed object (`Concept`, `Term`, `Degree`, `Expression`, `Inequation`, ...) or mutates the shared `KnowledgeBase` in place (side-effect callbacks return `None`). The hand-written recursive-descent driver in `dl_parser_fast.py` invokes these callbacks while walking the input. The class handles semantic validation and logic-specific constraints (e.g., distinguishing between Zadeh and Lukasiewicz logic), ensuring that the constructed knowledge base adheres to the specified fuzzy logic semantics. Parsed queries are accumulated in `queries_list`.
 
-    :param kb: The KnowledgeBase instance constructed and populated by the parser with the parsed domain model.
+    :param kb: The KnowledgeBase instance constructed and populated by the parser with the parsed domain model, stored in the active `ReasonerContext` like `queries_list`, so that several threads can parse at the same time.
     :type kb: KnowledgeBase
     :param queries_list: Accumulates Query objects extracted from the input during parsing, which are subsequently returned for execution against the knowledge base.
     :type queries_list: list[Query]
     """
 
-    kb: KnowledgeBase = None
-    queries_list: list[Query] = []
-
     @staticmethod
     def _is_non_decreasing(v: list[typing.Any]) -> bool:
         """
@@ -1501,7 +1499,9 @@ class DLParser(object):
             Util.debug(f"\t\t_parse_queries -> {tokens}")
 
         if tokens[0] == FuzzyDLKeyword.ALL_INSTANCES_QUERY:
-            DLParser.queries_list.append(AllInstancesQuery(tokens[1]))
+            DLParser.queries_list.append(
+                AllInstancesQuery(tokens[1], ConfigReader.BATCHED_ALL_INSTANCES)
+            )
         elif tokens[0] == FuzzyDLKeyword.SAT_QUERY:
             DLParser.queries_list.append(KbSatisfiableQuery())
         elif tokens[0] in (
@@ -29,6 +29,7 @@ from fuzzy_dl_owl2.fuzzydl.exception.inconsistent_ontology_exception import (
 from fuzzy_dl_owl2.fuzzydl.knowledge_base import KnowledgeBase
 from fuzzy_dl_owl2.fuzzydl.milp.solution import Solution
 from fuzzy_dl_owl2.fuzzydl.parser.dl_parser_clean import DLParser
+from fuzzy_dl_owl2.fuzzydl.parser.kb_cache import KBCache
 from fuzzy_dl_owl2.fuzzydl.parser.tokenizer.tokenizer_handler import (
     _SPLIT_NUM_RE,
     _STREAM_THRESHOLD,
@@ -51,9 +52,11 @@ from fuzzy_dl_owl2.fuzzydl.parser.tokenizer.tokens import (
 )
 from fuzzy_dl_owl2.fuzzydl.query.all_instances_query import AllInstancesQuery
 from fuzzy_dl_owl2.fuzzydl.query.query import Query
+from fuzzy_dl_owl2.fuzzydl.query.query_executor import QueryExecutor
 from fuzzy_dl_owl2.fuzzydl.util import constants
 from fuzzy_dl_owl2.fuzzydl.util.config_reader import ConfigReader
 from fuzzy_dl_owl2.fuzzydl.util.constants import FuzzyDLKeyword, FuzzyLogic
+from fuzzy_dl_owl2.fuzzydl.util.reasoner_context import ReasonerContext
 from fuzzy_dl_owl2.fuzzydl.util.util import Util
 
 # ---------------------------------------------------------------------------
@@ -1743,7 +1746,7 @@ class DLParserFast(object):
 
     @staticmethod
     def get_kb(
-        file_path: str, **kwargs: typing.Any
+        file_path: str, solve: bool = False, **kwargs: typing.Any
     ) -> typing.Tuple[KnowledgeBase, typing.List[Query]]:
         """
         Parses a fuzzy-DL file and returns the populated knowledge base together
@@ -1751,8 +1754,16 @@ class DLParserFast(object):
         :meth:`DLParser.get_kb` so callers can swap implementations without
         changing their call site.
 
+        When ``solve`` is true the knowledge base is also preprocessed with
+        :meth:`KnowledgeBase.solve_kb`. When ``KB_CACHE_DIR`` is set, the result
+        is loaded from the compiled-KB cache if the file, the library version
+        and the relevant settings are unchanged, and stored there otherwise
+        (see :class:`KBCache`).
+
         :param file_path: Path to the fuzzy-DL source file.
         :type file_path: str
+        :param solve: Whether the knowledge base is preprocessed before being returned.
+        :type solve: bool
         :param kwargs: Configuration overrides forwarded to :meth:`load_config`.
         :type kwargs: typing.Any
 
@@ -1768,9 +1779,18 @@ class DLParserFast(object):
 
         starting_time: float = time.perf_counter_ns()
         DLParserFast.load_config(**kwargs)
+        if KBCache.enabled():
+            try:
+                cached = KBCache.load(file_path, solve)
+            except FileNotFoundError:
+                Util.warning(f"File {file_path} not found.")
+                raise
+            if cached is not None:
+                DLParser.kb, DLParser.queries_list = cached
+                return DLParser.kb, DLParser.queries_list
         DLParser.kb = KnowledgeBase()
         DLParser.queries_list = []
-        constants.KNOWLEDGE_BASE_SEMANTICS = FuzzyLogic.LUKASIEWICZ
+        ReasonerContext.current().semantics = FuzzyLogic.LUKASIEWICZ
         # Bulk KB construction allocates millions of concept / axiom objects
         # that form a DAG with no cycles to reclaim mid-parse. Python's cyclic
         # collector would otherwise sweep the steadily growing object graph
@@ -1805,12 +1825,16 @@ class DLParserFast(object):
         ending_time: float = time.perf_counter_ns() - starting_time
         if ConfigReader.DEBUG_PRINT:
             Util.debug(f"Knowledge Base parsed in {(ending_time * 1e-9)}s")
+        if solve:
+            DLParser.kb.solve_kb()
+        if KBCache.enabled():
+            KBCache.store(file_path, solve, DLParser.kb, DLParser.queries_list)
         return DLParser.kb, DLParser.queries_list
 
     @staticmethod
     def main(file_path: str, **kwargs: typing.Any) -> dict[Query, Solution]:
         """
-        Runs the full fast-parser pipeline for a fuzzy-DL file: it parses the file into a knowledge base, solves the TBox, and answers every parsed query, collecting the per-query solutions into a dictionary. ``all-instances`` queries short-circuit to an informational message when the KB has no individuals. The cyclic garbage collector is disabled for the duration (and restored afterwards) since the run builds a large acyclic object graph that would otherwise be scanned repeatedly; an inconsistent ontology is reported as the answer ``1.0`` rather than propagated.
+        Runs the full fast-parser pipeline for a fuzzy-DL file: it parses the file into a knowledge base, solves the TBox, and answers every parsed query, collecting the per-query solutions into a dictionary. ``all-instances`` queries short-circuit to an informational message when the KB has no individuals. If the `QUERY_WORKERS` setting allows more than one process, the queries are answered in parallel by a `QueryExecutor` and reported in the order of the file; a query cancelled after `QUERY_TIMEOUT` seconds is reported as a warning and left out of the dictionary, and the remaining queries are still reported. The cyclic garbage collector is disabled for the duration (and restored afterwards) since the run builds a large acyclic object graph that would otherwise be scanned repeatedly; an inconsistent ontology is reported as the answer ``1.0`` rather than propagated.
 
         :param file_path: Path to the fuzzy-DL source file to run.
         :type file_path: str
@@ -1834,16 +1858,32 @@ class DLParserFast(object):
         gc_was_enabled: bool = gc.isenabled()
         gc.disable()
         try:
-            kb, queries = DLParserFast.get_kb(file_path, **kwargs)
-            kb.solve_kb()
+            kb, queries = DLParserFast.get_kb(file_path, solve=True, **kwargs)
+            skipped: list[Query] = [
+                query
+                for query in queries
+                if isinstance(query, AllInstancesQuery)
+                and not kb.get_individuals().values()
+            ]
+            answers: dict[Query, typing.Union[Solution, Exception]] = dict()
+            if QueryExecutor.get_workers() > 1:
+                answered: list[Query] = [q for q in queries if q not in skipped]
+                if len(answered) > 1:
+                    answers = dict(
+                        zip(answered, QueryExecutor(kb, answered).solve())
+                    )
             for query in queries:
-                if (
-                    isinstance(query, AllInstancesQuery)
-                    and not kb.get_individuals().values()
-                ):
+                if query in skipped:
                     Util.info(f"{query} -- There are no individuals in the fuzzy KB")
+                elif isinstance(answers.get(query), TimeoutError):
+                    # Util.error would raise and abort the remaining queries
+                    Util.warning(f"{query} -- {answers[query]}")
                 else:
-                    result: Solution = query.solve(kb)
+                    result: typing.Union[Solution, Exception] = (
+                        answers[query] if query in answers else query.solve(kb)
+                    )
+                    if isinstance(result, Exception):
+                        raise result
                     results[query] = result
                     if result.is_consistent_kb():
                         Util.info(f"{query}{result}")
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import gc
+import hashlib
+import importlib.metadata
+import os
+import pickle
+import tempfile
+import time
+import typing
+
+from fuzzy_dl_owl2.fuzzydl.concept.concept import Concept
+from fuzzy_dl_owl2.fuzzydl.knowledge_base import KnowledgeBase, _RestrictedKBUnpickler
+from fuzzy_dl_owl2.fuzzydl.milp.variable import Variable
+from fuzzy_dl_owl2.fuzzydl.query.query import Query
+from fuzzy_dl_owl2.fuzzydl.util import constants
+from fuzzy_dl_owl2.fuzzydl.util.config_reader import ConfigReader
+from fuzzy_dl_owl2.fuzzydl.util.constants import FuzzyLogic
+from fuzzy_dl_owl2.fuzzydl.util.reasoner_context import ReasonerContext
+from fuzzy_dl_owl2.fuzzydl.util.util import Util
+
+
+class KBCache:
+    """
+    This class implements the persistent cache of the compiled knowledge bases used by the parsers when the `KB_CACHE_DIR` setting is not empty. The knowledge base obtained from a fuzzy-DL file, optionally after the preprocessing performed by `KnowledgeBase.solve_kb`, is pickled together with the list of queries of the file, the global semantics of the knowledge base and the counters naming the new variables and concepts into a single entry of the cache directory, so that loading the same file again skips both the parsing and the preprocessing. Every source file has one entry for the parsed knowledge base and one for the preprocessed one, whose header records a key made of the hash of the contents of the file, the version of the library, the version of the format of the entries and the settings of the reasoner that affect the compiled knowledge base. An entry whose key does not match the current one, or that cannot be read, is discarded and replaced by the knowledge base parsed again, so that modifying the file, upgrading the library or changing the configuration invalidates the cache automatically. The entries are unpickled with the same restricted unpickler used by `KnowledgeBase.read_object_from_file`, so only the classes of the library can be loaded from the cache directory.
+
+    :param MAGIC: The bytes at the beginning of every entry of the cache.
+    :type MAGIC: bytes
+    :param FORMAT_VERSION: Version of the format of the entries, to be increased whenever the pickled classes change in an incompatible way.
+    :type FORMAT_VERSION: int
+    :param SUFFIX: Extension of the files of the entries.
+    :type SUFFIX: str
+    :param IGNORED_SETTINGS: Settings of `ConfigReader` that do not affect the compiled knowledge base and are not part of the key.
+    :type IGNORED_SETTINGS: frozenset[str]
+    """
+
+    MAGIC: bytes = b"FDLKB"
+    FORMAT_VERSION: int = 8
+    SUFFIX: str = ".kb"
+    IGNORED_SETTINGS: frozenset[str] = frozenset(
+        (
+            "DEBUG_PRINT",
+            "KB_CACHE_DIR",
+            "QUERY_TIMEOUT",
+            "QUERY_WORKERS",
+            "SOLVER_ARTIFACTS",
+            "SOLVER_ARTIFACTS_COMPRESS",
+        )
+    )
+
+    @staticmethod
+    def enabled() -> bool:
+        """
+        Checks whether the cache is enabled, i.e., whether the `KB_CACHE_DIR` setting is not empty.
+
+        :return: True if the cache is enabled, False otherwise.
+
+        :rtype: bool
+        """
+
+        return bool(ConfigReader.KB_CACHE_DIR)
+
+    @staticmethod
+    def library_version() -> str:
+        """
+        Returns the version of the installed library, or a placeholder when the library is used from a source tree without being installed.
+
+        :return: The version of the library.
+
+        :rtype: str
+        """
+
+        try:
+            return importlib.metadata.version("fuzzy-dl-owl2")
+        except importlib.metadata.PackageNotFoundError:
+            return "unknown"
+
+    @staticmethod
+    def get_key(file_path: str, solved: bool) -> bytes:
+        """
+        Computes the key of the compiled knowledge base of a file, namely the SHA-256 digest of the contents of the file, the version of the library and of the format of the entries, the settings of `ConfigReader` that are not in `IGNORED_SETTINGS` and whether the knowledge base has been preprocessed.
+
+        :param file_path: Path to the fuzzy-DL source file.
+        :type file_path: str
+        :param solved: Whether the cached knowledge base is preprocessed by `KnowledgeBase.solve_kb`.
+        :type solved: bool
+
+        :raises FileNotFoundError: if the file does not exist.
+
+        :return: The key of the compiled knowledge base.
+
+        :rtype: bytes
+        """
+
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as file:
+            for block in iter(lambda: file.read(1 << 20), b""):
+                digest.update(block)
+        settings: list[str] = [
+            f"{name}={value!r}"
+            for name, value in sorted(ReasonerContext.current().settings.items())
+            if name not in KBCache.IGNORED_SETTINGS
+        ]
+        digest.update(
+            "\n".join(
+                [
+                    KBCache.library_version(),
+                    str(KBCache.FORMAT_VERSION),
+                    str(constants.MAXVAL),
+                    str(solved),
+                    *settings,
+                ]
+            ).encode()
+        )
+        return digest.digest()
+
+    @staticmethod
+    def get_path(file_path: str, solved: bool) -> str:
+        """
+        Returns the path of the entry of the cache storing the compiled knowledge base of a file, which depends only on the absolute path of the file and on whether the knowledge base is preprocessed, so that a new version of the file replaces the entry of the previous one.
+
+        :param file_path: Path to the fuzzy-DL source file.
+        :type file_path: str
+        :param solved: Whether the cached knowledge base is preprocessed by `KnowledgeBase.solve_kb`.
+        :type solved: bool
+
+        :return: The path of the entry of the cache.
+
+        :rtype: str
+        """
+
+        name: str = hashlib.sha256(
+            f"{os.path.abspath(file_path)}:{solved}".encode()
+        ).hexdigest()
+        return os.path.join(ConfigReader.KB_CACHE_DIR, f"{name}{KBCache.SUFFIX}")
+
+    @staticmethod
+    def load(
+        file_path: str, solved: bool
+    ) -> typing.Optional[tuple[KnowledgeBase, list[Query]]]:
+        """
+        Loads the compiled knowledge base of a file and its queries from the cache, restoring the global semantics of the knowledge base and the counters naming the new variables and concepts, so that the names created while reasoning do not clash with the ones stored in the knowledge base. The entry is used only if its header matches the current key; otherwise, or if the entry cannot be unpickled, it is removed and None is returned, so that the caller parses the file again.
+
+        :param file_path: Path to the fuzzy-DL source file.
+        :type file_path: str
+        :param solved: Whether the cached knowledge base is preprocessed by `KnowledgeBase.solve_kb`.
+        :type solved: bool
+
+        :raises FileNotFoundError: if the source file does not exist.
+
+        :return: The cached knowledge base and list of queries, or None if the cache has no valid entry for the file.
+
+        :rtype: typing.Optional[tuple[KnowledgeBase, list[Query]]]
+        """
+
+        key: bytes = KBCache.get_key(file_path, solved)
+        path: str = KBCache.get_path(file_path, solved)
+        if not os.path.isfile(path):
+            return None
+        starting_time: float = time.perf_counter_ns()
+        gc_was_enabled: bool = gc.isenabled()
+        gc.disable()
+        try:
+            with open(path, "rb") as file:
+                header: bytes = file.read(len(KBCache.MAGIC) + 1 + len(key))
+                if header != KBCache.MAGIC + bytes((KBCache.FORMAT_VERSION,)) + key:
+                    raise pickle.UnpicklingError("stale cache entry")
+                kb, queries, logic, num_variables, num_concepts = (
+                    _RestrictedKBUnpickler(file).load()
+                )
+            if not isinstance(kb, KnowledgeBase) or not isinstance(logic, FuzzyLogic):
+                raise pickle.UnpicklingError("invalid cache entry")
+        except Exception as e:
+            if ConfigReader.DEBUG_PRINT:
+                Util.debug(f"Discarding cached knowledge base {path}: {e}")
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        ReasonerContext.current().semantics = logic
+        Variable.VARIABLE_NUMBER = num_variables
+        Concept.num_new_concepts = max(Concept.num_new_concepts, num_concepts)
+        if ConfigReader.DEBUG_PRINT:
+            ending_time: float = time.perf_counter_ns() - starting_time
+            Util.debug(
+                f"Knowledge Base loaded from {path} in {(ending_time * 1e-9)}s"
+            )
+        return kb, queries
+
+    @staticmethod
+    def store(
+        file_path: str, solved: bool, kb: KnowledgeBase, queries: list[Query]
+    ) -> None:
+        """
+        Stores the compiled knowledge base of a file and its queries in the cache. The entry is written to a temporary file of the cache directory that then atomically replaces the previous entry, so that concurrent processes never read a partial entry. Failures while writing the entry are logged as warnings and never affect the knowledge base.
+
+        :param file_path: Path to the fuzzy-DL source file.
+        :type file_path: str
+        :param solved: Whether the knowledge base is preprocessed by `KnowledgeBase.solve_kb`.
+        :type solved: bool
+        :param kb: The knowledge base to store.
+        :type kb: KnowledgeBase
+        :param queries: The list of queries of the file.
+        :type queries: list[Query]
+        """
+
+        path: str = KBCache.get_path(file_path, solved)
+        tmp_path: typing.Optional[str] = None
+        try:
+            key: bytes = KBCache.get_key(file_path, solved)
+            os.makedirs(ConfigReader.KB_CACHE_DIR, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=ConfigReader.KB_CACHE_DIR, suffix=".tmp"
+            )
+            with os.fdopen(fd, "wb") as file:
+                file.write(KBCache.MAGIC + bytes((KBCache.FORMAT_VERSION,)) + key)
+                pickle.dump(
+                    (
+                        kb,
+                        queries,
+                        constants.KNOWLEDGE_BASE_SEMANTICS,
+                        Variable.VARIABLE_NUMBER,
+                        Concept.num_new_concepts,
+                    ),
+                    file,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_path, path)
+        except Exception as e:
+            Util.warning(f"Cannot write cached knowledge base {path}: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
@@ -9,7 +9,6 @@ from fuzzy_dl_owl2.fuzzydl.individual.created_individual import CreatedIndividua
 from fuzzy_dl_owl2.fuzzydl.individual.individual import Individual
 from fuzzy_dl_owl2.fuzzydl.knowledge_base import KnowledgeBase
 from fuzzy_dl_owl2.fuzzydl.milp.expression import Expression
-from fuzzy_dl_owl2.fuzzydl.milp.milp_helper import MILPHelper
 from fuzzy_dl_owl2.fuzzydl.milp.solution import Solution
 from fuzzy_dl_owl2.fuzzydl.milp.term import Term  # Term
 from fuzzy_dl_owl2.fuzzydl.milp.variable import Variable  # Variable
@@ -23,6 +22,8 @@ class AllInstancesQuery(Query):
     """
     This class represents a query designed to retrieve all individuals from a knowledge base that are instances of a specified concept, along with their respective degrees of membership. It supports fuzzy logic by determining the minimum degree to which each individual satisfies the concept, rather than relying on binary classification. To use this class, instantiate it with a target `Concept` object—ensuring the concept is not concrete—and invoke the `solve` method with a `KnowledgeBase` to perform the retrieval. The results can be accessed via the `get_individuals` and `get_degrees` methods, which return the list of matching entities and their calculated membership values.
 
+    :param batched: Whether the degrees of all the individuals are computed on a single shared MILP model, built with one clone and one tableau expansion of the knowledge base, instead of running an independent minimum instance query per individual.
+    :type batched: bool
     :param conc: The concept defining the criteria for retrieving instances and calculating membership degrees.
     :type conc: typing.Any
     :param degrees: Stores the membership degrees corresponding to the retrieved individuals, indicating the extent to which each satisfies the concept.
@@ -34,18 +35,21 @@ class AllInstancesQuery(Query):
     """
 
 
-    def __init__(self, concept: Concept) -> None:
+    def __init__(self, concept: Concept, batched: bool = False) -> None:
         """
-        Initializes the query object designed to find all instances associated with a specific concept. It accepts a `Concept` argument which must not be concrete; if a concrete concept is provided, the method triggers an error via `Util.error`. The constructor stores the concept, initializes empty lists to hold the resulting individuals and their degrees, and generates a descriptive name for the query. It also invokes the superclass initializer to ensure proper object setup.
+        Initializes the query object designed to find all instances associated with a specific concept. It accepts a `Concept` argument which must not be concrete; if a concrete concept is provided, the method triggers an error via `Util.error`. The constructor stores the concept and the retrieval mode, initializes empty lists to hold the resulting individuals and their degrees, and generates a descriptive name for the query. It also invokes the superclass initializer to ensure proper object setup.
 
         :param concept: The abstract concept for which instances are being queried. Must not be a concrete concept.
         :type concept: Concept
+        :param batched: If True, the degrees of all the individuals are computed on a single shared MILP model (see `solve_new`); otherwise, one minimum instance query is solved per individual.
+        :type batched: bool
         """
 
         super().__init__()
         if concept.is_concrete():
             Util.error(f"Error: {concept} cannot be a concrete concept.")
         self.conc = concept
+        self.batched: bool = batched
         self.degrees: list[float] = []
         self.individuals: list[Individual] = []
         self.name = f"Instances of {self.conc}?"
@@ -62,7 +66,7 @@ class AllInstancesQuery(Query):
 
     def solve(self, kb: KnowledgeBase) -> Solution:
         """
-        Executes the query to identify all individuals within the Knowledge Base that are instances of the specified concept. It begins by validating the consistency of the ABox, returning a specific solution if the ontology is found to be inconsistent. The method iterates through the individuals in the knowledge base, ignoring any that are dynamically created, and performs a minimum instance query for each to determine the degree of membership. As consistent results are found, they are appended to the internal list of degrees and formatted into the query's name string. If an inconsistency arises during the iteration, the loop terminates immediately, and the inconsistent solution is returned.
+        Executes the query to identify all individuals within the Knowledge Base that are instances of the specified concept. If the query has been created in batched mode, the computation is delegated to `solve_new`. Otherwise, it begins by validating the consistency of the ABox, returning a specific solution if the ontology is found to be inconsistent. The method iterates through the individuals in the knowledge base, ignoring any that are dynamically created, and performs a minimum instance query for each to determine the degree of membership. As consistent results are found, they are appended to the internal list of degrees and formatted into the query's name string. If an inconsistency arises during the iteration, the loop terminates immediately, and the inconsistent solution is returned.
 
         :param kb: The knowledge base containing the ontology and individuals to be queried and solved.
         :type kb: KnowledgeBase
@@ -72,6 +76,9 @@ class AllInstancesQuery(Query):
         :rtype: Solution
         """
 
+        if self.batched:
+            return self.solve_new(kb)
+
         sol: Solution = None
         self.name: str = ""
         self.individuals: list[Individual] = list(kb.individuals.values())
@@ -85,6 +92,7 @@ class AllInstancesQuery(Query):
             if isinstance(i, CreatedIndividual):
                 continue
             q: MinInstanceQuery = MinInstanceQuery(self.conc, i)
+            q.set_solver_limits(self.limits)
             sol: Solution = q.solve(kb)
             if sol.is_consistent_kb():
                 self.degrees.append(float(sol.get_solution()))
@@ -96,70 +104,55 @@ class AllInstancesQuery(Query):
 
     def solve_new(self, kb: KnowledgeBase) -> Solution:
         """
-        Implements a specific algorithm to retrieve instances of the target concept by calculating the degree of membership for each individual in the provided knowledge base. The method operates on a clone of the input knowledge base to preserve the original state, first checking for consistency; if the ABox is inconsistent, it returns a solution indicating an inconsistent knowledge base. For each individual, excluding those that are dynamically created, it introduces a new semi-continuous variable into the MILP model and adds assertions that link the individual's relationship to the concept with this variable. It then constructs an objective function to maximize the sum of these variables and performs an optimization. As a side effect of this process, the method updates the instance's internal state by populating `self.degrees` with the calculated membership values and `self.name` with a descriptive string of the results, while temporarily toggling MILP helper flags for the optimization step.
+        Batched retrieval of the instances of the target concept, which computes the degree of membership of every named individual on a single MILP model. The method clones the input knowledge base once to preserve the original state, first checking for consistency; if the ABox is inconsistent, it returns a solution indicating an inconsistent knowledge base. For each individual, excluding those that are dynamically created, it introduces a new semi-continuous variable $q$ into the MILP model and adds the assertion that the individual belongs to the negation of the concept with degree at least $1 - q$, exactly as a minimum instance query does; since $q$ can always be set to 1, the assertion of one individual does not constrain the others. The tableau is expanded once for all these assertions, and the shared model is then minimized once per individual, using its variable as the objective. As a side effect, the method updates `self.individuals`, `self.degrees` and `self.name` with the named individuals, their membership degrees and a descriptive string of the results.
 
         :param kb: The knowledge base containing the ontology and individuals to be analyzed. It is cloned internally to ensure the original object remains unmodified during the solving process.
         :type kb: KnowledgeBase
 
-        :return: A Solution object containing the optimization results, including the degrees of membership for individuals regarding the target concept, or indicating an inconsistent knowledge base.
+        :return: The solution of the last individual, consistently with `solve`, or a Solution indicating an inconsistent knowledge base.
 
         :rtype: Solution
         """
 
+        sol: Solution = None
         self.name: str = ""
-        new_variables: list[Variable] = list()  # Variable
-        var_names: dict[str, str] = dict()
-        self.individuals: list[Individual] = list(kb.individuals.values())
-        cloned: KnowledgeBase = kb.clone()
+        self.degrees: list[float] = []
+        self.individuals: list[Individual] = [
+            i for i in kb.individuals.values() if not isinstance(i, CreatedIndividual)
+        ]
 
         try:
-            cloned.solve_abox()
-        except InconsistentOntologyException as e:
+            kb.solve_abox()
+            cloned: KnowledgeBase = kb.clone()
+            if "(some " in str(self.conc) or "(b-some " in str(self.conc):
+                cloned.set_dynamic_blocking()
+            objectives: list[Expression] = list()
+            for i in self.individuals:
+                q: Variable = cloned.milp.get_new_variable(
+                    VariableType.SEMI_CONTINUOUS
+                )  # Variable
+                cloned.old_01_variables += 1
+                objectives.append(Expression(Term(1.0, q)))  # Term
+                # a: not c >= 1-q
+                cloned.add_assertion(
+                    i,
+                    -self.conc,
+                    DegreeExpression.get_degree(
+                        Expression(1.0, Term(-1.0, q))
+                    ),  # Term
+                )
+            cloned.solve_assertions()
+            solutions: list[Solution] = cloned.optimize_objectives(objectives, self.limits)
+        except InconsistentOntologyException:
+            self.name = f"Instances of {self.conc}? Inconsistent KB"
             return Solution(Solution.INCONSISTENT_KB)
 
-        for i in self.individuals:
-            if isinstance(i, CreatedIndividual):
-                continue
-            q: Variable = cloned.milp.get_new_variable(VariableType.SEMI_CONTINUOUS)  # Variable
-            cloned.old_01_variables += 1
-            s: str = f"Is {i} instance of {self.conc}? >= "
-            var_names[str(q)] = s
-            cloned.milp.show_vars.add_variable(q, s)
-            new_variables.append(q)
-            # a: not c >= 1-q
-            cloned.add_assertion(
-                i,
-                -self.conc,
-                DegreeExpression.get_degree(Expression(1.0, Term(-1.0, q))),  # Term
-            )
-        cloned.solve_assertions()
-        obj_expr: Expression = Expression()
-        for var in new_variables:
-            obj_expr.add_term(Term(1.0, var))  # Term
-
-        MILPHelper.PRINT_LABELS = False
-        MILPHelper.PRINT_VARIABLES = False
-        MILPHelper.PARTITION = True
-        sol: Solution = cloned.optimize(obj_expr)
-        MILPHelper.PARTITION = False
-        MILPHelper.PRINT_LABELS = True
-        MILPHelper.PRINT_VARIABLES = True
-
-        if sol.is_consistent_kb():
-            ht: dict[str, float] = sol.get_showed_variables()
-            individuals_and_degrees: dict[str, float] = dict()
-            for s in ht:
-                var_name: str = var_names.get(s)
-                value: float = ht.get(s)
-                self.name += f"{var_name} {value}\n"
-                individuals_and_degrees[var_name, value]
-
-            for i in range(len(self.individuals)):
-                var_name: str = f"Is {self.individuals[i]} instance of {self.conc} >= "
-                value: float = individuals_and_degrees.get(var_name)
-                self.degrees.append(value)
-        else:
-            self.name = f"Instances of {self.conc}? Inconsistent KB"
+        for i, sol in zip(self.individuals, solutions):
+            if not sol.is_consistent_kb():
+                self.name = f"Instances of {self.conc}? Inconsistent KB"
+                break
+            self.degrees.append(float(sol.get_solution()))
+            self.name += f"Is {i} instance of {self.conc} ? >= {sol.get_solution()}\n"
         return sol
 
     def get_individuals(self) -> list[Individual]:
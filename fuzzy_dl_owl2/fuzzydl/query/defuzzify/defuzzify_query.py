@@ -12,7 +12,6 @@ from fuzzy_dl_owl2.fuzzydl.individual.created_individual import CreatedIndividua
 from fuzzy_dl_owl2.fuzzydl.individual.individual import Individual
 from fuzzy_dl_owl2.fuzzydl.knowledge_base import KnowledgeBase
 from fuzzy_dl_owl2.fuzzydl.milp.expression import Expression
-from fuzzy_dl_owl2.fuzzydl.milp.milp_helper import MILPHelper
 from fuzzy_dl_owl2.fuzzydl.milp.solution import Solution
 from fuzzy_dl_owl2.fuzzydl.milp.variable import Variable  # Variable
 from fuzzy_dl_owl2.fuzzydl.query.max.max_satisfiable_query import MaxSatisfiableQuery
@@ -38,7 +37,7 @@ class DefuzzifyQuery(Query):
 
     def __init__(self, c: Concept, ind: Individual, feature_name: str) -> None:
         """
-        Initializes a new instance of the query object by associating a specific concept and individual with a named feature. The constructor stores these parameters as instance attributes to define the context of the defuzzification operation. It also configures the underlying Mixed-Integer Linear Programming (MILP) environment by disabling verbose output for variables and labels, and initializes the placeholder for the objective expression.
+        Initializes a new instance of the query object by associating a specific concept and individual with a named feature. The constructor stores these parameters as instance attributes to define the context of the defuzzification operation. It also initializes the placeholder for the objective expression.
 
         :param c: The concept object to be associated with this instance.
         :type c: Concept
@@ -53,8 +52,6 @@ class DefuzzifyQuery(Query):
         self.a: Individual = ind
         self.f_name: str = feature_name
         self.obj_expr: Expression = None
-        MILPHelper.PRINT_VARIABLES = False
-        MILPHelper.PRINT_LABELS = False
 
     def preprocess(self, kb: KnowledgeBase) -> None:
         """
@@ -65,9 +62,12 @@ class DefuzzifyQuery(Query):
         """
 
         kb.set_dynamic_blocking()
-        s: Solution = MaxSatisfiableQuery(self.conc, self.a).solve(kb)
+        query: MaxSatisfiableQuery = MaxSatisfiableQuery(self.conc, self.a)
+        query.set_solver_limits(self.limits)
+        s: Solution = query.solve(kb)
 
-        if s is not None and s.is_consistent_kb():
+        # A bounded degree cannot be asserted, so the defuzzification is not computed
+        if s is not None and s.is_consistent_kb() and not s.is_bounded():
             self.a = kb.individuals[str(self.a)]
             kb.set_dynamic_blocking()
             kb.add_assertion(
@@ -85,7 +85,7 @@ class DefuzzifyQuery(Query):
 
     def solve(self, kb: KnowledgeBase) -> typing.Optional[Solution]:
         """
-        Attempts to solve the defuzzification problem by first resolving the ABox of the provided Knowledge Base and then operating on a cloned instance to preserve the original state. The method applies preprocessing to the clone and, if an objective expression is defined, performs an optimization to find a solution. If the resulting solution value is negative, it is converted to its absolute value before being returned. If no objective expression is available, the method issues a warning and returns None. Furthermore, it handles inconsistent ontologies by catching the specific exception and returning a Solution object marked as inconsistent.
+        Attempts to solve the defuzzification problem by first resolving the ABox of the provided Knowledge Base and then operating on a cloned instance to preserve the original state. The method applies preprocessing to the clone, with the output of the variables and of the linguistic labels disabled on its MILP problem, and, if an objective expression is defined, enables that output again and performs an optimization to find a solution. If the resulting solution value is negative, it is converted to its absolute value before being returned. If no objective expression is available, the method issues a warning and returns None. Furthermore, it handles inconsistent ontologies by catching the specific exception and returning a Solution object marked as inconsistent.
 
         :param kb: The knowledge base containing the ontology and ABox to be solved and optimized.
         :type kb: KnowledgeBase
@@ -98,13 +98,15 @@ class DefuzzifyQuery(Query):
         try:
             kb.solve_abox()
             cloned: KnowledgeBase = kb.clone()
+            cloned.milp.PRINT_LABELS = False
+            cloned.milp.PRINT_VARIABLES = False
             self.preprocess(cloned)
 
             if self.obj_expr is not None:
-                MILPHelper.PRINT_LABELS = True
-                MILPHelper.PRINT_VARIABLES = True
+                cloned.milp.PRINT_LABELS = True
+                cloned.milp.PRINT_VARIABLES = True
 
-                sol: Solution = cloned.optimize(self.obj_expr)
+                sol: Solution = cloned.optimize(self.obj_expr, self.limits)
                 if sol.get_solution() < 0.0:
                     return Solution(-sol.get_solution())
                 return sol
@@ -68,8 +68,11 @@ class MomDefuzzifyQuery(DefuzzifyQuery):
             kb.solve_abox()
             cloned: KnowledgeBase = kb.clone()
             cloned.set_dynamic_blocking()
-            s: Solution = MaxSatisfiableQuery(self.conc, self.a).solve(cloned)
-            if not s.is_consistent_kb():
+            query: MaxSatisfiableQuery = MaxSatisfiableQuery(self.conc, self.a)
+            query.set_solver_limits(self.limits)
+            s: Solution = query.solve(cloned)
+            # A bounded degree cannot be asserted, so it is returned as the answer
+            if not s.is_consistent_kb() or s.is_bounded():
                 return s
             d: float = s.get_solution()
             # LOM
@@ -95,13 +98,13 @@ class MomDefuzzifyQuery(DefuzzifyQuery):
 
         try:
             obj_expr: Expression = Expression(Term(-1.0, q))  # Term
-            sol1: Solution = cloned.optimize(obj_expr)
+            sol1: Solution = cloned.optimize(obj_expr, self.limits)
             if sol1.get_solution() < 0.0:
                 sol1 = Solution(sol1.get_solution())
 
             # SOM
             obj_expr: Expression = Expression(Term(1.0, q))  # Term
-            sol2: Solution = cloned.optimize(obj_expr)
+            sol2: Solution = cloned.optimize(obj_expr, self.limits)
             if sol2.get_solution() < 0.0:
                 sol2 = Solution(sol2.get_solution())
 
@@ -109,7 +112,12 @@ class MomDefuzzifyQuery(DefuzzifyQuery):
             if sol1.is_consistent_kb() and sol2.is_consistent_kb():
                 value = (sol1.get_solution() + sol2.get_solution()) / 2.0
                 kb.milp.print_instance_of_labels(self.f_name, str(self.a), value)
-                return Solution(value)
+                sol: Solution = Solution(value)
+                # The mean of a bounded maximum or minimum is only an estimate
+                for s in (sol1, sol2):
+                    if s.is_bounded():
+                        sol.set_bounded(s.get_status())
+                return sol
 
             # Returns an inconsistent KB solution
             return sol1
@@ -65,7 +65,7 @@ class KbSatisfiableQuery(Query):
         if len(cloned.individuals) == 0:
             cloned.get_new_individual()
             cloned.solve_assertions()
-        sol: Solution = cloned.optimize(None)
+        sol: Solution = cloned.optimize(None, self.limits)
         return sol is not None and sol.is_consistent_kb()
 
     def __str__(self) -> str:
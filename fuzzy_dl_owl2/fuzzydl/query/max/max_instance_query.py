@@ -66,7 +66,7 @@ class MaxInstanceQuery(InstanceQuery):
             kb.solve_abox()
             cloned: KnowledgeBase = kb.clone()
             self.preprocess(cloned)
-            sol: Solution = cloned.optimize(self.obj_expr)
+            sol: Solution = cloned.optimize(self.obj_expr, self.limits)
             self.set_total_time()
             return sol
         except InconsistentOntologyException:
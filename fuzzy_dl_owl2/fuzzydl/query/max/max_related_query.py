@@ -40,6 +40,7 @@ class MaxRelatedQuery(RelatedQuery):
         :type role_name: str
         """
 
+        super().__init__()
         self.ind1: Individual = a
         self.ind2: Individual = b
         self.role: str = role_name
@@ -77,7 +78,7 @@ class MaxRelatedQuery(RelatedQuery):
             kb.solve_abox()
             cloned: KnowledgeBase = kb.clone()
             self.preprocess(cloned)
-            sol: Solution = cloned.optimize(self.obj_expr)
+            sol: Solution = cloned.optimize(self.obj_expr, self.limits)
             self.set_total_time()
             return sol
         except InconsistentOntologyException:
@@ -85,7 +85,7 @@ class MaxSubsumesQuery(SubsumptionQuery):
                 cloned: KnowledgeBase = kb.clone_without_abox()
 
             self.preprocess(cloned)
-            sol: Solution = cloned.optimize(self.obj_expr)
+            sol: Solution = cloned.optimize(self.obj_expr, self.limits)
             self.set_total_time()
             return sol
         except InconsistentOntologyException:
@@ -71,7 +71,7 @@ class MinInstanceQuery(InstanceQuery):
             kb.solve_abox()
             cloned: KnowledgeBase = kb.clone()
             self.preprocess(cloned)
-            sol: Solution = cloned.optimize(self.obj_expr)
+            sol: Solution = cloned.optimize(self.obj_expr, self.limits)
             self.set_total_time()
             return sol
         except InconsistentOntologyException:
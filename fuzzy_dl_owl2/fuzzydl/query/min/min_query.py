@@ -56,7 +56,7 @@ class MinQuery(Query):
             self.set_initial_time()
             kb.solve_abox()
             cloned: KnowledgeBase = kb.clone()
-            sol: Solution = cloned.optimize(self.obj_expr)
+            sol: Solution = cloned.optimize(self.obj_expr, self.limits)
             self.set_total_time()
             return sol
         except InconsistentOntologyException:
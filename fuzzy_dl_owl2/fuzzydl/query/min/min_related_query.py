@@ -41,6 +41,7 @@ class MinRelatedQuery(RelatedQuery):
         :type role_name: str
         """
 
+        super().__init__()
         self.ind1: Individual = a
         self.ind2: Individual = b
         self.role: str = role_name
@@ -88,7 +89,7 @@ class MinRelatedQuery(RelatedQuery):
             kb.solve_abox()
             cloned: KnowledgeBase = kb.clone()
             self.preprocess(cloned)
-            sol: Solution = cloned.optimize(self.obj_expr)
+            sol: Solution = cloned.optimize(self.obj_expr, self.limits)
             self.set_total_time()
             return sol
         except InconsistentOntologyException:
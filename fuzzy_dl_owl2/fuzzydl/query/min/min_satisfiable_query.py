@@ -108,7 +108,7 @@ class MinSatisfiableQuery(SatisfiableQuery):
             if use_abox:
                 cloned.solve_abox()
             self.preprocess(cloned)
-            sol: Solution = cloned.optimize(self.obj_expr)
+            sol: Solution = cloned.optimize(self.obj_expr, self.limits)
             if sol.get_solution() < 0.0:
                 sol = Solution(-sol.get_solution())
             self.set_total_time()
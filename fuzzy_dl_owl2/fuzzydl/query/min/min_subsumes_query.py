@@ -47,9 +47,6 @@ class MinSubsumesQuery(SubsumptionQuery):
         :type kb: KnowledgeBase
         """
 
-        if kb.is_classified():
-            return
-
         ind: Individual = kb.get_new_individual()
 
         if self.type == LogicOperatorType.LUKASIEWICZ:
@@ -102,19 +99,21 @@ class MinSubsumesQuery(SubsumptionQuery):
 
         try:
             self.set_initial_time()
+            n1: typing.Optional[ClassificationNode] = None
+            n2: typing.Optional[ClassificationNode] = None
             if kb.is_classified() and self.c1.is_atomic() and self.c2.is_atomic():
-                n1: typing.Optional[ClassificationNode] = kb.get_classification_node(
-                    str(self.c1)
-                )
-                n2: typing.Optional[ClassificationNode] = kb.get_classification_node(
-                    str(self.c2)
-                )
-                if n1 is not None and n1.is_thing():
-                    sol: Solution = Solution(1.0)
-                elif n2 is not None and n1.is_thing():
-                    sol: Solution = Solution(1.0)
-                else:
-                    sol: Solution = Solution(kb.get_subsumption_flags(n1, n2))
+                n1 = kb.get_classification_node(str(self.c1))
+                n2 = kb.get_classification_node(str(self.c2))
+            if n1 is not None and n1.is_thing():
+                sol: Solution = Solution(1.0)
+            elif n2 is not None and n2.is_nothing():
+                sol: Solution = Solution(1.0)
+            elif (
+                n1 is not None
+                and n2 is not None
+                and self.type == kb.get_subsumption_implication()
+            ):
+                sol: Solution = Solution(kb.get_subsumption_flags(n1, n2))
             else:
                 if ConfigReader.OPTIMIZATIONS == 0 or kb.has_nominals_in_tbox():
                     cloned: KnowledgeBase = kb.clone()
@@ -122,7 +121,7 @@ class MinSubsumesQuery(SubsumptionQuery):
                 else:
                     cloned: KnowledgeBase = kb.clone_without_abox()
                 self.preprocess(cloned)
-                sol: Solution = cloned.optimize(self.obj_expr)
+                sol: Solution = cloned.optimize(self.obj_expr, self.limits)
 
             self.set_total_time()
             return sol
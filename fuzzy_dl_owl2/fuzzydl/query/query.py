@@ -5,24 +5,54 @@ from abc import ABC, abstractmethod
 
 from fuzzy_dl_owl2.fuzzydl.knowledge_base import KnowledgeBase
 from fuzzy_dl_owl2.fuzzydl.milp.solution import Solution
+from fuzzy_dl_owl2.fuzzydl.milp.solver_limits import SolverLimits
 
 
 class Query(ABC):
     """
-    This abstract base class serves as a foundational interface for defining questions that can be posed to a fuzzy knowledge base. It enforces the implementation of specific logic for preprocessing the knowledge base data and solving the query to produce a result, while also providing a mechanism for string representation. To facilitate performance analysis, the class includes built-in timing utilities that allow subclasses to record the start and end of the solving process and retrieve the total execution time in seconds.
+    This abstract base class serves as a foundational interface for defining questions that can be posed to a fuzzy knowledge base. It enforces the implementation of specific logic for preprocessing the knowledge base data and solving the query to produce a result, while also providing a mechanism for string representation. To facilitate performance analysis, the class includes built-in timing utilities that allow subclasses to record the start and end of the solving process and retrieve the total execution time in seconds. Every query also holds the limits of the MILP solver used to answer it, which override the `SOLVER_TIME_LIMIT` and `SOLVER_MIP_GAP` settings for this query and allow another thread to cancel it.
 
     :param initial_time: Timestamp marking the start of the query execution, used to calculate the total duration of the solving process.
     :type initial_time: int
     :param total_time: Duration of the query execution in nanoseconds, calculated as the difference between the time when the query is solved and the initial time.
     :type total_time: int
+    :param limits: Time limit, MIP gap and cancellation flag of the optimizations performed to answer the query.
+    :type limits: SolverLimits
     """
 
 
     def __init__(self) -> None:
-        """Initializes a new instance of the `Query` class, preparing it to track time-related metrics. The method sets the `initial_time` and `total_time` attributes to zero, establishing a baseline state for subsequent operations. This ensures that the object starts with a clean slate before any timing logic is applied."""
+        """Initializes a new instance of the `Query` class, preparing it to track time-related metrics. The method sets the `initial_time` and `total_time` attributes to zero, establishing a baseline state for subsequent operations, and creates solver limits that follow the settings of `ConfigReader`. This ensures that the object starts with a clean slate before any timing logic is applied."""
 
         self.initial_time: int = 0
         self.total_time: int = 0
+        self.limits: SolverLimits = SolverLimits()
+
+    def get_solver_limits(self) -> SolverLimits:
+        """
+        Returns the limits of the MILP solver used to answer the query.
+
+        :return: The time limit, MIP gap and cancellation flag of the query.
+
+        :rtype: SolverLimits
+        """
+
+        return self.limits
+
+    def set_solver_limits(self, limits: SolverLimits) -> None:
+        """
+        Replaces the limits of the MILP solver used to answer the query, e.g. to give it its own time limit or MIP gap, or to share a cancellation flag among several queries.
+
+        :param limits: The new limits of the query.
+        :type limits: SolverLimits
+        """
+
+        self.limits = limits
+
+    def cancel(self) -> None:
+        """Cancels the query from another thread: the optimization running for it is interrupted if the solver supports it, and the remaining ones are skipped, so that `solve` returns a bounded solution as soon as possible. The cancellation lasts until the limits of the query are reset."""
+
+        self.limits.cancel()
 
     def set_initial_time(self) -> None:
         """Records the current high-resolution monotonic time in nanoseconds as the starting point for the query. This method updates the `initial_time` attribute using `time.perf_counter_ns`, providing a precise timestamp for measuring execution duration or elapsed time. Note that invoking this method will overwrite any existing value in `initial_time`, effectively resetting the timer."""
@@ -0,0 +1,416 @@
+from __future__ import annotations
+
+import io
+import multiprocessing
+import multiprocessing.connection
+import os
+import pickle
+import time
+import traceback
+import typing
+
+from fuzzy_dl_owl2.fuzzydl.concept.concept import Concept
+from fuzzy_dl_owl2.fuzzydl.exception.inconsistent_ontology_exception import (
+    InconsistentOntologyException,
+)
+from fuzzy_dl_owl2.fuzzydl.individual.individual import Individual
+from fuzzy_dl_owl2.fuzzydl.knowledge_base import KnowledgeBase, _RestrictedKBUnpickler
+from fuzzy_dl_owl2.fuzzydl.milp.solution import Solution
+from fuzzy_dl_owl2.fuzzydl.query.query import Query
+from fuzzy_dl_owl2.fuzzydl.util.config_reader import ConfigReader
+from fuzzy_dl_owl2.fuzzydl.util.reasoner_context import ReasonerContext
+from fuzzy_dl_owl2.fuzzydl.util.util import Util
+
+
+class QueryExecutor:
+    """
+    This class answers the queries of a knowledge base in parallel, in a bounded pool of worker processes. The ABox of the knowledge base is expanded once in the calling process, and the expanded knowledge base is then shared with the workers, either through the copy-on-write memory of forked processes or, on platforms that cannot fork, through a pickled snapshot of the knowledge base, of its queries and of the active `ReasonerContext` that every worker loads once. Every worker solves one query at a time, on its own clone of the knowledge base as `Query.solve` does, and sends back the solution together with the attributes of the query computed while solving it, such as its total time or the degrees of an all-instances query, which are copied to the query of the calling process. A query running for longer than the timeout is cancelled by terminating its worker, which is replaced by a new one, so that a single hard query cannot stall the others. The results are returned in the order of the queries, regardless of the order in which the workers complete them.
+
+    :param kb: The knowledge base the queries are asked to, already preprocessed by `KnowledgeBase.solve_kb`.
+    :type kb: KnowledgeBase
+    :param queries: The queries to answer.
+    :type queries: list[Query]
+    :param workers: Maximum number of worker processes.
+    :type workers: int
+    :param timeout: Maximum number of seconds spent on a single query, or None if the queries are not limited in time.
+    :type timeout: typing.Optional[float]
+    """
+
+    def __init__(
+        self,
+        kb: KnowledgeBase,
+        queries: list[Query],
+        workers: typing.Optional[int] = None,
+        timeout: typing.Optional[float] = None,
+    ) -> None:
+        """
+        Initializes the executor of the queries of a knowledge base. The number of workers and the timeout default to the `QUERY_WORKERS` and `QUERY_TIMEOUT` settings.
+
+        :param kb: The knowledge base the queries are asked to, already preprocessed by `KnowledgeBase.solve_kb`.
+        :type kb: KnowledgeBase
+        :param queries: The queries to answer.
+        :type queries: list[Query]
+        :param workers: Maximum number of worker processes. A value that is not positive uses one process per available processor.
+        :type workers: typing.Optional[int]
+        :param timeout: Maximum number of seconds spent on a single query. A value that is not positive does not limit the queries in time.
+        :type timeout: typing.Optional[float]
+        """
+
+        self.kb: KnowledgeBase = kb
+        self.queries: list[Query] = queries
+        self.workers: int = QueryExecutor.get_workers(workers)
+        if timeout is None:
+            timeout = ConfigReader.QUERY_TIMEOUT
+        self.timeout: typing.Optional[float] = timeout if timeout > 0 else None
+
+    @staticmethod
+    def get_workers(workers: typing.Optional[int] = None) -> int:
+        """
+        Returns the number of worker processes used to answer the queries, namely the given number or the value of the `QUERY_WORKERS` setting, where a value that is not positive stands for the number of available processors.
+
+        :param workers: The requested number of worker processes, or None to use the `QUERY_WORKERS` setting.
+        :type workers: typing.Optional[int]
+
+        :return: The number of worker processes.
+
+        :rtype: int
+        """
+
+        if workers is None:
+            workers = ConfigReader.QUERY_WORKERS
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+        return workers
+
+    def get_snapshot(self) -> bytes:
+        """
+        Pickles the knowledge base, the queries and the state of the active `ReasonerContext` needed to reason over the knowledge base, which are loaded by the workers when the processes cannot be forked.
+
+        :return: The pickled snapshot.
+
+        :rtype: bytes
+        """
+
+        context: ReasonerContext = ReasonerContext.current()
+        return pickle.dumps(
+            (
+                self.kb,
+                self.queries,
+                context.settings,
+                context.semantics,
+                context.maxval,
+                context.maxval2,
+                context.variable_number,
+                Concept.num_new_concepts,
+            ),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+
+    def solve(self) -> list[typing.Union[Solution, Exception]]:
+        """
+        Answers the queries in the worker processes. The result of every query is either its solution or the exception raised while solving it, a `TimeoutError` if the query exceeded the timeout and was cancelled.
+
+        :return: The results of the queries, in the order of the queries.
+
+        :rtype: list[typing.Union[Solution, Exception]]
+        """
+
+        # Expand the ABox once, so that the workers inherit the expanded KB
+        try:
+            self.kb.solve_abox()
+        except InconsistentOntologyException:
+            # Every query reports the inconsistency on its own
+            pass
+
+        if "fork" in multiprocessing.get_all_start_methods():
+            mp_context = multiprocessing.get_context("fork")
+            args: tuple = (self.kb, self.queries, None)
+        else:
+            mp_context = multiprocessing.get_context("spawn")
+            args = (None, None, self.get_snapshot())
+
+        results: list[typing.Union[Solution, Exception, None]] = [None] * len(
+            self.queries
+        )
+        pending: list[int] = list(reversed(range(len(self.queries))))
+        workers: list[_QueryWorker] = []
+        try:
+            while pending or any(w.index is not None for w in workers):
+                # Assign the next queries to the idle workers
+                for worker in workers:
+                    if worker.index is None and pending:
+                        worker.start_query(pending.pop(), self.timeout)
+                while pending and len(workers) < min(self.workers, len(self.queries)):
+                    worker = _QueryWorker(mp_context, args)
+                    workers.append(worker)
+                    worker.start_query(pending.pop(), self.timeout)
+
+                busy: list[_QueryWorker] = [w for w in workers if w.index is not None]
+                deadlines: list[float] = [
+                    w.deadline for w in busy if w.deadline is not None
+                ]
+                wait_time: typing.Optional[float] = (
+                    max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+                )
+                ready: list = multiprocessing.connection.wait(
+                    [w.connection for w in busy], timeout=wait_time
+                )
+                for worker in busy:
+                    index: int = worker.index
+                    if worker.connection in ready:
+                        try:
+                            results[index] = self.load_result(
+                                index, worker.connection.recv_bytes()
+                            )
+                            worker.index = None
+                            continue
+                        except EOFError:
+                            results[index] = RuntimeError(
+                                f"Worker process exited with code {worker.process.exitcode}"
+                            )
+                    elif worker.deadline is None or worker.deadline > time.monotonic():
+                        continue
+                    else:
+                        results[index] = TimeoutError(
+                            f"Query exceeded the timeout of {self.timeout} s"
+                        )
+                    worker.terminate()
+                    workers.remove(worker)
+        finally:
+            for worker in workers:
+                worker.stop()
+        return results
+
+    def load_result(self, index: int, data: bytes) -> typing.Union[Solution, Exception]:
+        """
+        Loads the result of a query sent by a worker, copying the attributes of the query computed by the worker to the query of the calling process. The named individuals of the knowledge base are sent by name and resolved to the individuals of the knowledge base of the calling process.
+
+        :param index: The position of the query in the list of queries.
+        :type index: int
+        :param data: The pickled result sent by the worker.
+        :type data: bytes
+
+        :return: The solution of the query, or the exception raised by the worker.
+
+        :rtype: typing.Union[Solution, Exception]
+        """
+
+        try:
+            solution, state, error = _QueryResultUnpickler(
+                io.BytesIO(data), self.kb
+            ).load()
+        except Exception as e:
+            return RuntimeError(f"Cannot load the result of the query: {e}")
+        if error is not None:
+            return error
+        # The query keeps its own limits, whose cancellation flag is not sent to the workers
+        state.pop("limits", None)
+        vars(self.queries[index]).update(state)
+        return solution
+
+
+class _QueryWorker:
+    """
+    This class wraps a worker process of a `QueryExecutor`, together with the end of the pipe used to send it the positions of the queries to solve and to receive their results.
+
+    :param process: The worker process.
+    :type process: multiprocessing.process.BaseProcess
+    :param connection: The end of the pipe held by the calling process.
+    :type connection: multiprocessing.connection.Connection
+    :param index: The position of the query being solved by the worker, or None if the worker is idle.
+    :type index: typing.Optional[int]
+    :param deadline: The time, as returned by `time.monotonic`, at which the query being solved must be cancelled, or None if the query is not limited in time.
+    :type deadline: typing.Optional[float]
+    """
+
+    def __init__(self, mp_context: typing.Any, args: tuple) -> None:
+        """
+        Starts a worker process.
+
+        :param mp_context: The multiprocessing context used to start the process.
+        :type mp_context: typing.Any
+        :param args: The knowledge base and the queries shared through a forked process, or the snapshot loaded by a spawned one.
+        :type args: tuple
+        """
+
+        self.connection, child_connection = mp_context.Pipe()
+        self.process = mp_context.Process(
+            target=_run_worker, args=(child_connection, *args)
+        )
+        self.process.start()
+        child_connection.close()
+        self.index: typing.Optional[int] = None
+        self.deadline: typing.Optional[float] = None
+
+    def start_query(self, index: int, timeout: typing.Optional[float]) -> None:
+        """
+        Sends a query to the worker.
+
+        :param index: The position of the query in the list of queries.
+        :type index: int
+        :param timeout: Maximum number of seconds spent on the query, or None if the query is not limited in time.
+        :type timeout: typing.Optional[float]
+        """
+
+        self.index = index
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        self.connection.send(index)
+
+    def terminate(self) -> None:
+        """Kills the worker process, cancelling the query it is solving."""
+
+        self.process.terminate()
+        self.process.join()
+        self.connection.close()
+
+    def stop(self) -> None:
+        """Asks an idle worker process to exit, and kills it if it is still solving a query."""
+
+        if self.index is not None:
+            self.terminate()
+            return
+        try:
+            self.connection.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.connection.close()
+
+
+class _QueryResultPickler(pickle.Pickler):
+    """
+    This pickler of the results of the queries sends the named individuals of the knowledge base of a worker by name, since the calling process has its own copy of each of them.
+
+    :param kb: The knowledge base of the worker.
+    :type kb: KnowledgeBase
+    """
+
+    def __init__(self, file: typing.IO[bytes], kb: KnowledgeBase) -> None:
+        """
+        Initializes the pickler of the results of the queries solved on a knowledge base.
+
+        :param file: The file the results are written to.
+        :type file: typing.IO[bytes]
+        :param kb: The knowledge base of the worker.
+        :type kb: KnowledgeBase
+        """
+
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.kb: KnowledgeBase = kb
+
+    def persistent_id(self, obj: typing.Any) -> typing.Optional[str]:
+        """
+        Returns the name of the named individuals of the knowledge base, which are pickled by reference, and None for any other object, which is pickled by value.
+
+        :param obj: The object to pickle.
+        :type obj: typing.Any
+
+        :return: The name of the individual, or None.
+
+        :rtype: typing.Optional[str]
+        """
+
+        if isinstance(obj, Individual) and self.kb.individuals.get(obj.name) is obj:
+            return obj.name
+        return None
+
+
+class _QueryResultUnpickler(_RestrictedKBUnpickler):
+    """
+    This unpickler of the results of the queries resolves the named individuals sent by the workers to the individuals of the knowledge base of the calling process.
+
+    :param kb: The knowledge base of the calling process.
+    :type kb: KnowledgeBase
+    """
+
+    def __init__(self, file: typing.IO[bytes], kb: KnowledgeBase) -> None:
+        """
+        Initializes the unpickler of the results of the queries asked to a knowledge base.
+
+        :param file: The file the results are read from.
+        :type file: typing.IO[bytes]
+        :param kb: The knowledge base of the calling process.
+        :type kb: KnowledgeBase
+        """
+
+        super().__init__(file)
+        self.kb: KnowledgeBase = kb
+
+    def persistent_load(self, pid: typing.Any) -> Individual:
+        """
+        Returns the individual of the knowledge base with the given name.
+
+        :param pid: The name of the individual.
+        :type pid: typing.Any
+
+        :return: The individual.
+
+        :rtype: Individual
+        """
+
+        return self.kb.individuals[pid]
+
+
+def _run_worker(
+    connection: multiprocessing.connection.Connection,
+    kb: typing.Optional[KnowledgeBase],
+    queries: typing.Optional[list[Query]],
+    snapshot: typing.Optional[bytes],
+) -> None:
+    """
+    Main loop of a worker process of a `QueryExecutor`, which solves the queries whose positions are received from the pipe until it receives None or the pipe is closed. A spawned worker first loads the knowledge base, the queries and the state of the reasoner from the snapshot.
+
+    :param connection: The end of the pipe held by the worker.
+    :type connection: multiprocessing.connection.Connection
+    :param kb: The knowledge base inherited from the calling process, or None if the process was spawned.
+    :type kb: typing.Optional[KnowledgeBase]
+    :param queries: The queries inherited from the calling process, or None if the process was spawned.
+    :type queries: typing.Optional[list[Query]]
+    :param snapshot: The snapshot returned by `QueryExecutor.get_snapshot`, or None if the process was forked.
+    :type snapshot: typing.Optional[bytes]
+    """
+
+    if snapshot is not None:
+        (
+            kb,
+            queries,
+            settings,
+            semantics,
+            maxval,
+            maxval2,
+            variable_number,
+            num_new_concepts,
+        ) = _RestrictedKBUnpickler(io.BytesIO(snapshot)).load()
+        context: ReasonerContext = ReasonerContext.current()
+        context.settings.update(settings)
+        context.semantics = semantics
+        context.maxval = maxval
+        context.maxval2 = maxval2
+        context.variable_number = variable_number
+        Concept.num_new_concepts = num_new_concepts
+
+    while True:
+        try:
+            index: typing.Optional[int] = connection.recv()
+        except EOFError:
+            break
+        if index is None:
+            break
+        query: Query = queries[index]
+        try:
+            result: tuple = (query.solve(kb), vars(query), None)
+        except Exception as e:
+            if ConfigReader.DEBUG_PRINT:
+                Util.debug(traceback.format_exc())
+            result = (None, None, e)
+        file = io.BytesIO()
+        try:
+            _QueryResultPickler(file, kb).dump(result)
+        except Exception as e:
+            file = io.BytesIO()
+            _QueryResultPickler(file, kb).dump((None, None, RuntimeError(str(e))))
+        connection.send_bytes(file.getvalue())
+    connection.close()
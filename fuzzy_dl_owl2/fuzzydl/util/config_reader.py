@@ -7,30 +7,60 @@ import os
 from dotenv import dotenv_values, find_dotenv, load_dotenv
 
 from fuzzy_dl_owl2.fuzzydl.util import constants
+from fuzzy_dl_owl2.fuzzydl.util.reasoner_context import (
+    ContextSettingsMeta,
+    ReasonerContext,
+)
 
 
-class ConfigReader:
+class ConfigReader(metaclass=ContextSettingsMeta):
     """
-    A centralized configuration manager for a reasoning engine, defining default parameters that control precision, optimization levels, blocking strategies, and the selection of the Mixed-Integer Linear Programming (MILP) solver. It allows users to customize the reasoner's behavior by loading settings from a configuration file (INI) or, when that file is missing or unspecified, from a ``.env`` file located in the current working directory. Specific values can be overridden via command-line arguments. When parameters are loaded, the manager automatically adjusts internal precision calculations and updates global constants within the application to match the capabilities of the selected solver provider.
+    A centralized configuration manager for a reasoning engine, defining default parameters that control precision, optimization levels, blocking strategies, and the selection of the Mixed-Integer Linear Programming (MILP) solver. It allows users to customize the reasoner's behavior by loading settings from a configuration file (INI) or, when that file is missing or unspecified, from a ``.env`` file located in the current working directory. Specific values can be overridden via command-line arguments. When parameters are loaded, the manager automatically adjusts internal precision calculations and updates global constants within the application to match the capabilities of the selected solver provider. The values below are the defaults of the process; the settings are stored in the active `ReasonerContext`, so that reading or assigning them, including through `load_parameters`, only concerns the context of the current thread or task.
 
     :param ANYWHERE_DOUBLE_BLOCKING: Determines whether the anywhere double blocking optimization is applied.
     :type ANYWHERE_DOUBLE_BLOCKING: bool
     :param ANYWHERE_SIMPLE_BLOCKING: Determines whether anywhere simple blocking is applied during reasoning.
     :type ANYWHERE_SIMPLE_BLOCKING: bool
+    :param BATCHED_ALL_INSTANCES: Determines whether the all-instances queries created by the parser compute the degrees of all the individuals on a single shared MILP model instead of solving one minimum instance query per individual.
+    :type BATCHED_ALL_INSTANCES: bool
     :param DEBUG_PRINT: Flag to enable or disable the printing of debug messages to the console.
     :type DEBUG_PRINT: bool
     :param EPSILON: Precision threshold defining the minimum degree of satisfaction required for a concept to be considered satisfied by an individual.
     :type EPSILON: float
+    :param KB_CACHE_DIR: Directory of the persistent cache of the compiled knowledge bases, from which the parsers load the knowledge base of a fuzzy-DL file, already preprocessed if requested, as long as the file, the version of the library and the relevant settings are unchanged. An empty value disables the cache.
+    :type KB_CACHE_DIR: str
+    :param MEMBERSHIP_ENCODING: Encoding of the piecewise linear membership functions of the fuzzy concrete concepts and of the linear and triangular modifiers in the MILP problem, either with binary regions and big-M constraints or with piecewise linear constraints.
+    :type MEMBERSHIP_ENCODING: constants.MembershipEncoding
     :param MAX_INDIVIDUALS: Defines the maximum number of new individuals that can be generated during reasoning. A negative value disables this limit, allowing unlimited creation.
     :type MAX_INDIVIDUALS: int
     :param NUMBER_DIGITS: Number of digits of precision, computed from the epsilon value to define the decimal places required for the reasoner's operations.
     :type NUMBER_DIGITS: int
+    :param PERSISTENT_SOLVER_SESSIONS: Determines whether the MILP problems of the queries are solved on a persistent solver model, built once from the problem obtained after expanding the ABox, to which only the constraints, variables and objective function of each query are temporarily added. Only supported by the Gurobi and Python-MIP providers.
+    :type PERSISTENT_SOLVER_SESSIONS: bool
+    :param MILP_PARTITION: Determines whether the MILP problems are decomposed into independent sub-problems, grouping the connected components of the graph of variables, which are solved in parallel and whose solutions are merged.
+    :type MILP_PARTITION: bool
+    :param MILP_PARTITION_WORKERS: Maximum number of processes used to solve the sub-problems when the MILP problems are decomposed. A value that is not positive uses one process per available processor.
+    :type MILP_PARTITION_WORKERS: int
+    :param MILP_PRESOLVE: Determines whether the MILP problems are simplified before being handed to the solver backends, by propagating the bounds of the variables, substituting the fixed and aliased variables and dropping the redundant constraints and unused variables; the values of the removed variables are restored from the solution of the reduced problem.
+    :type MILP_PRESOLVE: bool
+    :param SOLVER_ARTIFACTS: Policy controlling when the MILP solver backends write the model and the solution of an optimization to the results directory, under file names unique to each optimization.
+    :type SOLVER_ARTIFACTS: constants.ArtifactPolicy
+    :param SOLVER_ARTIFACTS_COMPRESS: Determines whether the files written according to `SOLVER_ARTIFACTS` are compressed with gzip.
+    :type SOLVER_ARTIFACTS_COMPRESS: bool
+    :param SOLVER_TIME_LIMIT: Maximum number of seconds spent by the MILP solver on a single optimization, after which the solver stops and the query returns a bounded solution with the best feasible solution found and the best bound of the objective. A value that is not positive does not limit the solver in time.
+    :type SOLVER_TIME_LIMIT: float
+    :param SOLVER_MIP_GAP: Relative gap between the best feasible solution and the best bound at which the MILP solver stops. A negative value keeps the gap used by default for each provider.
+    :type SOLVER_MIP_GAP: float
     :param OPTIMIZATIONS: Level of optimizations applied. A value of 0 disables optimizations, while a positive value enables them. Default is 1.
     :type OPTIMIZATIONS: int
     :param RULE_ACYCLIC_TBOXES: Enables the rule acyclic TBox optimization.
     :type RULE_ACYCLIC_TBOXES: bool
     :param OWL_ANNOTATION_LABEL: The XML annotation label used to identify fuzzy logic constructs when creating or parsing Fuzzy OWL 2 ontologies.
     :type OWL_ANNOTATION_LABEL: str
+    :param QUERY_TIMEOUT: Maximum number of seconds spent on a single query when the queries are answered in parallel, after which the query is cancelled. A value that is not positive does not limit the queries in time.
+    :type QUERY_TIMEOUT: float
+    :param QUERY_WORKERS: Maximum number of processes answering the queries of a knowledge base in parallel in `DLParserFast.main`. A value of 1 answers the queries sequentially, while a value that is not positive uses one process per available processor.
+    :type QUERY_WORKERS: int
     :param MILP_PROVIDER: Specifies the Mixed-Integer Linear Programming (MILP) solver backend used by the reasoner for optimization tasks, influencing internal numerical limits based on the selected provider.
     :type MILP_PROVIDER: constants.MILPProvider
     """
@@ -39,16 +69,44 @@ class ConfigReader:
     ANYWHERE_DOUBLE_BLOCKING: bool = True
     # Anywhere simple blocking applied. false disables anywhere simple blocking; true enables anywhere simple blocking.
     ANYWHERE_SIMPLE_BLOCKING: bool = True
+    # All-instances queries solved on a single shared MILP model
+    BATCHED_ALL_INSTANCES: bool = False
     # Debugging mode
     DEBUG_PRINT: bool = False
     # Precision of the reasoner
     EPSILON: float = 0.001
+    # Directory of the compiled knowledge base cache. An empty value disables the cache.
+    KB_CACHE_DIR: str = ""
     # Maximum number of new individuals that will be created
     MAX_INDIVIDUALS: int = -1
+    # Encoding of the piecewise linear membership functions
+    MEMBERSHIP_ENCODING: constants.MembershipEncoding = (
+        constants.MembershipEncoding.BIG_M
+    )
     # Number of digits of precision
     NUMBER_DIGITS: int = 2
+    # MILP problems decomposed into independent sub-problems solved in parallel
+    MILP_PARTITION: bool = False
+    # Maximum number of processes solving the sub-problems. A non-positive value uses all the processors.
+    MILP_PARTITION_WORKERS: int = 0
+    # MILP problems simplified before being handed to the solver backends
+    MILP_PRESOLVE: bool = False
+    # When the solver backends dump their models and solutions: off, on_failure or always
+    SOLVER_ARTIFACTS: constants.ArtifactPolicy = constants.ArtifactPolicy.OFF
+    # Solver models and solutions dumped as gzip files
+    SOLVER_ARTIFACTS_COMPRESS: bool = False
+    # Maximum number of seconds spent by the solver on an optimization. A non-positive value disables the limit.
+    SOLVER_TIME_LIMIT: float = 0.0
+    # Relative MIP gap at which the solver stops. A negative value keeps the default gap of each provider.
+    SOLVER_MIP_GAP: float = -1.0
     # Level of the optimizations applied. 0 disables optimizations; a positive value enables optimizations.
     OPTIMIZATIONS: int = 1
+    # Queries solved on a persistent solver model shared with the expanded ABox
+    PERSISTENT_SOLVER_SESSIONS: bool = False
+    # Maximum number of seconds spent on a parallel query. A non-positive value disables the timeout.
+    QUERY_TIMEOUT: float = 0.0
+    # Maximum number of processes answering the queries. 1 answers them sequentially; a non-positive value uses all the processors.
+    QUERY_WORKERS: int = 1
     # Rule acyclic TBox optimization applied
     RULE_ACYCLIC_TBOXES: bool = True
     # XML OWL 2 annotation label used to create and parse Fuzzy OWL 2 ontologies
@@ -147,10 +205,79 @@ class ConfigReader:
             if isinstance(debug_print, bool)
             else str(debug_print).strip().lower() in ("1", "true", "yes", "on")
         )
+        batched_all_instances = settings.get(
+            "batchedallinstances", ConfigReader.BATCHED_ALL_INSTANCES
+        )
+        ConfigReader.BATCHED_ALL_INSTANCES = (
+            batched_all_instances
+            if isinstance(batched_all_instances, bool)
+            else str(batched_all_instances).strip().lower()
+            in ("1", "true", "yes", "on")
+        )
+        persistent_solver_sessions = settings.get(
+            "persistentsolversessions", ConfigReader.PERSISTENT_SOLVER_SESSIONS
+        )
+        ConfigReader.PERSISTENT_SOLVER_SESSIONS = (
+            persistent_solver_sessions
+            if isinstance(persistent_solver_sessions, bool)
+            else str(persistent_solver_sessions).strip().lower()
+            in ("1", "true", "yes", "on")
+        )
+        milp_partition = settings.get("milppartition", ConfigReader.MILP_PARTITION)
+        ConfigReader.MILP_PARTITION = (
+            milp_partition
+            if isinstance(milp_partition, bool)
+            else str(milp_partition).strip().lower() in ("1", "true", "yes", "on")
+        )
+        ConfigReader.MILP_PARTITION_WORKERS = int(
+            settings.get("milppartitionworkers", ConfigReader.MILP_PARTITION_WORKERS)
+        )
+        milp_presolve = settings.get("milppresolve", ConfigReader.MILP_PRESOLVE)
+        ConfigReader.MILP_PRESOLVE = (
+            milp_presolve
+            if isinstance(milp_presolve, bool)
+            else str(milp_presolve).strip().lower() in ("1", "true", "yes", "on")
+        )
+        ConfigReader.QUERY_WORKERS = int(
+            settings.get("queryworkers", ConfigReader.QUERY_WORKERS)
+        )
+        ConfigReader.QUERY_TIMEOUT = float(
+            settings.get("querytimeout", ConfigReader.QUERY_TIMEOUT)
+        )
+        ConfigReader.SOLVER_TIME_LIMIT = float(
+            settings.get("solvertimelimit", ConfigReader.SOLVER_TIME_LIMIT)
+        )
+        ConfigReader.SOLVER_MIP_GAP = float(
+            settings.get("solvermipgap", ConfigReader.SOLVER_MIP_GAP)
+        )
+        ConfigReader.SOLVER_ARTIFACTS = constants.ArtifactPolicy(
+            str(settings.get("solverartifacts", ConfigReader.SOLVER_ARTIFACTS))
+            .strip()
+            .lower()
+            .replace("-", "_")
+        )
+        solver_artifacts_compress = settings.get(
+            "solverartifactscompress", ConfigReader.SOLVER_ARTIFACTS_COMPRESS
+        )
+        ConfigReader.SOLVER_ARTIFACTS_COMPRESS = (
+            solver_artifacts_compress
+            if isinstance(solver_artifacts_compress, bool)
+            else str(solver_artifacts_compress).strip().lower()
+            in ("1", "true", "yes", "on")
+        )
         ConfigReader.EPSILON = float(settings.get("epsilon", ConfigReader.EPSILON))
+        ConfigReader.KB_CACHE_DIR = str(
+            settings.get("kbcachedir", ConfigReader.KB_CACHE_DIR)
+        ).strip()
         ConfigReader.MAX_INDIVIDUALS = int(
             settings.get("maxindividuals", ConfigReader.MAX_INDIVIDUALS)
         )
+        ConfigReader.MEMBERSHIP_ENCODING = constants.MembershipEncoding(
+            str(settings.get("membershipencoding", ConfigReader.MEMBERSHIP_ENCODING))
+            .strip()
+            .lower()
+            .replace("-", "_")
+        )
         ConfigReader.OWL_ANNOTATION_LABEL = settings.get(
             "owlannotationlabel", ConfigReader.OWL_ANNOTATION_LABEL
         )
@@ -166,18 +293,20 @@ class ConfigReader:
         )
 
         # Set global constants based on the selected MILP provider, adjusting MAXVAL accordingly to ensure compatibility with the solver's capabilities.
+        context: ReasonerContext = ReasonerContext.current()
         if ConfigReader.MILP_PROVIDER in (
             constants.MILPProvider.MIP,
             constants.MILPProvider.PULP,
         ):
-            constants.MAXVAL = (1 << 31) - 1
+            context.maxval = (1 << 31) - 1
         elif ConfigReader.MILP_PROVIDER in (
+            constants.MILPProvider.HIGHS,
             constants.MILPProvider.PULP_GLPK,
             constants.MILPProvider.PULP_CPLEX,
             constants.MILPProvider.PULP_HIGHS,
         ):
-            constants.MAXVAL = (1 << 28) - 1
-        constants.MAXVAL2 = constants.MAXVAL * 2
+            context.maxval = (1 << 28) - 1
+        context.maxval2 = context.maxval * 2
 
         if ConfigReader.DEBUG_PRINT:
             print(f"Debugging mode = {ConfigReader.DEBUG_PRINT}")
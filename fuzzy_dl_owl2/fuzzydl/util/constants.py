@@ -27,12 +27,14 @@ def ensure_results_dir() -> str:
 
 class MILPProvider(enum.StrEnum):
     """
-    This enumeration defines the available Mixed-Integer Linear Programming (MILP) solver backends supported by the reasoning system. It provides specific members for distinct solvers such as GUROBI and MIP, as well as configurations for the PULP library using different underlying engines like GLPK, HiGHS, or CPLEX. As a string-based enum, it facilitates configuration by allowing direct string comparisons, and it includes a static `from_str` method to safely parse case-insensitive string inputs into the corresponding enum member, raising an error for invalid values.
+    This enumeration defines the available Mixed-Integer Linear Programming (MILP) solver backends supported by the reasoning system. It provides specific members for distinct solvers such as GUROBI, MIP and HiGHS, as well as configurations for the PULP library using different underlying engines like GLPK, HiGHS, or CPLEX. As a string-based enum, it facilitates configuration by allowing direct string comparisons, and it includes a static `from_str` method to safely parse case-insensitive string inputs into the corresponding enum member, raising an error for invalid values.
 
     :param GUROBI: Selects the Gurobi solver for MILP optimization.
     :type GUROBI: typing.Any
     :param MIP: Selects the Python-MIP solver backend.
     :type MIP: typing.Any
+    :param HIGHS: Selects the HiGHS solver, driven in memory through its `highspy` bindings.
+    :type HIGHS: typing.Any
     :param PULP: Represents the default solver backend provided by the PuLP library.
     :type PULP: typing.Any
     :param PULP_GLPK: Uses the GLPK solver via the PuLP interface.
@@ -47,6 +49,7 @@ class MILPProvider(enum.StrEnum):
 
     GUROBI = enum.auto()
     MIP = enum.auto()
+    HIGHS = enum.auto()
     # SCIPY = enum.auto()
     PULP = enum.auto()
     PULP_GLPK = enum.auto()
@@ -76,6 +79,88 @@ class MILPProvider(enum.StrEnum):
             )
 
 
+class ArtifactPolicy(enum.StrEnum):
+    """
+    This enumeration defines when the MILP solver backends dump the model they built and the solution they found to the results directory, a debugging aid that costs synchronous file writes on every optimization. By inheriting from `StrEnum`, its members can be read directly from the string values of the configuration.
+
+    :param OFF: No model or solution file is written, so that solving performs no disk I/O.
+    :type OFF: typing.Any
+    :param ON_FAILURE: The files are written only when the solver does not find an optimal solution, either because the model is infeasible or because the solver stops for another reason, such as a limit.
+    :type ON_FAILURE: typing.Any
+    :param ALWAYS: The files are written after every optimization.
+    :type ALWAYS: typing.Any
+    """
+
+    OFF = "off"
+    ON_FAILURE = "on_failure"
+    ALWAYS = "always"
+
+
+class MembershipEncoding(enum.StrEnum):
+    """
+    This enumeration defines how the piecewise linear membership functions of the fuzzy concrete concepts (triangular, trapezoidal, left-shoulder, right-shoulder and linear) and of the linear and triangular modifiers are encoded in the MILP problem. By inheriting from `StrEnum`, its members can be read directly from the string values of the configuration.
+
+    :param BIG_M: Every region of the function is selected by a binary variable, and the constraints of the regions are relaxed with big-M coefficients built from the bounds of the domain.
+    :type BIG_M: typing.Any
+    :param PIECEWISE: The function is added as a piecewise linear constraint over its breakpoints, which the Gurobi and Python-MIP providers handle natively and the other providers encode as a convex combination of the breakpoints, without big-M coefficients.
+    :type PIECEWISE: typing.Any
+    """
+
+    BIG_M = "big_m"
+    PIECEWISE = "piecewise"
+
+
+class SolverCapability(enum.StrEnum):
+    r"""
+    This enumeration defines the high-level constraints that a MILP solver backend can handle natively, which `MILPHelper` queries to decide whether a constraint is sent to the solver as is or lowered into linear constraints with auxiliary variables. By inheriting from `StrEnum`, its members can be used directly as strings.
+
+    :param PIECEWISE_LINEAR: Piecewise linear constraints  $y = f(x)$ over a list of breakpoints.
+    :type PIECEWISE_LINEAR: typing.Any
+    :param MIN_MAX: Constraints  $z = \min(x_1, \dots, x_n, c)$  and  $z = \max(x_1, \dots, x_n, c)$.
+    :type MIN_MAX: typing.Any
+    :param INDICATOR: Indicator constraints, which enforce a linear constraint only when a binary variable takes a given value.
+    :type INDICATOR: typing.Any
+    """
+
+    PIECEWISE_LINEAR = "piecewise_linear"
+    MIN_MAX = "min_max"
+    INDICATOR = "indicator"
+
+
+class GeneralConstraintType(enum.StrEnum):
+    """
+    This enumeration defines the kinds of general constraints of a MILP problem, namely the constraints that are not linear but are handled natively by some solver backends. By inheriting from `StrEnum`, its members can be used directly as strings.
+
+    :param MIN: The result variable is the minimum of the operands.
+    :type MIN: typing.Any
+    :param MAX: The result variable is the maximum of the operands.
+    :type MAX: typing.Any
+    :param INDICATOR: A linear constraint holds whenever a binary variable takes a given value.
+    :type INDICATOR: typing.Any
+    """
+
+    MIN = "min"
+    MAX = "max"
+    INDICATOR = "indicator"
+
+
+class SolutionStatus(enum.StrEnum):
+    """
+    This enumeration defines the reason why the MILP solver stopped when computing a `Solution`. A solution whose status is not `OPTIMAL` is bounded: its value is the best feasible solution found so far, if any, and the best bound of the objective proven by the solver brackets the optimal value.
+
+    :param OPTIMAL: The solver proved that the solution is optimal, within the configured MIP gap.
+    :type OPTIMAL: typing.Any
+    :param TIME_LIMIT: The solver reached the time limit before proving optimality.
+    :type TIME_LIMIT: typing.Any
+    :param CANCELLED: The optimization was cancelled from another thread before the solver proved optimality.
+    :type CANCELLED: typing.Any
+    """
+
+    OPTIMAL = "optimal"
+    TIME_LIMIT = "time limit"
+    CANCELLED = "cancelled"
+
+
 class ConcreteFeatureType(enum.Enum):
     """
     This enumeration defines the set of primitive data types applicable to concrete features within the reasoning system. It categorizes features into distinct categories such as text, whole numbers, floating-point values, and binary states, enabling the reasoner to apply logic specific to each data format. Instances of this class provide a standardized way to represent feature types, and their string representation is simplified to the uppercase name of the specific type.
@@ -1437,6 +1522,34 @@ class FuzzyLogic(enum.StrEnum):
         return self.value
 
 
-KNOWLEDGE_BASE_SEMANTICS: FuzzyLogic = FuzzyLogic.CLASSICAL
-MAXVAL: float = ((1 << 31) - 1) * 1000  # 2.147483647e12
-MAXVAL2: float = MAXVAL * 2
+DEFAULT_MAXVAL: float = ((1 << 31) - 1) * 1000  # 2.147483647e12
+
+# Module attributes stored in the active reasoner context, and the
+# attributes of the context holding them.
+_CONTEXT_ATTRIBUTES: dict[str, str] = {
+    "KNOWLEDGE_BASE_SEMANTICS": "semantics",
+    "MAXVAL": "maxval",
+    "MAXVAL2": "maxval2",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    """
+    Returns the module attributes that depend on the knowledge base being reasoned over, namely the fuzzy logic semantics `KNOWLEDGE_BASE_SEMANTICS` and the numerical limits `MAXVAL` and `MAXVAL2`, which are stored in the active `ReasonerContext` so that several knowledge bases can be handled concurrently. They are assigned through the attributes of the context, since assigning them to this module would hide the value of the context.
+
+    :param name: The name of the attribute.
+    :type name: str
+
+    :raises AttributeError: if the module has no attribute with the given name.
+
+    :return: The value of the attribute in the active context.
+
+    :rtype: typing.Any
+    """
+
+    attribute: typing.Optional[str] = _CONTEXT_ATTRIBUTES.get(name)
+    if attribute is not None:
+        from fuzzy_dl_owl2.fuzzydl.util.reasoner_context import _CURRENT
+
+        return getattr(_CURRENT.get(), attribute)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import contextvars
+import typing
+
+from fuzzy_dl_owl2.fuzzydl.util import constants
+from fuzzy_dl_owl2.fuzzydl.util.constants import FuzzyLogic
+
+
+class ReasonerContext:
+    """
+    This class gathers the state that the parsers and the reasoner used to keep in class attributes and module variables, namely the values of the `ConfigReader` settings, the fuzzy logic semantics and the numerical limits of the knowledge base, the counter naming the new MILP variables, and the knowledge base and the queries built by the parser. The active context is stored in a context variable, so that every thread, and every asyncio task, can activate its own context with a `with` statement and parse and reason over a knowledge base without interfering with the others. Code that never activates a context uses the default one, which is shared by the whole process and behaves like the former global state. The legacy attributes, such as `ConfigReader.EPSILON`, `DLParser.kb`, `Variable.VARIABLE_NUMBER` or `constants.KNOWLEDGE_BASE_SEMANTICS`, remain available and read and write the active context. A new context starts with a copy of the settings, the semantics and the numerical limits of the context that is active when it is created, with an empty parser session.
+
+    :param settings: Values of the `ConfigReader` settings, indexed by the name of the setting.
+    :type settings: dict[str, typing.Any]
+    :param semantics: Fuzzy logic semantics of the knowledge base.
+    :type semantics: FuzzyLogic
+    :param maxval: Largest value of the MILP variables, which depends on the MILP provider.
+    :type maxval: float
+    :param maxval2: Twice the value of `maxval`.
+    :type maxval2: float
+    :param variable_number: Counter used to generate the names of the new MILP variables.
+    :type variable_number: int
+    :param kb: The knowledge base being built by the parser.
+    :type kb: typing.Any
+    :param queries_list: The queries collected by the parser.
+    :type queries_list: list[typing.Any]
+    :param tokens: Tokens restoring the previously active contexts, one for each nested `with` statement on this context.
+    :type tokens: list[contextvars.Token]
+    """
+
+    def __init__(self) -> None:
+        """Initializes a new context with a copy of the settings, the semantics and the numerical limits of the active context, a variable counter set to zero and an empty parser session."""
+
+        active: ReasonerContext = ReasonerContext.current()
+        self.settings: dict[str, typing.Any] = dict(active.settings)
+        self.semantics: FuzzyLogic = active.semantics
+        self.maxval: float = active.maxval
+        self.maxval2: float = active.maxval2
+        self.variable_number: int = 0
+        self.kb: typing.Any = None
+        self.queries_list: list[typing.Any] = []
+        self.tokens: list[contextvars.Token] = []
+
+    @staticmethod
+    def current() -> ReasonerContext:
+        """
+        Returns the context active in the current thread or asyncio task, which is the default context of the process if none has been activated.
+
+        :return: The active context.
+
+        :rtype: ReasonerContext
+        """
+
+        return _CURRENT.get()
+
+    def __enter__(self) -> typing.Self:
+        """
+        Activates the context until the end of the `with` statement.
+
+        :return: The context itself.
+
+        :rtype: typing.Self
+        """
+
+        self.tokens.append(_CURRENT.set(self))
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        """
+        Restores the context that was active before the `with` statement.
+
+        :param args: The exception information of the `with` statement, which is not suppressed.
+        :type args: typing.Any
+        """
+
+        _CURRENT.reset(self.tokens.pop())
+
+    def run(
+        self, func: typing.Callable[..., typing.Any], *args: typing.Any, **kwargs: typing.Any
+    ) -> typing.Any:
+        """
+        Calls a function with the context active, which is convenient to submit work to a thread pool. A context should be active in a single thread at a time, since it holds the parser session of a single knowledge base.
+
+        :param func: The function to call.
+        :type func: typing.Callable[..., typing.Any]
+        :param args: Positional arguments of the function.
+        :type args: typing.Any
+        :param kwargs: Keyword arguments of the function.
+        :type kwargs: typing.Any
+
+        :return: The value returned by the function.
+
+        :rtype: typing.Any
+        """
+
+        with self:
+            return func(*args, **kwargs)
+
+
+def context_property(name: str) -> property:
+    """
+    Creates a property for a metaclass that exposes an attribute of the active `ReasonerContext` as a class attribute, so that reading or assigning the class attribute reads or assigns the attribute of the active context.
+
+    :param name: The name of the attribute of the context.
+    :type name: str
+
+    :return: The property.
+
+    :rtype: property
+    """
+
+    def getter(cls: type) -> typing.Any:
+        return getattr(_CURRENT.get(), name)
+
+    def setter(cls: type, value: typing.Any) -> None:
+        setattr(_CURRENT.get(), name, value)
+
+    return property(getter, setter)
+
+
+def setting_property(name: str) -> property:
+    """
+    Creates a property for a metaclass that exposes a setting of the active `ReasonerContext` as a class attribute, so that reading or assigning the class attribute reads or assigns the value of the setting in the active context.
+
+    :param name: The name of the setting.
+    :type name: str
+
+    :return: The property.
+
+    :rtype: property
+    """
+
+    def getter(cls: type) -> typing.Any:
+        return _CURRENT.get().settings[name]
+
+    def setter(cls: type, value: typing.Any) -> None:
+        _CURRENT.get().settings[name] = value
+
+    return property(getter, setter)
+
+
+class ContextSettingsMeta(type):
+    """
+    This metaclass of `ConfigReader` turns every upper-case class attribute into a setting of the `ReasonerContext`. The values in the body of the class become the values of the settings in the default context, and the class attributes read and assign the values of the settings in the active context.
+    """
+
+    def __init__(
+        cls, name: str, bases: tuple[type, ...], namespace: dict[str, typing.Any]
+    ) -> None:
+        """
+        Registers the upper-case attributes of the class as settings of the default context and replaces them with properties of the metaclass.
+
+        :param name: The name of the class.
+        :type name: str
+        :param bases: The base classes of the class.
+        :type bases: tuple[type, ...]
+        :param namespace: The attributes defined in the body of the class.
+        :type namespace: dict[str, typing.Any]
+        """
+
+        super().__init__(name, bases, namespace)
+        for key, value in namespace.items():
+            if key.isupper():
+                _DEFAULT.settings[key] = value
+                setattr(type(cls), key, setting_property(key))
+
+
+class ParserSessionMeta(type):
+    """
+    This metaclass of the parsers exposes the knowledge base and the queries of the active `ReasonerContext` as the `kb` and `queries_list` class attributes used by the parsing callbacks.
+
+    :param kb: The knowledge base being built by the parser in the active context.
+    :type kb: typing.Any
+    :param queries_list: The queries collected by the parser in the active context.
+    :type queries_list: list[typing.Any]
+    """
+
+    kb = context_property("kb")
+    queries_list = context_property("queries_list")
+
+
+class VariableCounterMeta(type):
+    """
+    This metaclass of `Variable` exposes the counter of the active `ReasonerContext` naming the new MILP variables as the `VARIABLE_NUMBER` class attribute.
+
+    :param VARIABLE_NUMBER: Counter used to generate the names of the new MILP variables in the active context.
+    :type VARIABLE_NUMBER: int
+    """
+
+    VARIABLE_NUMBER = context_property("variable_number")
+
+
+_DEFAULT: ReasonerContext = object.__new__(ReasonerContext)
+_DEFAULT.settings = dict()
+_DEFAULT.semantics = FuzzyLogic.CLASSICAL
+_DEFAULT.maxval = constants.DEFAULT_MAXVAL
+_DEFAULT.maxval2 = constants.DEFAULT_MAXVAL * 2
+_DEFAULT.variable_number = 0
+_DEFAULT.kb = None
+_DEFAULT.queries_list = []
+_DEFAULT.tokens = []
+
+_CURRENT: contextvars.ContextVar[ReasonerContext] = contextvars.ContextVar(
+    "fuzzydl_reasoner_context", default=_DEFAULT
+)
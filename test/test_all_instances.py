@@ -0,0 +1,35 @@
+import unittest
+
+from fuzzy_dl_owl2.fuzzydl.milp.variable import Variable
+from fuzzy_dl_owl2.fuzzydl.parser import DLParserFast as DLParser
+
+
+class TestAllInstances(unittest.TestCase):
+
+    def get_degrees(self, batched: bool) -> dict[str, float]:
+        Variable.VARIABLE_NUMBER = 0
+        kb, queries = DLParser.get_kb(
+            "../examples/TestSuite/allInstances1.txt",
+            batched_all_instances=batched,
+        )
+        kb.solve_kb()
+        query = queries[0]
+        self.assertEqual(batched, query.batched)
+        self.assertTrue(query.solve(kb).is_consistent_kb())
+        return {
+            str(i): d for i, d in zip(query.get_individuals(), query.get_degrees())
+        }
+
+    def test_query1(self):
+        self.assertEqual(
+            {"a": 0.7, "b": 0.4, "c": 0.5},
+            self.get_degrees(False),
+            "TestAllInstances",
+        )
+
+    def test_query2(self):
+        self.assertEqual(self.get_degrees(False), self.get_degrees(True))
+
+
+if __name__ == "__main__":
+    unittest.main()
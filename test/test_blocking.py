@@ -2,6 +2,13 @@ import unittest
 
 from parser_interface import ParserInterface
 
+from fuzzy_dl_owl2.fuzzydl.individual.created_individual import CreatedIndividual
+from fuzzy_dl_owl2.fuzzydl.knowledge_base import (
+    CreatedIndividualHandler,
+    KnowledgeBase,
+)
+from fuzzy_dl_owl2.fuzzydl.util.constants import BlockingDynamicType
+
 
 class TestBlocking(unittest.TestCase):
 
@@ -41,6 +48,45 @@ class TestBlocking(unittest.TestCase):
         p = ParserInterface("../examples/TestSuite/blockingSet.txt")
         self.assertEqual(0.8, p.solve(), "TestBlocking")
 
+    def test_label_bitsets(self):
+        a, b, c = (CreatedIndividual(f"i{n}", None, "R") for n in (1, 2, 3))
+        for ind, concepts in ((a, [3, 70]), (b, [70, 3, 5]), (c, [70, 3])):
+            for concept in concepts:
+                self.assertTrue(ind.add_concept_label(concept))
+        self.assertFalse(a.add_concept_label(3))
+        self.assertEqual(1 << 3 | 1 << 70, a.concept_bits)
+        self.assertEqual({3, 70}, a.concept_list)
+        self.assertTrue(a.label_is_subset_of(b))
+        self.assertFalse(b.label_is_subset_of(a))
+        self.assertTrue(a.label_equals(c))
+        self.assertFalse(a.label_equals(b))
+        self.assertEqual(a.get_label_hash(), c.get_label_hash())
+        c.add_concept_label(5)
+        self.assertTrue(b.label_equals(c))
+        self.assertTrue(CreatedIndividualHandler.match_set_concept_labels(b, c))
+        self.assertTrue(CreatedIndividualHandler.match_subset_concept_labels(a, c))
+        self.assertFalse(CreatedIndividualHandler.match_subset_concept_labels(c, None))
+
+    def test_matching_individual(self):
+        kb = KnowledgeBase()
+        a, b, c, d = (CreatedIndividual(f"i{n}", None, "R") for n in (1, 2, 3, 4))
+        labels = ((a, [3, 5, 9]), (b, [3, 5, 7, 9]), (c, [3, 5, 7]), (d, [3, 5, 9]))
+        for ind, concepts in labels:
+            kb.add_created_individual(ind.name, ind)
+            for concept in concepts:
+                ind.add_concept_label(concept)
+                kb.add_individual_to_concept(concept, ind)
+
+        # The label of i1 shares 3 and 5 with the label of i3 but lacks 7
+        kb.blocking_type = BlockingDynamicType.ANYWHERE_SUBSET_BLOCKING
+        self.assertEqual([b], list(CreatedIndividualHandler.matching_individual(c, kb)))
+        self.assertEqual(
+            [a, b], list(CreatedIndividualHandler.matching_individual(d, kb))
+        )
+        kb.blocking_type = BlockingDynamicType.ANYWHERE_SET_BLOCKING
+        self.assertEqual([], list(CreatedIndividualHandler.matching_individual(c, kb)))
+        self.assertEqual([a], list(CreatedIndividualHandler.matching_individual(d, kb)))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+
+from parser_interface import ParserInterface
+
+from fuzzy_dl_owl2.fuzzydl.knowledge_base import KnowledgeBase
+from fuzzy_dl_owl2.fuzzydl.milp.variable import Variable
+from fuzzy_dl_owl2.fuzzydl.parser import DLParserFast as DLParser
+from fuzzy_dl_owl2.fuzzydl.query.classification_query import ClassificationQuery
+
+
+class TestClassification(unittest.TestCase):
+
+    def get_kb(self) -> tuple[KnowledgeBase, list]:
+        Variable.VARIABLE_NUMBER = 0
+        kb, queries = DLParser.get_kb("../examples/TestSuite/classification1.txt")
+        kb.solve_kb()
+        return kb, queries
+
+    def test_query1(self):
+        p = ParserInterface("../examples/TestSuite/classification1.txt")
+        self.assertEqual(1.0, p.solve(), "TestClassification")
+
+    def test_hierarchy(self):
+        kb, _ = self.get_kb()
+        self.assertTrue(ClassificationQuery().solve(kb).is_consistent_kb())
+        self.assertTrue(kb.is_classified())
+        parents = {
+            name: {
+                str(n)
+                for n in kb.get_classification_node(name).get_immediate_predecessors()
+            }
+            for name in ("A", "B", "C", "D", "E")
+        }
+        self.assertEqual({"B"}, parents["A"], "TestClassification")
+        self.assertEqual({"C"}, parents["B"], "TestClassification")
+        self.assertEqual({"*top*"}, parents["C"], "TestClassification")
+        self.assertEqual({"*top*"}, parents["D"], "TestClassification")
+        self.assertEqual({"A", "D"}, parents["E"], "TestClassification")
+
+    def test_classified_queries(self):
+        kb, queries = self.get_kb()
+        expected = [query.solve(kb).get_solution() for query in queries]
+        kb.classify()
+        self.assertEqual([1.0, 0.7, 0.0], expected, "TestClassification")
+        self.assertEqual(
+            expected,
+            [query.solve(kb).get_solution() for query in queries],
+            "TestClassification",
+        )
+
+    def test_subsumption_lookups(self):
+        kb, _ = self.get_kb()
+        kb.classify()
+        node = kb.get_classification_node
+        self.assertEqual(1.0, kb.get_subsumption_flags(node("C"), node("A")))
+        self.assertEqual(1.0, kb.get_subsumption_flags(node("D"), node("E")))
+        # The descendants of the queried nodes are cached bottom-up
+        self.assertEqual(
+            {"A", "B", "E", "*bottom*"},
+            {str(n) for n in kb.classification_descendants[node("C")]},
+            "TestClassification",
+        )
+        self.assertIn(node("B"), kb.classification_descendants)
+
+
+if __name__ == "__main__":
+    unittest.main()
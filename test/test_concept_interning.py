@@ -0,0 +1,45 @@
+import pickle
+import unittest
+
+from fuzzy_dl_owl2.fuzzydl.concept.all_some_concept import AllSomeConcept
+from fuzzy_dl_owl2.fuzzydl.concept.atomic_concept import AtomicConcept
+from fuzzy_dl_owl2.fuzzydl.concept.operator_concept import OperatorConcept
+
+
+class TestConceptInterning(unittest.TestCase):
+
+    def test_factories_share_instances(self):
+        a = AtomicConcept("A")
+        b = AtomicConcept("B")
+        self.assertIs(-a, OperatorConcept.not_(a))
+        self.assertIs(AllSomeConcept.some("r", a), AllSomeConcept.some("r", a))
+        self.assertIsNot(AllSomeConcept.some("r", a), AllSomeConcept.all("r", a))
+        c = OperatorConcept.and_(a, b)
+        self.assertIs(c, OperatorConcept.and_(a, b))
+        self.assertEqual(hash(c), hash(OperatorConcept.and_(a, b)))
+
+        # Equal atomic concepts that are different objects still compare equal
+        self.assertEqual(-a, -AtomicConcept("A"))
+
+    def test_in_place_changes_release_concepts(self):
+        a = AtomicConcept("A")
+        b = AtomicConcept("B")
+        c = OperatorConcept.or_(a, b)
+        name = str(c)
+        concept_id = c.concept_id
+        c.concepts = [b, a]
+        self.assertNotEqual(concept_id, c.concept_id)
+        self.assertIsNot(c, OperatorConcept.or_(a, b))
+        self.assertEqual(name, str(OperatorConcept.or_(a, b)))
+
+    def test_pickle(self):
+        a = AtomicConcept("A")
+        c = AllSomeConcept.some("r", -a)
+        restored = pickle.loads(pickle.dumps(c))
+        self.assertNotEqual(c.concept_id, restored.concept_id)
+        self.assertEqual(c, restored)
+        self.assertEqual(hash(c), hash(restored))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -29,6 +29,14 @@ class TestFuzzyConcreteDomain(unittest.TestCase):
         p = ParserInterface("../examples/TestSuite/fcd6.txt")
         self.assertEqual(0.2647, p.solve(), "TestFuzzyConcreteDomain")
 
+    def test_query7(self):
+        p = ParserInterface("../examples/TestSuite/fcd7.txt")
+        self.assertEqual(0.3, p.solve(), "TestFuzzyConcreteDomain")
+
+    def test_query8(self):
+        p = ParserInterface("../examples/TestSuite/fcd8.txt")
+        self.assertEqual(0.5, p.solve(), "TestFuzzyConcreteDomain")
+
 
 if __name__ == "__main__":
     unittest.main()
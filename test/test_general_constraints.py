@@ -0,0 +1,96 @@
+import unittest
+
+from fuzzy_dl_owl2.fuzzydl.milp.expression import Expression
+from fuzzy_dl_owl2.fuzzydl.milp.milp_helper import MILPHelper
+from fuzzy_dl_owl2.fuzzydl.milp.term import Term
+from fuzzy_dl_owl2.fuzzydl.milp.variable import Variable
+from fuzzy_dl_owl2.fuzzydl.parser import DLParserFast as DLParser
+from fuzzy_dl_owl2.fuzzydl.util.config_reader import ConfigReader
+from fuzzy_dl_owl2.fuzzydl.util.constants import (
+    InequalityType,
+    MILPProvider,
+    SolverCapability,
+    VariableType,
+)
+from fuzzy_dl_owl2.fuzzydl.util.reasoner_context import ReasonerContext
+
+
+class TestGeneralConstraints(unittest.TestCase):
+
+    FILES = {
+        "impliesG1.txt": 0.4,
+        "impliesKd1.txt": 0.9,
+        "aggregation1.txt": 0.6,
+        "and3.txt": 0.7,
+    }
+
+    def test_capabilities(self):
+        self.assertTrue(
+            MILPHelper.supports(SolverCapability.INDICATOR, MILPProvider.GUROBI)
+        )
+        self.assertTrue(
+            MILPHelper.supports(SolverCapability.PIECEWISE_LINEAR, MILPProvider.MIP)
+        )
+        self.assertFalse(
+            MILPHelper.supports(SolverCapability.MIN_MAX, MILPProvider.MIP)
+        )
+        self.assertFalse(
+            MILPHelper.supports(SolverCapability.MIN_MAX, MILPProvider.HIGHS)
+        )
+
+    def test_native_and_lowered(self):
+        for filename, expected in TestGeneralConstraints.FILES.items():
+            with self.subTest(filename=filename):
+                Variable.VARIABLE_NUMBER = 0
+                with ReasonerContext():
+                    kb, queries = DLParser.get_kb(
+                        f"../examples/TestSuite/{filename}",
+                        milp_provider=MILPProvider.GUROBI.value,
+                    )
+                    kb.solve_kb()
+                    self.assertEqual(expected, queries[0].solve(kb).get_solution())
+                    # The general constraints are lowered for the other providers
+                    ConfigReader.MILP_PROVIDER = MILPProvider.HIGHS
+                    self.assertEqual(expected, queries[0].solve(kb).get_solution())
+
+    def test_lowering(self):
+        milp = MILPHelper()
+        x1 = milp.get_new_variable(VariableType.SEMI_CONTINUOUS)
+        x2 = milp.get_new_variable(VariableType.SEMI_CONTINUOUS)
+        z_min = milp.get_new_variable(VariableType.SEMI_CONTINUOUS)
+        z_max = milp.get_new_variable(VariableType.SEMI_CONTINUOUS)
+        y = milp.get_new_variable(VariableType.BINARY)
+        milp.add_new_constraint(Expression(Term(1.0, x1)), InequalityType.EQUAL, 0.3)
+        milp.add_new_constraint(Expression(Term(1.0, x2)), InequalityType.EQUAL, 0.6)
+        milp.add_min_constraint(z_min, [x1, x2], 0.5)
+        milp.add_max_constraint(z_max, [x1], 0.5)
+        # y = 1 -> z_max + x1 <= 0.5, which cannot hold
+        milp.add_indicator_constraint(
+            y,
+            1,
+            Expression(Term(1.0, z_max), Term(1.0, x1)),
+            InequalityType.LESS_THAN,
+            0.5,
+        )
+        self.assertEqual(3, len(milp.general_constraints))
+        for var, name in ((z_min, "z_min"), (z_max, "z_max"), (y, "y")):
+            milp.show_vars.add_variable(var, name)
+        for provider in (MILPProvider.GUROBI, MILPProvider.HIGHS):
+            with self.subTest(provider=provider):
+                with ReasonerContext():
+                    ConfigReader.MILP_PROVIDER = provider
+                    lowered = milp.clone()
+                    sol = lowered.optimize(Expression(Term(-1.0, y)))
+                self.assertEqual(
+                    3 if provider == MILPProvider.GUROBI else 0,
+                    len(lowered.general_constraints),
+                )
+                self.assertEqual(3, len(milp.general_constraints))
+                values = sol.get_showed_variables()
+                self.assertAlmostEqual(0.3, values[str(z_min)])
+                self.assertAlmostEqual(0.5, values[str(z_max)])
+                self.assertAlmostEqual(0.0, values[str(y)])
+
+
+if __name__ == "__main__":
+    unittest.main()
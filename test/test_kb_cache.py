@@ -0,0 +1,69 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from fuzzy_dl_owl2.fuzzydl.milp.variable import Variable
+from fuzzy_dl_owl2.fuzzydl.parser import DLParserFast as DLParser
+from fuzzy_dl_owl2.fuzzydl.parser.kb_cache import KBCache
+from fuzzy_dl_owl2.fuzzydl.util.config_reader import ConfigReader
+
+
+class TestKBCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.tmp, "cache")
+        self.file_path = os.path.join(self.tmp, "kb.txt")
+        shutil.copy("../examples/TestSuite/solverSession1.txt", self.file_path)
+        self.epsilon = ConfigReader.EPSILON
+
+    def tearDown(self):
+        DLParser.load_config(kb_cache_dir="", epsilon=self.epsilon)
+        shutil.rmtree(self.tmp)
+
+    def get_results(self, **kwargs) -> list[float]:
+        Variable.VARIABLE_NUMBER = 0
+        kb, queries = DLParser.get_kb(
+            self.file_path, solve=True, kb_cache_dir=self.cache_dir, **kwargs
+        )
+        self.assertTrue(kb.KB_LOADED)
+        return [query.solve(kb).get_solution() for query in queries]
+
+    def test_query1(self):
+        expected = [0.7, 0.5, 0.0, 0.5, 1.0, 1.0]
+        self.assertEqual(expected, self.get_results(), "TestKBCache")
+        self.assertEqual(1, len(os.listdir(self.cache_dir)))
+        self.assertIsNotNone(KBCache.load(self.file_path, True))
+        self.assertIsNone(KBCache.load(self.file_path, False))
+
+        # The second load is answered by the cache
+        self.assertEqual(expected, self.get_results(), "TestKBCache")
+
+    def test_invalidation(self):
+        self.get_results()
+        path = KBCache.get_path(self.file_path, True)
+
+        # Changing a setting that affects the knowledge base invalidates the entry
+        self.get_results(epsilon=0.01)
+        DLParser.load_config(epsilon=self.epsilon)
+        self.assertIsNone(KBCache.load(self.file_path, True))
+
+        # Changing the file invalidates the entry
+        self.get_results()
+        with open(self.file_path, "a") as file:
+            file.write("(instance a C 0.9)\n")
+        self.assertIsNone(KBCache.load(self.file_path, True))
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual([0.9, 0.5, 0.0, 0.5, 1.0, 1.0], self.get_results())
+
+        # Corrupted entries are discarded and replaced
+        with open(path, "r+b") as file:
+            file.seek(-16, os.SEEK_END)
+            file.write(bytes(16))
+        self.assertEqual([0.9, 0.5, 0.0, 0.5, 1.0, 1.0], self.get_results())
+        self.assertIsNotNone(KBCache.load(self.file_path, True))
+
+
+if __name__ == "__main__":
+    unittest.main()
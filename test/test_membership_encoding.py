@@ -0,0 +1,80 @@
+import unittest
+
+from fuzzy_dl_owl2.fuzzydl.milp.expression import Expression
+from fuzzy_dl_owl2.fuzzydl.milp.milp_helper import MILPHelper
+from fuzzy_dl_owl2.fuzzydl.milp.term import Term
+from fuzzy_dl_owl2.fuzzydl.milp.variable import Variable
+from fuzzy_dl_owl2.fuzzydl.parser import DLParserFast as DLParser
+from fuzzy_dl_owl2.fuzzydl.util.config_reader import ConfigReader
+from fuzzy_dl_owl2.fuzzydl.util.constants import (
+    InequalityType,
+    MembershipEncoding,
+    MILPProvider,
+    VariableType,
+)
+from fuzzy_dl_owl2.fuzzydl.util.reasoner_context import ReasonerContext
+
+
+class TestMembershipEncoding(unittest.TestCase):
+
+    FILES = {
+        "fcd1.txt": 1.0,
+        "fcd5.txt": 0.25,
+        "fcd6.txt": 0.2647,
+        "fuzzyNumber4.txt": 11.0,
+        "modifier1.txt": 0.5,
+        "modifier2.txt": 0.9,
+    }
+
+    def solve(self, filename: str, provider: MILPProvider) -> float:
+        Variable.VARIABLE_NUMBER = 0
+        with ReasonerContext():
+            kb, queries = DLParser.get_kb(
+                f"../examples/TestSuite/{filename}",
+                milp_provider=provider.value,
+                membership_encoding=MembershipEncoding.PIECEWISE.value,
+            )
+            kb.solve_kb()
+            return queries[0].solve(kb).get_solution()
+
+    def test_piecewise_encoding(self):
+        for provider in (
+            MILPProvider.GUROBI,
+            MILPProvider.MIP,
+            MILPProvider.HIGHS,
+            MILPProvider.PULP,
+        ):
+            for filename, expected in TestMembershipEncoding.FILES.items():
+                with self.subTest(provider=provider, filename=filename):
+                    self.assertEqual(expected, self.solve(filename, provider))
+
+    def test_lowering(self):
+        milp = MILPHelper()
+        x = milp.get_new_variable(VariableType.CONTINUOUS)
+        y = milp.get_new_variable(VariableType.SEMI_CONTINUOUS)
+        # Trapezoid over [0, 100] with a repeated breakpoint
+        milp.add_piecewise_linear_constraint(
+            x, y, [0, 20, 30, 30, 50, 100], [0, 0, 1, 1, 0, 0]
+        )
+        milp.add_new_constraint(Expression(-40.0, Term(1.0, x)), InequalityType.EQUAL)
+        self.assertEqual(1, len(milp.piecewise_constraints))
+        self.assertEqual(
+            [0, 20, 30, 50, 100], milp.piecewise_constraints[0].get_x_points()
+        )
+        lowered = milp.clone()
+        lowered.lower_piecewise_linear_constraints()
+        self.assertEqual(0, len(lowered.piecewise_constraints))
+        self.assertEqual(1, len(milp.piecewise_constraints))
+        self.assertEqual(
+            4,
+            sum(v.get_type() == VariableType.BINARY for v in lowered.variables),
+        )
+        lowered.show_vars.add_variable(y, "y")
+        with ReasonerContext():
+            ConfigReader.MILP_PROVIDER = MILPProvider.HIGHS
+            sol = lowered.optimize(Expression(Term(-1.0, y)))
+        self.assertEqual(0.5, sol.get_solution())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,290 @@
+import os
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+
+from fuzzy_dl_owl2.fuzzydl.milp.constraint_store import ConstraintStore
+from fuzzy_dl_owl2.fuzzydl.milp.expression import Expression
+from fuzzy_dl_owl2.fuzzydl.milp.milp_helper import MILPHelper
+from fuzzy_dl_owl2.fuzzydl.milp.solution import Solution
+from fuzzy_dl_owl2.fuzzydl.milp.term import Term
+from fuzzy_dl_owl2.fuzzydl.milp.union_find import UnionFind
+from fuzzy_dl_owl2.fuzzydl.util.config_reader import ConfigReader
+from fuzzy_dl_owl2.fuzzydl.util.constants import (
+    ArtifactPolicy,
+    InequalityType,
+    MILPProvider,
+    VariableType,
+)
+
+
+class TestMILPHelper(unittest.TestCase):
+
+    def test_clone_is_copy_on_write(self):
+        milp = MILPHelper()
+        x = milp.get_variable("a:A")
+        milp.add_new_constraint(
+            Expression(-0.5, Term(1.0, x)), InequalityType.GREATER_THAN
+        )
+
+        cloned = milp.clone()
+        self.assertIs(milp.constraints[0], cloned.constraints[0])
+
+        y = cloned.get_variable("a:A", VariableType.BINARY)
+        cloned.add_new_constraint(
+            Expression(-1.0, Term(1.0, y)), InequalityType.GREATER_THAN
+        )
+        self.assertIsNot(x, y)
+        self.assertEqual(VariableType.SEMI_CONTINUOUS, x.get_type())
+        self.assertEqual(VariableType.BINARY, y.get_type())
+        self.assertEqual(1, len(milp.constraints))
+        self.assertEqual(2, len(cloned.constraints))
+
+        # The original helper copies shared variables before modifying them too
+        z = milp.get_variable("a:A", VariableType.CONTINUOUS)
+        self.assertIsNot(x, z)
+        self.assertEqual(VariableType.BINARY, cloned.get_variable("a:A").get_type())
+
+    def test_partitioned_solving(self):
+        milp = MILPHelper()
+        x = milp.get_variable("a:A")
+        y = milp.get_variable("a:B")
+        z = milp.get_variable("b:A")
+        # Two independent components: {x, y} and {z}
+        milp.add_new_constraint(
+            Expression(-0.7, Term(1.0, x), Term(1.0, y)), InequalityType.GREATER_THAN
+        )
+        milp.add_new_constraint(Expression(-0.4, Term(1.0, y)), InequalityType.LESS_THAN)
+        milp.add_new_constraint(Expression(-0.2, Term(1.0, z)), InequalityType.GREATER_THAN)
+        milp.show_vars.add_variable(z, "b:A")
+        objective = Expression(Term(1.0, x), Term(1.0, z))
+
+        expected = milp.solve_model(objective)
+        partition, workers = ConfigReader.MILP_PARTITION, ConfigReader.MILP_PARTITION_WORKERS
+        try:
+            ConfigReader.MILP_PARTITION, ConfigReader.MILP_PARTITION_WORKERS = True, 2
+            sol = milp.optimize(objective)
+        finally:
+            ConfigReader.MILP_PARTITION, ConfigReader.MILP_PARTITION_WORKERS = partition, workers
+        self.assertEqual(0.5, expected.get_solution())
+        self.assertEqual(expected.get_solution(), sol.get_solution())
+        self.assertEqual({"b:A": 0.2}, sol.get_showed_variables())
+
+    def test_union_find(self):
+        uf = UnionFind(3)
+        uf.union(np.array([0]), np.array([1]))
+        uf.grow(40)
+        uf.union(np.array([39, 5, 6]), np.array([1, 6, 7]))
+        labels = uf.roots()
+        self.assertEqual(40 - 4, len(set(labels.tolist())))
+        self.assertEqual(labels[0], labels[39])
+        self.assertEqual(labels[5], labels[7])
+        self.assertNotEqual(labels[0], labels[5])
+        # The last element is a component on its own
+        self.assertEqual([38], [i for i in range(40) if labels[i] == labels[38]])
+
+        cloned = uf.clone()
+        cloned.union(np.array([0]), np.array([5]))
+        self.assertNotEqual(uf.roots()[0], uf.roots()[5])
+        self.assertEqual(cloned.roots()[0], cloned.roots()[7])
+
+        restored = pickle.loads(pickle.dumps(cloned))
+        self.assertEqual(cloned.roots().tolist(), restored.roots().tolist())
+
+    def test_variable_ids(self):
+        milp = MILPHelper()
+        x = milp.get_variable("a:A")
+        y = milp.get_new_variable(VariableType.BINARY)
+        self.assertEqual([0, 1], [x.id, y.id])
+        self.assertEqual("a:A", milp.get_name_for_integer(x.id))
+
+        # Copies keep the identifier of the shared variable
+        cloned = milp.clone()
+        x2 = cloned.get_variable("a:A", VariableType.BINARY)
+        self.assertIsNot(x, x2)
+        self.assertEqual(x.id, x2.id)
+        self.assertEqual(2, cloned.get_variable("b:A").id)
+        self.assertEqual(2, milp.get_variable("c:A").id)
+
+    def test_nominal_variable_lookup(self):
+        milp = MILPHelper()
+        self.assertFalse(milp.exists_nominal_variable("a"))
+        milp.get_nominal_variable("a")
+        self.assertTrue(milp.exists_nominal_variable("a"))
+        self.assertFalse(milp.exists_nominal_variable("b"))
+
+        # The partition equation is only added when the variable is created
+        v = milp.get_negated_nominal_variable("a", "b")
+        self.assertEqual(VariableType.BINARY, v.get_type())
+        self.assertEqual(1, len(milp.constraints))
+        self.assertIs(v, milp.get_negated_nominal_variable("a", "b"))
+        self.assertEqual(1, len(milp.constraints))
+
+    def test_show_variables_lookup(self):
+        milp = MILPHelper()
+        x = milp.get_variable("a:A")
+        y = milp.get_variable("b:A")
+        milp.show_vars.add_variable(x, "a:A")
+        self.assertEqual({x.id}, milp.show_vars.variable_ids)
+        self.assertTrue(milp.show_vars.show_variable(x))
+        self.assertFalse(milp.show_vars.show_variable(y))
+
+        # Private copies keep the identifier of the shown variable
+        cloned = milp.clone()
+        x2 = cloned.get_variable("a:A", VariableType.BINARY)
+        self.assertIsNot(x, x2)
+        self.assertTrue(cloned.show_vars.show_variable(x2))
+        cloned.show_vars.add_variable(y, "b:A")
+        self.assertFalse(milp.show_vars.show_variable(y))
+
+    def test_lazy_showed_values(self):
+        milp = MILPHelper()
+        x = milp.get_variable("a:A")
+        y = milp.get_variable("b:A")
+        sol = Solution(0.5)
+        sol.set_showed_values([x, y], np.array([0.1234567, 0.7]))
+        self.assertEqual(0, len(sol.showed_variables))
+        sol.add_showed_variable("b:A", 0.8)
+        self.assertEqual({"a:A": 0.123457, "b:A": 0.8}, sol.get_showed_variables())
+        self.assertEqual(["a:A", "b:A"], list(sol.get_showed_variables()))
+        self.assertEqual(hash(sol), hash(sol))
+
+    def test_constraint_store(self):
+        milp = MILPHelper()
+        x = milp.get_variable("a:A")
+        y = milp.get_variable("b:A")
+        milp.add_new_constraint(
+            Expression(-0.5, Term(1.0, x), Term(-2.0, y)), InequalityType.LESS_THAN
+        )
+        store = milp.constraint_store
+        self.assertEqual(1, len(store))
+        cols, coefs = store.get_row(0)
+        self.assertEqual([x.id, y.id], cols.tolist())
+        self.assertEqual([1.0, -2.0], coefs.tolist())
+        self.assertEqual(InequalityType.LESS_THAN, store.get_sense(0))
+        self.assertEqual(0.5, store.rhs[0])
+
+        # Snapshots share the rows but not the rows appended afterwards
+        cloned = milp.clone()
+        cloned.add_new_constraint(Expression(Term(1.0, y)), InequalityType.EQUAL)
+        self.assertEqual(1, len(milp.constraint_store))
+        self.assertEqual(2, len(cloned.constraint_store))
+        self.assertEqual([y.id], cloned.constraint_store.get_row(1)[0].tolist())
+
+        # Rows are normalized, and duplicated and trivial rows are discarded
+        store = ConstraintStore()
+        self.assertTrue(store.append([1, 0], [1.0, 1.0], InequalityType.EQUAL, 1.0))
+        self.assertFalse(store.append([2, 2], [0.5, -0.5], InequalityType.GREATER_THAN, -0.0))
+        self.assertFalse(store.append([0, 1, 2], [1.0, 1.0, 0.0], InequalityType.EQUAL, 1.0))
+        self.assertTrue(store.append([1], [2.0], InequalityType.EQUAL, 1.0))
+        self.assertTrue(store.append([], [], InequalityType.GREATER_THAN, 1.0))
+        self.assertEqual(3, len(store))
+        self.assertEqual([0, 1], store.get_row(0)[0].tolist())
+        self.assertEqual(0, len(store.get_row(2)[0]))
+
+        # Keys are shared with the snapshots and rebuilt for selected rows
+        cloned = store.clone()
+        self.assertFalse(cloned.append([1], [2.0], InequalityType.EQUAL, 1.0))
+        self.assertTrue(cloned.append([1], [2.0], InequalityType.LESS_THAN, 1.0))
+        self.assertTrue(store.append([1], [2.0], InequalityType.LESS_THAN, 1.0))
+        selected = store.select([1, 0])
+        self.assertFalse(selected.append([0, 1], [1.0, 1.0], InequalityType.EQUAL, 1.0))
+
+        restored = pickle.loads(pickle.dumps(store))
+        self.assertEqual(4, len(restored))
+        self.assertEqual(store.get_row(1)[1].tolist(), restored.get_row(1)[1].tolist())
+        self.assertFalse(restored.append([1], [2.0], InequalityType.EQUAL, 1.0))
+
+        # Duplicated constraints are not added to the helper either
+        milp.add_new_constraint(
+            Expression(-0.5, Term(-2.0, y), Term(1.0, x)), InequalityType.LESS_THAN
+        )
+        self.assertEqual(1, len(milp.constraints))
+
+    def test_bound_folding(self):
+        milp = MILPHelper()
+        x = milp.get_variable("a:A")
+        y = milp.get_variable("b:A")
+        z = milp.get_variable("c:A")
+        milp.add_new_constraint(Expression(-0.3, Term(2.0, x)), InequalityType.GREATER_THAN)
+        milp.add_new_constraint(Expression(0.8, Term(-1.0, x)), InequalityType.GREATER_THAN)
+        milp.add_new_constraint(Expression(-0.6, Term(1.0, y)), InequalityType.LESS_THAN)
+        milp.add_new_constraint(
+            Expression(-0.5, Term(1.0, y), Term(1.0, z)), InequalityType.GREATER_THAN
+        )
+        milp.show_vars.add_variable(x, "a:A")
+        objective = Expression(Term(1.0, x), Term(1.0, z))
+
+        sol = milp.optimize(objective)
+        self.assertEqual(0.15, sol.get_solution())
+        self.assertEqual({"a:A": 0.15}, sol.get_showed_variables())
+        # The variables keep their own bounds
+        self.assertEqual((0.0, 1.0), (x.get_lower_bound(), x.get_upper_bound()))
+
+        # Contradicting bounds are left to the solver
+        milp.add_new_constraint(Expression(-0.9, Term(1.0, x)), InequalityType.GREATER_THAN)
+        self.assertFalse(milp.optimize(objective).is_consistent_kb())
+
+    def test_highs_backend(self):
+        milp = MILPHelper()
+        x = milp.get_variable("a:A")
+        z = milp.get_variable("b:A")
+        b = milp.get_new_variable(VariableType.BINARY)
+        milp.add_new_constraint(
+            Expression(-0.2, Term(1.0, z), Term(-0.5, b)), InequalityType.GREATER_THAN
+        )
+        milp.add_new_constraint(Expression(-0.5, Term(1.0, b)), InequalityType.GREATER_THAN)
+        milp.add_new_constraint(Expression(-0.3, Term(1.0, x)), InequalityType.EQUAL)
+        milp.show_vars.add_variable(z, "b:A")
+        objective = Expression(Term(1.0, x), Term(1.0, z))
+
+        provider = ConfigReader.MILP_PROVIDER
+        try:
+            ConfigReader.MILP_PROVIDER = MILPProvider.HIGHS
+            sol = milp.optimize(objective)
+            milp.add_new_constraint(Expression(-2.0, Term(1.0, x)), InequalityType.GREATER_THAN)
+            inconsistent = milp.optimize(objective)
+        finally:
+            ConfigReader.MILP_PROVIDER = provider
+        self.assertEqual(1.0, sol.get_solution())
+        self.assertEqual({"b:A": 0.7}, sol.get_showed_variables())
+        self.assertFalse(inconsistent.is_consistent_kb())
+
+    def test_solver_artifacts(self):
+        milp = MILPHelper()
+        x = milp.get_variable("a:A")
+        milp.add_new_constraint(Expression(-0.3, Term(1.0, x)), InequalityType.EQUAL)
+        objective = Expression(Term(1.0, x))
+
+        cwd = os.getcwd()
+        policy, compress = ConfigReader.SOLVER_ARTIFACTS, ConfigReader.SOLVER_ARTIFACTS_COMPRESS
+        with tempfile.TemporaryDirectory() as tmp:
+            try:
+                os.chdir(tmp)
+                ConfigReader.SOLVER_ARTIFACTS = ArtifactPolicy.OFF
+                milp.optimize(objective)
+                self.assertFalse(os.path.exists("results"))
+
+                ConfigReader.SOLVER_ARTIFACTS = ArtifactPolicy.ON_FAILURE
+                milp.optimize(objective)
+                self.assertFalse(os.path.exists("results"))
+
+                ConfigReader.SOLVER_ARTIFACTS = ArtifactPolicy.ALWAYS
+                ConfigReader.SOLVER_ARTIFACTS_COMPRESS = True
+                milp.optimize(objective)
+                milp.optimize(objective)
+                files = os.listdir("results")
+            finally:
+                ConfigReader.SOLVER_ARTIFACTS = policy
+                ConfigReader.SOLVER_ARTIFACTS_COMPRESS = compress
+                os.chdir(cwd)
+        # Every optimization dumps its model and solution to its own files
+        self.assertEqual(4, len(files))
+        self.assertTrue(all(f.endswith(".gz") for f in files))
+        self.assertEqual(2, len([f for f in files if "_model." in f]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+
+from fuzzy_dl_owl2.fuzzydl.milp.expression import Expression
+from fuzzy_dl_owl2.fuzzydl.milp.milp_helper import MILPHelper
+from fuzzy_dl_owl2.fuzzydl.milp.presolve import Presolver
+from fuzzy_dl_owl2.fuzzydl.milp.term import Term
+from fuzzy_dl_owl2.fuzzydl.milp.variable import Variable
+from fuzzy_dl_owl2.fuzzydl.parser import DLParserFast as DLParser
+from fuzzy_dl_owl2.fuzzydl.util.config_reader import ConfigReader
+from fuzzy_dl_owl2.fuzzydl.util.constants import (
+    InequalityType,
+    MILPProvider,
+    VariableType,
+)
+from fuzzy_dl_owl2.fuzzydl.util.reasoner_context import ReasonerContext
+
+
+class TestPresolve(unittest.TestCase):
+
+    FILES = {
+        "datatype5.txt": 1.0,
+        "impliesG1.txt": 0.4,
+        "aggregation1.txt": 0.6,
+        "and3.txt": 0.7,
+    }
+
+    def test_presolver(self):
+        presolver = Presolver(
+            [0.0, 0.0, 0.0],
+            [1.0, 1.0, 1.0],
+            [False, False, True],
+            [True, False, False],
+        )
+        # x1 = x0, 2 * x2 <= 1 and x0 + x2 <= 0.5
+        presolver.add_row(0, [0, 1], [1.0, -1.0], InequalityType.EQUAL, 0.0)
+        presolver.add_row(1, [2], [2.0], InequalityType.LESS_THAN, 1.0)
+        presolver.add_row(2, [0, 2], [1.0, 1.0], InequalityType.LESS_THAN, 0.5)
+        self.assertTrue(presolver.presolve())
+        self.assertFalse(presolver.is_removed(0))
+        self.assertEqual((0.0, 1.0, 0), presolver.get_substitution(1))
+        self.assertEqual((0.0, 0.0, -1), presolver.get_substitution(2))
+        self.assertEqual(0.5, presolver.upper[0])
+        self.assertEqual([], list(presolver.get_rows()))
+
+        presolver = Presolver([0.0], [1.0], [False], [False])
+        presolver.add_row(0, [0], [1.0], InequalityType.GREATER_THAN, 2.0)
+        self.assertFalse(presolver.presolve())
+
+    def test_postsolve(self):
+        milp = MILPHelper()
+        x = milp.get_new_variable(VariableType.SEMI_CONTINUOUS)
+        y = milp.get_new_variable(VariableType.SEMI_CONTINUOUS)
+        z = milp.get_new_variable(VariableType.SEMI_CONTINUOUS)
+        w = milp.get_new_variable(VariableType.SEMI_CONTINUOUS)
+        u = milp.get_new_variable(VariableType.SEMI_CONTINUOUS)
+        milp.add_equality(x, y)
+        milp.add_equality(y, z)
+        milp.add_new_constraint(Expression(Term(1.0, w)), InequalityType.EQUAL, 0.4)
+        milp.add_new_constraint(
+            Expression(Term(1.0, z), Term(-1.0, w)), InequalityType.LESS_THAN, 0.2
+        )
+        for var in (x, y, z, w, u):
+            milp.show_vars.add_variable(var, str(var))
+        for provider in (MILPProvider.GUROBI, MILPProvider.HIGHS):
+            with self.subTest(provider=provider):
+                with ReasonerContext():
+                    ConfigReader.MILP_PROVIDER = provider
+                    ConfigReader.MILP_PRESOLVE = True
+                    sol = milp.clone().optimize(Expression(Term(-1.0, x)))
+                self.assertEqual(0.6, sol.get_solution())
+                self.assertEqual(
+                    {str(x): 0.6, str(y): 0.6, str(z): 0.6, str(w): 0.4, str(u): 0.0},
+                    sol.get_showed_variables(),
+                )
+
+    def test_examples(self):
+        providers = (
+            MILPProvider.GUROBI,
+            MILPProvider.HIGHS,
+            MILPProvider.MIP,
+            MILPProvider.PULP,
+        )
+        for provider in providers:
+            for filename, expected in TestPresolve.FILES.items():
+                with self.subTest(provider=provider, filename=filename):
+                    Variable.VARIABLE_NUMBER = 0
+                    with ReasonerContext():
+                        kb, queries = DLParser.get_kb(
+                            f"../examples/TestSuite/{filename}",
+                            milp_provider=provider.value,
+                            milp_presolve=True,
+                        )
+                        kb.solve_kb()
+                        self.assertEqual(
+                            expected, queries[0].solve(kb).get_solution()
+                        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import time
+import unittest
+
+from fuzzy_dl_owl2.fuzzydl.knowledge_base import KnowledgeBase
+from fuzzy_dl_owl2.fuzzydl.milp.solution import Solution
+from fuzzy_dl_owl2.fuzzydl.milp.variable import Variable
+from fuzzy_dl_owl2.fuzzydl.parser import DLParserFast as DLParser
+from fuzzy_dl_owl2.fuzzydl.query.query import Query
+from fuzzy_dl_owl2.fuzzydl.query.query_executor import QueryExecutor
+from fuzzy_dl_owl2.fuzzydl.util.reasoner_context import ReasonerContext
+
+
+class SleepQuery(Query):
+
+    def preprocess(self, knowledge_base: KnowledgeBase) -> None:
+        pass
+
+    def solve(self, knowledge_base: KnowledgeBase) -> Solution:
+        time.sleep(60)
+        return Solution(1.0)
+
+    def __str__(self) -> str:
+        return "Sleep? "
+
+
+class TestQueryExecutor(unittest.TestCase):
+
+    def get_kb(self, file_path: str) -> tuple[KnowledgeBase, list[Query]]:
+        Variable.VARIABLE_NUMBER = 0
+        return DLParser.get_kb(file_path, solve=True)
+
+    def test_query1(self):
+        kb, queries = self.get_kb("../examples/TestSuite/solverSession1.txt")
+        results = QueryExecutor(kb, queries, workers=3).solve()
+        self.assertEqual(
+            [0.7, 0.5, 0.0, 0.5, 1.0, 1.0],
+            [result.get_solution() for result in results],
+            "TestQueryExecutor",
+        )
+        self.assertTrue(all(query.get_total_time() > 0 for query in queries))
+
+    def test_all_instances(self):
+        kb, queries = self.get_kb("../examples/TestSuite/allInstances1.txt")
+        QueryExecutor(kb, queries * 2, workers=2).solve()
+        self.assertEqual(
+            {"a": 0.7, "b": 0.4, "c": 0.5},
+            {
+                str(i): d
+                for i, d in zip(queries[0].get_individuals(), queries[0].get_degrees())
+            },
+        )
+        self.assertTrue(
+            all(i is kb.individuals[str(i)] for i in queries[0].get_individuals())
+        )
+
+    def test_timeout(self):
+        kb, queries = self.get_kb("../examples/TestSuite/solverSession1.txt")
+        queries.insert(1, SleepQuery())
+        start = time.perf_counter()
+        results = QueryExecutor(kb, queries, workers=2, timeout=2).solve()
+        self.assertLess(time.perf_counter() - start, 30)
+        self.assertIsInstance(results[1], TimeoutError)
+        del results[1]
+        self.assertEqual(
+            [0.7, 0.5, 0.0, 0.5, 1.0, 1.0],
+            [result.get_solution() for result in results],
+            "TestQueryExecutor",
+        )
+
+    def test_main_timeout(self):
+        # Every query times out, which must not abort the reporting of the others
+        Variable.VARIABLE_NUMBER = 0
+        with ReasonerContext():
+            with self.assertLogs("fuzzy_dl_owl2.reasoner", "WARNING") as logs:
+                results = DLParser.main(
+                    "../examples/TestSuite/solverSession1.txt",
+                    query_workers=2,
+                    query_timeout=1e-6,
+                )
+        self.assertEqual({}, results)
+        self.assertEqual(6, sum("timeout" in line for line in logs.output))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import threading
+import unittest
+
+from fuzzy_dl_owl2.fuzzydl.parser import DLParserFast as DLParser
+from fuzzy_dl_owl2.fuzzydl.util import constants
+from fuzzy_dl_owl2.fuzzydl.util.config_reader import ConfigReader
+from fuzzy_dl_owl2.fuzzydl.util.constants import FuzzyLogic
+from fuzzy_dl_owl2.fuzzydl.util.reasoner_context import ReasonerContext
+
+
+class TestReasonerContext(unittest.TestCase):
+
+    FILES = {
+        "../examples/TestSuite/and2.txt": 0.1,
+        "../examples/TestSuite/and4.txt": 0.4,
+        "../examples/TestSuite/some4.txt": 0.8,
+        "../examples/TestSuite/solverSession1.txt": 0.7,
+    }
+
+    def solve(self, file_path: str) -> float:
+        kb, queries = DLParser.get_kb(file_path, solve=True)
+        return queries[0].solve(kb).get_solution()
+
+    def test_settings(self):
+        epsilon = ConfigReader.EPSILON
+        semantics = constants.KNOWLEDGE_BASE_SEMANTICS
+        with ReasonerContext() as context:
+            ConfigReader.EPSILON = epsilon * 10
+            context.semantics = FuzzyLogic.ZADEH
+            self.assertEqual(epsilon * 10, ConfigReader.EPSILON)
+            self.assertEqual(FuzzyLogic.ZADEH, constants.KNOWLEDGE_BASE_SEMANTICS)
+        self.assertEqual(epsilon, ConfigReader.EPSILON)
+        self.assertEqual(semantics, constants.KNOWLEDGE_BASE_SEMANTICS)
+
+    def test_threads(self):
+        DLParser.load_config()
+        results: dict[tuple[str, int], float] = dict()
+
+        def worker(file_path: str, i: int) -> None:
+            results[(file_path, i)] = ReasonerContext().run(self.solve, file_path)
+
+        threads = [
+            threading.Thread(target=worker, args=(file_path, i))
+            for i in range(3)
+            for file_path in TestReasonerContext.FILES
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for (file_path, _), result in results.items():
+            self.assertEqual(
+                TestReasonerContext.FILES[file_path], result, "TestReasonerContext"
+            )
+        self.assertEqual(len(threads), len(results))
+
+
+if __name__ == "__main__":
+    unittest.main()
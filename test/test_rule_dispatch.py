@@ -0,0 +1,37 @@
+import unittest
+
+from fuzzy_dl_owl2.fuzzydl.concept.atomic_concept import AtomicConcept
+from fuzzy_dl_owl2.fuzzydl.concept.weighted_sum_concept import WeightedSumConcept
+from fuzzy_dl_owl2.fuzzydl.knowledge_base import KnowledgeBase
+from fuzzy_dl_owl2.fuzzydl.parser import DLParserFast as DLParser
+from fuzzy_dl_owl2.fuzzydl.util.constants import ConceptType
+
+
+class TestRuleDispatch(unittest.TestCase):
+
+    def test_rule_key(self):
+        a = AtomicConcept("A")
+        b = AtomicConcept("B")
+        self.assertEqual((ConceptType.ATOMIC, None), KnowledgeBase.get_rule_key(a))
+        self.assertEqual(
+            (ConceptType.COMPLEMENT, ConceptType.ATOMIC),
+            KnowledgeBase.get_rule_key(-a),
+        )
+        ws = WeightedSumConcept([0.5, 0.5], [a, b])
+        self.assertEqual((ConceptType.W_SUM, None), KnowledgeBase.get_rule_key(ws))
+        self.assertEqual(
+            (ConceptType.COMPLEMENT, ConceptType.W_SUM),
+            KnowledgeBase.get_rule_key(-ws),
+        )
+
+    def test_statistics(self):
+        kb, _ = DLParser.get_kb("../examples/TestSuite/solverSession1.txt")
+        kb.solve_abox()
+        self.assertEqual(4, kb.rule_handler_calls["rule_atomic"])
+        self.assertEqual(1, kb.rule_handler_calls["rule_complemented_atomic"])
+        self.assertEqual(set(kb.rule_handler_calls), set(kb.rule_handler_time))
+        self.assertTrue(all(t >= 0 for t in kb.rule_handler_time.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
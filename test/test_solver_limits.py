@@ -0,0 +1,81 @@
+import math
+import threading
+import unittest
+
+from fuzzy_dl_owl2.fuzzydl.knowledge_base import KnowledgeBase
+from fuzzy_dl_owl2.fuzzydl.milp.solver_limits import SolverLimits
+from fuzzy_dl_owl2.fuzzydl.milp.variable import Variable
+from fuzzy_dl_owl2.fuzzydl.parser import DLParserFast as DLParser
+from fuzzy_dl_owl2.fuzzydl.query.query import Query
+from fuzzy_dl_owl2.fuzzydl.util.config_reader import ConfigReader
+from fuzzy_dl_owl2.fuzzydl.util.constants import MILPProvider, SolutionStatus
+from fuzzy_dl_owl2.fuzzydl.util.reasoner_context import ReasonerContext
+
+
+class TestSolverLimits(unittest.TestCase):
+
+    RESULTS = [0.7, 0.5, 0.0, 0.5, 1.0, 1.0]
+
+    def get_kb(self) -> tuple[KnowledgeBase, list[Query]]:
+        Variable.VARIABLE_NUMBER = 0
+        return DLParser.get_kb("../examples/TestSuite/solverSession1.txt", solve=True)
+
+    def test_mip_gap(self):
+        kb, queries = self.get_kb()
+        for query in queries:
+            query.set_solver_limits(SolverLimits(time_limit=60, mip_gap=0.0))
+        solutions = [query.solve(kb) for query in queries]
+        self.assertEqual(
+            TestSolverLimits.RESULTS,
+            [sol.get_solution() for sol in solutions],
+            "TestSolverLimits",
+        )
+        self.assertFalse(any(sol.is_bounded() for sol in solutions))
+
+    def test_time_limit(self):
+        kb, queries = self.get_kb()
+        with ReasonerContext():
+            ConfigReader.SOLVER_TIME_LIMIT = 1e-9
+            sol = queries[0].solve(kb)
+        self.assertTrue(sol.is_bounded())
+        self.assertEqual(SolutionStatus.TIME_LIMIT, sol.get_status())
+        self.assertTrue(math.isnan(sol.get_solution()))
+        # The limit of the query overrides the setting
+        queries[0].set_solver_limits(SolverLimits(time_limit=0))
+        with ReasonerContext():
+            ConfigReader.SOLVER_TIME_LIMIT = 1e-9
+            sol = queries[0].solve(kb)
+        self.assertEqual(0.7, sol.get_solution(), "TestSolverLimits")
+        self.assertFalse(sol.is_bounded())
+
+    def test_time_limit_mip(self):
+        # CBC reports a huge finite bound when it stops before finding a solution
+        Variable.VARIABLE_NUMBER = 0
+        with ReasonerContext():
+            kb, queries = DLParser.get_kb(
+                "../examples/TestSuite/solverSession1.txt",
+                milp_provider=MILPProvider.MIP.value,
+                solver_time_limit=1e-4,
+            )
+            kb.solve_kb()
+            sol = queries[0].solve(kb)
+        self.assertTrue(sol.is_bounded())
+        self.assertEqual(SolutionStatus.TIME_LIMIT, sol.get_status())
+        self.assertTrue(math.isnan(sol.get_solution()))
+        self.assertIsNone(sol.get_bound())
+
+    def test_cancel(self):
+        kb, queries = self.get_kb()
+        thread = threading.Thread(target=queries[1].cancel)
+        thread.start()
+        thread.join()
+        sol = queries[1].solve(kb)
+        self.assertEqual(SolutionStatus.CANCELLED, sol.get_status())
+        self.assertTrue(math.isnan(sol.get_solution()))
+        self.assertEqual(0.7, queries[0].solve(kb).get_solution(), "TestSolverLimits")
+        queries[1].get_solver_limits().reset()
+        self.assertEqual(0.5, queries[1].solve(kb).get_solution(), "TestSolverLimits")
+
+
+if __name__ == "__main__":
+    unittest.main()
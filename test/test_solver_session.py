@@ -0,0 +1,73 @@
+import unittest
+
+from fuzzy_dl_owl2.fuzzydl.milp.expression import Expression
+from fuzzy_dl_owl2.fuzzydl.milp.milp_helper import MILPHelper
+from fuzzy_dl_owl2.fuzzydl.milp.term import Term
+from fuzzy_dl_owl2.fuzzydl.milp.variable import Variable
+from fuzzy_dl_owl2.fuzzydl.parser import DLParserFast as DLParser
+from fuzzy_dl_owl2.fuzzydl.util.config_reader import ConfigReader
+from fuzzy_dl_owl2.fuzzydl.util.constants import (
+    InequalityType,
+    MILPProvider,
+    VariableType,
+)
+from fuzzy_dl_owl2.fuzzydl.util.reasoner_context import ReasonerContext
+
+
+class TestSolverSession(unittest.TestCase):
+
+    def tearDown(self):
+        ConfigReader.PERSISTENT_SOLVER_SESSIONS = False
+
+    def get_results(self, persistent: bool) -> list[float]:
+        Variable.VARIABLE_NUMBER = 0
+        kb, queries = DLParser.get_kb(
+            "../examples/TestSuite/solverSession1.txt",
+            persistent_solver_sessions=persistent,
+        )
+        kb.solve_kb()
+        results = [query.solve(kb).get_solution() for query in queries]
+        self.assertEqual(persistent, kb.milp.session is not None)
+        if persistent:
+            self.assertEqual(len(queries), kb.milp.session.num_solves)
+        return results
+
+    def test_query1(self):
+        self.assertEqual(
+            [0.7, 0.5, 0.0, 0.5, 1.0, 1.0],
+            self.get_results(False),
+            "TestSolverSession",
+        )
+
+    def test_query2(self):
+        self.assertEqual(self.get_results(False), self.get_results(True))
+
+    def test_changed_before_clone(self):
+        for provider in (MILPProvider.GUROBI, MILPProvider.MIP):
+            for persistent in (False, True):
+                with self.subTest(provider=provider, persistent=persistent):
+                    with ReasonerContext():
+                        ConfigReader.MILP_PROVIDER = provider
+                        ConfigReader.PERSISTENT_SOLVER_SESSIONS = persistent
+                        base = MILPHelper()
+                        x = base.get_variable("x", VariableType.SEMI_CONTINUOUS)
+                        y = base.get_variable("y", VariableType.SEMI_CONTINUOUS)
+                        base.add_new_constraint(
+                            Expression(Term(1.0, x)), InequalityType.LESS_THAN, 0.5
+                        )
+                        base.add_new_constraint(
+                            Expression(Term(1.0, y), Term(-1.0, x)),
+                            InequalityType.LESS_THAN,
+                            0.0,
+                        )
+                        c1 = base.clone()
+                        # The change made by c1 must reach the snapshots of c1
+                        c1.get_variable("x", VariableType.BINARY)
+                        c2 = c1.clone()
+                        self.assertEqual(persistent, c2.session is not None)
+                        sol = c2.optimize(Expression(Term(-1.0, y)))
+                    self.assertEqual(0.0, sol.get_solution())
+
+
+if __name__ == "__main__":
+    unittest.main()
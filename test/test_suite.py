@@ -3,8 +3,11 @@ import unittest
 from test_absorption import TestAbsorption
 from test_aggregation import TestAggregation
 from test_all import TestAll
+from test_all_instances import TestAllInstances
 from test_and import TestAnd
 from test_blocking import TestBlocking
+from test_classification import TestClassification
+from test_concept_interning import TestConceptInterning
 from test_conversion_dl_to_owl2 import TestConversionDlToOwl2
 from test_conversion_owl2_to_dl import TestConversionOwl2ToDl
 from test_conversion_roundtrip import TestConversionRoundtrip
@@ -18,15 +21,25 @@ from test_implies_role import TestImpliesRole
 from test_inconsistency import TestInconsistency
 from test_instance import TestInstance
 from test_inverse import TestInverse
+from test_kb_cache import TestKBCache
+from test_membership_encoding import TestMembershipEncoding
+from test_general_constraints import TestGeneralConstraints
+from test_presolve import TestPresolve
+from test_milp_helper import TestMILPHelper
 from test_modifier import TestModifier
 from test_not import TestNot
 from test_or import TestOr
+from test_query_executor import TestQueryExecutor
+from test_reasoner_context import TestReasonerContext
+from test_solver_limits import TestSolverLimits
 from test_reflexive import TestReflexive
 from test_related import TestRelated
 from test_rough_sets import TestRoughSets
+from test_rule_dispatch import TestRuleDispatch
 from test_sat import TestSat
 from test_self import TestSelf
 from test_show_statement import TestShowStatement
+from test_solver_session import TestSolverSession
 from test_some import TestSome
 from test_subsumption import TestSubsumption
 from test_symmetric import TestSymmetric
@@ -44,6 +57,7 @@ def suite():
     suite.addTests(loader.loadTestsFromTestCase(TestAbsorption))
     suite.addTests(loader.loadTestsFromTestCase(TestAggregation))
     suite.addTests(loader.loadTestsFromTestCase(TestAll))
+    suite.addTests(loader.loadTestsFromTestCase(TestAllInstances))
     suite.addTests(loader.loadTestsFromTestCase(TestAnd))
     suite.addTests(loader.loadTestsFromTestCase(TestDatatype))
     suite.addTests(loader.loadTestsFromTestCase(TestDisjoint))
@@ -55,15 +69,25 @@ def suite():
     suite.addTests(loader.loadTestsFromTestCase(TestInconsistency))
     suite.addTests(loader.loadTestsFromTestCase(TestInstance))
     suite.addTests(loader.loadTestsFromTestCase(TestInverse))
+    suite.addTests(loader.loadTestsFromTestCase(TestKBCache))
+    suite.addTests(loader.loadTestsFromTestCase(TestMembershipEncoding))
+    suite.addTests(loader.loadTestsFromTestCase(TestGeneralConstraints))
+    suite.addTests(loader.loadTestsFromTestCase(TestPresolve))
+    suite.addTests(loader.loadTestsFromTestCase(TestMILPHelper))
     suite.addTests(loader.loadTestsFromTestCase(TestModifier))
     suite.addTests(loader.loadTestsFromTestCase(TestNot))
     suite.addTests(loader.loadTestsFromTestCase(TestOr))
+    suite.addTests(loader.loadTestsFromTestCase(TestQueryExecutor))
+    suite.addTests(loader.loadTestsFromTestCase(TestReasonerContext))
+    suite.addTests(loader.loadTestsFromTestCase(TestSolverLimits))
     suite.addTests(loader.loadTestsFromTestCase(TestReflexive))
     suite.addTests(loader.loadTestsFromTestCase(TestRelated))
     suite.addTests(loader.loadTestsFromTestCase(TestRoughSets))
+    suite.addTests(loader.loadTestsFromTestCase(TestRuleDispatch))
     suite.addTests(loader.loadTestsFromTestCase(TestSat))
     suite.addTests(loader.loadTestsFromTestCase(TestSelf))
     suite.addTests(loader.loadTestsFromTestCase(TestShowStatement))
+    suite.addTests(loader.loadTestsFromTestCase(TestSolverSession))
     suite.addTests(loader.loadTestsFromTestCase(TestSome))
     suite.addTests(loader.loadTestsFromTestCase(TestSubsumption))
     suite.addTests(loader.loadTestsFromTestCase(TestSymmetric))
@@ -74,6 +98,8 @@ def suite():
     suite.addTests(loader.loadTestsFromTestCase(TestWeightedConcept))
     suite.addTests(loader.loadTestsFromTestCase(TestWeightedSum))
     suite.addTests(loader.loadTestsFromTestCase(TestBlocking))
+    suite.addTests(loader.loadTestsFromTestCase(TestClassification))
+    suite.addTests(loader.loadTestsFromTestCase(TestConceptInterning))
     suite.addTests(loader.loadTestsFromTestCase(TestConversionDlToOwl2))
     suite.addTests(loader.loadTestsFromTestCase(TestConversionOwl2ToDl))
     suite.addTests(loader.loadTestsFromTestCase(TestConversionRoundtrip))
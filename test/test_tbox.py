@@ -2,6 +2,13 @@ import unittest
 
 from parser_interface import ParserInterface
 
+from fuzzy_dl_owl2.fuzzydl.concept.atomic_concept import AtomicConcept
+from fuzzy_dl_owl2.fuzzydl.concept.truth_concept import TruthConcept
+from fuzzy_dl_owl2.fuzzydl.degree.degree_numeric import DegreeNumeric
+from fuzzy_dl_owl2.fuzzydl.general_concept_inclusion import GeneralConceptInclusion
+from fuzzy_dl_owl2.fuzzydl.knowledge_base import KnowledgeBase
+from fuzzy_dl_owl2.fuzzydl.util.constants import LogicOperatorType
+
 
 class TestTbox(unittest.TestCase):
 
@@ -21,6 +28,30 @@ class TestTbox(unittest.TestCase):
         p = ParserInterface("../examples/TestSuite/lazy.txt")
         self.assertEqual(0.8, p.solve(), "TestTbox")
 
+    def test_gci_index(self):
+        kb = KnowledgeBase()
+        a, b = AtomicConcept("A"), AtomicConcept("B")
+
+        def gci(type_):
+            return GeneralConceptInclusion(b, a, DegreeNumeric.get_one(), type_)
+
+        kb.t_G.extend([gci(LogicOperatorType.GOEDEL), gci(LogicOperatorType.GOEDEL)])
+        self.assertEqual([kb.t_G[0]], kb.get_gci_index())
+
+        # GCIs appended later are indexed too, and clones keep their own index
+        cloned = kb.clone()
+        kb.t_G.append(gci(LogicOperatorType.KLEENE_DIENES))
+        self.assertEqual(2, len(kb.get_gci_index()))
+        self.assertEqual(1, len(cloned.get_gci_index()))
+
+        # The concepts asserted for every individual are built once
+        self.assertIs(kb.t_G[0].get_implication(), kb.t_G[0].get_implication())
+        self.assertIs(kb.t_G[2].get_negated_subsumed(), kb.t_G[2].get_negated_subsumed())
+        top = GeneralConceptInclusion(
+            b, TruthConcept.get_top(), DegreeNumeric.get_one(), LogicOperatorType.GOEDEL
+        )
+        self.assertIs(b, top.get_implication())
+
 
 if __name__ == "__main__":
     unittest.main()